@@ -0,0 +1,233 @@
+"""Tests for the headless batch runner (``tse_analytics.batch``)."""
+
+import json
+import pickle
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from tse_analytics.batch import BatchJob, load_batch_spec, parse_batch_spec, run_batch
+from tse_analytics.batch.__main__ import main
+from tse_analytics.batch.processors import BATCH_PROCESSORS, bind_processor_arguments, get_batch_processor
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.data.shared import Aggregation, Variable
+from tse_analytics.core.data.workspace import Workspace
+from tse_analytics.core.io.storage import save_workspace
+
+
+def _make_drinkfeed_datatable(dataset) -> Datatable:
+    seconds = [0, 10, 400, 20, 700]
+    df = pd.DataFrame({
+        "DateTime": pd.Timestamp("2024-01-01") + pd.to_timedelta(seconds, unit="s"),
+        "Timedelta": pd.to_timedelta(seconds, unit="s"),
+        "Animal": pd.Categorical(["A1", "A1", "A1", "A2", "A2"]),
+        "Box": pd.array([1, 1, 1, 2, 2], dtype="UInt16"),
+        "Drink1": pd.array([0.02, 0.02, 0.03, 0.0, 0.0], dtype="Float64"),
+        "Feed1": pd.array([0.0, 0.0, 0.0, 0.06, 0.08], dtype="Float64"),
+    })
+    variables = {
+        name: Variable(name, unit, "", "Float64", Aggregation.SUM, False)
+        for name, unit in (("Drink1", "ml"), ("Feed1", "g"))
+    }
+    return Datatable(dataset, "drinkfeed_bin", "Raw DrinkFeed", variables, df, {})
+
+
+def _make_workspace(make_dataset) -> Workspace:
+    workspace = Workspace(name="W")
+    for name in ("First", "Second"):
+        dataset = make_dataset(name)
+        dataset.add_raw_datatable("DrinkFeed", _make_drinkfeed_datatable(dataset))
+        with patch("tse_analytics.core.data.dataset.messaging"):
+            dataset.set_factors(dataset.factors)
+        workspace.datasets[dataset.id] = dataset
+    return workspace
+
+
+@pytest.fixture
+def workspace_path(tmp_path, make_dataset):
+    path = tmp_path / "experiment.duckdb"
+    save_workspace(str(path), _make_workspace(make_dataset))
+    return path
+
+
+def _spec_data(**overrides) -> dict:
+    data = {
+        "inputs": ["*.duckdb"],
+        "output": "results",
+        "max_workers": 1,
+        "figsize": [4, 3],
+        "jobs": [
+            {"name": "Weight histogram", "processor": "histogram", "variables": ["Weight"], "factor": "Group"},
+            {"name": "Missing", "processor": "histogram", "variables": ["Unknown"], "factor": "Group"},
+        ],
+    }
+    data.update(overrides)
+    return data
+
+
+def test_processor_registry_resolves():
+    for name in BATCH_PROCESSORS:
+        assert callable(get_batch_processor(name)), name
+
+
+def test_bind_processor_arguments(make_dataset):
+    datatable = make_dataset().datatables["Main"]
+
+    job = BatchJob("Job", "one_way_anova", variables=["Weight"], factor="Group", settings={"effsize": "np2"})
+    arguments = bind_processor_arguments(get_batch_processor("one_way_anova"), datatable, job, (4, 3))
+    assert arguments["dependent_variable"] is datatable.variables["Weight"]
+    assert arguments["factor_name"] == "Group"
+    assert arguments["effsize"] == "np2"
+    assert arguments["figsize"] == (4, 3)
+
+    job = BatchJob("Job", "data_plot", variables=["Weight"], factor="Group", settings={"error_bar": "se"})
+    arguments = bind_processor_arguments(get_batch_processor("data_plot"), datatable, job, None)
+    assert arguments["variables"] == {"Weight": datatable.variables["Weight"]}
+
+    with pytest.raises(ValueError, match="requires the 'covariate' setting"):
+        bind_processor_arguments(get_batch_processor("regression"), datatable, BatchJob("Job", "regression"), None)
+    with pytest.raises(ValueError, match="Unknown settings"):
+        bind_processor_arguments(
+            get_batch_processor("histogram"), datatable, BatchJob("Job", "histogram", settings={"bins": 3}), None
+        )
+
+
+def test_spec_validation(tmp_path, workspace_path):
+    spec = parse_batch_spec(_spec_data(), tmp_path)
+    assert spec.inputs == [workspace_path]
+    assert spec.output == tmp_path / "results"
+    assert spec.figsize == (4, 3)
+
+    with pytest.raises(ValueError, match="Unknown processor"):
+        parse_batch_spec(_spec_data(jobs=[{"processor": "nope"}]), tmp_path)
+    with pytest.raises(ValueError, match="Duplicate job names"):
+        parse_batch_spec(_spec_data(jobs=[{"processor": "pca"}, {"processor": "pca"}]), tmp_path)
+    with pytest.raises(ValueError, match="No input files"):
+        parse_batch_spec(_spec_data(inputs=["*.tse"]), tmp_path)
+
+
+def test_run_batch_writes_reports_and_summary(tmp_path, workspace_path):
+    spec = parse_batch_spec(_spec_data(), tmp_path)
+
+    outcomes = run_batch(spec)
+
+    assert [(outcome.dataset, outcome.job, outcome.succeeded) for outcome in outcomes] == [
+        ("First", "Weight histogram", True),
+        ("First", "Missing", False),
+        ("Second", "Weight histogram", True),
+        ("Second", "Missing", False),
+    ]
+    assert "Variable 'Unknown' not found" in outcomes[1].error
+    report = tmp_path / "results" / "First" / "Weight histogram.html"
+    assert outcomes[0].files == ["First/Weight histogram.html"]
+    assert "<img" in report.read_text(encoding="utf-8")
+
+    summary_df = pd.read_csv(tmp_path / "results" / "summary.csv")
+    assert summary_df["Status"].tolist() == ["OK", "Failed", "OK", "Failed"]
+    assert "First/Weight histogram.html" in (tmp_path / "results" / "index.html").read_text(encoding="utf-8")
+
+
+def test_run_batch_analyses_extension_raw_datatables(tmp_path, workspace_path):
+    jobs = [
+        {
+            "name": "Meals",
+            "processor": "drinkfeed_sequences",
+            "extension": "DrinkFeed",
+            "datatable": "drinkfeed_bin",
+            "settings": {"intermeal_interval": "00:01:00", "drinking_minimum_amount": 0.01, "diets": {"A2": 3.0}},
+        },
+        {
+            "name": "Intervals",
+            "processor": "drinkfeed_intervals",
+            "extension": "DrinkFeed",
+            "datatable": "drinkfeed_bin",
+            "settings": {"fixed_interval": "00:10:00"},
+        },
+        {"name": "Calo <&>", "processor": "calo_fitting", "extension": "Calo", "datatable": "calo_bin"},
+    ]
+    spec = parse_batch_spec(_spec_data(inputs=[workspace_path.name], jobs=jobs), tmp_path)
+    assert spec.jobs[0].extension == "DrinkFeed"
+
+    outcomes = run_batch(spec)
+
+    assert [(outcome.dataset, outcome.job, outcome.succeeded) for outcome in outcomes] == [
+        ("First", "Meals", True),
+        ("First", "Intervals", True),
+        ("First", "Calo <&>", False),
+        ("Second", "Meals", True),
+        ("Second", "Intervals", True),
+        ("Second", "Calo <&>", False),
+    ]
+    assert outcomes[0].files == ["First/Meals.html", "First/Meals - events.csv", "First/Meals - episodes.csv"]
+    episodes_df = pd.read_csv(tmp_path / "results" / "First" / "Meals - episodes.csv")
+    assert list(zip(episodes_df["Animal"], episodes_df["Sensor"], strict=True)) == [
+        ("A1", "Drink1"),
+        ("A2", "Feed1"),
+        ("A1", "Drink1"),
+        ("A2", "Feed1"),
+    ]
+    assert episodes_df["Quantity[kcal]"].tolist()[1] == pytest.approx(0.18)
+    intervals_df = pd.read_csv(tmp_path / "results" / "First" / "Intervals - intervals.csv")
+    assert intervals_df.groupby("Animal")["Drink1"].sum().tolist() == pytest.approx([0.07, 0.0])
+    assert outcomes[2].error == "ValueError: Datatable 'calo_bin' of extension 'Calo' not found"
+
+    # Names and errors are escaped in the index
+    index = (tmp_path / "results" / "index.html").read_text(encoding="utf-8")
+    assert "<td>Calo &lt;&amp;&gt;</td>" in index
+    assert "Calo <&>" not in index
+    assert "&#x27;calo_bin&#x27;" in index
+
+
+def test_cli_runs_datasets_in_worker_processes(tmp_path, workspace_path):
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(_spec_data(jobs=[_spec_data()["jobs"][0]])), encoding="utf-8")
+
+    assert main([str(spec_path), "--workers", "2", "--output", str(tmp_path / "out")]) == 0
+
+    assert (tmp_path / "out" / "First" / "Weight histogram.html").is_file()
+    assert (tmp_path / "out" / "Second" / "Weight histogram.html").is_file()
+    assert main([str(tmp_path / "missing.json")]) == 2
+    assert load_batch_spec(spec_path).max_workers == 1
+
+
+def test_run_batch_opens_legacy_pickled_workspaces(tmp_path, make_dataset):
+    with open(tmp_path / "legacy.workspace", "wb") as file:
+        pickle.dump(_make_workspace(make_dataset), file)
+    spec = parse_batch_spec(_spec_data(inputs=["*.workspace"], jobs=[_spec_data()["jobs"][0]]), tmp_path)
+
+    outcomes = run_batch(spec)
+
+    assert [(outcome.dataset, outcome.succeeded) for outcome in outcomes] == [("First", True), ("Second", True)]
+
+
+def test_run_batch_records_crashed_workers_as_failed_jobs(tmp_path, workspace_path):
+    class _BrokenExecutor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_exception(BrokenProcessPool("A process in the process pool was terminated abruptly"))
+            return future
+
+    spec = parse_batch_spec(_spec_data(max_workers=2), tmp_path)
+
+    with patch("tse_analytics.batch.runner.ProcessPoolExecutor", _BrokenExecutor):
+        outcomes = run_batch(spec)
+
+    assert [(outcome.dataset, outcome.job, outcome.succeeded) for outcome in outcomes] == [
+        ("First", "Weight histogram", False),
+        ("First", "Missing", False),
+        ("Second", "Weight histogram", False),
+        ("Second", "Missing", False),
+    ]
+    assert outcomes[0].error.startswith("BrokenProcessPool")
+    assert pd.read_csv(tmp_path / "results" / "summary.csv")["Status"].tolist() == ["Failed"] * 4
@@ -296,6 +296,40 @@ class TestDatasetClone:
         clone.rename("Cloned")
         assert sample_dataset.name != "Cloned"
 
+    def test_clone_with_reports_keeps_datatables_unloaded(self, sample_dataset, sample_datatable):
+        from tse_analytics.core.data.datatable import Datatable
+        from tse_analytics.core.data.report import Report
+
+        class _Source:
+            columns = sample_datatable.df.columns.tolist()
+
+            def read(self, columns=None):
+                return sample_datatable.df.copy()
+
+        sample_dataset.datatables["Main"] = Datatable(sample_dataset, "Main", "", {}, None, {}, df_source=_Source())
+        sample_dataset.add_report(Report(dataset=sample_dataset, name="R1", content="<p>x</p>"))
+        with patch("tse_analytics.core.data.dataset.messaging"):
+            clone = sample_dataset.clone()
+
+        assert not sample_dataset.datatables["Main"].is_loaded
+        assert not clone.datatables["Main"].is_loaded
+        assert clone.reports["R1"].dataset is clone
+        assert clone.reports["R1"].content == "<p>x</p>"
+
+    def test_clone_with_reports_shares_column_buffers(self, sample_dataset, sample_datatable):
+        from tse_analytics.core.data.report import Report
+        from tse_analytics.core.utils.memory import get_memory_usage
+
+        sample_dataset.add_report(Report(dataset=sample_dataset, name="R1", content="<p>x</p>"))
+        with patch("tse_analytics.core.data.dataset.messaging"):
+            clone = sample_dataset.clone()
+
+        # Every datatable reachable from the clone, including through its reports, shares the buffers
+        report_datatable = clone.reports["R1"].dataset.datatables["Main"]
+        usage = get_memory_usage([sample_datatable, report_datatable])
+        assert usage[report_datatable.id].shared_bytes > 0
+        assert usage[report_datatable.id].owned_bytes == 0
+
 
 class TestDatasetSetstate:
     """Tests for Dataset.__setstate__ (unpickling)."""
@@ -1,7 +1,9 @@
 """Tests for tse_analytics.core.data.datatable module."""
 
 from datetime import timedelta
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from tse_analytics.core.data.shared import (
@@ -151,6 +153,36 @@ class TestSetFactors:
         a2_groups = df[df["Animal"] == "A2"]["Group"].unique()
         assert "Treatment" in a2_groups
 
+    def test_reuses_unchanged_factor_columns(self, sample_datatable, sample_factor, monkeypatch):
+        from tse_analytics.core.data import datatable as datatable_module
+
+        applied = []
+        apply_factors = datatable_module.apply_factors
+        monkeypatch.setattr(
+            datatable_module,
+            "apply_factors",
+            lambda df, factors, dataset: applied.extend(factors) or apply_factors(df, factors, dataset),
+        )
+        sample_datatable.set_factors({"Group": sample_factor})
+        column = sample_datatable.df["Group"]
+
+        sample_datatable.set_factors({"Group": sample_factor}, ["Group"])
+        assert applied == ["Group"]
+        pd.testing.assert_series_equal(sample_datatable.df["Group"], column)
+
+        sample_factor.levels.popitem()
+        sample_datatable.set_factors({"Group": sample_factor}, ["Group"])
+        assert applied == ["Group", "Group"]
+
+        sample_datatable.mark_df_modified()
+        sample_datatable.set_factors({"Group": sample_factor}, ["Group"])
+        assert applied == ["Group", "Group", "Group"]
+
+    def test_does_not_copy_untouched_columns(self, sample_datatable, sample_factor):
+        datetimes = sample_datatable.df["DateTime"].to_numpy()
+        sample_datatable.set_factors({"Group": sample_factor})
+        assert np.shares_memory(sample_datatable.df["DateTime"].to_numpy(), datetimes)
+
 
 class TestGetFilteredDf:
     """Tests for Datatable.get_filtered_df."""
@@ -159,6 +191,13 @@ class TestGetFilteredDf:
         df = sample_datatable.get_filtered_df(["Animal", "Weight"])
         assert set(df.columns) == {"Animal", "Weight"}
 
+    def test_modifying_result_leaves_datatable_unchanged(self, sample_datatable):
+        df = sample_datatable.get_filtered_df(["Animal", "Weight"])
+        df.loc[0, "Weight"] = 999.0
+        df["Extra"] = 1
+        assert sample_datatable.df.loc[0, "Weight"] != 999.0
+        assert "Extra" not in sample_datatable.df.columns
+
 
 class TestDeleteVariables:
     """Tests for Datatable.delete_variables."""
@@ -205,6 +244,14 @@ class TestDatatableClone:
         clone.df.iloc[0, clone.df.columns.get_loc("Weight")] = 999.0
         assert sample_datatable.df.iloc[0, sample_datatable.df.columns.get_loc("Weight")] != 999.0
 
+    def test_shares_column_buffers_until_modified(self, sample_datatable):
+        clone = sample_datatable.clone()
+        assert np.shares_memory(clone.df["DateTime"].to_numpy(), sample_datatable.df["DateTime"].to_numpy())
+
+        clone.df.loc[0, "DateTime"] = pd.Timestamp("2000-01-01")
+        assert not np.shares_memory(clone.df["DateTime"].to_numpy(), sample_datatable.df["DateTime"].to_numpy())
+        assert sample_datatable.df.loc[0, "DateTime"] == pd.Timestamp("2024-01-01")
+
     def test_assigns_fresh_id(self, sample_datatable):
         clone = sample_datatable.clone()
         assert clone.id != sample_datatable.id
@@ -225,6 +272,144 @@ class TestDatatableClone:
         assert sample_datatable.outliers_settings.mode == OutliersMode.REMOVE
 
 
+class TestFingerprint:
+    """Tests for Datatable.fingerprint."""
+
+    def test_equal_content_has_equal_fingerprint(self, sample_datatable):
+        fingerprint = sample_datatable.fingerprint
+        assert sample_datatable.fingerprint == fingerprint
+        assert sample_datatable.clone().fingerprint == fingerprint
+
+        copied = sample_datatable.clone()
+        copied.df = sample_datatable.df.copy(deep=True)
+        assert copied.fingerprint == fingerprint
+
+    def test_changes_with_content(self, sample_datatable):
+        fingerprint = sample_datatable.fingerprint
+
+        sample_datatable.df.loc[0, "Weight"] = 99.0
+        sample_datatable.mark_df_modified()
+        assert sample_datatable.fingerprint != fingerprint
+
+        fingerprint = sample_datatable.fingerprint
+        sample_datatable.df = sample_datatable.df.head(3)
+        assert sample_datatable.fingerprint != fingerprint
+
+        fingerprint = sample_datatable.fingerprint
+        sample_datatable.df = sample_datatable.df.rename(columns={"Speed": "Velocity"})
+        assert sample_datatable.fingerprint != fingerprint
+
+    def test_changes_with_categories(self, sample_datatable):
+        fingerprints = set()
+        for dtype in (
+            pd.CategoricalDtype(["x", "y"]),
+            pd.CategoricalDtype(["x", "y", "z"]),
+            pd.CategoricalDtype(["y", "x"]),
+            pd.CategoricalDtype(["y", "x"], ordered=True),
+        ):
+            df = sample_datatable.df.copy()
+            df["Group"] = pd.Categorical(["x", "y"] * (len(df) // 2) + ["x"] * (len(df) % 2), dtype=dtype)
+            sample_datatable.df = df
+            fingerprints.add(sample_datatable.fingerprint)
+        assert len(fingerprints) == 4
+
+    def test_rehashes_replaced_columns_only(self, sample_datatable):
+        from tse_analytics.core.data import datatable as datatable_module
+
+        _ = sample_datatable.fingerprint
+        df = sample_datatable.df.copy(deep=False)
+        df["Weight"] = df["Weight"] * 2
+        sample_datatable.df = df
+
+        with patch.object(datatable_module, "_column_hash", wraps=datatable_module._column_hash) as column_hash:
+            _ = sample_datatable.fingerprint
+        assert column_hash.call_count == 1
+
+        sample_datatable.mark_df_modified()
+        with patch.object(datatable_module, "_column_hash", wraps=datatable_module._column_hash) as column_hash:
+            _ = sample_datatable.fingerprint
+        assert column_hash.call_count == len(df.columns)
+
+    def test_unloaded_frame_is_hashed_from_its_source(self, sample_datatable):
+        from tse_analytics.core.data.datatable import Datatable
+
+        class _Source:
+            def __init__(self, df):
+                self.df = df
+                self.reads = []
+
+            @property
+            def columns(self):
+                return self.df.columns.tolist()
+
+            def read(self, columns=None):
+                self.reads.append(columns)
+                return self.df if columns is None else self.df[columns]
+
+        source = _Source(sample_datatable.df)
+        lazy = Datatable(sample_datatable.dataset, "Lazy", "", sample_datatable.variables, None, {}, df_source=source)
+
+        assert lazy.fingerprint == sample_datatable.fingerprint
+        assert not lazy.is_loaded
+        assert None not in source.reads
+
+        _ = lazy.df
+        with patch("tse_analytics.core.data.datatable._column_hash") as column_hash:
+            assert lazy.fingerprint == sample_datatable.fingerprint
+        column_hash.assert_not_called()
+
+
+class TestDatatablePickle:
+    """Tests for pickling datatables (legacy ``.workspace`` files)."""
+
+    def test_lazy_frame_is_pickled_without_loading(self, sample_datatable):
+        import pickle
+
+        from tse_analytics.core.data.datatable import Datatable
+
+        class _Source:
+            columns = sample_datatable.df.columns.tolist()
+
+            def read(self, columns=None):
+                return sample_datatable.df.copy()
+
+        lazy = Datatable(sample_datatable.dataset, "Lazy", "", {}, None, {}, df_source=_Source())
+
+        restored = pickle.loads(pickle.dumps(lazy))
+
+        assert not lazy.is_loaded
+        assert restored.is_loaded
+        pd.testing.assert_frame_equal(restored.df, sample_datatable.df)
+
+    def test_unpickles_state_from_before_lazy_loading(self, sample_datatable):
+        from tse_analytics.core.data.datatable import Datatable
+
+        state = {
+            key: value
+            for key, value in sample_datatable.__dict__.items()
+            if key
+            not in (
+                "_df",
+                "_df_source",
+                "persisted_table",
+                "persisted_meta_hash",
+                "revision",
+                "_factor_keys",
+                "_factor_keys_revision",
+                "_column_hashes",
+            )
+        }
+        state["df"] = sample_datatable.df
+
+        restored = Datatable.__new__(Datatable)
+        restored.__setstate__(state)
+
+        assert restored.df is sample_datatable.df
+        assert restored.persisted_table is None
+        assert restored.revision == 0
+        assert restored.fingerprint == sample_datatable.fingerprint
+
+
 class TestApplyByTimeInterval:
     """Tests for the BY_TIME_INTERVAL factor applier."""
 
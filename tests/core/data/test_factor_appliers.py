@@ -112,6 +112,22 @@ class TestByAnimalApplier:
         a3_values = time_df.loc[time_df["Animal"] == "A3", "Partial"]
         assert a3_values.isna().all()
 
+    def test_maps_categorical_animal_codes(self, stub_dataset):
+        df = pd.DataFrame({"Animal": pd.Categorical(["A2", None, "A1", "A9"], categories=["A9", "A1", "A2", "A0"])})
+        factor = Factor(
+            name="Group",
+            config=ByAnimalConfig(),
+            role=FactorRole.BETWEEN_SUBJECT,
+            levels={
+                "trt": FactorLevel(name="trt", color="#000", animal_ids=["A2"]),
+                "Ctrl": FactorLevel(name="Ctrl", color="#000", animal_ids=["A1"]),
+            },
+        )
+        _apply_by_animal(df, factor, stub_dataset)
+
+        assert df["Group"].cat.categories.tolist() == ["Ctrl", "trt"]
+        assert df["Group"].cat.codes.tolist() == [1, -1, 0, -1]
+
 
 class TestByAnimalPropertyApplier:
     def test_derives_levels_from_animal_property(self, time_df, stub_dataset):
@@ -172,6 +188,22 @@ class TestByTimeOfDayApplier:
         assert time_df.loc[time_df["DateTime"].dt.hour == 6, "LightCycle"].unique().tolist() == ["Light"]
         assert set(time_df.loc[time_df["DateTime"].dt.hour.isin([7, 8, 9]), "LightCycle"]) == {"Dark"}
 
+    @pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+    def test_matches_wall_clock_times(self, unit, stub_dataset):
+        datetimes = pd.Series(
+            pd.to_datetime(["1969-12-31 07:00:00.000", "2024-01-01 06:59:59.999", "2024-01-01 19:00:00.000", None])
+        ).dt.as_unit(unit)
+        df = pd.DataFrame({"DateTime": datetimes.dt.tz_localize("Europe/Berlin")})
+        factor = Factor(
+            name="LC",
+            role=FactorRole.WITHIN_SUBJECT,
+            config=ByTimeOfDayConfig(light_cycle_start=time(6, 59, 59, 999001), dark_cycle_start=time(19, 0)),
+        )
+        _apply_by_time_of_day(df, factor, stub_dataset)
+
+        # The boundary lies between two milliseconds; NaT counts as dark like a missing time did
+        assert df["LC"].tolist() == ["Light", "Dark", "Dark", "Dark"]
+
     def test_skips_when_datetime_column_missing(self, stub_dataset):
         df = pd.DataFrame({"Animal": ["A1", "A2"]})
         factor = Factor(
@@ -0,0 +1,164 @@
+"""Tests for the out-of-core dataset merge (``core/io/merge_store`` via ``merge_datasets``)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.core.data.dataset import Dataset
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.data.shared import Aggregation, Animal, Variable
+from tse_analytics.core.data.workspace import Workspace
+from tse_analytics.core.io.merge_store import create_temporary_store_path, release_temporary_stores
+from tse_analytics.core.io.storage import DuckDBTableSource, load_workspace, save_workspace
+from tse_analytics.core.utils.data_merger import merge_datasets
+
+
+def _make_trial(name: str, start: str, hours: int = 4) -> Dataset:
+    start = pd.Timestamp(start)
+    metadata = {
+        "name": name,
+        "experiment_started": str(start),
+        "experiment_stopped": str(start + pd.Timedelta(hours=hours)),
+        "animals": {},
+    }
+    animals = {animal_id: Animal(id=animal_id, properties={}) for animal_id in ("A1", "A2")}
+    with patch("tse_analytics.core.data.dataset.messaging"):
+        dataset = Dataset(name=name, description="", dataset_type="PhenoMaster", metadata=metadata, animals=animals)
+
+    timestamps = pd.date_range(start, periods=hours, freq="h").repeat(2)
+    df = pd.DataFrame({
+        "Animal": pd.Categorical(["A1", "A2"] * hours),
+        "DateTime": timestamps,
+        "Timedelta": timestamps - start,
+        "Box": pd.Categorical([f"{name}-1", f"{name}-2"] * hours),
+        "Weight": pd.array(np.arange(2 * hours, dtype=float), dtype="Float64"),
+    })
+    variables = {"Weight": Variable("Weight", "g", "Body weight", "float", Aggregation.MEAN, False)}
+    dataset.add_datatable(Datatable(dataset, "Main", "", variables, df, {"sample_interval": pd.Timedelta("1h")}))
+
+    raw_df = pd.DataFrame({
+        "StartDateTime": timestamps,
+        "Timedelta": timestamps - start,
+        "Animal": pd.Categorical(["A2", "A1"] * hours),
+        "Channel": pd.array(range(2 * hours), dtype="Int64"),
+    })
+    raw_datatable = Datatable(dataset, "Reads", "", {}, raw_df, {"animal_ids": ["A1", "A2"], "origin_path": "x"})
+    dataset.add_raw_datatable("GroupHousing", raw_datatable)
+    return dataset
+
+
+def _trials() -> list[Dataset]:
+    return [_make_trial("B", "2024-01-02 06:00"), _make_trial("A", "2024-01-01 06:00")]
+
+
+@pytest.mark.parametrize(
+    ("single_trial", "continuous_mode", "generate_new_animal_names"),
+    [(False, True, False), (True, True, False), (False, False, True), (False, False, False)],
+)
+def test_out_of_core_merge_matches_in_memory_merge(tmp_path, single_trial, continuous_mode, generate_new_animal_names):
+    expected = merge_datasets("M", _trials(), single_trial, continuous_mode, generate_new_animal_names)
+    merged = merge_datasets(
+        "M", _trials(), single_trial, continuous_mode, generate_new_animal_names, store_path=str(tmp_path / "m.duckdb")
+    )
+
+    assert merged.factors == expected.factors
+    assert merged.metadata == expected.metadata
+    for get_datatable in (lambda ds: ds.datatables["Main"], lambda ds: ds.raw_datatables["GroupHousing"]["Reads"]):
+        datatable = get_datatable(merged)
+        assert isinstance(datatable.df_source, DuckDBTableSource)
+        assert datatable.metadata == get_datatable(expected).metadata
+        # DuckDB normalizes dtypes like a lazily loaded workspace does (ENUM -> category, DOUBLE -> float64)
+        pd.testing.assert_frame_equal(
+            datatable.df, get_datatable(expected).df, check_dtype=False, check_categorical=False
+        )
+        assert datatable.df["Animal"].dtype == "category"
+
+
+def test_out_of_core_merge_leaves_sources_unchanged(tmp_path):
+    trials = _trials()
+    originals = {trial.name: trial.datatables["Main"].df.copy() for trial in trials}
+
+    merged = merge_datasets("M", trials, False, False, True, store_path=str(tmp_path / "m.duckdb"))
+
+    assert sorted(merged.animals) == ["A1_1", "A1_2", "A2_1", "A2_2"]
+    for trial in trials:
+        pd.testing.assert_frame_equal(trial.datatables["Main"].df, originals[trial.name])
+        assert [(animal_id, animal.id) for animal_id, animal in trial.animals.items()] == [("A1", "A1"), ("A2", "A2")]
+
+
+def test_in_memory_merge_keeps_saved_sources_consistent(tmp_path):
+    path = str(tmp_path / "ws.duckdb")
+    workspace = Workspace(name="W")
+    for trial in _trials():
+        workspace.datasets[trial.id] = trial
+    save_workspace(path, workspace)
+    loaded = load_workspace(path)
+    trials = list(loaded.datasets.values())
+    originals = {trial.name: trial.datatables["Main"].df.copy() for trial in trials}
+
+    merged = merge_datasets("M", trials, False, False, True)
+    loaded.datasets[merged.id] = merged
+    save_workspace(path, loaded, incremental=True)
+
+    for trial in trials:
+        pd.testing.assert_frame_equal(trial.datatables["Main"].df, originals[trial.name])
+    reloaded = load_workspace(path)
+    for trial in trials:
+        reloaded_trial = reloaded.datasets[trial.id]
+        assert list(reloaded_trial.animals) == ["A1", "A2"]
+        df = reloaded_trial.datatables["Main"].df
+        assert "Trial" not in df.columns
+        assert sorted(df["Animal"].unique()) == ["A1", "A2"]
+    assert sorted(reloaded.datasets[merged.id].datatables["Main"].df["Animal"].unique()) == [
+        "A1_1",
+        "A1_2",
+        "A2_1",
+        "A2_2",
+    ]
+
+
+def test_out_of_core_merge_copies_unloaded_sources_without_reading_them(tmp_path):
+    workspace = Workspace(name="W")
+    for trial in _trials():
+        workspace.datasets[trial.id] = trial
+    save_workspace(str(tmp_path / "ws.duckdb"), workspace)
+    trials = list(load_workspace(str(tmp_path / "ws.duckdb"), lazy=True).datasets.values())
+
+    merged = merge_datasets("M", trials, False, True, False, store_path=str(tmp_path / "m.duckdb"))
+
+    assert not any(trial.datatables["Main"].is_loaded for trial in trials)
+    assert merged.datatables["Main"].df["Trial"].tolist() == ["Trial 0"] * 8 + ["Trial 1"] * 8
+
+
+def test_temporary_store_is_deleted_once_unreferenced(tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    store_path = create_temporary_store_path()
+    merged = merge_datasets("M", _trials(), False, True, False, store_path=store_path)
+    workspace = Workspace(name="W")
+    workspace.datasets[merged.id] = merged
+
+    release_temporary_stores(merged.datatables.values())
+    assert Path(store_path).exists()
+
+    # Saving rebinds the merged datatables to the workspace file
+    save_workspace(str(tmp_path / "ws.duckdb"), workspace)
+    release_temporary_stores(merged.datatables.values())
+    assert not Path(store_path).exists()
+    assert len(merged.datatables["Main"].df) == 16
+
+
+def test_merge_store_streams_in_chunks(tmp_path):
+    with patch("tse_analytics.core.io.merge_store.CHUNK_VECTORS", 1):
+        trials = [_make_trial("B", "2024-01-02 06:00", 1500), _make_trial("A", "2024-01-01 06:00", 1500)]
+        expected = merge_datasets("M", _copy_trials(trials), False, True, False)
+        merged = merge_datasets("M", trials, False, True, False, store_path=str(tmp_path / "m.duckdb"))
+
+    df = merged.datatables["Main"].df
+    assert len(df) == 6000
+    pd.testing.assert_frame_equal(df, expected.datatables["Main"].df, check_dtype=False, check_categorical=False)
+
+
+def _copy_trials(trials: list[Dataset]) -> list[Dataset]:
+    return [trial.clone() for trial in trials]
@@ -0,0 +1,78 @@
+"""Equivalence tests for the DuckDB push-down query layer (``core/io/query``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.core.data.outliers import OutliersMode, OutliersSettings, OutliersType
+from tse_analytics.core.data.workspace import Workspace
+from tse_analytics.core.io.query import query_datatable
+from tse_analytics.core.io.storage import load_workspace, save_workspace
+
+
+@pytest.fixture
+def datatable(make_dataset):
+    dataset = make_dataset()
+    datatable = dataset.datatables["Main"]
+    rng = np.random.default_rng(0)
+    weights = rng.normal(25.0, 1.0, 40)
+    weights[[3, 17]] = [60.0, -10.0]
+    datatable.df = pd.DataFrame({
+        "Animal": pd.Categorical(["A1", "A2"] * 20),
+        "Group": pd.Categorical(["Control", "Treatment"] * 20),
+        "Weight": pd.array(weights, dtype="Float64"),
+    })
+    datatable.variables["Weight"].remove_outliers = True
+    return datatable
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("string")
+        elif pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = df[column].astype("Float64")
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("outliers_type", [OutliersType.IQR, OutliersType.ZSCORE, OutliersType.THRESHOLDS])
+def test_projection_matches_get_filtered_df(datatable, outliers_type):
+    datatable.outliers_settings = OutliersSettings(
+        mode=OutliersMode.REMOVE,
+        type=outliers_type,
+        min_threshold_enabled=True,
+        min_threshold=0.0,
+    )
+    columns = ["Animal", "Weight"]
+
+    expected = datatable.get_filtered_df(columns)
+    result = query_datatable(datatable, columns)
+
+    pd.testing.assert_frame_equal(_sorted(result), _sorted(expected))
+
+
+def test_grouped_filtered_query_matches_pandas(datatable):
+    datatable.outliers_settings = OutliersSettings(mode=OutliersMode.REMOVE, type=OutliersType.IQR)
+    columns = ["Animal", "Group", "Weight"]
+
+    df = datatable.get_filtered_df(columns)
+    df = df[df["Group"].isin(["Treatment"])]
+    expected = df.groupby(["Animal", "Group"], dropna=False, observed=True).aggregate({"Weight": "mean"}).reset_index()
+    result = query_datatable(datatable, columns, filters={"Group": ["Treatment"]}, group_by=["Animal", "Group"])
+
+    pd.testing.assert_frame_equal(_sorted(result), _sorted(expected))
+
+
+def test_query_on_lazy_datatable_does_not_materialize(tmp_path, datatable):
+    workspace = Workspace(name="WS")
+    workspace.datasets[datatable.dataset.id] = datatable.dataset
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, workspace)
+
+    lazy_datatable = next(iter(load_workspace(path, lazy=True).datasets.values())).datatables["Main"]
+    result = query_datatable(lazy_datatable, ["Animal", "Weight"], group_by=["Animal"])
+
+    assert lazy_datatable.is_loaded is False
+    assert result["Animal"].astype("string").tolist() == ["A1", "A2"]
+    expected = datatable.df.groupby("Animal", observed=True)["Weight"].mean()
+    assert result["Weight"].tolist() == pytest.approx(expected.astype("float").tolist())
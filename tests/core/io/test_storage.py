@@ -85,3 +85,196 @@ def test_save_overwrites_existing_file(tmp_path, make_dataset):
 
     loaded = load_workspace(path)
     assert len(loaded.datasets) == 1
+
+
+def test_lazy_load_defers_dataframes(tmp_path, make_dataset):
+    dataset = make_dataset()
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, _workspace_with(dataset))
+
+    loaded = load_workspace(path, lazy=True)
+    loaded_dt = next(iter(loaded.datasets.values())).datatables["Main"]
+
+    assert loaded_dt.is_loaded is False
+    assert loaded_dt.columns == ["Animal", "DateTime", "Timedelta", "Weight"]
+    assert loaded_dt.is_timeseries is True
+    assert loaded_dt.is_loaded is False
+
+    assert sorted(loaded_dt.df["Weight"].astype("float").tolist()) == [25.0, 25.5, 26.0, 26.5]
+    assert loaded_dt.is_loaded is True
+    assert loaded_dt.df_source is None
+
+
+def test_lazy_filtered_df_reads_only_requested_columns(tmp_path, make_dataset):
+    dataset = make_dataset()
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, _workspace_with(dataset))
+
+    loaded_dt = next(iter(load_workspace(path, lazy=True).datasets.values())).datatables["Main"]
+    df = loaded_dt.get_filtered_df(["Animal", "Weight"])
+
+    assert list(df.columns) == ["Animal", "Weight"]
+    assert len(df) == 4
+    assert loaded_dt.is_loaded is False
+
+
+def test_lazy_workspace_can_be_saved_over_its_own_file(tmp_path, make_dataset):
+    dataset = make_dataset()
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, _workspace_with(dataset))
+
+    loaded = load_workspace(path, lazy=True)
+    save_workspace(path, loaded)  # unloaded tables are copied from the file being replaced
+
+    loaded_dt = next(iter(loaded.datasets.values())).datatables["Main"]
+    assert loaded_dt.is_loaded is False
+    assert len(loaded_dt.df) == 4
+
+    reloaded_dt = next(iter(load_workspace(path).datasets.values())).datatables["Main"]
+    assert sorted(reloaded_dt.df["Weight"].astype("float").tolist()) == [25.0, 25.5, 26.0, 26.5]
+
+
+def _df_tables(path) -> set[str]:
+    import duckdb
+
+    con = duckdb.connect(path, read_only=True)
+    try:
+        rows = con.execute("SELECT table_name FROM duckdb_tables()").fetchall()
+    finally:
+        con.close()
+    return {row[0] for row in rows if row[0].startswith("df__")}
+
+
+def test_incremental_save_rewrites_only_modified_datatables(tmp_path, make_dataset, monkeypatch):
+    import pandas as pd
+    from tse_analytics.core.data.datatable import Datatable
+    from tse_analytics.core.io import storage
+
+    dataset = make_dataset()
+    extra_df = pd.DataFrame({"Animal": pd.Categorical(["A1"]), "Value": pd.array([1.0], dtype="Float64")})
+    dataset.datatables["Extra"] = Datatable(dataset, "Extra", "", {}, extra_df, {})
+    ws = _workspace_with(dataset)
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, ws)
+
+    written = []
+    original_save_dataframe = storage._save_dataframe
+    monkeypatch.setattr(
+        storage,
+        "_save_dataframe",
+        lambda con, table_name, df: written.append(table_name) or original_save_dataframe(con, table_name, df),
+    )
+
+    save_workspace(path, ws, incremental=True)
+    assert written == []
+
+    dataset.datatables["Extra"].df = extra_df.assign(Value=pd.array([2.0], dtype="Float64"))
+    dataset.reports["R1"].content = "<p>updated</p>"
+    save_workspace(path, ws, incremental=True)
+    assert len(written) == 1 and written[0].startswith("df__Extra__")
+
+    loaded_ds = next(iter(load_workspace(path).datasets.values()))
+    assert loaded_ds.datatables["Extra"].df["Value"].astype("float").tolist() == [2.0]
+    assert loaded_ds.reports["R1"].content == "<p>updated</p>"
+    assert len(loaded_ds.datatables["Main"].df) == 4
+
+
+def test_incremental_save_drops_removed_and_renames_tables(tmp_path, make_dataset):
+    dataset = make_dataset()
+    ws = _workspace_with(dataset)
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, ws)
+
+    loaded = load_workspace(path, lazy=True)
+    loaded_ds = next(iter(loaded.datasets.values()))
+    datatable = loaded_ds.datatables.pop("Main")
+    datatable.name = "Renamed"
+    loaded_ds.datatables["Renamed"] = datatable
+    save_workspace(path, loaded, incremental=True)
+
+    assert len(_df_tables(path)) == 1
+    reloaded_ds = next(iter(load_workspace(path).datasets.values()))
+    assert list(reloaded_ds.datatables) == ["Renamed"]
+    assert len(reloaded_ds.datatables["Renamed"].df) == 4
+
+    reloaded = load_workspace(path)
+    next(iter(reloaded.datasets.values())).datatables.clear()
+    save_workspace(path, reloaded, incremental=True)
+    assert _df_tables(path) == set()
+    assert next(iter(load_workspace(path).datasets.values())).datatables == {}
+
+
+def test_incremental_save_keeps_tables_shared_with_lazy_clones(tmp_path, make_dataset):
+    dataset = make_dataset()
+    dataset.reports.clear()
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, _workspace_with(dataset))
+
+    # The clone still reads the original's table, which the save replaces
+    loaded = load_workspace(path, lazy=True)
+    original = next(iter(loaded.datasets.values()))
+    clone = original.clone()
+    loaded.datasets[clone.id] = clone
+    original.datatables["Main"].df = original.datatables["Main"].df.iloc[:1].copy()
+    save_workspace(path, loaded, incremental=True)
+
+    reloaded = load_workspace(path)
+    assert len(reloaded.datasets[original.id].datatables["Main"].df) == 1
+    assert len(reloaded.datasets[clone.id].datatables["Main"].df) == 4
+
+    # ... and renames
+    loaded = load_workspace(path, lazy=True)
+    original = loaded.datasets[original.id]
+    clone = original.clone()
+    loaded.datasets[clone.id] = clone
+    original.datatables["Renamed"] = original.datatables.pop("Main")
+    original.datatables["Renamed"].name = "Renamed"
+    save_workspace(path, loaded, incremental=True)
+
+    reloaded = load_workspace(path)
+    assert len(reloaded.datasets[original.id].datatables["Renamed"].df) == 1
+    assert len(reloaded.datasets[clone.id].datatables["Main"].df) == 1
+
+
+def _report_images(path) -> int:
+    import duckdb
+
+    con = duckdb.connect(path, read_only=True)
+    try:
+        return con.execute("SELECT count(*) FROM _meta_report_images").fetchone()[0]
+    finally:
+        con.close()
+
+
+def test_report_images_are_stored_once_as_blobs(tmp_path, make_dataset):
+    import base64
+
+    import duckdb
+    from tse_analytics.core.data.report import Report
+
+    image = f"<img src='data:image/png;base64,{base64.b64encode(b'png-bytes').decode()}'><br>"
+    other_image = f"<img src='data:image/png;base64,{base64.b64encode(b'other-bytes').decode()}'><br>"
+    dataset = make_dataset()
+    dataset.reports["R1"].content = f"<p>report</p>{image}{image}"
+    dataset.reports["R2"] = Report(dataset, "R2", f"{image}{other_image}")
+    ws = _workspace_with(dataset)
+    path = str(tmp_path / "ws.duckdb")
+    save_workspace(path, ws)
+
+    assert _report_images(path) == 2
+    con = duckdb.connect(path, read_only=True)
+    try:
+        stored = [row[0] for row in con.execute("SELECT content FROM _meta_reports").fetchall()]
+    finally:
+        con.close()
+    assert all("base64" not in content and "tse-image:" in content for content in stored)
+
+    loaded_ds = next(iter(load_workspace(path).datasets.values()))
+    assert loaded_ds.reports["R1"].content == f"<p>report</p>{image}{image}"
+    assert loaded_ds.reports["R2"].content == f"{image}{other_image}"
+
+    # Images no report refers to any more are dropped
+    dataset.reports.pop("R2")
+    save_workspace(path, ws, incremental=True)
+    assert _report_images(path) == 1
+    assert next(iter(load_workspace(path).datasets.values())).reports["R1"].content == f"<p>report</p>{image}{image}"
@@ -25,6 +25,17 @@ class _Other(Message):
     pass
 
 
+class _Keyed(Message):
+    """A message coalesced by its payload."""
+
+    def __init__(self, sender, payload):
+        super().__init__(sender)
+        self.payload = payload
+
+    def coalesce_key(self):
+        return self.payload
+
+
 class _Recorder(MessengerListener):
     """A listener that records every message it is notified about."""
 
@@ -162,6 +173,37 @@ def test_delay_callbacks_queues_then_flushes(messenger, recorder):
     assert len(recorder.received) == 2  # flushed on exit
 
 
+def test_delay_callbacks_coalesces_redundant_messages(messenger, recorder):
+    messenger.subscribe(recorder, Message, recorder.notify)
+    first_a, b, other, last_a = _Keyed("1", "a"), _Keyed("2", "b"), _Base("3"), _Keyed("4", "a")
+    unkeyed = _Base("5")
+    with messenger.delay_callbacks(coalesce=True):
+        for message in (first_a, b, other, last_a, unkeyed):
+            messenger.broadcast(message)
+    # the last message per (type, key) is kept in place; messages without a key are all kept
+    assert recorder.received == [b, other, last_a, unkeyed]
+
+
+def test_delay_callbacks_without_coalescing_keeps_duplicates(messenger, recorder):
+    messenger.subscribe(recorder, _Keyed, recorder.notify)
+    with messenger.delay_callbacks():
+        messenger.broadcast(_Keyed("1", "a"))
+        messenger.broadcast(_Keyed("2", "a"))
+    assert len(recorder.received) == 2
+
+
+def test_nested_delay_callbacks_flush_on_outermost_exit(messenger, recorder):
+    messenger.subscribe(recorder, _Keyed, recorder.notify)
+    with messenger.delay_callbacks():
+        messenger.broadcast(_Keyed("1", "a"))
+        with messenger.delay_callbacks(coalesce=True):
+            messenger.broadcast(_Keyed("2", "a"))
+        assert recorder.received == []  # still queued by the outer block
+    assert [message.sender for message in recorder.received] == ["2"]
+    messenger.broadcast(_Keyed("3", "a"))  # delivered directly after the flush
+    assert len(recorder.received) == 2
+
+
 def test_ignore_callbacks_suppresses_only_that_type(messenger, recorder):
     messenger.subscribe(recorder, _Base, recorder.notify)
     messenger.subscribe(recorder, _Other, recorder.notify)
@@ -173,6 +215,48 @@ def test_ignore_callbacks_suppresses_only_that_type(messenger, recorder):
     assert len(recorder.received) == 2
 
 
+# --- dispatch cache ----------------------------------------------------------
+
+
+def test_dispatch_follows_subscription_changes(messenger, recorder):
+    calls: list[str] = []
+    messenger.subscribe(recorder, _Base, lambda m: calls.append("base"))
+    messenger.broadcast(_Derived("x"))
+
+    messenger.subscribe(recorder, _Derived, lambda m: calls.append("derived"))
+    messenger.broadcast(_Derived("x"))
+
+    messenger.unsubscribe(recorder, _Derived)
+    messenger.broadcast(_Derived("x"))
+
+    other = _Recorder()
+    messenger.subscribe(other, _Base, other.notify)
+    messenger.broadcast(_Derived("x"))
+    assert calls == ["base", "derived", "base", "base"]
+    assert len(other.received) == 1
+
+    messenger.unsubscribe_all(recorder)
+    messenger.broadcast(_Derived("x"))
+    assert calls == ["base", "derived", "base", "base"]
+
+
+def test_dispatch_falls_back_when_handler_is_collected(messenger, recorder):
+    class _Handler:
+        def handle(self, message):
+            recorder.received.append("collected")
+
+    handler = _Handler()
+    messenger.subscribe(recorder, _Base, recorder.notify)
+    messenger.subscribe(recorder, _Derived, handler.handle)
+    messenger.broadcast(_Derived("x"))
+    del handler
+    gc.collect()
+
+    message = _Derived("x")
+    messenger.broadcast(message)
+    assert recorder.received == ["collected", message]
+
+
 # --- constructor registration ------------------------------------------------
 
 
@@ -0,0 +1,100 @@
+"""Tests for the columnar PandasModel."""
+
+import pandas as pd
+import pytest
+from PySide6.QtCore import Qt
+from tse_analytics.core.data.outliers import OutliersMode, OutliersSettings, OutliersType
+from tse_analytics.core.models.pandas_model import PandasModel
+
+
+@pytest.fixture
+def datatable(make_dataset):
+    datatable = make_dataset().datatables["Main"]
+    datatable.variables["Weight"].remove_outliers = True
+    return datatable
+
+
+def _display(model, row, column):
+    return model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole)
+
+
+def _is_highlighted(model, row, column):
+    return model.data(model.index(row, column), Qt.ItemDataRole.BackgroundRole) == PandasModel.outlier_color
+
+
+def test_display_matches_cell_formatting(qapp, datatable):
+    df = datatable.df.copy()
+    df.loc[1, "Weight"] = pd.NA
+    model = PandasModel(df, datatable)
+
+    for row in range(len(df)):
+        for column in range(len(df.columns)):
+            assert _display(model, row, column) == str(df.iat[row, column])
+
+
+def test_rows_are_fetched_in_batches(qapp, datatable, monkeypatch):
+    monkeypatch.setattr(PandasModel, "fetch_size", 3)
+    model = PandasModel(datatable.df.copy(), datatable)
+
+    assert model.rowCount() == 3
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 4
+    assert not model.canFetchMore()
+
+
+def test_formatted_blocks_are_evicted(qapp, datatable, monkeypatch):
+    monkeypatch.setattr(PandasModel, "block_size", 1)
+    monkeypatch.setattr(PandasModel, "cache_blocks", 2)
+    model = PandasModel(datatable.df.copy(), datatable)
+
+    for row in range(4):
+        _display(model, row, 3)
+
+    assert list(model._blocks) == [2, 3]
+    assert _display(model, 0, 3) == "25.0"
+
+
+@pytest.mark.parametrize(
+    ("settings", "expected"),
+    [
+        (OutliersSettings(OutliersMode.HIGHLIGHT, OutliersType.IQR, iqr_multiplier=1.5), [False] * 7 + [True]),
+        (
+            OutliersSettings(
+                OutliersMode.HIGHLIGHT,
+                OutliersType.THRESHOLDS,
+                min_threshold_enabled=True,
+                min_threshold=25.2,
+                max_threshold_enabled=True,
+                max_threshold=26.0,
+            ),
+            [True, False, False, True, False, False, False, True],
+        ),
+    ],
+)
+def test_outliers_are_highlighted(qapp, datatable, settings, expected):
+    datatable.outliers_settings = settings
+    df = pd.DataFrame({
+        "Animal": ["A1"] * 8,
+        "Weight": pd.array([25.0, 25.5, 25.6, 26.5, 25.4, 25.5, pd.NA, 40.0], dtype="Float64"),
+    })
+    model = PandasModel(df, datatable)
+
+    assert [_is_highlighted(model, row, 1) for row in range(len(df))] == expected
+    assert not any(_is_highlighted(model, row, 0) for row in range(len(df)))
+
+
+def test_set_data_updates_display_and_outliers(qapp, datatable):
+    datatable.outliers_settings = OutliersSettings(
+        OutliersMode.HIGHLIGHT, OutliersType.THRESHOLDS, max_threshold_enabled=True, max_threshold=26.0
+    )
+    df = datatable.df.copy()
+    model = PandasModel(df, datatable)
+    assert _display(model, 3, 3) == "26.5"
+    assert _is_highlighted(model, 3, 3)
+
+    assert model.setData(model.index(3, 3), pd.NA)
+
+    assert _display(model, 3, 3) == "<NA>"
+    assert not _is_highlighted(model, 3, 3)
+    assert datatable.df.at[3, "Weight"] is pd.NA
@@ -36,6 +36,21 @@ def test_remove_dataset(qapp, recorder, make_dataset):
     assert dataset.id not in ws.get_workspace().datasets
 
 
+def test_out_of_core_merge_store_is_deleted_with_the_merged_dataset(
+    qapp, recorder, make_dataset, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    svc, ws = _services()
+    datasets = [make_dataset("A"), make_dataset("B")]
+
+    svc.merge_datasets("M", datasets, False, True, False, out_of_core=True)
+
+    (store_path,) = tmp_path.glob("tse-analytics-merge-*.duckdb")
+    (merged,) = [dataset for dataset in ws.get_workspace().datasets.values() if dataset.name == "M"]
+    svc.remove_dataset(merged)
+    assert not store_path.exists()
+
+
 def test_clone_dataset_adds_independent_copy(qapp, recorder, make_dataset):
     svc, ws = _services()
     dataset = make_dataset("Original")
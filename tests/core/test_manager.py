@@ -209,7 +209,7 @@ class TestSaveWorkspace:
         with patch("tse_analytics.core.services.workspace_service._save_to_duckdb") as mock_save:
             manager.save_workspace("test_path.duckdb")
 
-            mock_save.assert_called_once_with("test_path.duckdb", manager.get_workspace())
+            mock_save.assert_called_once_with("test_path.duckdb", manager.get_workspace(), incremental=True)
 
     def test_saves_workspace_to_legacy_pickle(self, manager):
         """Test that save_workspace saves to legacy pickle when .workspace extension."""
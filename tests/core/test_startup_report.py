@@ -0,0 +1,30 @@
+"""Tests for the startup import-time report (``core/startup_report.py``)."""
+
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+from tse_analytics.core import startup_report
+
+
+def test_report_lists_deferred_packages_and_loaded_plugins():
+    from tse_analytics.toolbox import PLUGINS
+
+    plugin = PLUGINS[0]
+    with patch.dict(sys.modules, {"umap": ModuleType("umap"), plugin.module_name: ModuleType("widget")}):
+        report = startup_report.get_startup_report()
+
+    assert "umap" in report.deferred_packages
+    assert plugin.label in report.loaded_plugins
+    assert report.seconds > 0 and report.module_count > 0
+
+
+def test_log_warns_about_deferred_packages():
+    messages = []
+    with (
+        patch.dict(sys.modules, {"sklearn": ModuleType("sklearn")}),
+        patch.object(startup_report.logger, "warning", messages.append),
+    ):
+        startup_report.log_startup_report()
+
+    assert any("sklearn" in message for message in messages)
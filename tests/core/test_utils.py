@@ -6,6 +6,7 @@ from datetime import time
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from matplotlib.figure import Figure
@@ -20,8 +21,11 @@ from tse_analytics.core.utils import (
     get_html_table,
     get_save_file_name,
     get_widget_tool_button,
+    render_html_sections,
+    rendering,
     time_to_float,
 )
+from tse_analytics.core.utils.data import reassign_df_timedelta
 
 
 class TestGetHtmlImageFromFigure:
@@ -64,6 +68,97 @@ class TestGetHtmlImageFromFigure:
         assert result1 != result2
 
 
+def _line_figure(values: list[float]) -> Figure:
+    figure = Figure(figsize=(3, 2))
+    ax = figure.add_subplot(111)
+    ax.plot(values)
+    ax.set_title("Line")
+    return figure
+
+
+class TestRenderFiguresPng:
+    """Tests for report figure rendering (``core/utils/rendering``)."""
+
+    @pytest.fixture(autouse=True)
+    def empty_image_cache(self):
+        rendering.configure_image_cache(rendering.DEFAULT_CACHE_BYTES)
+        yield
+        rendering.configure_image_cache(rendering.DEFAULT_CACHE_BYTES)
+
+    def test_spec_hash_identifies_figure_content(self):
+        figure = _line_figure([1, 2, 3])
+
+        assert rendering.figure_spec_hash(figure) == rendering.figure_spec_hash(figure)
+        assert rendering.figure_spec_hash(figure) == rendering.figure_spec_hash(_line_figure([1, 2, 3]))
+        assert rendering.figure_spec_hash(figure) != rendering.figure_spec_hash(_line_figure([3, 2, 1]))
+
+    def test_identical_figures_are_rendered_once(self):
+        with patch.object(rendering, "render_png", wraps=rendering.render_png) as render_png:
+            first = get_html_image_from_figure(_line_figure([1, 2, 3]))
+            second = get_html_image_from_figure(_line_figure([1, 2, 3]))
+            images = rendering.render_figures_png([_line_figure([1, 2, 3]), _line_figure([3, 2, 1])])
+
+        assert first == second
+        assert render_png.call_count == 2
+        assert len(images) == 2 and images[0] != images[1]
+
+    def test_cache_is_size_limited(self):
+        rendering.configure_image_cache(1)
+        with patch.object(rendering, "render_png", wraps=rendering.render_png) as render_png:
+            get_html_image_from_figure(_line_figure([1, 2, 3]))
+            get_html_image_from_figure(_line_figure([1, 2, 3]))
+
+        assert render_png.call_count == 2
+
+    def test_render_pool_matches_rendering_in_process(self):
+        figures = [_line_figure([1, 2, 3]), _line_figure([3, 2, 1]), _line_figure([2, 2, 2])]
+        expected = [rendering.render_png(figure) for figure in figures]
+
+        rendering.set_parallel_rendering(True)
+        try:
+            with (
+                patch.object(rendering.os, "cpu_count", return_value=2),
+                patch.object(rendering, "render_png", wraps=rendering.render_png) as render_png,
+            ):
+                images = rendering.render_figures_png(figures)
+        finally:
+            rendering.shutdown_render_pool()
+
+        assert images == expected
+        assert render_png.call_count == 0
+
+    def test_categorical_figures_are_picklable(self):
+        import pickle
+        import warnings
+
+        import seaborn as sns
+
+        def box_figure():
+            figure = Figure()
+            df = pd.DataFrame({"Group": ["a", "b"] * 5, "Value": np.arange(10.0)})
+            sns.boxplot(data=df, x="Group", y="Value", ax=figure.add_subplot())
+            return figure
+
+        figure = box_figure()
+        with warnings.catch_warnings():
+            # Pickling itertools objects warns before Python 3.14 and fails from then on
+            warnings.simplefilter("error", DeprecationWarning)
+            spec_hash = rendering.figure_spec_hash(figure)
+            restored = pickle.loads(rendering._pickle_figure(figure))
+
+        assert spec_hash is not None
+        assert spec_hash == rendering.figure_spec_hash(box_figure())
+        assert [label.get_text() for label in restored.axes[0].get_xticklabels()] == ["a", "b"]
+        assert rendering.render_png(restored) == rendering.render_png(figure)
+
+    def test_render_html_sections_keeps_order(self):
+        sections = render_html_sections(["<h3>A</h3>", _line_figure([1, 2]), "<p>B</p>", _line_figure([2, 1])])
+
+        assert sections[0] == "<h3>A</h3>" and sections[2] == "<p>B</p>"
+        assert sections[1].startswith("<img src='data:image/png;base64,")
+        assert sections[3].startswith("<img") and sections[3] != sections[1]
+
+
 class TestGetHtmlTable:
     """Tests for get_html_table function."""
 
@@ -258,6 +353,48 @@ class TestTimeToFloat:
         assert result == pytest.approx(5.016666, rel=1e-5)
 
 
+class TestReassignDfTimedelta:
+    """Tests for reassign_df_timedelta function."""
+
+    @pytest.fixture
+    def trials_df(self):
+        """Rows of two interleaved trials, with a stale Timedelta and a filtered index."""
+        return pd.DataFrame(
+            {
+                "DateTime": pd.to_datetime([
+                    "2024-01-02 08:00",
+                    "2024-01-01 08:00",
+                    "2024-01-02 09:00",
+                    "2024-01-01 10:00",
+                ]),
+                "Trial": pd.Categorical(["Trial 1", "Trial 0", "Trial 1", "Trial 0"]),
+                "Timedelta": pd.to_timedelta([9, 9, 9, 9], unit="h"),
+            },
+            index=[3, 5, 8, 9],
+        )
+
+    def test_overlap_rebases_each_trial_on_its_first_row(self, trials_df):
+        """Test that every trial starts at its own first timestamp in overlap mode."""
+        result = reassign_df_timedelta(trials_df, "overlap")
+
+        assert result.index.tolist() == [0, 1, 2, 3]
+        assert result["Timedelta"].tolist() == pd.to_timedelta([0, 0, 1, 2], unit="h").tolist()
+
+    def test_overlap_keeps_timedelta_resolution(self, trials_df):
+        """Test that the existing Timedelta resolution is kept in overlap mode."""
+        trials_df["Timedelta"] = trials_df["Timedelta"].dt.as_unit("ms")
+
+        result = reassign_df_timedelta(trials_df, "overlap")
+
+        assert result["Timedelta"].dtype == "timedelta64[ms]"
+
+    def test_continuous_rebases_on_first_row(self, trials_df):
+        """Test that all rows are re-based on the first timestamp outside overlap mode."""
+        result = reassign_df_timedelta(trials_df, "continuous")
+
+        assert result["Timedelta"].tolist() == pd.to_timedelta([0, -24, 1, -22], unit="h").tolist()
+
+
 class TestGetSaveFileName:
     """Tests for get_save_file_name function (the QFileDialog.getSaveFileName wrapper)."""
 
@@ -387,3 +524,40 @@ class TestGetFigsizeFromWidget:
 
         # Should be close to 2.0
         assert pytest.approx(ratio, rel=0.1) == 2.0
+
+
+class TestGetMemoryUsage:
+    """Tests for get_memory_usage."""
+
+    def test_clone_shares_columns_until_modified(self, make_dataset):
+        from tse_analytics.core.utils.memory import get_memory_usage
+
+        datatable = make_dataset().datatables["Main"]
+        usage = get_memory_usage([datatable])[datatable.id]
+        assert usage.shared_bytes == 0 and usage.owned_bytes > 0
+
+        clone = datatable.clone()
+        usages = get_memory_usage([datatable, clone])
+        assert usages[datatable.id] == usages[clone.id]
+        assert usages[clone.id].owned_bytes == 0
+        assert usages[clone.id].shared_bytes == usage.total_bytes
+
+        clone.df["Weight"] = clone.df["Weight"] * 2
+        usages = get_memory_usage([datatable, clone])
+        assert 0 < usages[clone.id].owned_bytes < usage.total_bytes
+        assert usages[clone.id].owned_bytes == usages[datatable.id].owned_bytes
+
+    def test_skips_unloaded_datatables(self, make_dataset):
+        from tse_analytics.core.utils.memory import get_memory_usage
+
+        datatable = make_dataset().datatables["Main"]
+        datatable._df = None
+        assert get_memory_usage([datatable]) == {}
+
+    @pytest.mark.parametrize(
+        ("size", "expected"), [(0, "0 B"), (1023, "1023 B"), (1536, "1.5 KB"), (5 * 1024**3, "5.0 GB")]
+    )
+    def test_format_bytes(self, size, expected):
+        from tse_analytics.core.utils.memory import format_bytes
+
+        assert format_bytes(size) == expected
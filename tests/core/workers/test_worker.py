@@ -97,3 +97,41 @@ class TestWorkerFailure:
 
         mock_logger.opt.assert_called_once()
         mock_logger.opt.return_value.error.assert_called_once()
+
+
+class TestWorkerProgressAndCancellation:
+    """Tests for the opt-in progress reporting and cooperative cancellation."""
+
+    def test_is_cancelled_after_cancel(self, qapp):
+        """cancel sets the flag polled by the wrapped function."""
+        worker = Worker(lambda: None)
+
+        assert worker.is_cancelled() is False
+        worker.cancel()
+        assert worker.is_cancelled() is True
+
+    def test_function_reports_progress_and_stops_when_cancelled(self, qapp):
+        """A function wired to progress/is_cancelled reports steps until cancelled."""
+
+        def steps(progress_callback, is_cancelled):
+            done = 0
+            for _ in range(5):
+                if is_cancelled():
+                    break
+                done += 1
+                progress_callback(done, 5)
+                if done == 2:
+                    worker.cancel()
+            return done
+
+        progress = []
+        results = []
+        worker = Worker(steps)
+        worker.kwargs.update(progress_callback=worker.signals.progress.emit, is_cancelled=worker.is_cancelled)
+        worker.signals.progress.connect(lambda done, total: progress.append((done, total)))
+        worker.signals.result.connect(results.append)
+
+        worker.run()
+
+        assert progress == [(1, 5), (2, 5)]
+        assert results == [2]
@@ -0,0 +1,63 @@
+"""Tests for reading RunningWheel tables straight from an IntelliMaze archive."""
+
+import zipfile
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from tse_analytics.core.data.shared import Animal
+from tse_analytics.modules.intellimaze.extensions.running_wheel.io import import_data
+
+REGISTRATION = (
+    "Time\tDeviceId\tLeft\tRight\tReset\tTag\n"
+    "2024-01-01T00:10:00+01:00\tD1\t5\t2\tFalse\tT1\n"
+    "2024-01-01T00:00:00+01:00\tD1\t0\t0\tFalse\tT1\n"
+    "2024-01-01T00:20:00+01:00\tD1\t12\t5\tFalse\tT1\n"
+)
+MODEL = "Time\tDeviceId\tSwitchMode\tModel\n2024-01-01T00:00:00+01:00\tD1\tAuto\tWheel\n"
+INTEGER_VARIABLES = "Time\tDeviceId\tName\tData\tConditionValue\tTag\n2024-01-01T00:00:00+01:00\tD1\tLaps\t3\t0\tT1\n"
+
+
+@pytest.fixture
+def dataset():
+    metadata = {
+        "name": "IM",
+        "animals": {},
+        "experiment_started": "2024-01-01 00:00:00",
+        "experiment_stopped": "2024-01-01 01:00:00",
+    }
+    with patch("tse_analytics.core.data.dataset.messaging"):
+        from tse_analytics.core.data.dataset import Dataset
+
+        return Dataset("IM", "", "IntelliMaze", metadata, {"M1": Animal(id="M1", properties={"Tag": "T1"})})
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "experiment.zip"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zip:
+        zip.writestr("RunningWheel/Registration.txt", "﻿" + REGISTRATION)
+        zip.writestr("RunningWheel/Model.txt", MODEL)
+        zip.writestr("RunningWheel/IntegerVariables.txt", INTEGER_VARIABLES)
+    return path
+
+
+def test_import_data_reads_archive_members(archive, dataset):
+    with zipfile.ZipFile(archive) as zip:
+        extension_data = import_data(zipfile.Path(zip) / "RunningWheel", dataset)
+
+    assert set(extension_data) == {"Registration", "Model", "IntegerVariables"}
+    registration_df = extension_data["Registration"].df
+    assert list(registration_df.columns) == ["Time", "DeviceId", "Left", "Right", "Reset", "Tag"]
+    assert registration_df["Time"].tolist() == list(pd.date_range("2024-01-01 00:00", periods=3, freq="10min"))
+    assert registration_df["Left"].tolist() == [0, 5, 12]
+    assert extension_data["IntegerVariables"].df["Data"].tolist() == [3]
+
+
+def test_import_data_reports_missing_members(tmp_path, dataset):
+    path = tmp_path / "empty.zip"
+    with zipfile.ZipFile(path, "w") as zip:
+        zip.writestr("RunningWheel/Model.txt", MODEL)
+
+    with zipfile.ZipFile(path) as zip, pytest.raises(FileNotFoundError):
+        import_data(zipfile.Path(zip) / "RunningWheel", dataset)
@@ -0,0 +1,158 @@
+"""Tests for the IntelliMaze merged CSV export (``modules/intellimaze/io/merged_csv_export``)."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.data.shared import Animal
+from tse_analytics.modules.intellimaze.extensions import consumption_scale, running_wheel
+from tse_analytics.modules.intellimaze.io.merged_csv_export import (
+    CSV_CORE_COLUMNS,
+    export_merged_csv,
+    get_extension_csv_data,
+    write_merged_csv,
+)
+
+
+@pytest.fixture
+def dataset():
+    animals = {
+        "M1": Animal(id="M1", properties={"Tag": "T1"}),
+        "M2": Animal(id="M2", properties={"Tag": "T2"}),
+    }
+    metadata = {
+        "name": "IM",
+        "animals": {},
+        "experiment_started": "2024-01-01 00:00:00",
+        "experiment_stopped": "2024-01-01 01:00:00",
+    }
+    with patch("tse_analytics.core.data.dataset.messaging"):
+        from tse_analytics.core.data.dataset import Dataset
+
+        dataset = Dataset("IM", "", "IntelliMaze", metadata, animals)
+
+    registration_df = pd.DataFrame({
+        "Time": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 00:20", "2024-01-01 00:40"]),
+        "Tag": ["T1", None, "T2"],
+        "DeviceId": ["W1", "W1", "W2"],
+        "Left": [1, 2, 3],
+        "Right": [4, 5, 6],
+        "Reset": [0, 0, 1],
+    })
+    consumption_df = pd.DataFrame({
+        "Time": pd.to_datetime(["2024-01-01 00:10", "2024-01-01 00:30"]),
+        "Tag": ["T2", "T9"],
+        "DeviceId": ["S1", "S1"],
+        "Consumption": [0.5, np.nan],
+    })
+    variables_df = pd.DataFrame({
+        "Time": pd.to_datetime(["2024-01-01 00:20"]),
+        "Tag": ["T1"],
+        "DeviceId": ["S1"],
+        "Name": ["Level"],
+        "Data": [7.25],
+    })
+    dataset.raw_datatables = {
+        running_wheel.EXTENSION_NAME: {"Registration": Datatable(dataset, "Registration", "", {}, registration_df, {})},
+        consumption_scale.EXTENSION_NAME: {
+            "Consumption": Datatable(dataset, "Consumption", "", {}, consumption_df, {}),
+            "DoubleVariables": Datatable(dataset, "DoubleVariables", "", {}, variables_df, {}),
+        },
+    }
+    return dataset
+
+
+@pytest.fixture
+def csv_data(dataset):
+    return get_extension_csv_data(
+        dataset,
+        [running_wheel.EXTENSION_NAME, consumption_scale.EXTENSION_NAME],
+        export_registrations=True,
+        export_variables=True,
+    )
+
+
+def _read_lines(path) -> list[list[str]]:
+    return [line.split(";") for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_csv_tables_start_with_core_columns(csv_data):
+    registration_df = csv_data[running_wheel.EXTENSION_NAME]["Registration"]
+    consumption_df = csv_data[consumption_scale.EXTENSION_NAME]["Consumption"]
+
+    assert list(registration_df.columns) == CSV_CORE_COLUMNS + ["Left", "Right", "Reset"]
+    assert registration_df["AnimalName"].tolist() == ["M1", "", "M2"]
+    assert registration_df["AnimalTag"].tolist() == ["T1", "", "T2"]
+    assert set(registration_df["TableType"]) == {"Registration"}
+    # Unknown tags have no animal name
+    assert consumption_df["AnimalName"].tolist() == ["M2", ""]
+    assert list(csv_data[consumption_scale.EXTENSION_NAME]["DoubleVariables"]["TableType"]) == ["Doubles"]
+
+
+def test_old_format_aligns_tables_in_column_blocks(tmp_path, csv_data):
+    path = tmp_path / "old.csv"
+
+    assert write_merged_csv(csv_data, path, ";", old_format=True)
+
+    lines = _read_lines(path)
+    core = [""] * len(CSV_CORE_COLUMNS)
+    assert lines[0] == core + ["RunningWheel"] * 3 + ["ConsumptionScale"] * 3
+    assert lines[1] == core + ["Registration"] * 3 + ["Consumption"] + ["DoubleVariables"] * 2
+    assert lines[2] == CSV_CORE_COLUMNS + ["Left", "Right", "Reset", "Consumption", "Name", "Data"]
+    # Rows of all tables ordered by time, each table's values in its own block
+    assert [line[0] for line in lines[3:]] == [
+        "2024-01-01 00:00:00",
+        "2024-01-01 00:10:00",
+        "2024-01-01 00:20:00",
+        "2024-01-01 00:20:00",
+        "2024-01-01 00:30:00",
+        "2024-01-01 00:40:00",
+    ]
+    assert lines[3][1:] == ["RunningWheel", "W1", "M1", "T1", "Registration", "1", "4", "0", "", "", ""]
+    assert lines[4][6:] == ["", "", "", "0.5", "", ""]
+    assert lines[6][6:] == ["", "", "", "", "Level", "7.25"]
+    assert lines[7][6:] == ["", "", "", "", "", ""]
+
+
+def test_new_format_merges_columns_by_name(tmp_path, csv_data):
+    path = tmp_path / "new.csv"
+
+    assert write_merged_csv(csv_data, path, ";")
+
+    lines = _read_lines(path)
+    assert lines[0] == CSV_CORE_COLUMNS + ["Left", "Right", "Reset", "Consumption", "Name", "Data"]
+    assert len(lines) == 7
+    assert lines[2][5:] == ["Consumption", "", "", "", "0.5", "", ""]
+
+
+def test_chunked_writing_matches_single_chunk(tmp_path, csv_data):
+    progress = []
+    write_merged_csv(csv_data, tmp_path / "one.csv", ";", old_format=True)
+    write_merged_csv(
+        csv_data,
+        tmp_path / "chunked.csv",
+        ";",
+        old_format=True,
+        chunk_rows=2,
+        progress_callback=lambda completed, total: progress.append((completed, total)),
+    )
+
+    assert (tmp_path / "chunked.csv").read_text(encoding="utf-8") == (tmp_path / "one.csv").read_text(encoding="utf-8")
+    assert progress == [(0, 6), (2, 6), (4, 6), (6, 6)]
+
+
+def test_cancelled_export_removes_partial_file(tmp_path, dataset):
+    path = tmp_path / "cancelled.csv"
+
+    completed = export_merged_csv(
+        dataset,
+        [running_wheel.EXTENSION_NAME],
+        path,
+        ",",
+        is_cancelled=lambda: True,
+    )
+
+    assert not completed
+    assert not path.exists()
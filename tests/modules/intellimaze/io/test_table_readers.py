@@ -0,0 +1,51 @@
+"""Tests for the concurrent IntelliMaze table readers."""
+
+import threading
+
+import pandas as pd
+import pytest
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.modules.intellimaze.io.table_readers import read_tables
+
+
+@pytest.fixture
+def dataset(make_dataset):
+    return make_dataset()
+
+
+def _reader(dataset, name, wait_for=None, started=None):
+    def read():
+        if started is not None:
+            started.set()
+        if wait_for is not None:
+            assert wait_for.wait(timeout=5)
+        return Datatable(dataset, name, "", {}, pd.DataFrame({"Value": [1]}), {})
+
+    return read
+
+
+def test_read_tables_merges_in_declaration_order(dataset):
+    # The first table only completes once the last one has started, so completion order differs from declaration order
+    last_started = threading.Event()
+    readers = {
+        "Gate": {
+            "Sessions": _reader(dataset, "Sessions", wait_for=last_started),
+            "IntegerVariables": lambda: None,
+            "Log": _reader(dataset, "Log"),
+        },
+        "Wheel": {"Registration": _reader(dataset, "Registration", started=last_started)},
+    }
+
+    result = read_tables(readers, max_workers=4)
+
+    assert list(result) == ["Gate", "Wheel"]
+    assert list(result["Gate"]) == ["Sessions", "Log"]
+    assert result["Wheel"]["Registration"].name == "Registration"
+
+
+def test_read_tables_raises_reader_errors(dataset):
+    def missing():
+        raise FileNotFoundError("Log.txt")
+
+    with pytest.raises(FileNotFoundError, match="Log.txt"):
+        read_tables({"Gate": {"Sessions": _reader(dataset, "Sessions"), "Log": missing}})
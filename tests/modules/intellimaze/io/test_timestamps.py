@@ -0,0 +1,84 @@
+"""Tests for the vectorized ISO 8601 timestamp decoding."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.modules.intellimaze.io import timestamps
+from tse_analytics.modules.intellimaze.io.timestamps import TimestampLayout, parse_timestamps
+
+
+def to_datetime(values: pd.Series, drop_offset: bool) -> pd.Series:
+    result = pd.to_datetime(values, format="ISO8601", utc=False)
+    if drop_offset:
+        result = result.dt.tz_localize(None)
+    return result.dt.as_unit("ms")
+
+
+@pytest.mark.parametrize(
+    ("values", "drop_offset"),
+    [
+        (["2024-01-01T08:30:00.1234567+01:00", "2024-02-29T23:59:59.9999999+01:00", None], True),
+        (["2024-01-01T08:30:00.1234567+01:00", "2024-03-01T00:00:00.5+01:00"], True),
+        (["2024-01-01T08:30:00.1234567+01:00", "2023-12-31T23:00:00.0000000+01:00"], False),
+        (["2024-01-01T08:30:00.123-05:30", None, "1999-12-31T23:59:59.999-05:30"], False),
+        (["2024-01-01T08:30:00Z", "2024-06-01T08:30:00Z"], False),
+        (["2024-01-01 08:30:00", "2023-12-31 23:59:59", None], False),
+        (["2024-01-01T08:30:00.123", "2024-01-01T08:30:00.12345"], True),
+        (["2024-01-01", "2024-01-02T08:30"], False),
+        ([None, None], True),
+    ],
+)
+@pytest.mark.parametrize("dtype", [object, "string"])
+def test_parse_timestamps_matches_pandas(values, drop_offset, dtype):
+    series = pd.Series(values, dtype=dtype, index=range(10, 10 + len(values)), name="DateTime")
+
+    result = parse_timestamps(series, drop_offset=drop_offset)
+
+    pd.testing.assert_series_equal(result, to_datetime(series, drop_offset))
+
+
+def test_parse_timestamps_decodes_random_dates():
+    rng = np.random.default_rng(1)
+    nanoseconds = rng.integers(pd.Timestamp("1900-01-01").value, pd.Timestamp("2200-01-01").value, 10_000)
+    series = pd.Series(pd.to_datetime(nanoseconds).strftime("%Y-%m-%dT%H:%M:%S.%f+02:00"))
+
+    pd.testing.assert_series_equal(parse_timestamps(series, drop_offset=True), to_datetime(series, True))
+
+
+def test_parse_timestamps_falls_back_to_pandas_for_irregular_rows_only(monkeypatch):
+    monkeypatch.setattr(timestamps, "DECODE_CHUNK_SIZE", 2)
+    series = pd.Series(["2024-01-01T08:30:00.000+01:00"] * 5, dtype="string")
+    series[3] = "2024-01-01T08:30:00+01:00"
+    calls = []
+    original = pd.to_datetime
+    monkeypatch.setattr(
+        pd, "to_datetime", lambda values, **kwargs: calls.append(len(values)) or original(values, **kwargs)
+    )
+
+    result = parse_timestamps(series, drop_offset=True)
+
+    assert calls == [1]
+    assert (result == pd.Timestamp("2024-01-01 08:30:00")).all()
+
+
+def test_parse_timestamps_keeps_wall_time_when_offset_changes():
+    series = pd.Series(["2024-03-31T01:59:00.000+01:00", "2024-03-31T03:00:00.000+02:00"])
+
+    result = parse_timestamps(series, drop_offset=True)
+
+    assert result.tolist() == [pd.Timestamp("2024-03-31 01:59:00"), pd.Timestamp("2024-03-31 03:00:00")]
+
+
+def test_parse_timestamps_rejects_invalid_dates_like_pandas():
+    series = pd.Series(["2024-02-28T00:00:00.000+01:00", "2024-02-30T00:00:00.000+01:00"])
+
+    with pytest.raises(ValueError, match="2024-02-30"):
+        parse_timestamps(series, drop_offset=True)
+
+
+def test_timestamp_layout_detect():
+    assert TimestampLayout.detect("2024-01-01T08:30:00.1234567+01:00") == TimestampLayout(33, 7, b"+01:00")
+    assert TimestampLayout.detect("2024-01-01 08:30:00") == TimestampLayout(19, 0, b"")
+    assert TimestampLayout.detect("2024-01-01T08:30:00Z").offset_seconds == 0
+    assert TimestampLayout.detect("2024-01-01T08:30:00-05:30").offset_seconds == -19800
+    assert TimestampLayout.detect("01/02/2024") is None
@@ -0,0 +1,51 @@
+"""Tests for the chunked ActiMot raw table import."""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.modules.phenomaster.extensions.actimot.io.data_loader import read_actimot_raw
+from tse_analytics.modules.phenomaster.io.tse_import_settings import ACTIMOT_RAW_TABLE
+
+
+@pytest.fixture
+def actimot_dataset(make_dataset):
+    dataset = make_dataset()
+    dataset.animals["A1"].properties["Box"] = 1
+    dataset.animals["A2"].properties["Box"] = 2
+    dataset.metadata["tables"] = {ACTIMOT_RAW_TABLE: {"sample_interval": "00:00:00.100"}}
+    return dataset
+
+
+@pytest.fixture
+def actimot_db(tmp_path):
+    path = tmp_path / "experiment.db"
+    start = pd.Timestamp("2024-01-01 00:00:00").value
+    rows = [(start + i * 100_000_000, 1 + i % 2, (i * 7919) & 0xFFFFFFFF, i, 0xFFFFFFFF - i) for i in range(10)]
+    with sqlite3.connect(path) as con:
+        con.execute(
+            f"CREATE TABLE {ACTIMOT_RAW_TABLE} (DateTime INTEGER, Box INTEGER, X1 INTEGER, X2 INTEGER, Y1 INTEGER)"
+        )
+        con.executemany(f"INSERT INTO {ACTIMOT_RAW_TABLE} VALUES (?, ?, ?, ?, ?)", rows)
+    return path
+
+
+def test_read_actimot_raw_decodes_columns(actimot_db, actimot_dataset):
+    df = read_actimot_raw(actimot_db, actimot_dataset).df
+
+    assert list(df.columns) == ["DateTime", "Timedelta", "Animal", "Box", "Y", "X"]
+    assert len(df) == 10
+    assert df.at[3, "DateTime"] == pd.Timestamp("2024-01-01 00:00:00.300")
+    assert df.at[3, "Timedelta"] == pd.Timedelta("300ms")
+    assert df["Animal"].tolist() == ["A1", "A2"] * 5
+    assert df.at[3, "X"] == np.uint64((3 << 32) + 3 * 7919)
+    assert df.at[3, "Y"] == 0xFFFFFFFF - 3
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 11])
+def test_chunked_read_matches_single_query(actimot_db, actimot_dataset, chunk_size):
+    expected = read_actimot_raw(actimot_db, actimot_dataset, chunk_size=None).df
+    result = read_actimot_raw(actimot_db, actimot_dataset, chunk_size=chunk_size).df
+
+    pd.testing.assert_frame_equal(result, expected)
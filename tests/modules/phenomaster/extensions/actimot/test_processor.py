@@ -0,0 +1,52 @@
+"""Equivalence tests for the vectorized ActiMot beam centroid decoding."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.modules.phenomaster.extensions.actimot import processor
+from tse_analytics.modules.phenomaster.extensions.actimot.processor import (
+    decode_centroids,
+    get_centroid_lookup,
+    get_pixmap_and_centroid,
+    x_range,
+    y_range,
+)
+
+
+@pytest.fixture
+def beam_states():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 2**64 - 1, 2_000, dtype=np.uint64, endpoint=True)
+    y = rng.integers(-(2**31), 2**31, 2_000, dtype=np.int64)
+    # Edge cases: no beam interrupted, all beams interrupted, single beams at both ends
+    x[:4] = [2**64 - 1, 0, 2**64 - 2, 2**63 - 1]
+    y[:4] = [2**32 - 1, 0, -2, 2**31 - 1]
+    return x, y
+
+
+def test_decode_centroids_matches_scalar_lookup(beam_states):
+    x, y = beam_states
+
+    expected_x = pd.Series(x).apply(get_centroid_lookup, value_range=x_range).to_numpy(dtype=float)
+    expected_y = pd.Series(y).apply(get_centroid_lookup, value_range=y_range).to_numpy(dtype=float)
+
+    np.testing.assert_array_equal(decode_centroids(x, len(x_range)), expected_x)
+    np.testing.assert_array_equal(decode_centroids(y, len(y_range)), expected_y)
+
+
+def test_decode_centroids_is_chunk_size_independent(monkeypatch, beam_states):
+    x, _ = beam_states
+    expected = decode_centroids(x, 64)
+
+    monkeypatch.setattr(processor, "DECODE_CHUNK_SIZE", 7)
+
+    np.testing.assert_array_equal(decode_centroids(x, 64), expected)
+
+
+def test_pixmap_centroid_matches_scalar_lookup(qapp, beam_states):
+    x, y = beam_states
+    for x_value, y_value in zip(x[4:20], y[4:20], strict=True):
+        _, centroid = get_pixmap_and_centroid(int(x_value), int(y_value))
+
+        assert centroid[0] == pytest.approx(get_centroid_lookup(int(y_value), y_range), nan_ok=True)
+        assert centroid[1] == pytest.approx(get_centroid_lookup(int(x_value), x_range), nan_ok=True)
@@ -0,0 +1,109 @@
+"""Tests for the per-box calorimetry batch engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.modules.phenomaster.extensions.calo.batch import get_calo_boxes, get_calo_result, run_calo_batch
+from tse_analytics.modules.phenomaster.extensions.calo.calo_settings import CaloSettings
+from tse_analytics.modules.phenomaster.extensions.calo.data.calo_box import CaloBox
+from tse_analytics.modules.phenomaster.extensions.calo.fitting_params import FittingParams
+from tse_analytics.modules.phenomaster.extensions.calo.processor import process_box
+
+BINS = 3
+SAMPLES = 40
+
+
+@pytest.fixture
+def calo_datatable(make_dataset):
+    dataset = make_dataset()
+    start = pd.Timestamp("2024-01-01 00:00:00")
+
+    raw_rows = []
+    main_rows = []
+    for box, (o2_base, co2_base) in {1: (20.5, 0.5), 2: (20.9, 0.05), 3: (20.4, 0.6)}.items():
+        for bin_number in range(BINS):
+            bin_start = start + pd.Timedelta(minutes=10 * bin_number)
+            for offset in range(SAMPLES):
+                x = offset + 1
+                raw_rows.append({
+                    "DateTime": bin_start + pd.Timedelta(seconds=offset),
+                    "Box": box,
+                    "Bin": bin_number,
+                    "Offset": offset,
+                    "O2": o2_base + 0.1 * bin_number + 2.0 * x**-1.5,
+                    "CO2": co2_base + 0.01 * bin_number + 0.5 * x**-1.2,
+                })
+            main_rows.append({
+                "Box": box,
+                "Bin": bin_number,
+                "RER": 0.9,
+                "O2": o2_base,
+                "CO2": co2_base,
+                "VO2": 100.0,
+                "VCO2": 90.0,
+                "EE": 0.5,
+            })
+
+    dataset.datatables["Main"].df = pd.DataFrame(main_rows)
+    return Datatable(
+        dataset,
+        "calo_bin",
+        "Raw calo datatable",
+        {},
+        pd.DataFrame(raw_rows),
+        {"ref_box_mapping": {1: 2, 3: 2}},
+    )
+
+
+def _expected_result(calo_datatable, calo_box, calo_settings):
+    raw_df = calo_datatable.df.loc[calo_datatable.df["Bin"] != BINS - 1]
+    main_df = calo_datatable.dataset.datatables["Main"].df
+    main_df = main_df.loc[main_df["Bin"] != BINS - 1]
+    params = FittingParams(
+        calo_box,
+        main_df[main_df["Box"] == calo_box.box].copy(),
+        raw_df[raw_df["Box"] == calo_box.box].copy(),
+        raw_df[raw_df["Box"] == calo_box.ref_box].copy(),
+        calo_settings,
+    )
+    return process_box(params)
+
+
+def test_get_calo_boxes_uses_ref_box_mapping(calo_datatable):
+    assert get_calo_boxes(calo_datatable) == [CaloBox(1, 2), CaloBox(3, 2)]
+
+
+def test_run_calo_batch_matches_process_box(calo_datatable):
+    calo_settings = CaloSettings.get_default()
+    progress = []
+
+    results = run_calo_batch(calo_datatable, None, calo_settings, progress_callback=lambda *p: progress.append(p))
+
+    assert sorted(results) == [1, 3]
+    assert progress[0] == (0, 2)
+    assert progress[-1] == (2, 2)
+    for box_number, result in results.items():
+        expected = _expected_result(calo_datatable, CaloBox(box_number, 2), calo_settings)
+        assert result.box_number == box_number
+        pd.testing.assert_frame_equal(result.df, expected.df)
+        assert len(result.df) == BINS - 1
+        assert np.isfinite(result.df["RER-p"]).all()
+
+
+def test_run_calo_batch_stops_when_cancelled(calo_datatable):
+    results = run_calo_batch(calo_datatable, None, CaloSettings.get_default(), is_cancelled=lambda: True)
+
+    assert results == {}
+
+
+def test_get_calo_result_combines_fitted_boxes(calo_datatable):
+    result = get_calo_result(calo_datatable, boxes=[3])
+
+    expected = _expected_result(calo_datatable, CaloBox(3, 2), CaloSettings.get_default())
+    pd.testing.assert_frame_equal(result.fitting.drop(columns="Box"), expected.df)
+    assert result.fitting["Box"].unique().tolist() == [3]
+    assert "<table" in result.report
+
+    with pytest.raises(ValueError, match="Boxes without reference box: 2"):
+        get_calo_result(calo_datatable, boxes=[2])
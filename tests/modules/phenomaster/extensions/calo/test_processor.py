@@ -0,0 +1,86 @@
+"""Tests for the batched calorimetry curve fitting."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.modules.phenomaster.extensions.calo import processor
+from tse_analytics.modules.phenomaster.extensions.calo.calo_settings import CaloSettings
+from tse_analytics.modules.phenomaster.extensions.calo.processor import (
+    calculate_fit_v2,
+    calculate_predicted_measurements,
+    curve_fitting_func,
+    fit_power_curves,
+)
+
+BOUNDS = CaloSettings.get_default().o2_settings.bounds
+
+
+@pytest.fixture
+def curves():
+    rng = np.random.default_rng(3)
+    a = rng.uniform(1.0, 1e4, 40)
+    b = rng.uniform(-4.0, -0.5, 40)
+    c = rng.uniform(19.0, 21.0, 40)
+    x = np.tile(np.arange(20.0, 30.0), (40, 1))
+    y = curve_fitting_func(x, a[:, np.newaxis], b[:, np.newaxis], c[:, np.newaxis])
+    return x, y, (a, b, c)
+
+
+def test_fit_power_curves_recovers_exact_curves(curves):
+    x, y, (a, b, c) = curves
+
+    fitted_a, fitted_b, fitted_c, converged = fit_power_curves(x, y, np.ones_like(x), BOUNDS)
+
+    assert converged.all()
+    np.testing.assert_allclose(
+        curve_fitting_func(50.0, fitted_a, fitted_b, fitted_c), curve_fitting_func(50.0, a, b, c)
+    )
+    np.testing.assert_allclose(fitted_b, b, rtol=1e-4)
+
+
+def test_fit_power_curves_is_never_worse_than_lmfit(curves):
+    x, y, _ = curves
+    y = y + np.random.default_rng(4).normal(0.0, 0.002, y.shape)
+
+    a, b, c, converged = fit_power_curves(x, y, np.ones_like(x), BOUNDS)
+
+    for i in np.flatnonzero(converged):
+        lmfit_params = calculate_fit_v2(pd.DataFrame({"Offset": x[i], "O2": y[i]}), "O2", 1, BOUNDS)
+        lmfit_sse = ((curve_fitting_func(x[i], *lmfit_params) - y[i]) ** 2).sum()
+        sse = ((curve_fitting_func(x[i], a[i], b[i], c[i]) - y[i]) ** 2).sum()
+        assert sse <= lmfit_sse * (1 + 1e-6) + 1e-12
+
+
+def test_fit_power_curves_ignores_padding(curves):
+    x, y, _ = curves
+    weights = np.ones_like(x)
+    weights[0, 7:] = 0.0
+    padded_y = y.copy()
+    padded_y[0, 7:] = 1e6
+
+    expected = fit_power_curves(x[:1, :7], y[:1, :7], weights[:1, :7], BOUNDS)
+    result = fit_power_curves(x[:1], padded_y[:1], weights[:1], BOUNDS)
+
+    np.testing.assert_allclose(np.concatenate(result[:3]), np.concatenate(expected[:3]))
+
+
+def test_predicted_measurements_refit_non_converged_bins_with_lmfit():
+    rows = []
+    for bin_number in [2, 0, 1]:
+        for offset in range(40):
+            x = max(offset, 1)
+            # Bin 1 is flat: its optimum lies on the exponent bound and cannot converge
+            o2 = 20.5 if bin_number == 1 else 20.5 + 2.0 * x**-1.5
+            rows.append({"Bin": bin_number, "Offset": offset, "O2": o2, "CO2": 0.5 + 0.5 * x**-1.2})
+    df = pd.DataFrame(rows)
+
+    with patch.object(processor, "calculate_fit_v2", wraps=calculate_fit_v2) as lmfit_fit:
+        result = calculate_predicted_measurements(df, timedelta(seconds=1), CaloSettings.get_default(), False)
+
+    assert result["Bin"].tolist() == [2, 0, 1]
+    assert lmfit_fit.call_count == 1
+    assert lmfit_fit.call_args.args[0]["O2"].eq(20.5).all()
+    assert result["O2"].tolist() == pytest.approx([20.5 + 2.0 * 50**-1.5, 20.5 + 2.0 * 50**-1.5, 20.5], abs=1e-4)
@@ -1,9 +1,16 @@
-"""Unit tests for the DrinkFeed sequential processor wide-episodes reshape."""
+"""Unit tests for the DrinkFeed sequential processor (episode detection and wide-episodes reshape)."""
+
+from datetime import time
 
 import pandas as pd
 import pytest
+from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Aggregation
-from tse_analytics.modules.phenomaster.extensions.drinkfeed.sequential_processor import _reshape_episodes_to_wide
+from tse_analytics.modules.phenomaster.extensions.drinkfeed.drinkfeed_settings import DrinkFeedSettings
+from tse_analytics.modules.phenomaster.extensions.drinkfeed.sequential_processor import (
+    _reshape_episodes_to_wide,
+    process_drinkfeed_sequences,
+)
 
 _METRICS = ["Duration[minutes]", "Interval[minutes]", "Quantity", "Quantity[kcal]", "Rate"]
 
@@ -73,3 +80,63 @@ def test_reshape_episodes_to_wide_empty():
     assert variables == {}
     assert list(wide.columns) == ["DateTime", "Timedelta", "Animal"]
     assert len(wide) == 0
+
+
+@pytest.fixture
+def drinkfeed_bin_datatable(make_dataset):
+    """Interleaved events of two animals and two sensors (plus an ignored Weight sensor)."""
+    dataset = make_dataset()
+    # seconds, animal, Drink1, Feed1
+    events = [
+        (0, "A1", 0.02, 0.0),
+        (5, "A2", 0.0, 0.01),
+        (10, "A1", 0.02, 0.05),
+        (20, "A2", 0.0, 0.01),
+        (200, "A1", 0.005, 0.0),
+        (400, "A1", 0.03, 0.0),
+        (700, "A2", 0.0, 0.08),
+    ]
+    seconds = [e[0] for e in events]
+    df = pd.DataFrame({
+        "DateTime": pd.Timestamp("2024-01-01") + pd.to_timedelta(seconds, unit="s"),
+        "Timedelta": pd.to_timedelta(seconds, unit="s"),
+        "Animal": pd.Categorical([e[1] for e in events]),
+        "Box": pd.array([1] * len(events), dtype="UInt16"),
+        "Drink1": pd.array([e[2] for e in events], dtype="Float64"),
+        "Feed1": pd.array([e[3] for e in events], dtype="Float64"),
+        "Weight": pd.array([25.0] * len(events), dtype="Float64"),
+    })
+    return Datatable(dataset, "DrinkFeedBin", "Raw bin", {}, df, {})
+
+
+def test_process_drinkfeed_sequences_detects_episodes(drinkfeed_bin_datatable):
+    settings = DrinkFeedSettings(True, time(minute=1), 0.01, 0.02, time(hour=1), [])
+
+    events_datatable, episodes_datatable = process_drinkfeed_sequences(
+        drinkfeed_bin_datatable, settings, {"A1": 2.0, "A2": 3.0}
+    )
+
+    events = events_datatable.df
+    assert "Weight" not in events["Sensor"].tolist()
+    a1_drink = events[(events["Animal"] == "A1") & (events["Sensor"] == "Drink1")]
+    # 0 s and 10 s form episode 0; 200 s (below the minimum amount) is invalid; 400 s is episode 2
+    assert a1_drink["EpisodeId"].tolist() == [0, 0, pd.NA, 2]
+
+    episodes = episodes_datatable.df
+    assert list(zip(episodes["Animal"], episodes["Sensor"], episodes["Id"], strict=True)) == [
+        ("A1", "Drink1", 0),
+        ("A2", "Feed1", 0),
+        ("A1", "Feed1", 0),
+        ("A1", "Drink1", 2),
+        ("A2", "Feed1", 1),
+    ]
+    first = episodes.iloc[0]
+    assert first["Quantity"] == pytest.approx(0.04)
+    assert first["Quantity[kcal]"] == pytest.approx(0.08)
+    assert first["Duration[minutes]"] == pytest.approx(10 / 60, abs=1e-3)
+    # Next valid A1/Drink1 episode starts at 400 s: 400 - 0 + 10 seconds
+    assert first["Interval[minutes]"] == pytest.approx(410 / 60, abs=1e-3)
+    assert episodes.iloc[1]["Quantity"] == pytest.approx(0.02)
+    # Single-event episode
+    assert pd.isna(episodes.iloc[2]["Duration"])
+    assert episodes.iloc[2]["Quantity"] == pytest.approx(0.05)
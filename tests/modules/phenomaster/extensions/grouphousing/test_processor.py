@@ -0,0 +1,43 @@
+"""Tests for the grouped TraffiCage preprocessing."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from tse_analytics.modules.phenomaster.extensions.grouphousing.data.processor import get_preprocessed_data
+
+
+def _make_datatable() -> SimpleNamespace:
+    rows = [
+        # Milliseconds since start, Animal, Channel, ChannelType
+        (0, "A1", 4, "TraffiCage1"),
+        (100, "A2", 5, "TraffiCage2"),
+        (200, "A1", 9, "TraffiCage6"),
+        (300, "A1", 4, "TraffiCage1"),
+        (400, "A2", 0, "Drink1"),
+        (600, "A2", 7, "TraffiCage4"),
+        (700, "A2", 5, "TraffiCage2"),
+        (5000, "A1", 9, "TraffiCage6"),
+    ]
+    df = pd.DataFrame(rows, columns=["StartDateTime", "Animal", "Channel", "ChannelType"])
+    df["StartDateTime"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(df["StartDateTime"], unit="ms")
+    df["Channel"] = df["Channel"].astype("Int64")
+    return SimpleNamespace(df=df, metadata={"animal_ids": ["A1", "A2"]})
+
+
+def test_previous_channel_type_and_distance_are_per_animal():
+    result = get_preprocessed_data(_make_datatable(), False, False, None)["TraffiCage"]
+
+    assert result["PreviousChannelType"].tolist()[:4] == [np.nan, np.nan, "TraffiCage1", "TraffiCage6"]
+    assert result["Distance"].tolist()[:4] == pytest.approx([np.nan, np.nan, np.sqrt(5), np.sqrt(5)], nan_ok=True)
+    assert result["Activity"].tolist() == [0, 0, 1, 2, 1, 2, 3]
+
+
+def test_overlapping_records_are_removed_per_animal():
+    result = get_preprocessed_data(_make_datatable(), False, True, 1000)["TraffiCage"]
+
+    # A1 at 300 ms and A2 at 700 ms return to the antenna read two records earlier within a second
+    assert result["StartDateTime"].dt.strftime("%f").str[:3].tolist() == ["000", "100", "200", "600", "000"]
+    assert result["TimeDiff"].iloc[-1] == pd.Timedelta(milliseconds=4800)
+    assert result["Activity"].tolist() == [0, 0, 1, 1, 2]
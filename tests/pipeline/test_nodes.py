@@ -195,6 +195,7 @@ def test_datatable_output_renames_and_forwards_to_manager(qapp, datatable):
     assert result is None  # terminal node
     fake_manager.add_datatable.assert_called_once()
     assert fake_manager.add_datatable.call_args.args[0].name == "Renamed"
+    assert datatable.name == "Main"  # a copy is added; the input stays untouched
 
 
 def test_datatable_output_invalid_input_is_noop(qapp):
@@ -0,0 +1,226 @@
+"""Tests for the memoized execution of ``PipelineNodeGraph``.
+
+The graph uses small counting nodes, so the tests observe which nodes actually ran.
+"""
+
+import threading
+
+import pytest
+from tse_analytics.pipeline.pipeline_node import PipelineNode
+from tse_analytics.pipeline.pipeline_packet import PipelinePacket
+
+# NodeGraphQt's viewer uses deprecated distutils version checks
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+calls: list[str] = []
+
+
+class _SourceNode(PipelineNode):
+    __identifier__ = "test"
+    NODE_NAME = "Source"
+
+    def __init__(self):
+        super().__init__()
+        self.add_output("out")
+        self.create_property("value", "a")
+
+    def process(self, packet: PipelinePacket) -> PipelinePacket:
+        calls.append(self.name())
+        return PipelinePacket(self.get_property("value"))
+
+
+class _AppendNode(PipelineNode):
+    __identifier__ = "test"
+    NODE_NAME = "Append"
+    CONCURRENT = True
+
+    def __init__(self):
+        super().__init__()
+        self.add_input("in")
+        self.add_output("out")
+        self.create_property("suffix", "x")
+
+    def process(self, packet: PipelinePacket) -> PipelinePacket:
+        calls.append(self.name())
+        return PipelinePacket(packet.value + self.get_property("suffix"), meta={"thread": threading.get_ident()})
+
+
+class _SinkNode(PipelineNode):
+    __identifier__ = "test"
+    NODE_NAME = "Sink"
+
+    def __init__(self):
+        super().__init__()
+        self.add_input("in")
+        self.received: list[str] = []
+
+    def process(self, packet: PipelinePacket) -> None:
+        calls.append(self.name())
+        self.received.append(packet.value)
+
+
+class _TableSourceNode(PipelineNode):
+    __identifier__ = "test"
+    NODE_NAME = "TableSource"
+    datatable = None
+
+    def __init__(self):
+        super().__init__()
+        self.add_output("out")
+
+    def process(self, packet: PipelinePacket) -> PipelinePacket:
+        calls.append(self.name())
+        return PipelinePacket(_TableSourceNode.datatable)
+
+
+class _WeightSumNode(PipelineNode):
+    __identifier__ = "test"
+    NODE_NAME = "WeightSum"
+
+    def __init__(self):
+        super().__init__()
+        self.add_input("in")
+        self.add_output("out")
+
+    def process(self, packet: PipelinePacket) -> PipelinePacket:
+        calls.append(self.name())
+        return PipelinePacket(float(packet.value.df["Weight"].sum()))
+
+
+@pytest.fixture
+def graph(qapp):
+    from tse_analytics.pipeline import PipelineNodeGraph
+
+    calls.clear()
+    graph = PipelineNodeGraph()
+    graph.register_nodes([_SourceNode, _AppendNode, _SinkNode])
+    yield graph
+    graph.clear_session()
+
+
+def _node(graph, node_class, name: str):
+    return graph.create_node(f"test.{node_class.__name__}", name=name, push_undo=False)
+
+
+def _build_branches(graph):
+    """source -> left -> sink; source -> right"""
+    source = _node(graph, _SourceNode, "source")
+    left = _node(graph, _AppendNode, "left")
+    right = _node(graph, _AppendNode, "right")
+    sink = _node(graph, _SinkNode, "sink")
+    source.set_output(0, left.input(0))
+    source.set_output(0, right.input(0))
+    left.set_output(0, sink.input(0))
+    return source, left, right, sink
+
+
+def test_execute_pipeline_runs_every_node_once(graph):
+    source, left, right, sink = _build_branches(graph)
+
+    outputs = graph.execute_pipeline(None)
+
+    assert sorted(calls) == ["left", "right", "sink", "source"]
+    assert outputs[(left.id, "out")].value == "ax"
+    assert sink.received == ["ax"]
+    assert not any(run.cached for run in graph.node_runs.values())
+
+
+def test_unchanged_nodes_are_reused(graph):
+    source, left, right, sink = _build_branches(graph)
+    graph.execute_pipeline(None)
+    calls.clear()
+
+    outputs = graph.execute_pipeline(None)
+
+    # Sources and sinks always run; the transformations are reused
+    assert sorted(calls) == ["sink", "source"]
+    assert graph.node_runs[left.id].cached and graph.node_runs[right.id].cached
+    assert outputs[(right.id, "out")].value == "ax"
+    assert sink.received == ["ax", "ax"]
+
+
+def test_editing_a_node_reruns_its_downstream_only(graph):
+    source, left, right, sink = _build_branches(graph)
+    graph.execute_pipeline(None)
+    calls.clear()
+
+    left.set_property("suffix", "y")
+    graph.execute_pipeline(None)
+
+    assert sorted(calls) == ["left", "sink", "source"]
+    assert sink.received[-1] == "ay"
+
+
+def test_changed_source_output_reruns_everything(graph):
+    source, left, right, sink = _build_branches(graph)
+    graph.execute_pipeline(None)
+    calls.clear()
+
+    source.set_property("value", "b")
+    outputs = graph.execute_pipeline(None)
+
+    assert sorted(calls) == ["left", "right", "sink", "source"]
+    assert outputs[(right.id, "out")].value == "bx"
+
+
+def test_cache_can_be_bypassed_and_cleared(graph):
+    _build_branches(graph)
+    graph.execute_pipeline(None)
+
+    calls.clear()
+    graph.execute_pipeline(None, use_cache=False)
+    assert len(calls) == 4
+
+    calls.clear()
+    graph.clear_cache()
+    graph.execute_pipeline(None)
+    assert len(calls) == 4
+
+
+def test_concurrent_nodes_run_on_worker_threads(graph):
+    source, left, right, sink = _build_branches(graph)
+
+    outputs = graph.execute_pipeline(None, max_workers=2)
+
+    assert outputs[(left.id, "out")].meta["thread"] != threading.get_ident()
+    assert outputs[(right.id, "out")].value == "ax"
+    assert sink.received == ["ax"]
+
+
+def test_datatable_fingerprint_follows_mutations(make_dataset):
+    from tse_analytics.pipeline.fingerprint import value_fingerprint
+
+    datatable = make_dataset().datatables["Main"]
+    fingerprint = value_fingerprint(datatable)
+    assert value_fingerprint(datatable) == fingerprint
+    assert value_fingerprint(datatable.clone()) != fingerprint
+
+    datatable.mark_df_modified()
+    assert value_fingerprint(datatable) != fingerprint
+
+    fingerprint = value_fingerprint(datatable)
+    datatable.df = datatable.df.head(1)
+    assert value_fingerprint(datatable) != fingerprint
+
+    # Columns replaced in place without mark_df_modified
+    fingerprint = value_fingerprint(datatable)
+    datatable.df["Weight"] = datatable.df["Weight"] * 2
+    assert value_fingerprint(datatable) != fingerprint
+    assert value_fingerprint(object()) is None
+
+
+def test_mutated_input_datatable_invalidates_cached_outputs(graph, make_dataset):
+    datatable = make_dataset().datatables["Main"]
+    _TableSourceNode.datatable = datatable
+    graph.register_nodes([_TableSourceNode, _WeightSumNode])
+    source = _node(graph, _TableSourceNode, "table")
+    total = _node(graph, _WeightSumNode, "total")
+    source.set_output(0, total.input(0))
+    first = graph.execute_pipeline(None)[(total.id, "out")].value
+
+    datatable.df["Weight"] = datatable.df["Weight"] + 1
+    calls.clear()
+    second = graph.execute_pipeline(None)[(total.id, "out")].value
+
+    assert "total" in calls
+    assert second == first + len(datatable.df)
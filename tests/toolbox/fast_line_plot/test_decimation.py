@@ -0,0 +1,58 @@
+"""Tests for the fast line plot decimation pyramid."""
+
+import numpy as np
+import pytest
+from tse_analytics.toolbox.fast_line_plot.decimation import DecimationPyramid
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.uniform(0.5, 1.5, 20_000))
+    y = rng.normal(size=x.size)
+    y[rng.random(x.size) < 0.05] = np.nan
+    return x, y
+
+
+def test_small_ranges_return_raw_samples(series):
+    x, y = series
+    pyramid = DecimationPyramid(x, y)
+
+    qx, qy = pyramid.query(x[100], x[199], 1000)
+
+    np.testing.assert_array_equal(qx, x[99:201])
+    np.testing.assert_array_equal(qy, y[99:201])
+
+
+def test_query_is_bounded_by_pixel_width(series):
+    x, y = series
+    pyramid = DecimationPyramid(x, y)
+
+    qx, _ = pyramid.query(x[0], x[-1], 100)
+
+    assert qx.size < x.size // 10
+    assert np.all(np.diff(qx) > 0)
+    assert qx[0] == x[0]
+    assert qx[-1] == x[-1]
+
+
+@pytest.mark.parametrize(("start", "stop", "pixel_width"), [(0, 20_000, 50), (1234, 17_777, 10), (5000, 5900, 3)])
+def test_query_keeps_range_extrema(series, start, stop, pixel_width):
+    x, y = series
+    pyramid = DecimationPyramid(x, y)
+
+    qx, qy = pyramid.query(x[start], x[stop - 1], pixel_width)
+
+    visible = (qx >= x[start]) & (qx <= x[stop - 1])
+    assert np.nanmin(qy[visible]) == np.nanmin(y[start:stop])
+    assert np.nanmax(qy[visible]) == np.nanmax(y[start:stop])
+    assert set(qx[visible]) <= set(x[start:stop])
+
+
+def test_all_nan_series():
+    pyramid = DecimationPyramid(np.arange(100.0), np.full(100, np.nan))
+
+    qx, qy = pyramid.query(0.0, 99.0, 5)
+
+    assert qx.size > 0
+    assert np.isnan(qy).all()
@@ -0,0 +1,115 @@
+"""Tests for tse_analytics.toolbox.result_cache module."""
+
+import os
+from dataclasses import dataclass
+
+import pytest
+from tse_analytics.toolbox.result_cache import ResultCache, cached_result, configure_result_cache, get_result_cache
+
+calls: list[tuple] = []
+
+
+@dataclass
+class _Result:
+    report: str
+
+
+@cached_result
+def _get_sum_result(datatable, variable_name: str, scale: float = 1.0) -> _Result | None:
+    calls.append((variable_name, scale))
+    if variable_name == "None":
+        return None
+    return _Result(f"{datatable.df[variable_name].sum() * scale}")
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    calls.clear()
+    cache = configure_result_cache(tmp_path / "cache")
+    yield cache
+    configure_result_cache(None)
+
+
+class TestResultCache:
+    """Tests for the ResultCache storage."""
+
+    def test_get_put(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        assert cache.get("a") is None
+
+        cache.put("a", _Result("x"))
+        assert cache.get("a") == _Result("x")
+        assert cache.size_bytes > 0
+
+        cache.clear()
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResultCache(tmp_path, max_bytes=10_000)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.put(key, "x" * 3000)
+            os.utime(cache._entry_path(key), ns=(i * 10**9, i * 10**9))
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get("a") is not None
+
+        cache.put("d", "x" * 3000)
+
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+        assert cache.size_bytes <= 10_000
+
+    def test_skips_values_over_the_limit(self, tmp_path):
+        cache = ResultCache(tmp_path, max_bytes=100)
+        cache.put("a", "x" * 1000)
+        assert cache.get("a") is None
+
+    def test_discards_unreadable_entries(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        cache._entry_path("a").write_bytes(b"not a pickle")
+        assert cache.get("a") is None
+        assert not cache._entry_path("a").exists()
+
+
+class TestCachedResult:
+    """Tests for the cached_result processor decorator."""
+
+    def test_disabled_by_default(self, make_dataset):
+        assert get_result_cache() is None
+        calls.clear()
+        datatable = make_dataset().datatables["Main"]
+        _get_sum_result(datatable, "Weight")
+        _get_sum_result(datatable, "Weight")
+        assert len(calls) == 2
+
+    def test_reuses_results_of_unchanged_calls(self, result_cache, make_dataset):
+        datatable = make_dataset().datatables["Main"]
+
+        first = _get_sum_result(datatable, "Weight")
+        assert _get_sum_result(datatable, variable_name="Weight", scale=1.0) == first
+        # Equal content in another datatable
+        assert _get_sum_result(datatable.clone(), "Weight") == first
+        assert calls == [("Weight", 1.0)]
+
+    def test_recomputes_after_changes(self, result_cache, make_dataset):
+        datatable = make_dataset().datatables["Main"]
+        _get_sum_result(datatable, "Weight")
+
+        _get_sum_result(datatable, "Weight", 2.0)
+        datatable.df.loc[0, "Weight"] = 100.0
+        datatable.mark_df_modified()
+        _get_sum_result(datatable, "Weight")
+        datatable.variables["Weight"].remove_outliers = True
+        _get_sum_result(datatable, "Weight")
+        datatable.dataset.factors.pop("Group")
+        _get_sum_result(datatable, "Weight")
+
+        assert len(calls) == 5
+
+    def test_none_results_are_not_cached(self, result_cache, make_dataset):
+        datatable = make_dataset().datatables["Main"]
+        datatable.df["None"] = 1.0
+        datatable.mark_df_modified()
+
+        assert _get_sum_result(datatable, "None") is None
+        assert _get_sum_result(datatable, "None") is None
+        assert len(calls) == 2
@@ -1,15 +1,17 @@
 """Validation tests for the toolbox plugin registry.
 
 These exercise the *real* registry: importing ``tse_analytics.toolbox`` runs the
-explicit import manifest in ``toolbox/__init__.py``, populating the singleton
-``registry``.  The tests guarantee that every ``@toolbox_plugin`` widget is
-discovered, uniquely identified, and satisfies the minimal contract the consumer
+static manifest in ``toolbox/__init__.py``, populating the singleton ``registry``.
+The tests guarantee that every toolbox widget is declared, uniquely identified,
+loaded lazily, and satisfies the minimal contract the consumer
 (:class:`~tse_analytics.views.misc.toolbox_button.ToolboxButton`) relies on —
 i.e. constructable as ``widget_class(datatable)``.
 """
 
+import ast
 import inspect
-import re
+import subprocess
+import sys
 from collections import Counter
 from pathlib import Path
 from types import SimpleNamespace
@@ -17,18 +19,17 @@ from unittest.mock import patch
 
 import pytest
 
-# Importing the package triggers the import manifest that populates the registry.
+# Importing the package runs the manifest that populates the registry.
 import tse_analytics.toolbox  # noqa: F401
 from PySide6.QtWidgets import QWidget
 from tse_analytics.toolbox.toolbox_registry import ToolboxPluginInfo, registry, validate_registry
 
 _REPO_ROOT = Path(__file__).resolve().parents[2]
-# Roots that may contain @toolbox_plugin-decorated widgets (add new module roots here).
+# Roots that may contain toolbox widgets (add new module roots here).
 _WIDGET_ROOTS = [
     _REPO_ROOT / "tse_analytics" / "toolbox",
     _REPO_ROOT / "tse_analytics" / "modules" / "intellicage" / "toolbox",
 ]
-_DECORATOR_RE = re.compile(r"@toolbox_plugin\b")
 
 
 def _all_plugins() -> list[ToolboxPluginInfo]:
@@ -42,33 +43,60 @@ def _plugin_by(category: str, label: str) -> ToolboxPluginInfo:
     raise AssertionError(f"No registered plugin {category!r}.{label!r}")
 
 
-def _decorated_widget_files() -> set[Path]:
-    """Source files that contain a ``@toolbox_plugin`` decoration."""
-    files: set[Path] = set()
+def _toolbox_widget_classes() -> set[str]:
+    """``module:Class`` paths of the ``ToolboxWidgetBase`` subclasses in the widget roots."""
+    paths: set[str] = set()
     for root in _WIDGET_ROOTS:
         for path in root.rglob("*_widget.py"):
-            if _DECORATOR_RE.search(path.read_text(encoding="utf-8")):
-                files.add(path.resolve())
-    return files
+            module = ".".join(path.relative_to(_REPO_ROOT).with_suffix("").parts)
+            for node in ast.parse(path.read_text(encoding="utf-8")).body:
+                if isinstance(node, ast.ClassDef) and any(
+                    isinstance(base, ast.Name) and base.id == "ToolboxWidgetBase" for base in node.bases
+                ):
+                    paths.add(f"{module}:{node.name}")
+    return paths
 
 
 def test_registry_is_populated():
     assert _all_plugins(), "Toolbox registry is empty — the import manifest did not run."
 
 
-def test_every_decorated_widget_is_registered():
-    """Drift guard: a @toolbox_plugin widget missing from toolbox/__init__.py fails here."""
-    decorated = _decorated_widget_files()
-    registered = {
-        Path(src).resolve() for p in _all_plugins() if (src := inspect.getsourcefile(p.widget_class)) is not None
-    }
-    missing = decorated - registered
+def test_every_toolbox_widget_is_declared():
+    """Drift guard: a ``ToolboxWidgetBase`` widget missing from the manifest fails here."""
+    declared = {p.widget for p in _all_plugins()}
+    missing = _toolbox_widget_classes() - declared
     assert not missing, (
-        "These @toolbox_plugin widgets are not registered — add an import to "
-        f"tse_analytics/toolbox/__init__.py: {sorted(str(p) for p in missing)}"
+        f"These toolbox widgets are not declared in tse_analytics/toolbox/__init__.py: {sorted(missing)}"
     )
 
 
+def test_manifest_imports_no_widget_module():
+    """Building the menus must not import the widget modules or the analysis libraries behind them."""
+    code = (
+        "import sys\n"
+        "import tse_analytics.views.misc.toolbox_button\n"
+        "from tse_analytics.core.startup_report import get_startup_report\n"
+        "report = get_startup_report()\n"
+        "print(report.loaded_plugins, report.deferred_packages)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=_REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == "[] []"
+
+
+def test_widget_class_is_imported_on_first_access():
+    plugin = ToolboxPluginInfo("Cat", "Lazy", ":/icons/x.png", "json.decoder:JSONDecoder")
+    assert plugin.module_name == "json.decoder"
+    with patch.dict(sys.modules):
+        sys.modules.pop("json.decoder", None)
+        assert not plugin.is_loaded
+
+        assert plugin.widget_class.__name__ == "JSONDecoder"
+        assert plugin.is_loaded
+
+    direct = ToolboxPluginInfo("Cat", "Direct", ":/icons/x.png", QWidget)
+    assert direct.widget_class is QWidget and direct.is_loaded and direct.module_name is None
+
+
 def test_no_duplicate_category_label():
     keys = [(p.category, p.label) for p in _all_plugins()]
     dupes = [key for key, count in Counter(keys).items() if count > 1]
@@ -176,7 +204,9 @@ def test_validate_registry_detects_duplicates_and_empty_icons():
     dup_a = ToolboxPluginInfo("Cat", "Dup", ":/icons/x.png", object)
     dup_b = ToolboxPluginInfo("Cat", "Dup", ":/icons/x.png", object)  # duplicate (category, label)
     no_icon = ToolboxPluginInfo("Cat", "NoIcon", "", object)  # empty icon
-    with patch.object(registry, "get_plugins", return_value={"Cat": [dup_a, dup_b, no_icon]}):
+    bad_path = ToolboxPluginInfo("Cat", "BadPath", ":/icons/x.png", "some.module")  # no class name
+    with patch.object(registry, "get_plugins", return_value={"Cat": [dup_a, dup_b, no_icon, bad_path]}):
         issues = validate_registry()
     assert any("Duplicate" in issue and "Dup" in issue for issue in issues)
     assert any("empty icon" in issue and "NoIcon" in issue for issue in issues)
+    assert any("module:Class" in issue and "BadPath" in issue for issue in issues)
@@ -0,0 +1,17 @@
+"""Headless batch analysis.
+
+Applies toolbox processors to many datasets without the user interface, driven by a declarative
+JSON spec. Run it with ``python -m tse_analytics.batch spec.json`` or ``tse-analytics-batch``.
+"""
+
+from tse_analytics.batch.runner import JobOutcome, run_batch
+from tse_analytics.batch.spec import BatchJob, BatchSpec, load_batch_spec, parse_batch_spec
+
+__all__ = [
+    "BatchJob",
+    "BatchSpec",
+    "JobOutcome",
+    "load_batch_spec",
+    "parse_batch_spec",
+    "run_batch",
+]
@@ -0,0 +1,51 @@
+"""Command line entry point of the batch runner: ``python -m tse_analytics.batch spec.json``."""
+
+import argparse
+import dataclasses
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from tse_analytics.batch.runner import run_batch
+from tse_analytics.batch.spec import load_batch_spec
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a batch spec from the command line.
+
+    Args:
+        argv: Command line arguments, ``sys.argv[1:]`` if None.
+
+    Returns:
+        The exit code: 0 if all jobs succeeded, 1 if any failed, 2 if the spec is invalid.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m tse_analytics.batch",
+        description="Apply toolbox analyses to many datasets without the user interface.",
+    )
+    parser.add_argument("spec", type=Path, help="JSON batch spec")
+    parser.add_argument("-o", "--output", type=Path, help="output directory, overriding the spec")
+    parser.add_argument("-j", "--workers", type=int, help="number of worker processes, overriding the spec")
+    parser.add_argument("--cache", type=Path, help="result cache directory, overriding the spec")
+    args = parser.parse_args(argv)
+
+    try:
+        spec = load_batch_spec(args.spec)
+    except (OSError, ValueError) as e:
+        logger.error(f"Invalid batch spec {args.spec}: {e}")
+        return 2
+    if args.output is not None:
+        spec = dataclasses.replace(spec, output=args.output.resolve())
+    if args.workers is not None:
+        spec = dataclasses.replace(spec, max_workers=args.workers)
+    if args.cache is not None:
+        spec = dataclasses.replace(spec, cache=args.cache.resolve())
+
+    outcomes = run_batch(spec, lambda done, total: logger.info(f"Analysed {done}/{total} datasets"))
+    logger.info(f"Results written to {spec.output}")
+    return 0 if all(outcome.succeeded for outcome in outcomes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
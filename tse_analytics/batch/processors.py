@@ -0,0 +1,141 @@
+"""Toolbox and extension processors available to batch jobs.
+
+Processors are referenced by ``"module:function"`` path and imported in the worker process that runs
+them, like toolbox widgets are imported on first use. Their arguments are bound from the job by
+parameter name, see ``bind_processor_arguments``.
+"""
+
+import importlib
+import inspect
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, get_args, get_origin
+
+from tse_analytics.core.data.shared import Variable
+
+if TYPE_CHECKING:
+    from tse_analytics.batch.spec import BatchJob
+    from tse_analytics.core.data.datatable import Datatable
+
+BATCH_PROCESSORS: dict[str, str] = {
+    "actogram": "tse_analytics.toolbox.actogram.processor:get_actogram_result",
+    "ancova": "tse_analytics.toolbox.ancova.processor:get_ancova_result",
+    "chronobiology": "tse_analytics.toolbox.chronobiology.processor:get_chronobiology_result",
+    "composite_score": "tse_analytics.toolbox.composite_score.processor:get_composite_score_result",
+    "correlation": "tse_analytics.toolbox.correlation.processor:get_correlation_result",
+    "correlation_matrix": "tse_analytics.toolbox.correlation_matrix.processor:get_correlation_matrix_result",
+    "data_plot": "tse_analytics.toolbox.data_plot.processor:get_data_plot_result",
+    "distribution": "tse_analytics.toolbox.distribution.processor:get_distribution_result",
+    "histogram": "tse_analytics.toolbox.histogram.processor:get_histogram_result",
+    "matrix_plot": "tse_analytics.toolbox.matrix_plot.processor:get_matrix_plot_result",
+    "mds": "tse_analytics.toolbox.mds.processor:get_mds_result",
+    "mixed_anova": "tse_analytics.toolbox.mixed_anova.processor:get_mixed_anova_result",
+    "n_way_anova": "tse_analytics.toolbox.n_way_anova.processor:get_n_way_anova_result",
+    "normality": "tse_analytics.toolbox.normality.processor:get_normality_result",
+    "one_way_anova": "tse_analytics.toolbox.one_way_anova.processor:get_one_way_anova_result",
+    "pca": "tse_analytics.toolbox.pca.processor:get_pca_result",
+    "periodogram": "tse_analytics.toolbox.periodogram.processor:get_periodogram_result",
+    "regression": "tse_analytics.toolbox.regression.processor:get_regression_result",
+    "rm_anova": "tse_analytics.toolbox.rm_anova.processor:get_rm_anova_result",
+    "timeseries_autocorrelation": (
+        "tse_analytics.toolbox.timeseries_autocorrelation.processor:get_timeseries_autocorrelation_result"
+    ),
+    "timeseries_decomposition": (
+        "tse_analytics.toolbox.timeseries_decomposition.processor:get_timeseries_decomposition_result"
+    ),
+    "tsne": "tse_analytics.toolbox.tsne.processor:get_tsne_result",
+    "umap": "tse_analytics.toolbox.umap.processor:get_umap_result",
+    # PhenoMaster extensions, run on raw datatables (job "extension" key)
+    "calo_fitting": "tse_analytics.modules.phenomaster.extensions.calo.batch:get_calo_result",
+    "drinkfeed_intervals": (
+        "tse_analytics.modules.phenomaster.extensions.drinkfeed.batch:get_drinkfeed_intervals_result"
+    ),
+    "drinkfeed_sequences": (
+        "tse_analytics.modules.phenomaster.extensions.drinkfeed.batch:get_drinkfeed_sequences_result"
+    ),
+}
+
+# Parameters receiving the first job variable
+_SINGLE_VARIABLE_PARAMETERS = ("variable", "variable_name", "dependent_variable")
+
+
+def get_batch_processor(name: str) -> Callable[..., Any]:
+    """Import a batch processor function.
+
+    Args:
+        name: Key of the processor in ``BATCH_PROCESSORS``.
+
+    Returns:
+        The processor function.
+    """
+    module_name, _, function_name = BATCH_PROCESSORS[name].partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _resolve_variable(datatable: Datatable, name: str) -> Variable:
+    if name not in datatable.variables:
+        raise ValueError(f"Variable '{name}' not found in datatable '{datatable.name}'")
+    return datatable.variables[name]
+
+
+def bind_processor_arguments(
+    function: Callable[..., Any],
+    datatable: Datatable,
+    job: BatchJob,
+    figsize: tuple[float, float] | None,
+) -> dict[str, Any]:
+    """Bind the arguments of a processor call from a batch job.
+
+    Parameters are filled by name: ``datatable`` and ``figsize`` from the batch, any parameter named
+    in ``job.settings`` from the settings, ``variables`` from the job variables, ``variable``,
+    ``variable_name`` and ``dependent_variable`` from the first job variable, ``factor_name`` from
+    the job factor and ``factor_names`` from it as a one-item list. Parameters left unbound keep their
+    defaults. Variable names passed to ``Variable`` parameters are resolved against the datatable.
+
+    Args:
+        function: The processor function.
+        datatable: The datatable to analyse.
+        job: The batch job.
+        figsize: Figure size passed to processors taking one.
+
+    Returns:
+        The keyword arguments of the processor call.
+
+    Raises:
+        ValueError: If a setting is not a processor parameter, a required parameter cannot be
+            bound, or a job variable does not exist in the datatable.
+    """
+    parameters = inspect.signature(function, eval_str=True).parameters
+    unknown = set(job.settings) - set(parameters)
+    if unknown:
+        raise ValueError(f"Unknown settings for processor '{job.processor}': {', '.join(sorted(unknown))}")
+    for variable_name in job.variables:
+        _resolve_variable(datatable, variable_name)
+
+    arguments: dict[str, Any] = {}
+    for name, parameter in parameters.items():
+        if name == "datatable":
+            value = datatable
+        elif name in job.settings:
+            value = job.settings[name]
+        elif name == "figsize":
+            value = figsize
+        elif name == "variables" and job.variables:
+            value = list(job.variables)
+        elif name in _SINGLE_VARIABLE_PARAMETERS and job.variables:
+            value = job.variables[0]
+        elif name == "factor_name" and job.factor is not None:
+            value = job.factor
+        elif name == "factor_names" and job.factor is not None:
+            value = [job.factor]
+        elif parameter.default is not inspect.Parameter.empty:
+            continue
+        else:
+            raise ValueError(f"Processor '{job.processor}' requires the '{name}' setting")
+
+        annotation = parameter.annotation
+        if annotation is Variable and isinstance(value, str):
+            value = _resolve_variable(datatable, value)
+        elif get_origin(annotation) is dict and get_args(annotation)[-1] is Variable:
+            value = {variable_name: _resolve_variable(datatable, variable_name) for variable_name in value}
+        arguments[name] = value
+    return arguments
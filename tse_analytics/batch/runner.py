@@ -0,0 +1,371 @@
+"""Batch runner: applies the jobs of a batch spec to every dataset of its inputs.
+
+Every dataset is analysed in a worker process of a spawn-context process pool. Workers open their
+dataset themselves (DuckDB workspaces lazily, so only the datatables the jobs use are read), so no dataset
+is pickled between processes; only the spec and the job outcomes are. The runner has no Qt
+dependency and renders figures with the Agg backend.
+"""
+
+import html
+import multiprocessing
+import os
+import pickle
+import re
+import timeit
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import pandas as pd
+from loguru import logger
+
+from tse_analytics.batch.processors import bind_processor_arguments, get_batch_processor
+from tse_analytics.batch.spec import BatchJob, BatchSpec
+from tse_analytics.core.csv_import_settings import CsvImportSettings
+from tse_analytics.core.data.dataset import Dataset
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.data.workspace import Workspace
+from tse_analytics.core.io.storage import load_workspace
+from tse_analytics.core.utils.formatting import get_html_document
+from tse_analytics.modules.phenomaster.io.tse_import_settings import TseImportSettings
+from tse_analytics.toolbox.result_cache import configure_result_cache
+
+WORKSPACE_SUFFIXES = (".workspace", ".duckdb")
+
+LEGACY_WORKSPACE_SUFFIX = ".workspace"
+
+
+@dataclass(frozen=True)
+class BatchTask:
+    """One dataset to analyse.
+
+    Attributes:
+        source: The input file.
+        dataset_id: Id of the dataset in a workspace file, None for raw data files holding one dataset.
+        dataset_name: Dataset name, as shown in the summary.
+        output: Directory the results of the dataset are written to.
+    """
+
+    source: Path
+    dataset_id: UUID | None
+    dataset_name: str
+    output: Path
+
+
+@dataclass(frozen=True)
+class JobOutcome:
+    """Outcome of one job on one dataset.
+
+    Attributes:
+        dataset: Dataset name.
+        job: Job name.
+        files: Files written, relative to the batch output directory.
+        error: Error message if the job failed, None on success.
+        seconds: Time the job took.
+    """
+
+    dataset: str
+    job: str
+    files: list[str]
+    error: str | None
+    seconds: float
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def _file_name(text: str) -> str:
+    """A file name derived from a dataset or job name."""
+    return re.sub(r"[^\w\-. ()]+", "_", text).strip() or "_"
+
+
+def open_workspace(path: Path) -> Workspace:
+    """Open a workspace file.
+
+    Args:
+        path: A DuckDB workspace, opened lazily, or a legacy pickled ``.workspace`` file.
+
+    Returns:
+        The workspace.
+    """
+    if path.suffix.lower() == LEGACY_WORKSPACE_SUFFIX:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    return load_workspace(str(path), lazy=True)
+
+
+def open_raw_dataset(path: Path, tse_import_settings: TseImportSettings) -> Dataset | None:
+    """Import a raw PhenoMaster, IntelliCage or IntelliMaze data file.
+
+    Args:
+        path: A ``.tse`` or ``.csv`` PhenoMaster file, or an IntelliCage/IntelliMaze ``.zip`` archive.
+        tse_import_settings: Extension tables imported from ``.tse`` files.
+
+    Returns:
+        The imported dataset, or None if the file is not a supported dataset.
+    """
+    match path.suffix.lower():
+        case ".tse":
+            from tse_analytics.modules.phenomaster.io.tse_dataset_loader import load_tse_dataset
+
+            return load_tse_dataset(path, tse_import_settings)
+        case ".csv":
+            from tse_analytics.modules.phenomaster.io.csv_dataset_loader import load_csv_dataset
+
+            return load_csv_dataset(path, CsvImportSettings.get_default())
+        case ".zip":
+            if not zipfile.is_zipfile(path):
+                return None
+            with zipfile.ZipFile(path, mode="r") as zip:
+                archived_files = zip.namelist()
+            if any(".IntelliMaze" in name for name in archived_files):
+                from tse_analytics.modules.intellimaze.io.dataset_loader import import_intellimaze_dataset
+
+                return import_intellimaze_dataset(path)
+            if any(".experiment" in name for name in archived_files):
+                from tse_analytics.modules.intellicage.io.dataset_loader import import_intellicage_dataset
+
+                return import_intellicage_dataset(path)
+    return None
+
+
+def plan_batch_tasks(spec: BatchSpec) -> list[BatchTask]:
+    """List the datasets of the batch inputs.
+
+    DuckDB workspaces are opened lazily to list their datasets; raw data files are taken to hold one
+    dataset named after the file. Every dataset gets its own output directory.
+
+    Args:
+        spec: The batch spec.
+
+    Returns:
+        One task per dataset, in input order.
+    """
+    datasets: list[tuple[Path, UUID | None, str]] = []
+    for path in spec.inputs:
+        if path.suffix.lower() in WORKSPACE_SUFFIXES:
+            workspace = open_workspace(path)
+            datasets.extend((path, dataset.id, dataset.name) for dataset in workspace.datasets.values())
+        else:
+            datasets.append((path, None, path.stem))
+
+    tasks: list[BatchTask] = []
+    used_names: set[str] = set()
+    for path, dataset_id, name in datasets:
+        folder_name = _file_name(name)
+        suffix = 2
+        while folder_name.lower() in used_names:
+            folder_name = f"{_file_name(name)} ({suffix})"
+            suffix += 1
+        used_names.add(folder_name.lower())
+        tasks.append(BatchTask(path, dataset_id, name, spec.output / folder_name))
+    return tasks
+
+
+def write_job_result(result: Any, job: BatchJob, output: Path) -> list[Path]:
+    """Write a processor result: its report as an HTML document and its tables as CSV files.
+
+    Args:
+        result: The result dataclass returned by the processor.
+        job: The job that produced it.
+        output: Directory to write to.
+
+    Returns:
+        The files written.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    files: list[Path] = []
+
+    def write_table(df: pd.DataFrame, table_name: str) -> None:
+        path = output / f"{_file_name(f'{job.name} - {table_name}')}.csv"
+        df.to_csv(path, index=False)
+        files.append(path)
+
+    for result_field in fields(result):
+        value = getattr(result, result_field.name)
+        if result_field.name == "report":
+            path = output / f"{_file_name(job.name)}.html"
+            path.write_text(get_html_document(value), encoding="utf-8")
+            files.append(path)
+        elif isinstance(value, pd.DataFrame):
+            write_table(value, result_field.name)
+        elif isinstance(value, dict):
+            # Named result tables, e.g. chronobiology's ResultTable objects
+            for table_name, table in value.items():
+                df = table if isinstance(table, pd.DataFrame) else getattr(table, "df", None)
+                if isinstance(df, pd.DataFrame):
+                    write_table(df, str(table_name))
+    return files
+
+
+def get_job_datatable(dataset: Dataset, job: BatchJob) -> Datatable:
+    """Look up the datatable a job runs on.
+
+    Args:
+        dataset: The dataset being analysed.
+        job: The batch job.
+
+    Returns:
+        The dataset datatable named by the job, or the raw datatable of the job extension.
+
+    Raises:
+        ValueError: If the dataset has no such datatable.
+    """
+    if job.extension is None:
+        if job.datatable not in dataset.datatables:
+            raise ValueError(f"Datatable '{job.datatable}' not found")
+        return dataset.datatables[job.datatable]
+    raw_datatables = dataset.raw_datatables.get(job.extension, {})
+    if job.datatable not in raw_datatables:
+        raise ValueError(f"Datatable '{job.datatable}' of extension '{job.extension}' not found")
+    return raw_datatables[job.datatable]
+
+
+def run_batch_task(task: BatchTask, spec: BatchSpec) -> list[JobOutcome]:
+    """Run all jobs of a batch on one dataset. This is the worker process entry point.
+
+    A failing job does not stop the others; its error is reported in its outcome.
+
+    Args:
+        task: The dataset to analyse.
+        spec: The batch spec.
+
+    Returns:
+        The outcome of every job.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    configure_result_cache(spec.cache)
+
+    try:
+        if task.dataset_id is None:
+            dataset = open_raw_dataset(task.source, spec.tse_import_settings)
+            if dataset is None:
+                raise ValueError(f"'{task.source.name}' is not a supported dataset")
+        else:
+            dataset = open_workspace(task.source).datasets[task.dataset_id]
+    except Exception as e:
+        logger.error(f"Cannot open dataset '{task.dataset_name}' from {task.source}: {e}")
+        return [JobOutcome(task.dataset_name, job.name, [], f"Cannot open dataset: {e}", 0.0) for job in spec.jobs]
+
+    outcomes: list[JobOutcome] = []
+    for job in spec.jobs:
+        tic = timeit.default_timer()
+        files: list[Path] = []
+        error = None
+        try:
+            datatable = get_job_datatable(dataset, job)
+            if job.factor is not None and job.factor not in dataset.factors:
+                raise ValueError(f"Factor '{job.factor}' not found")
+            processor = get_batch_processor(job.processor)
+            result = processor(**bind_processor_arguments(processor, datatable, job, spec.figsize))
+            if result is None:
+                raise ValueError("The processor returned no result")
+            files = write_job_result(result, job, task.output)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"Job '{job.name}' failed on dataset '{task.dataset_name}': {error}")
+        finally:
+            plt.close("all")
+        outcomes.append(
+            JobOutcome(
+                task.dataset_name,
+                job.name,
+                [file.relative_to(spec.output).as_posix() for file in files],
+                error,
+                timeit.default_timer() - tic,
+            )
+        )
+    return outcomes
+
+
+def write_batch_summary(outcomes: list[JobOutcome], output: Path) -> None:
+    """Write ``summary.csv`` and an ``index.html`` linking the reports of all jobs.
+
+    Args:
+        outcomes: The job outcomes.
+        output: The batch output directory.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    summary_df = pd.DataFrame(
+        {
+            "Dataset": [outcome.dataset for outcome in outcomes],
+            "Job": [outcome.job for outcome in outcomes],
+            "Status": ["OK" if outcome.succeeded else "Failed" for outcome in outcomes],
+            "Seconds": [round(outcome.seconds, 3) for outcome in outcomes],
+            "Error": [outcome.error or "" for outcome in outcomes],
+            "Files": [";".join(outcome.files) for outcome in outcomes],
+        },
+    )
+    summary_df.to_csv(output / "summary.csv", index=False)
+
+    rows = []
+    for outcome in outcomes:
+        links = " ".join(f"<a href='{html.escape(file)}'>{html.escape(Path(file).name)}</a>" for file in outcome.files)
+        status = "OK" if outcome.succeeded else f"Failed: {outcome.error}"
+        rows.append(
+            f"<tr><td>{html.escape(outcome.dataset)}</td><td>{html.escape(outcome.job)}</td>"
+            f"<td>{html.escape(status)}</td><td>{links}</td></tr>"
+        )
+    content = (
+        "<table><caption>Batch results</caption>"
+        "<tr><th>Dataset</th><th>Job</th><th>Status</th><th>Files</th></tr>"
+        f"{''.join(rows)}</table>"
+    )
+    (output / "index.html").write_text(get_html_document(content), encoding="utf-8")
+
+
+def run_batch(spec: BatchSpec, on_progress: Callable[[int, int], None] | None = None) -> list[JobOutcome]:
+    """Run a batch: every job on every dataset of the inputs, then write the summary.
+
+    Args:
+        spec: The batch spec.
+        on_progress: Called with the number of finished and total datasets after each dataset.
+
+    Returns:
+        The outcome of every job, grouped by dataset in input order.
+    """
+    tic = timeit.default_timer()
+    tasks = plan_batch_tasks(spec)
+    results: dict[int, list[JobOutcome]] = {}
+
+    max_workers = min(spec.max_workers or os.cpu_count() or 1, len(tasks))
+    if max_workers <= 1:
+        for i, task in enumerate(tasks):
+            results[i] = run_batch_task(task, spec)
+            if on_progress is not None:
+                on_progress(len(results), len(tasks))
+    else:
+        # Never fork: loaders and processors may have started threads in this process
+        with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {executor.submit(run_batch_task, task, spec): i for i, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                task = tasks[futures[future]]
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    # A crashed worker breaks the pool: record the jobs of every unfinished dataset as failed
+                    error = f"{type(e).__name__}: {e}"
+                    logger.error(f"Dataset '{task.dataset_name}' failed in its worker process: {error}")
+                    results[futures[future]] = [
+                        JobOutcome(task.dataset_name, job.name, [], error, 0.0) for job in spec.jobs
+                    ]
+                if on_progress is not None:
+                    on_progress(len(results), len(tasks))
+
+    outcomes = [outcome for i in range(len(tasks)) for outcome in results[i]]
+    write_batch_summary(outcomes, spec.output)
+    failed = sum(not outcome.succeeded for outcome in outcomes)
+    logger.info(
+        f"Batch of {len(spec.jobs)} jobs on {len(tasks)} datasets done in {(timeit.default_timer() - tic):.3f} sec"
+        f" ({failed} failed)"
+    )
+    return outcomes
@@ -0,0 +1,191 @@
+"""Declarative batch job specification.
+
+A batch spec is a JSON file naming the inputs to analyse, the analyses (jobs) to run on every
+dataset found in them, and where to write the results::
+
+    {
+        "inputs": ["experiments/*.duckdb", "raw/run-1.tse"],
+        "output": "results",
+        "max_workers": 4,
+        "figsize": [10, 6],
+        "cache": "cache",
+        "jobs": [
+            {"name": "PCA", "processor": "pca", "variables": ["VO2(3)", "VCO2(3)", "RER"], "factor": "Genotype"},
+            {"name": "RER ANOVA", "processor": "one_way_anova", "variables": ["RER"], "factor": "Genotype",
+             "settings": {"effsize": "np2"}},
+            {"name": "Meals", "processor": "drinkfeed_sequences", "extension": "DrinkFeed",
+             "datatable": "drinkfeed_bin"}
+        ]
+    }
+
+Relative input and output paths are resolved against the directory of the spec file.
+"""
+
+import glob
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from tse_analytics.batch.processors import BATCH_PROCESSORS
+from tse_analytics.modules.phenomaster.io.tse_import_settings import TseImportSettings
+
+# Input file types the batch runner can open
+INPUT_SUFFIXES = (".workspace", ".duckdb", ".tse", ".csv", ".zip")
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One analysis applied to every dataset of a batch.
+
+    Attributes:
+        name: Job name, used for the output file names.
+        processor: Key of the toolbox processor in ``BATCH_PROCESSORS``.
+        datatable: Name of the dataset datatable the processor runs on.
+        extension: Extension whose raw datatables ``datatable`` is looked up in (e.g. ``"DrinkFeed"``,
+            ``"Calo"``), or None for the dataset datatables.
+        variables: Variables to analyse. Processors taking a single variable use the first one.
+        factor: Factor to group by. Processors taking several factors receive it as a one-item list.
+        settings: Further processor arguments by parameter name; they take precedence over the
+            arguments derived from ``variables`` and ``factor``.
+    """
+
+    name: str
+    processor: str
+    datatable: str = "Main"
+    extension: str | None = None
+    variables: list[str] = field(default_factory=list)
+    factor: str | None = None
+    settings: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BatchSpec:
+    """A batch: input files, jobs and output options.
+
+    Attributes:
+        inputs: Input files, already resolved and expanded from glob patterns.
+        jobs: Jobs to run on every dataset.
+        output: Directory the results are written to.
+        max_workers: Number of worker processes; None uses one per CPU, 1 runs in the calling process.
+        figsize: Figure size in inches passed to the processors, or None for the matplotlib default.
+        tse_import_settings: Extension tables imported from raw ``.tse`` files.
+        cache: Result cache directory reused across batch runs, or None to always compute.
+    """
+
+    inputs: list[Path]
+    jobs: list[BatchJob]
+    output: Path
+    max_workers: int | None = None
+    figsize: tuple[float, float] | None = None
+    tse_import_settings: TseImportSettings = field(
+        default_factory=lambda: TseImportSettings(False, False, False, False, False)
+    )
+    cache: Path | None = None
+
+
+def _expand_inputs(patterns: list[str], base_path: Path) -> list[Path]:
+    inputs: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if not path.is_absolute():
+            path = base_path / path
+        matches = sorted(Path(match) for match in glob.glob(str(path)))
+        if not matches:
+            raise ValueError(f"No input files match '{pattern}'")
+        for match in matches:
+            if match.suffix.lower() not in INPUT_SUFFIXES:
+                raise ValueError(f"Unsupported input file type: '{match}'")
+            if match not in inputs:
+                inputs.append(match)
+    return inputs
+
+
+def _parse_job(data: dict[str, Any]) -> BatchJob:
+    unknown = set(data) - {"name", "processor", "datatable", "extension", "variables", "factor", "settings"}
+    if unknown:
+        raise ValueError(f"Unknown job keys: {', '.join(sorted(unknown))}")
+    if "processor" not in data:
+        raise ValueError("Job without processor")
+    processor = data["processor"]
+    if processor not in BATCH_PROCESSORS:
+        raise ValueError(f"Unknown processor '{processor}'. Available: {', '.join(sorted(BATCH_PROCESSORS))}")
+    return BatchJob(
+        name=data.get("name", processor),
+        processor=processor,
+        datatable=data.get("datatable", "Main"),
+        extension=data.get("extension"),
+        variables=list(data.get("variables", [])),
+        factor=data.get("factor"),
+        settings=dict(data.get("settings", {})),
+    )
+
+
+def parse_batch_spec(data: dict[str, Any], base_path: Path) -> BatchSpec:
+    """Build a batch spec from its JSON representation.
+
+    Args:
+        data: The decoded JSON object.
+        base_path: Directory relative paths are resolved against.
+
+    Returns:
+        The validated batch spec.
+
+    Raises:
+        ValueError: If the spec is malformed, names an unknown processor, or an input pattern
+            matches no supported file.
+    """
+    jobs = [_parse_job(job) for job in data.get("jobs", [])]
+    if not jobs:
+        raise ValueError("The batch spec defines no jobs")
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate job names: {', '.join(duplicates)}")
+
+    output = Path(data.get("output", "batch-results"))
+    if not output.is_absolute():
+        output = base_path / output
+    inputs = _expand_inputs(list(data.get("inputs", [])), base_path)
+    if not inputs:
+        raise ValueError("The batch spec defines no inputs")
+    tse_import_settings = {
+        "import_calo_bin": False,
+        "import_drinkfeed_bin": False,
+        "import_drinkfeed_raw": False,
+        "import_actimot_raw": False,
+        "import_grouphousing": False,
+    }
+    unknown = set(data.get("tse_import_settings", {})) - set(tse_import_settings)
+    if unknown:
+        raise ValueError(f"Unknown TSE import settings: {', '.join(sorted(unknown))}")
+    tse_import_settings.update(data.get("tse_import_settings", {}))
+    figsize = data.get("figsize")
+    cache = Path(data["cache"]) if data.get("cache") is not None else None
+    if cache is not None and not cache.is_absolute():
+        cache = base_path / cache
+
+    return BatchSpec(
+        inputs=inputs,
+        jobs=jobs,
+        output=output,
+        max_workers=data.get("max_workers"),
+        figsize=tuple(figsize) if figsize is not None else None,
+        tse_import_settings=TseImportSettings(**tse_import_settings),
+        cache=cache,
+    )
+
+
+def load_batch_spec(path: str | Path) -> BatchSpec:
+    """Read a batch spec from a JSON file.
+
+    Args:
+        path: The spec file.
+
+    Returns:
+        The validated batch spec, with paths resolved against the directory of the file.
+    """
+    path = Path(path).resolve()
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return parse_batch_spec(data, path.parent)
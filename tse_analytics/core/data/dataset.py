@@ -100,6 +100,15 @@ class Dataset:
 
         self.reports: dict[str, Report] = {}
 
+        # Hash of the last persisted metadata row and reports, maintained by core/io/storage.py
+        # so incremental saves skip unchanged datasets.
+        self.persisted_meta_hash: str | None = None
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles written before incremental saves lack the persistence bookkeeping.
+        state.setdefault("persisted_meta_hash", None)
+        self.__dict__.update(state)
+
     @property
     def light_cycles(self) -> ByTimeOfDayConfig:
         """Configuration for the dataset's light/dark cycle.
@@ -524,9 +533,11 @@ class Dataset:
         """
         Create a deep copy of the dataset.
 
-        Uses ``Datatable.clone()`` (which uses pandas' ``df.copy()``) for each
-        datatable instead of ``copy.deepcopy``, which is significantly faster
-        for large dataframes.
+        Uses ``Datatable.clone()`` for each datatable instead of ``copy.deepcopy``:
+        the cloned datatables share the column buffers of the originals and pandas
+        copy-on-write copies a column only when either side modifies it, so cloning
+        does not duplicate the data in memory. Reports are copied with the clone as
+        their dataset.
 
         Returns
         -------
@@ -542,7 +553,10 @@ class Dataset:
         )
         new.subject_id_column = self.subject_id_column
         new.factors = deepcopy(self.factors)
-        new.reports = deepcopy(self.reports)
+        # Not deepcopy: it would follow ``Report.dataset`` and copy (and load) the whole original
+        new.reports = {
+            name: Report(new, report.name, report.content, report.timestamp) for name, report in self.reports.items()
+        }
 
         new.datatables = {}
         for name, dt in self.datatables.items():
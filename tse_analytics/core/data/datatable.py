@@ -9,16 +9,19 @@ excluding time ranges, resampling, and applying factors.
 from __future__ import annotations
 
 import copy
+import hashlib
+import timeit
+import weakref
 from collections.abc import Iterable
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import uuid7
 
 import pandas as pd
 from loguru import logger
 
 from tse_analytics.core import messaging
-from tse_analytics.core.data.factor_appliers import FACTOR_APPLIERS
+from tse_analytics.core.data.factor_appliers import apply_factors, factor_cache_key
 from tse_analytics.core.data.operators.outliers_pipe_operator import process_outliers
 from tse_analytics.core.data.outliers import OutliersMode, OutliersSettings
 from tse_analytics.core.data.shared import (
@@ -29,6 +32,7 @@ from tse_analytics.core.data.shared import (
     Variable,
 )
 from tse_analytics.core.utils.data import exclude_animals_from_df, reassign_df_timedelta, rename_animal_df
+from tse_analytics.core.utils.memory import column_buffers, root_buffer
 
 if TYPE_CHECKING:
     from tse_analytics.core.data.dataset import Dataset
@@ -48,6 +52,66 @@ META_EXTENSION_NAME = "extension_name"
 """Owning extension name; set automatically by ``Dataset.add_raw_datatable``."""
 
 
+def _column_hash(series: pd.Series) -> str:
+    """Hash of a column's dtype and values."""
+    hashes = pd.util.hash_pandas_object(series, index=False)
+    digest = hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16)
+    dtype = series.dtype
+    digest.update(str(dtype).encode())
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Categories and their order are part of the dtype: grouping and plot order depend on them
+        categories = pd.util.hash_pandas_object(pd.Series(dtype.categories), index=False)
+        digest.update(categories.to_numpy().tobytes())
+        digest.update(f"{dtype.ordered}\0{dtype.categories.dtype}".encode())
+    return digest.hexdigest()
+
+
+def _column_storage(series: pd.Series) -> tuple | None:
+    """
+    Identify the memory a column's values are stored in: a weak reference to each buffer's owning
+    array together with the buffer's address, shape and strides within it. None if the buffers
+    cannot be inspected.
+    """
+    buffers = column_buffers(series.array)
+    if buffers is None:
+        return None
+    return tuple(
+        (weakref.ref(root_buffer(buffer)), buffer.__array_interface__["data"][0], buffer.shape, buffer.strides)
+        for buffer in buffers
+    )
+
+
+def _is_column_storage(storage: Any, series: pd.Series) -> bool:
+    """Whether a column is still stored in the memory identified by ``_column_storage``."""
+    buffers = column_buffers(series.array)
+    if not isinstance(storage, tuple) or buffers is None or len(buffers) != len(storage):
+        return False
+    return all(
+        ref() is root_buffer(buffer)
+        and address == buffer.__array_interface__["data"][0]
+        and shape == buffer.shape
+        and strides == buffer.strides
+        for (ref, address, shape, strides), buffer in zip(storage, buffers, strict=True)
+    )
+
+
+class DataframeSource(Protocol):
+    """Deferred storage backing of a datatable DataFrame.
+
+    A datatable constructed with a source instead of a DataFrame reads its frame only on first
+    access of :attr:`Datatable.df`. The DuckDB implementation lives in ``core/io/storage.py``.
+    """
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names of the stored frame, available without reading any rows."""
+        ...
+
+    def read(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Read the stored frame, optionally projected to ``columns``."""
+        ...
+
+
 class Datatable:
     """
     A class representing a data table in an experiment.
@@ -64,8 +128,10 @@ class Datatable:
         name: str,
         description: str,
         variables: dict[str, Variable],
-        df: pd.DataFrame,
+        df: pd.DataFrame | None,
         metadata: dict[str, Any],
+        *,
+        df_source: DataframeSource | None = None,
     ):
         """
         Initialize a Datatable instance.
@@ -80,21 +146,167 @@ class Datatable:
             A description of the datatable.
         variables : dict[str, Variable]
             Dictionary mapping variable names to Variable objects.
-        df : pd.DataFrame
-            The pandas DataFrame containing the data.
+        df : pd.DataFrame | None
+            The pandas DataFrame containing the data, or ``None`` when ``df_source`` is given.
         metadata : dict[str, Any]
             Metadata associated with the datatable, such as sampling interval.
+        df_source : DataframeSource | None
+            Storage backing the DataFrame is read from on first access (lazy workspaces).
         """
+        if df is None and df_source is None:
+            raise ValueError(f"Datatable {name!r} needs either a DataFrame or a DataFrame source.")
+
         self.id = uuid7()
         self.dataset = dataset
         self.name = name
         self.description = description
         self.variables = variables
-        self.df = df
         self.metadata = metadata
 
+        self._df = df
+        self._df_source = df_source if df is None else None
+
         self.outliers_settings = OutliersSettings()
 
+        # Persistence bookkeeping for incremental saves, maintained by core/io/storage.py:
+        # the (workspace file, table name) holding an unmodified copy of the DataFrame, and
+        # a hash of the last persisted metadata row.
+        self.persisted_table: tuple[str, str] | None = None
+        self.persisted_meta_hash: str | None = None
+
+        # Incremented on every DataFrame replacement or in-place mutation, so that results
+        # derived from the frame (e.g. cached pipeline outputs) can tell it changed.
+        self.revision = 0
+
+        # Cache keys of the factor columns materialized by the last ``set_factors`` call, valid
+        # while the frame is at ``_factor_keys_revision``.
+        self._factor_keys: dict[str, str] = {}
+        self._factor_keys_revision = -1
+
+        # Content hashes of the columns by name, each with the storage it was computed from: the
+        # column's buffers (see ``_column_storage``), or the DataFrame source of an unloaded frame.
+        self._column_hashes: dict[str, tuple[Any, str]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Legacy pickle workspaces must be self-contained: read a lazily backed frame into the
+        # pickled state, leaving this datatable unloaded.
+        state = self.__dict__.copy()
+        if self._df is None:
+            state["_df"] = self._df_source.read()
+            state["_df_source"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles written before lazy loading hold the frame as ``df`` and lack the bookkeeping below.
+        if "df" in state:
+            state["_df"] = state.pop("df")
+        state.setdefault("_df_source", None)
+        state.setdefault("persisted_table", None)
+        state.setdefault("persisted_meta_hash", None)
+        state.setdefault("revision", 0)
+        state.setdefault("_factor_keys", {})
+        state.setdefault("_factor_keys_revision", -1)
+        state.setdefault("_column_hashes", {})
+        self.__dict__.update(state)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """The datatable DataFrame, read from its storage backing on first access."""
+        if self._df is None:
+            tic = timeit.default_timer()
+            source = self._df_source
+            self._df = source.read()
+            self._df_source = None
+            # Hashes computed from the source hold for the frame read from it
+            for column, (storage, column_hash) in self._column_hashes.items():
+                if storage is source and column in self._df.columns:
+                    self._column_hashes[column] = (_column_storage(self._df[column]), column_hash)
+            logger.debug(f"Datatable {self.name!r} materialized in {(timeit.default_timer() - tic):.3f} sec")
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._df_source = None
+        self.persisted_table = None
+        self.revision += 1
+
+    def mark_df_modified(self) -> None:
+        """Flag an in-place DataFrame mutation so the next incremental save rewrites the table."""
+        self.persisted_table = None
+        self.revision += 1
+        # Any column may have been written in place
+        self._column_hashes.clear()
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of the DataFrame content: column names, dtypes and values.
+
+        Equal frames have equal fingerprints, whichever datatable holds them. Column hashes are
+        cached and reused while a column keeps its buffers, so after a mutation only replaced
+        columns are hashed again; in-place mutations flagged by ``mark_df_modified`` rehash all
+        columns. An unloaded frame is hashed column by column from its storage without being
+        materialized.
+
+        Returns
+        -------
+        str
+            The fingerprint.
+        """
+        if self._df is None:
+            columns = self._df_source.columns
+            digest = hashlib.blake2b(digest_size=16)
+            for column in columns:
+                storage, column_hash = self._column_hashes.get(column, (None, None))
+                if storage is not self._df_source:
+                    column_hash = _column_hash(self._df_source.read([column])[column])
+                    self._column_hashes[column] = (self._df_source, column_hash)
+                digest.update(f"{column}\0{column_hash}\0".encode())
+            return digest.hexdigest()
+
+        df = self._df
+        digest = hashlib.blake2b(digest_size=16)
+        for column in df.columns:
+            series = df[column]
+            storage, column_hash = self._column_hashes.get(column, (None, None))
+            if storage is None or not _is_column_storage(storage, series):
+                column_hash = _column_hash(series)
+                storage = _column_storage(series)
+                if storage is not None:
+                    self._column_hashes[column] = (storage, column_hash)
+            digest.update(f"{column}\0{column_hash}\0".encode())
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+            digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the DataFrame is materialized in memory."""
+        return self._df is not None
+
+    @property
+    def df_source(self) -> DataframeSource | None:
+        """Storage backing of a not yet materialized DataFrame; ``None`` once loaded."""
+        return self._df_source
+
+    @df_source.setter
+    def df_source(self, source: DataframeSource) -> None:
+        # Rebinding only makes sense while the frame still lives in storage (e.g. after a save moved it).
+        if self._df is None:
+            # The new backing holds the same frame
+            for column, (storage, column_hash) in self._column_hashes.items():
+                if storage is self._df_source:
+                    self._column_hashes[column] = (source, column_hash)
+            self._df_source = source
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names of the DataFrame, without materializing a lazily backed frame."""
+        if self._df is None:
+            return self._df_source.columns
+        return self._df.columns.tolist()
+
     @classmethod
     def from_dataframe(
         cls,
@@ -129,7 +341,8 @@ class Datatable:
         name : str
             The datatable name (its key in ``dataset.datatables``).
         df : pd.DataFrame
-            The source data. It is copied; the caller's frame is not mutated.
+            The source data. The datatable shares its column buffers copy-on-write; the caller's
+            frame is not mutated.
         origin : str
             Provenance label, stored in ``metadata[META_ORIGIN]`` (e.g. ``"Chronobiology"``).
         description : str | None
@@ -163,7 +376,7 @@ class Datatable:
             The constructed datatable (not yet added to the dataset — call
             ``manager.add_datatable(...)``).
         """
-        df = df.copy()
+        df = df.copy(deep=False)
         if normalize_dtypes:
             df = df.convert_dtypes()
 
@@ -217,7 +430,7 @@ class Datatable:
         Cross-sectional tables generated by the toolbox (e.g. per-animal chronobiology parameters)
         have no ``DateTime`` column; the time-based members are guarded against that case.
         """
-        return "DateTime" in self.df.columns
+        return "DateTime" in self.columns
 
     @property
     def start_timestamp(self) -> pd.Timestamp:
@@ -290,9 +503,9 @@ class Datatable:
             List of default column names.
         """
         columns = ["Animal"]
-        if "DateTime" in self.df.columns:
+        if "DateTime" in self.columns:
             columns.append("DateTime")
-        if "Timedelta" in self.df.columns:
+        if "Timedelta" in self.columns:
             columns.append("Timedelta")
         return columns
 
@@ -467,6 +680,10 @@ class Datatable:
         requires only a new config type and a new applier function — no
         changes to this method.
 
+        A factor whose cache key (see ``factor_cache_key``) is unchanged since
+        the previous call keeps its column, unless the frame was modified in
+        between.
+
         Parameters
         ----------
         factors : dict[str, Factor]
@@ -478,26 +695,40 @@ class Datatable:
         if "Animal" not in self.df.columns:
             return
 
-        # TODO: should be copy?
-        df = self.df.copy()
+        previous_df = self.df
+        # Keys of the factor columns computed from the current frame, if it did not change since
+        cached_keys = self._factor_keys if self._factor_keys_revision == self.revision else {}
+
+        # Shallow copy: pandas copy-on-write copies only the columns the appliers replace
+        df = previous_df.copy(deep=False)
 
         # Drop old factors but ignore "Animal" and "Trial"
         if old_factor_names is not None:
             cols_to_drop = [n for n in old_factor_names if n not in ("Animal", "Trial")]
             df.drop(columns=cols_to_drop, inplace=True, errors="ignore")
+        input_columns = set(df.columns)
 
+        reuse = True
         for factor in factors.values():
-            config = factor.config
-            if config is None:
-                logger.debug(f"Skipping factor {factor.name!r}: no config")
-                continue
-            applier = FACTOR_APPLIERS.get(type(config))
-            if applier is None:
-                logger.debug(f"Skipping factor {factor.name!r}: no applier registered for {type(config).__name__}")
+            if (
+                reuse
+                and factor.name in previous_df.columns
+                and cached_keys.get(factor.name) == factor_cache_key(factor, self.dataset)
+            ):
+                df[factor.name] = previous_df[factor.name]
                 continue
-            applier(df, factor, self.dataset)
+            apply_factors(df, {factor.name: factor}, self.dataset)
+            # A recomputed factor that replaced an input column (e.g. "Animal") may change what
+            # the following factors are computed from
+            if factor.name in input_columns:
+                reuse = False
 
         self.df = df
+        # Keys are taken after applying: appliers may fill in missing levels
+        self._factor_keys = {
+            factor.name: factor_cache_key(factor, self.dataset) for factor in factors.values() if factor.name in df
+        }
+        self._factor_keys_revision = self.revision
 
     def get_filtered_df(
         self,
@@ -508,6 +739,8 @@ class Datatable:
 
         This method returns a dataframe containing only the specified columns,
         filtered by enabled animals and with outliers removed if configured.
+        A not yet materialized datatable reads only the requested columns from
+        its storage and stays unloaded.
 
         Parameters
         ----------
@@ -519,7 +752,11 @@ class Datatable:
         pd.DataFrame
             A filtered dataframe containing the specified columns.
         """
-        df = self.df[columns].copy()
+        if self._df is None:
+            df = self._df_source.read(columns)
+        else:
+            # Column selection shares buffers copy-on-write; callers may still modify the result
+            df = self._df[columns]
 
         # Outliers removal
         if self.outliers_settings.mode == OutliersMode.REMOVE:
@@ -541,6 +778,7 @@ class Datatable:
             self.variables.pop(var_name, None)
 
         self.df.drop(columns=variable_names, inplace=True, errors="ignore")
+        self.mark_df_modified()
 
     def rename_variables(self, variable_name_map: dict[str, str]) -> None:
         for old_name, new_name in variable_name_map.items():
@@ -552,6 +790,7 @@ class Datatable:
         self.variables = dict(sorted(self.variables.items(), key=lambda x: x[0].lower()))
 
         self.df.rename(columns=variable_name_map, inplace=True, errors="ignore")
+        self.mark_df_modified()
 
     def freeze_outliers_removal(self):
         df = process_outliers(self.df, self.outliers_settings, self.variables)
@@ -560,13 +799,21 @@ class Datatable:
     def clone(self):
         # A fresh id is intentional: the persisted DuckDB df-table name is keyed on
         # dataset.id + datatable.id, so a duplicated id would collide (see core/io/storage.py).
+        # A not yet materialized datatable shares its storage backing instead of being read, a
+        # materialized one shares its column buffers: pandas copy-on-write copies a column only
+        # when either datatable modifies it.
         cloned = Datatable(
             self.dataset,
             self.name,
             self.description,
             self.variables.copy(),
-            self.df.copy(),
+            None if self._df is None else self._df.copy(deep=False),
             self.metadata.copy(),
+            df_source=self._df_source,
         )
         cloned.outliers_settings = copy.deepcopy(self.outliers_settings)
+        if self._df is not None and self._factor_keys_revision == self.revision:
+            cloned._factor_keys = self._factor_keys.copy()
+            cloned._factor_keys_revision = cloned.revision
+        cloned._column_hashes = self._column_hashes.copy()
         return cloned
@@ -6,11 +6,21 @@ materializes a new categorical column on the dataframe. ``FACTOR_APPLIERS``
 maps each ``FactorConfig`` subtype to its applier; adding a new factor
 source means registering a new entry here and (if needed) defining a new
 config dataclass in ``shared.py``.
+
+Appliers build the category codes directly: per-animal factors look up the
+codes of the ``Animal`` column in a small per-category array, time-of-day
+factors compare integer offsets into the day. ``factor_cache_key`` identifies
+everything a factor column is computed from besides the frame itself, so
+``Datatable.set_factors`` can keep columns whose factor did not change.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 from collections.abc import Callable
+from dataclasses import asdict
+from datetime import time
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -31,13 +41,30 @@ if TYPE_CHECKING:
     from tse_analytics.core.data.dataset import Dataset
 
 
+def _animal_codes(df: pd.DataFrame) -> tuple[np.ndarray, pd.Index]:
+    """Integer codes of the ``Animal`` column (-1 for missing) and the animal ids they index."""
+    animals = df["Animal"]
+    if isinstance(animals.dtype, pd.CategoricalDtype):
+        return animals.cat.codes.to_numpy(), animals.cat.categories
+    codes, uniques = pd.factorize(animals)
+    return codes, pd.Index(uniques)
+
+
 def _apply_animal_map(df: pd.DataFrame, factor: Factor, animal_factor_map: dict[str, Any]) -> None:
-    series = df["Animal"].astype("string").map(animal_factor_map)
     categories = sorted(
         {v for v in animal_factor_map.values() if pd.notna(v)},
         key=str.lower,
     )
-    df[factor.name] = pd.Categorical(series, categories=categories)
+    category_codes = {category: code for code, category in enumerate(categories)}
+
+    animal_codes, animal_ids = _animal_codes(df)
+    # Level code of every animal id; the extra last entry maps missing animals (code -1) to missing
+    lookup = np.full(len(animal_ids) + 1, -1, dtype=np.int32)
+    for i, animal_id in enumerate(animal_ids):
+        level = animal_factor_map.get(str(animal_id), pd.NA)
+        if pd.notna(level):
+            lookup[i] = category_codes[level]
+    df[factor.name] = pd.Categorical.from_codes(lookup[animal_codes], categories=categories)
 
 
 def _apply_by_animal(df: pd.DataFrame, factor: Factor, dataset: Dataset) -> None:
@@ -59,6 +86,11 @@ def _apply_by_animal_property(df: pd.DataFrame, factor: Factor, dataset: Dataset
     _apply_animal_map(df, factor, animal_factor_map)
 
 
+def _nanoseconds_of_day(value: time) -> int:
+    seconds = value.hour * 3600 + value.minute * 60 + value.second
+    return seconds * 1_000_000_000 + value.microsecond * 1_000
+
+
 def _apply_by_time_of_day(df: pd.DataFrame, factor: Factor, dataset: Dataset) -> None:
     cfg = factor.config
     assert isinstance(cfg, ByTimeOfDayConfig)
@@ -66,17 +98,31 @@ def _apply_by_time_of_day(df: pd.DataFrame, factor: Factor, dataset: Dataset) ->
         logger.debug(f"Skipping factor {factor.name!r}: no DateTime column")
         return
 
-    light_start = cfg.light_cycle_start
-    dark_start = cfg.dark_cycle_start
+    datetimes = df["DateTime"]
+    if not pd.api.types.is_datetime64_any_dtype(datetimes):
+        datetimes = pd.to_datetime(datetimes)
+    if isinstance(datetimes.dtype, pd.DatetimeTZDtype):
+        # Compare the local wall-clock time, like ``.dt.time`` does
+        datetimes = datetimes.dt.tz_localize(None)
+    values = datetimes.to_numpy()
+    unit = np.datetime_data(values.dtype)[0]
+    unit_nanoseconds = np.timedelta64(1, unit) // np.timedelta64(1, "ns")
+
+    # Time of day in units of the column (floor modulo keeps pre-1970 timestamps positive)
+    time_of_day = values.view(np.int64) % (86_400_000_000_000 // unit_nanoseconds)
+    # Rounding the boundaries up keeps ``>=`` / ``<`` exact for coarser units
+    light_start = -(-_nanoseconds_of_day(cfg.light_cycle_start) // unit_nanoseconds)
+    dark_start = -(-_nanoseconds_of_day(cfg.dark_cycle_start) // unit_nanoseconds)
 
-    times = df["DateTime"].dt.time
     if light_start <= dark_start:
-        is_light = (times >= light_start) & (times < dark_start)
+        is_light = (time_of_day >= light_start) & (time_of_day < dark_start)
     else:
         # Light period wraps past midnight (reversed cycle, e.g. 19:00 -> 07:00)
-        is_light = (times >= light_start) | (times < dark_start)
-    df[factor.name] = pd.Categorical(
-        np.where(is_light, "Light", "Dark"),
+        is_light = (time_of_day >= light_start) | (time_of_day < dark_start)
+    # Missing timestamps compare like ``NaT`` times did: never light
+    is_light &= ~np.isnat(values)
+    df[factor.name] = pd.Categorical.from_codes(
+        np.where(is_light, 0, 1).astype(np.int8),
         categories=["Light", "Dark"],
         ordered=True,
     )
@@ -150,3 +196,33 @@ FACTOR_APPLIERS: dict[type, FactorApplier] = {
     ByColumnConfig: _apply_by_column,
     ByTimeIntervalConfig: _apply_by_time_interval,
 }
+
+
+def factor_cache_key(factor: Factor, dataset: Dataset) -> str:
+    """
+    Identify the inputs of a factor column other than the frame it is applied to.
+
+    The key covers the factor definition (config, role and levels) and, for factors drawn from
+    animal properties, the relevant property values. Two applications of a factor with the same
+    key to an unchanged frame produce the same column.
+    """
+    payload: list[Any] = [asdict(factor)]
+    if isinstance(factor.config, ByAnimalPropertyConfig):
+        key = factor.config.property_key
+        payload.append({animal.id: animal.properties.get(key) for animal in dataset.animals.values()})
+    text = json.dumps(payload, default=str, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def apply_factors(df: pd.DataFrame, factors: dict[str, Factor], dataset: Dataset) -> None:
+    """Materialize the columns of ``factors`` on ``df`` in place, dispatching on ``FACTOR_APPLIERS``."""
+    for factor in factors.values():
+        config = factor.config
+        if config is None:
+            logger.debug(f"Skipping factor {factor.name!r}: no config")
+            continue
+        applier = FACTOR_APPLIERS.get(type(config))
+        if applier is None:
+            logger.debug(f"Skipping factor {factor.name!r}: no applier registered for {type(config).__name__}")
+            continue
+        applier(df, factor, dataset)
@@ -0,0 +1,285 @@
+"""Out-of-core merging of datatables in a DuckDB file.
+
+``MergeStore`` backs the out-of-core mode of ``core/utils/data_merger.py``. Each trial's frame is
+written to a staging table of the store, a not yet materialized workspace datatable is copied
+file-to-file without passing through pandas. The union, Trial assignment, Animal renaming and
+Timedelta re-basing then run as one sorted DuckDB query, which spills to disk instead of holding
+all trials in memory. Its result is streamed in chunks through pandas only to materialize factor
+columns, and the merged table is read back lazily through a ``DuckDBTableSource``.
+
+Stores created in the temporary directory with ``create_temporary_store_path`` are deleted by
+``release_temporary_stores`` once no datatable reads from them any more (e.g. after the workspace
+is saved or the merged dataset is removed), and at exit otherwise.
+"""
+
+from __future__ import annotations
+
+import atexit
+import tempfile
+import timeit
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+from uuid import uuid4, uuid7
+
+import duckdb
+import pandas as pd
+from loguru import logger
+
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.io.storage import DuckDBTableSource
+
+# DuckDB vectors (2048 rows each) per streamed chunk
+CHUNK_VECTORS = 128
+
+# Temporary store files, deleted once unreferenced
+_temporary_stores: set[str] = set()
+
+
+def create_temporary_store_path() -> str:
+    """Path of a new merge store file in the temporary directory.
+
+    The file is tracked from now on: ``release_temporary_stores`` deletes it once no datatable
+    reads from it, and it is deleted at exit at the latest. Call ``release_temporary_stores`` only
+    while no merge into it is running.
+
+    Returns:
+        The path; the file does not exist yet.
+    """
+    path = str(Path(tempfile.gettempdir()) / f"tse-analytics-merge-{uuid7().hex}.duckdb")
+    _temporary_stores.add(path)
+    return path
+
+
+def _delete_temporary_store(path: str) -> None:
+    _temporary_stores.discard(path)
+    for file in (Path(path), Path(f"{path}.wal")):
+        try:
+            file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Cannot delete temporary merge store {file}: {e}")
+
+
+def release_temporary_stores(datatables: Iterable[Datatable]) -> None:
+    """Delete the temporary merge stores none of ``datatables`` reads from.
+
+    Args:
+        datatables: All datatables that may still read a store, typically those of the workspace.
+    """
+    if not _temporary_stores:
+        return
+    referenced = {
+        datatable.df_source.path for datatable in datatables if isinstance(datatable.df_source, DuckDBTableSource)
+    }
+    for path in _temporary_stores - referenced:
+        logger.debug(f"Deleting temporary merge store {path}")
+        _delete_temporary_store(path)
+
+
+@atexit.register
+def _delete_temporary_stores() -> None:
+    for path in list(_temporary_stores):
+        _delete_temporary_store(path)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class MergeStore:
+    """DuckDB file holding the merged datatables of one merge.
+
+    The store keeps a read-write connection while the merge runs; ``close`` must be called before
+    the returned sources are read. Use it as a context manager.
+
+    Args:
+        path: Path of the DuckDB file; created if missing.
+        chunk_vectors: DuckDB vectors per chunk streamed through pandas.
+    """
+
+    def __init__(self, path: str, chunk_vectors: int = CHUNK_VECTORS):
+        self.path = path
+        self.chunk_vectors = chunk_vectors
+        self._con = duckdb.connect(path)
+        self._attached: dict[str, str] = {}
+        # Staging tables and formerly categorical columns, by merged table name
+        self._staged: dict[str, list[str]] = {}
+        self._categorical: dict[str, set[str]] = {}
+
+    def __enter__(self) -> MergeStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for alias in self._attached.values():
+            self._con.execute(f"DETACH {alias}")
+        self._attached.clear()
+        self._con.close()
+
+    def _relation(self, datatable: Datatable) -> str:
+        """Relation reading the frame of ``datatable``: its workspace table if not materialized."""
+        source = datatable.df_source
+        if isinstance(source, DuckDBTableSource):
+            alias = self._attached.get(source.path)
+            if alias is None:
+                alias = f"_source_{len(self._attached)}"
+                escaped_path = source.path.replace("'", "''")
+                self._con.execute(f"ATTACH '{escaped_path}' AS {alias} (READ_ONLY)")
+                self._attached[source.path] = alias
+            return f"{alias}.{_quote(source.table_name)}"
+
+        relation = f"_frame_{uuid4().hex}"
+        self._con.register(relation, datatable.df)
+        return relation
+
+    def stage(
+        self,
+        table_name: str,
+        datatable: Datatable,
+        trial: str | None = None,
+        animal_name_map: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Write the frame of one trial to a staging table of ``table_name``.
+
+        Categorical columns are staged as text so that trials with different categories unite.
+
+        Args:
+            table_name: Name of the merged table the frame belongs to.
+            datatable: Source datatable of the trial.
+            trial: Value of the ``Trial`` column; None drops an existing ``Trial`` column.
+            animal_name_map: New animal ids by old id; ids missing from the map become NULL.
+        """
+        relation = self._relation(datatable)
+        try:
+            columns = self._con.execute(f"DESCRIBE {relation}").fetchall()
+            categorical = self._categorical.setdefault(table_name, set())
+            excluded: list[str] = []
+            replaced: list[str] = []
+            parameters: list[Any] = []
+            for name, column_type, *_ in columns:
+                if name == "Trial":
+                    excluded.append(_quote(name))
+                elif name == "Animal" and animal_name_map is not None:
+                    if len(animal_name_map) == 0:
+                        replaced.append(f"NULL::VARCHAR AS {_quote(name)}")
+                    else:
+                        cases = " ".join("WHEN ? THEN ?" for _ in animal_name_map)
+                        replaced.append(f"CASE CAST({_quote(name)} AS VARCHAR) {cases} END AS {_quote(name)}")
+                        parameters.extend(value for item in animal_name_map.items() for value in item)
+                elif column_type.startswith("ENUM"):
+                    replaced.append(f"CAST({_quote(name)} AS VARCHAR) AS {_quote(name)}")
+                    categorical.add(name)
+
+            selected = "*"
+            if excluded:
+                selected += f" EXCLUDE ({', '.join(excluded)})"
+            if replaced:
+                selected += f" REPLACE ({', '.join(replaced)})"
+            if trial is not None:
+                selected += f", CAST(? AS VARCHAR) AS {_quote('Trial')}"
+                parameters.append(trial)
+
+            staged = self._staged.setdefault(table_name, [])
+            staging_table = f"_stage__{table_name}__{len(staged)}"
+            self._con.execute(
+                f"CREATE OR REPLACE TABLE {_quote(staging_table)} AS SELECT {selected} FROM {relation}",
+                parameters,
+            )
+            staged.append(staging_table)
+        finally:
+            if relation.startswith("_frame_"):
+                self._con.unregister(relation)
+
+    def merge(
+        self,
+        table_name: str,
+        sort_keys: Callable[[list[str]], list[str]],
+        timedelta_origin: pd.Timestamp | None = None,
+        transform: Callable[[pd.DataFrame], None] | None = None,
+    ) -> DuckDBTableSource:
+        """
+        Unite the staged frames of ``table_name`` into the merged table.
+
+        Args:
+            table_name: Name of the merged table.
+            sort_keys: Returns the sort columns of the merged table, given its columns.
+            timedelta_origin: If set, ``Timedelta`` is recomputed as the time since this timestamp
+                from ``StartDateTime`` (or ``DateTime``).
+            transform: Applied in place to every streamed chunk, e.g. to add factor columns.
+
+        Returns:
+            DuckDBTableSource: The lazy backing of the merged table.
+        """
+        tic = timeit.default_timer()
+        staged = self._staged.pop(table_name)
+        union = " UNION ALL BY NAME ".join(f"SELECT * FROM {_quote(table)}" for table in staged)
+        columns = [row[0] for row in self._con.execute(f"DESCRIBE {union}").fetchall()]
+
+        selected = "*"
+        parameters: list[Any] = []
+        if timedelta_origin is not None and "Timedelta" in columns:
+            datetime_column = "StartDateTime" if "StartDateTime" in columns else "DateTime"
+            selected = f"* REPLACE ({_quote(datetime_column)} - CAST(? AS TIMESTAMP) AS {_quote('Timedelta')})"
+            parameters.append(timedelta_origin.to_pydatetime())
+        keys = sort_keys(columns)
+        order_by = f" ORDER BY {', '.join(_quote(key) for key in keys)}" if keys else ""
+        query = f"SELECT {selected} FROM ({union}){order_by}"
+
+        # Text columns that were categorical (Animal, Trial, staged ENUMs) become categorical again
+        # with the categories of the whole table, so every chunk shares the same dtype.
+        categories: dict[str, list[str]] = {}
+        for column in ("Animal", "Trial", *sorted(self._categorical.pop(table_name, set()))):
+            if column in columns and column not in categories:
+                rows = self._con.execute(
+                    f"SELECT DISTINCT {_quote(column)} FROM ({union}) WHERE {_quote(column)} IS NOT NULL ORDER BY 1"
+                ).fetchall()
+                categories[column] = [row[0] for row in rows]
+
+        merged_table = f"merged__{table_name}"
+        self._con.execute(f"DROP TABLE IF EXISTS {_quote(merged_table)}")
+        reader = self._con.cursor()
+        try:
+            reader.execute(query, parameters)
+            row_count = 0
+            while True:
+                chunk = reader.fetch_df_chunk(self.chunk_vectors)
+                if row_count > 0 and len(chunk) == 0:
+                    break
+                for column, column_categories in categories.items():
+                    chunk[column] = pd.Categorical(chunk[column], categories=column_categories)
+                if transform is not None:
+                    transform(chunk)
+
+                relation = f"_chunk_{uuid4().hex}"
+                self._con.register(relation, chunk)
+                try:
+                    # The first chunk, even if empty, defines the schema (categoricals become ENUMs)
+                    statement = "CREATE TABLE {} AS" if row_count == 0 else "INSERT INTO {}"
+                    self._con.execute(f"{statement.format(_quote(merged_table))} SELECT * FROM {relation}")
+                finally:
+                    self._con.unregister(relation)
+                if len(chunk) == 0:
+                    break
+                row_count += len(chunk)
+        finally:
+            reader.close()
+
+        for table in staged:
+            self._con.execute(f"DROP TABLE {_quote(table)}")
+        logger.debug(f"Merged {row_count} rows of {table_name!r} in {(timeit.default_timer() - tic):.3f} sec")
+        return DuckDBTableSource(self.path, merged_table)
+
+    def columns(self, source: DuckDBTableSource) -> list[str]:
+        """Column names of a merged table."""
+        return [row[0] for row in self._con.execute(f"DESCRIBE {_quote(source.table_name)}").fetchall()]
+
+    def distinct_values(self, source: DuckDBTableSource, column: str) -> list[Any]:
+        """Sorted distinct non-null values of a column of a merged table."""
+        rows = self._con.execute(
+            f"SELECT DISTINCT {_quote(column)} FROM {_quote(source.table_name)} "
+            f"WHERE {_quote(column)} IS NOT NULL ORDER BY 1"
+        ).fetchall()
+        return [row[0] for row in rows]
@@ -0,0 +1,195 @@
+"""DuckDB push-down queries over datatables.
+
+``query_datatable`` answers "columns X, filtered by factor levels Y, outlier-masked,
+aggregated by Z" as a single DuckDB query. A materialized datatable frame is scanned
+in place by DuckDB; a lazily loaded datatable is queried directly in its workspace
+file. Either way only the reduced result is converted to pandas, instead of copying
+the whole table (``Datatable.get_filtered_df``) and reducing it in pandas afterwards.
+
+The outlier handling mirrors ``process_outliers`` for ``OutliersMode.REMOVE``: bounds
+are computed over the whole table, before level filters, and outlier values are
+replaced by NULL.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from uuid import uuid4
+
+import duckdb
+import pandas as pd
+
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.data.outliers import OutliersMode, OutliersSettings, OutliersType
+from tse_analytics.core.data.shared import Aggregation
+from tse_analytics.core.io.storage import DuckDBTableSource
+
+_AGGREGATION_SQL = {
+    Aggregation.MEAN: "avg({})",
+    Aggregation.MEDIAN: "median({})",
+    # pandas sums an all-NA group to 0
+    Aggregation.SUM: "coalesce(sum({}), 0)",
+    Aggregation.MIN: "min({})",
+    Aggregation.MAX: "max({})",
+}
+
+# One in-process database; each query runs on its own cursor so worker threads do not share state.
+_connection = duckdb.connect()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _outlier_condition(column: str, settings: OutliersSettings) -> str | None:
+    """SQL predicate flagging an outlier value of ``column`` (bounds read from the ``bounds`` CTE)."""
+    value = _quote(column)
+    match settings.type:
+        case OutliersType.IQR:
+            q1 = f"bounds.{_quote(column + '__q1')}"
+            q3 = f"bounds.{_quote(column + '__q3')}"
+            multiplier = float(settings.iqr_multiplier)
+            return f"{value} < {q1} - {multiplier} * ({q3} - {q1}) OR {value} > {q3} + {multiplier} * ({q3} - {q1})"
+        case OutliersType.ZSCORE:
+            mean = f"bounds.{_quote(column + '__mean')}"
+            std = f"bounds.{_quote(column + '__std')}"
+            return f"abs(({value} - {mean}) / {std}) > 3"
+        case OutliersType.THRESHOLDS:
+            conditions = []
+            if settings.min_threshold_enabled:
+                conditions.append(f"{value} < {float(settings.min_threshold)}")
+            if settings.max_threshold_enabled:
+                conditions.append(f"{value} > {float(settings.max_threshold)}")
+            return " OR ".join(conditions) if conditions else None
+    return None
+
+
+def _bounds_columns(column: str, settings: OutliersSettings) -> list[str]:
+    value = _quote(column)
+    match settings.type:
+        case OutliersType.IQR:
+            return [
+                f"quantile_cont({value}, 0.25) AS {_quote(column + '__q1')}",
+                f"quantile_cont({value}, 0.75) AS {_quote(column + '__q3')}",
+            ]
+        case OutliersType.ZSCORE:
+            return [
+                f"avg({value}) AS {_quote(column + '__mean')}",
+                f"stddev_samp({value}) AS {_quote(column + '__std')}",
+            ]
+    return []
+
+
+def _build_query(
+    relation: str,
+    datatable: Datatable,
+    columns: list[str],
+    filters: dict[str, Iterable[str]] | None = None,
+    group_by: list[str] | None = None,
+    aggregations: dict[str, Aggregation] | None = None,
+) -> tuple[str, list]:
+    """Build the SQL text and parameters of a datatable query against ``relation``.
+
+    Args:
+        relation: Quoted name of the relation holding the datatable frame.
+        datatable: The datatable whose variables and outlier settings apply.
+        columns: Columns to return.
+        filters: Column name -> allowed values (compared as strings), e.g. factor levels.
+        group_by: Columns to group by; the remaining columns are aggregated.
+        aggregations: Per-column aggregation overriding the variable's default aggregation.
+
+    Returns:
+        The SQL text and its positional parameters.
+    """
+    filters = filters or {}
+    source_columns = list(dict.fromkeys([*columns, *filters]))
+
+    outlier_columns: list[str] = []
+    if datatable.outliers_settings.mode == OutliersMode.REMOVE:
+        outlier_columns = [
+            name
+            for name, variable in datatable.variables.items()
+            if variable.remove_outliers and name in source_columns
+        ]
+
+    conditions = {column: _outlier_condition(column, datatable.outliers_settings) for column in outlier_columns}
+    conditions = {column: condition for column, condition in conditions.items() if condition is not None}
+
+    ctes = [f"src AS (SELECT {', '.join(_quote(c) for c in source_columns)} FROM {relation})"]
+    bounds = [expr for column in conditions for expr in _bounds_columns(column, datatable.outliers_settings)]
+    if bounds:
+        ctes.append(f"bounds AS (SELECT {', '.join(bounds)} FROM src)")
+    masked = [
+        f"CASE WHEN {conditions[c]} THEN NULL ELSE {_quote(c)} END AS {_quote(c)}" if c in conditions else _quote(c)
+        for c in source_columns
+    ]
+    ctes.append(f"masked AS (SELECT {', '.join(masked)} FROM src{', bounds' if bounds else ''})")
+
+    parameters: list = []
+    where = []
+    for column, values in filters.items():
+        where.append(f"list_contains(?, CAST({_quote(column)} AS VARCHAR))")
+        parameters.append([str(value) for value in values])
+    where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+
+    if group_by:
+        aggregations = aggregations or {}
+        selected = [_quote(c) for c in group_by]
+        for column in columns:
+            if column in group_by:
+                continue
+            aggregation = aggregations.get(column)
+            if aggregation is None:
+                aggregation = datatable.variables[column].aggregation if column in datatable.variables else "first"
+            template = _AGGREGATION_SQL.get(aggregation, "first({})")
+            selected.append(f"{template.format(_quote(column))} AS {_quote(column)}")
+        keys = ", ".join(_quote(c) for c in group_by)
+        select_sql = f"SELECT {', '.join(selected)} FROM masked{where_sql} GROUP BY {keys} ORDER BY {keys}"
+    else:
+        select_sql = f"SELECT {', '.join(_quote(c) for c in columns)} FROM masked{where_sql}"
+
+    return f"WITH {', '.join(ctes)} {select_sql}", parameters
+
+
+def query_datatable(
+    datatable: Datatable,
+    columns: list[str],
+    *,
+    filters: dict[str, Iterable[str]] | None = None,
+    group_by: list[str] | None = None,
+    aggregations: dict[str, Aggregation] | None = None,
+) -> pd.DataFrame:
+    """Run a pushed-down projection / filter / outlier-mask / aggregation over a datatable.
+
+    Without ``filters`` and ``group_by`` the result equals ``datatable.get_filtered_df(columns)``.
+    With ``group_by`` it equals grouping that frame (``observed=True``, ``dropna=False``) and
+    aggregating each remaining column with its variable's aggregation.
+
+    Args:
+        datatable: The datatable to query.
+        columns: Columns to return.
+        filters: Column name -> allowed values (compared as strings), e.g. factor levels.
+        group_by: Columns to group by; the remaining columns are aggregated.
+        aggregations: Per-column aggregation overriding the variable's default aggregation.
+
+    Returns:
+        The query result as a new DataFrame.
+    """
+    source = datatable.df_source
+    if isinstance(source, DuckDBTableSource):
+        # Not materialized: query the persisted table in its workspace file.
+        sql, parameters = _build_query(_quote(source.table_name), datatable, columns, filters, group_by, aggregations)
+        con = duckdb.connect(source.path, read_only=True)
+        try:
+            return con.execute(sql, parameters).fetchdf()
+        finally:
+            con.close()
+
+    relation = f"_datatable_{uuid4().hex}"
+    sql, parameters = _build_query(_quote(relation), datatable, columns, filters, group_by, aggregations)
+    cursor = _connection.cursor()
+    try:
+        cursor.register(relation, datatable.df)
+        return cursor.execute(sql, parameters).fetchdf()
+    finally:
+        cursor.close()
@@ -3,11 +3,23 @@
 Provides save/load functions that store a Workspace as a single DuckDB file.
 Each Datatable DataFrame becomes a separate DuckDB table; all metadata is
 stored in relational ``_meta_*`` tables.
+
+Images embedded in reports as base64 data URIs are stored once, as binary blobs in
+``_meta_report_images``, and referenced from the report content by their hash.
+
+Workspaces can be loaded lazily: the ``_meta_*`` tables are read eagerly while
+each datatable keeps a ``DuckDBTableSource`` and reads its frame on first access.
 """
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import os
+import re
 import timeit
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from uuid import UUID
@@ -24,7 +36,12 @@ from tse_analytics.core.data.report import Report
 from tse_analytics.core.data.shared import Animal, Factor, Variable
 from tse_analytics.core.data.workspace import Workspace
 
-_SCHEMA_VERSION = 1
+_SCHEMA_VERSION = 2
+
+# Images embedded in report content, and the references they are stored as
+_IMAGE_DATA_URI_PATTERN = re.compile(r"data:(image/[\w.+-]+);base64,([A-Za-z0-9+/=]+)")
+_IMAGE_REFERENCE_PREFIX = "tse-image:"
+_IMAGE_REFERENCE_PATTERN = re.compile(rf"{_IMAGE_REFERENCE_PREFIX}([0-9a-f]{{40}})")
 
 
 # ---------------------------------------------------------------------------
@@ -75,6 +92,13 @@ _META_TABLES_DDL = [
     )
     """,
     """
+    CREATE TABLE _meta_report_images (
+        hash            VARCHAR PRIMARY KEY,
+        mime_type       VARCHAR NOT NULL,
+        data            BLOB NOT NULL
+    )
+    """,
+    """
     CREATE TABLE _meta_datatables (
         id                      UUID NOT NULL,
         dataset_id              UUID NOT NULL,
@@ -127,13 +151,49 @@ def _save_dataframe(
     con.execute(f'CREATE TABLE "{table_name}" AS SELECT * FROM df')
 
 
-def _load_dataframe(con: duckdb.DuckDBPyConnection, table_name: str) -> pd.DataFrame:
+def _load_dataframe(
+    con: duckdb.DuckDBPyConnection,
+    table_name: str,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
     """Read a DuckDB table back into a DataFrame with original dtypes restored."""
-    df = con.execute(f'SELECT * FROM "{table_name}"').fetchdf()
+    projection = "*" if columns is None else ", ".join(f'"{column}"' for column in columns)
+    df = con.execute(f'SELECT {projection} FROM "{table_name}"').fetchdf()
 
     return df
 
 
+class DuckDBTableSource:
+    """Lazy backing of a datatable by a ``df__…`` table in a workspace file.
+
+    Each read opens a short-lived read-only connection, so the workspace file is
+    never held open between accesses.
+    """
+
+    def __init__(self, path: str, table_name: str):
+        self.path = path
+        self.table_name = table_name
+        self._columns: list[str] | None = None
+
+    @property
+    def columns(self) -> list[str]:
+        if self._columns is None:
+            con = duckdb.connect(self.path, read_only=True)
+            try:
+                rows = con.execute(f'DESCRIBE "{self.table_name}"').fetchall()
+            finally:
+                con.close()
+            self._columns = [row[0] for row in rows]
+        return self._columns
+
+    def read(self, columns: list[str] | None = None) -> pd.DataFrame:
+        con = duckdb.connect(self.path, read_only=True)
+        try:
+            return _load_dataframe(con, self.table_name, columns)
+        finally:
+            con.close()
+
+
 # ---------------------------------------------------------------------------
 # Save implementation
 # ---------------------------------------------------------------------------
@@ -152,115 +212,372 @@ def _save_workspace(con: duckdb.DuckDBPyConnection, workspace: Workspace) -> Non
     )
 
 
+def _extract_report_images(content: str, images: dict[str, tuple[str, bytes]]) -> str:
+    """Replace the images embedded in report content by references, collecting the images by hash."""
+
+    def replace(match: re.Match) -> str:
+        data = base64.b64decode(match[2])
+        image_hash = hashlib.sha1(data).hexdigest()
+        images[image_hash] = (match[1], data)
+        return f"{_IMAGE_REFERENCE_PREFIX}{image_hash}"
+
+    return _IMAGE_DATA_URI_PATTERN.sub(replace, content)
+
+
 def _save_reports(con: duckdb.DuckDBPyConnection, dataset_id: UUID, reports: dict[str, Report]) -> None:
+    images: dict[str, tuple[str, bytes]] = {}
     for report in reports.values():
         con.execute(
             "INSERT INTO _meta_reports VALUES (?, ?, ?, ?)",
             [
                 dataset_id,
                 report.name,
-                report.content,
+                _extract_report_images(report.content, images) if report.content else report.content,
                 report.timestamp,
             ],
         )
+    if images:
+        con.executemany(
+            "INSERT OR IGNORE INTO _meta_report_images VALUES (?, ?, ?)",
+            [[image_hash, mime_type, data] for image_hash, (mime_type, data) in images.items()],
+        )
+
+
+def _iter_workspace_datatables(workspace: Workspace) -> Iterator[Datatable]:
+    for dataset in workspace.datasets.values():
+        yield from dataset.datatables.values()
+        for extension_datatables in dataset.raw_datatables.values():
+            yield from extension_datatables.values()
 
 
-def _save_datatable(
+def _attach_sources(
     con: duckdb.DuckDBPyConnection,
+    workspace: Workspace,
+    target_path: str,
+) -> dict[str, str]:
+    """Attach the files backing not yet materialized datatables; returns path -> database alias.
+
+    The file being written is mapped to the connection's own database.
+    """
+    aliases: dict[str, str] = {target_path: con.execute("SELECT current_database()").fetchone()[0]}
+    for datatable in _iter_workspace_datatables(workspace):
+        source = datatable.df_source
+        if isinstance(source, DuckDBTableSource) and source.path not in aliases:
+            alias = f"_source_{len(aliases)}"
+            escaped_path = source.path.replace("'", "''")
+            con.execute(f"ATTACH '{escaped_path}' AS {alias} (READ_ONLY)")
+            aliases[source.path] = alias
+    return aliases
+
+
+def _detach_sources(con: duckdb.DuckDBPyConnection, sources: dict[str, str]) -> None:
+    for alias in list(sources.values())[1:]:
+        con.execute(f"DETACH {alias}")
+
+
+def _save_datatable_frame(
+    con: duckdb.DuckDBPyConnection,
+    table_name: str,
     datatable: Datatable,
-    parent_id: UUID | None = None,
+    sources: dict[str, str],
+    snapshots: dict[tuple[str, str], str] | None = None,
 ) -> None:
-    table_name = _df_table_name(datatable)
+    source = datatable.df_source
+    if isinstance(source, DuckDBTableSource):
+        # Never opened since loading: copy the table file-to-file without materializing it in pandas.
+        from_table = (snapshots or {}).get((source.path, source.table_name))
+        if from_table is None:
+            from_table = f'{sources[source.path]}."{source.table_name}"'
+        con.execute(f'CREATE TABLE "{table_name}" AS SELECT * FROM {from_table}')
+        return
 
     _save_dataframe(con, table_name, datatable.df)
 
-    con.execute(
-        "INSERT INTO _meta_datatables VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        [
-            datatable.id,
-            datatable.dataset.id,
-            parent_id,
-            datatable.name,
-            datatable.description,
-            table_name,
-            TypeAdapter(dict[str, Variable]).dump_python(datatable.variables),
-            datatable.metadata,
-            TypeAdapter(OutliersSettings).dump_python(datatable.outliers_settings),
-        ],
-    )
+
+def _datatable_row(datatable: Datatable, table_name: str, parent_id: UUID | None) -> list[Any]:
+    return [
+        datatable.id,
+        datatable.dataset.id,
+        parent_id,
+        datatable.name,
+        datatable.description,
+        table_name,
+        TypeAdapter(dict[str, Variable]).dump_python(datatable.variables),
+        datatable.metadata,
+        TypeAdapter(OutliersSettings).dump_python(datatable.outliers_settings),
+    ]
+
+
+def _raw_datatable_row(datatable: Datatable, table_name: str, extension_name: str | None) -> list[Any]:
+    return [
+        datatable.id,
+        datatable.dataset.id,
+        extension_name,
+        datatable.name,
+        datatable.description,
+        table_name,
+        TypeAdapter(dict[str, Variable]).dump_python(datatable.variables),
+        datatable.metadata,
+        TypeAdapter(OutliersSettings).dump_python(datatable.outliers_settings),
+    ]
+
+
+def _dataset_row(dataset: Dataset) -> list[Any]:
+    return [
+        dataset.id,
+        dataset.name,
+        dataset.description,
+        dataset.dataset_type,
+        TypeAdapter(dict[str, Animal]).dump_python(dataset.animals),
+        TypeAdapter(dict[str, Factor]).dump_python(dataset.factors),
+        dataset.metadata,
+    ]
+
+
+def _meta_hash(path: str, row: list[Any]) -> str:
+    """Hash a metadata row together with the file it belongs to (a save to another file never matches)."""
+    payload = json.dumps([path, row], default=str, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _dataset_meta_hash(path: str, dataset: Dataset) -> str:
+    reports = [[report.name, report.content, report.timestamp] for report in dataset.reports.values()]
+    return _meta_hash(path, [_dataset_row(dataset), reports])
+
+
+def _iter_datatable_rows(dataset: Dataset) -> Iterator[tuple[str, Datatable, list[Any]]]:
+    """Yield ``(meta table, datatable, row)`` for every datatable of a dataset."""
+    for datatable in dataset.datatables.values():
+        yield "_meta_datatables", datatable, _datatable_row(datatable, _df_table_name(datatable), None)
+
+    for extension_name, extension_data in dataset.raw_datatables.items():
+        for raw_datatable in extension_data.values():
+            row = _raw_datatable_row(raw_datatable, _df_table_name(raw_datatable), extension_name)
+            yield "_meta_raw_datatables", raw_datatable, row
+
+
+def _save_dataset(con: duckdb.DuckDBPyConnection, dataset: Dataset, sources: dict[str, str]) -> None:
+    con.execute("INSERT INTO _meta_datasets VALUES (?, ?, ?, ?, ?, ?, ?)", _dataset_row(dataset))
+
+    _save_reports(con, dataset.id, dataset.reports)
+
+    for meta_table, datatable, row in _iter_datatable_rows(dataset):
+        _save_datatable_frame(con, _df_table_name(datatable), datatable, sources)
+        con.execute(f"INSERT INTO {meta_table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+
+def _mark_persisted(path: str, workspace: Workspace) -> None:
+    """Record that the workspace objects now match ``path``; rebind not yet materialized datatables."""
+    for dataset in workspace.datasets.values():
+        dataset.persisted_meta_hash = _dataset_meta_hash(path, dataset)
+        for _meta_table, datatable, row in _iter_datatable_rows(dataset):
+            table_name = _df_table_name(datatable)
+            datatable.persisted_table = (path, table_name)
+            datatable.persisted_meta_hash = _meta_hash(path, row)
+            if datatable.df_source is not None:
+                datatable.df_source = DuckDBTableSource(path, table_name)
+
+
+# ---------------------------------------------------------------------------
+# Incremental save implementation
+# ---------------------------------------------------------------------------
+
+
+def _can_save_incrementally(path: str, workspace: Workspace) -> bool:
+    """Whether ``path`` is an existing file of this workspace written with the current schema."""
+    if not Path(path).exists():
+        return False
+    con = duckdb.connect(path, read_only=True)
+    try:
+        row = con.execute("SELECT id, schema_version FROM _meta_workspace").fetchone()
+    except duckdb.Error:
+        return False
+    finally:
+        con.close()
+    return row is not None and row[0] == workspace.id and row[1] == _SCHEMA_VERSION
+
+
+def _needs_table_rewrite(path: str, datatable: Datatable, existing_tables: set[str]) -> bool:
+    table_name = _df_table_name(datatable)
+    return datatable.persisted_table != (path, table_name) or table_name not in existing_tables
 
 
-def _save_raw_datatable(
+def _snapshot_shared_tables(
     con: duckdb.DuckDBPyConnection,
+    path: str,
+    workspace: Workspace,
+    existing_tables: set[str],
+) -> dict[tuple[str, str], str]:
+    """Copy tables of ``path`` the save replaces or renames while lazy datatables still have to copy them.
+
+    A cloned, not yet materialized datatable reads the table of the datatable it was cloned from;
+    that table must not be overwritten before the clone is copied. Returns
+    ``(path, table name) -> snapshot table``.
+    """
+    replaced: set[str] = set()
+    copied: set[str] = set()
+    for datatable in _iter_workspace_datatables(workspace):
+        if not _needs_table_rewrite(path, datatable, existing_tables):
+            continue
+        replaced.add(_df_table_name(datatable))
+        persisted = datatable.persisted_table
+        if persisted is not None and persisted[0] == path and persisted[1] in existing_tables:
+            # Renamed, not copied
+            replaced.add(persisted[1])
+            continue
+        source = datatable.df_source
+        if isinstance(source, DuckDBTableSource) and source.path == path:
+            copied.add(source.table_name)
+    snapshots: dict[tuple[str, str], str] = {}
+    for table_name in sorted(replaced & copied & existing_tables):
+        snapshot = f'temp.main."_snapshot__{table_name}"'
+        con.execute(f'CREATE TEMP TABLE "_snapshot__{table_name}" AS SELECT * FROM "{table_name}"')
+        snapshots[(path, table_name)] = snapshot
+    return snapshots
+
+
+def _save_datatable_incremental(
+    con: duckdb.DuckDBPyConnection,
+    path: str,
+    meta_table: str,
     datatable: Datatable,
-    extension_name: str | None = None,
+    row: list[Any],
+    existing_tables: set[str],
+    sources: dict[str, str],
+    snapshots: dict[tuple[str, str], str],
 ) -> None:
     table_name = _df_table_name(datatable)
+    persisted = datatable.persisted_table
 
-    _save_dataframe(con, table_name, datatable.df)
+    if _needs_table_rewrite(path, datatable, existing_tables):
+        con.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+        if persisted is not None and persisted[0] == path and persisted[1] in existing_tables:
+            # Unchanged frame under a new name (datatable renamed): rename instead of rewriting.
+            con.execute(f'ALTER TABLE "{persisted[1]}" RENAME TO "{table_name}"')
+            existing_tables.discard(persisted[1])
+        else:
+            _save_datatable_frame(con, table_name, datatable, sources, snapshots)
+        existing_tables.add(table_name)
 
-    con.execute(
-        "INSERT INTO _meta_raw_datatables VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        [
-            datatable.id,
-            datatable.dataset.id,
-            extension_name,
-            datatable.name,
-            datatable.description,
-            table_name,
-            TypeAdapter(dict[str, Variable]).dump_python(datatable.variables),
-            datatable.metadata,
-            TypeAdapter(OutliersSettings).dump_python(datatable.outliers_settings),
-        ],
-    )
+    if datatable.persisted_meta_hash != _meta_hash(path, row):
+        con.execute(f"DELETE FROM {meta_table} WHERE id = ?", [datatable.id])
+        con.execute(f"INSERT INTO {meta_table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
 
 
-def _save_dataset(con: duckdb.DuckDBPyConnection, dataset: Dataset) -> None:
+def _save_dataset_incremental(
+    con: duckdb.DuckDBPyConnection,
+    path: str,
+    dataset: Dataset,
+    existing_tables: set[str],
+    sources: dict[str, str],
+    snapshots: dict[tuple[str, str], str],
+) -> None:
+    if dataset.persisted_meta_hash != _dataset_meta_hash(path, dataset):
+        con.execute("DELETE FROM _meta_datasets WHERE id = ?", [dataset.id])
+        con.execute("INSERT INTO _meta_datasets VALUES (?, ?, ?, ?, ?, ?, ?)", _dataset_row(dataset))
+        con.execute("DELETE FROM _meta_reports WHERE dataset_id = ?", [dataset.id])
+        _save_reports(con, dataset.id, dataset.reports)
+
+    for meta_table, datatable, row in _iter_datatable_rows(dataset):
+        _save_datatable_incremental(con, path, meta_table, datatable, row, existing_tables, sources, snapshots)
+
+
+def _save_workspace_incremental(con: duckdb.DuckDBPyConnection, path: str, workspace: Workspace) -> None:
+    """Rewrite only the DuckDB tables and ``_meta_*`` rows that changed since the last load/save."""
+    existing_tables = {
+        row[0]
+        for row in con.execute(
+            "SELECT table_name FROM duckdb_tables() WHERE database_name = current_database()"
+        ).fetchall()
+        if row[0].startswith("df__")
+    }
+    sources = _attach_sources(con, workspace, path)
+
+    con.execute("DELETE FROM _meta_workspace")
+    _save_workspace(con, workspace)
+
+    snapshots = _snapshot_shared_tables(con, path, workspace, existing_tables)
+    for dataset in workspace.datasets.values():
+        _save_dataset_incremental(con, path, dataset, existing_tables, sources, snapshots)
+    for snapshot in snapshots.values():
+        con.execute(f"DROP TABLE {snapshot}")
+
+    # Drop rows and tables of datasets/datatables removed from the workspace.
+    dataset_ids = list(workspace.datasets)
+    datatable_ids = [datatable.id for datatable in _iter_workspace_datatables(workspace)]
+    con.execute("DELETE FROM _meta_datasets WHERE NOT list_contains(?::UUID[], id)", [dataset_ids])
+    con.execute("DELETE FROM _meta_reports WHERE NOT list_contains(?::UUID[], dataset_id)", [dataset_ids])
     con.execute(
-        "INSERT INTO _meta_datasets VALUES (?, ?, ?, ?, ?, ?, ?)",
-        [
-            dataset.id,
-            dataset.name,
-            dataset.description,
-            dataset.dataset_type,
-            TypeAdapter(dict[str, Animal]).dump_python(dataset.animals),
-            TypeAdapter(dict[str, Factor]).dump_python(dataset.factors),
-            dataset.metadata,
-        ],
+        f"""
+        DELETE FROM _meta_report_images AS image WHERE NOT EXISTS (
+            SELECT 1 FROM _meta_reports AS report
+            WHERE contains(report.content, '{_IMAGE_REFERENCE_PREFIX}' || image.hash)
+        )
+        """
     )
+    for meta_table in ("_meta_datatables", "_meta_raw_datatables"):
+        con.execute(f"DELETE FROM {meta_table} WHERE NOT list_contains(?::UUID[], id)", [datatable_ids])
 
-    _save_reports(con, dataset.id, dataset.reports)
+    used_tables = {_df_table_name(datatable) for datatable in _iter_workspace_datatables(workspace)}
+    for table_name in existing_tables - used_tables:
+        con.execute(f'DROP TABLE "{table_name}"')
 
-    for datatable in dataset.datatables.values():
-        _save_datatable(con, datatable)
-
-    for extension_name, extension_data in dataset.raw_datatables.items():
-        for raw_datatable in extension_data.values():
-            _save_raw_datatable(con, raw_datatable, extension_name)
+    _detach_sources(con, sources)
 
 
-def save_workspace(filename: str, workspace: Workspace) -> None:
+def save_workspace(filename: str, workspace: Workspace, incremental: bool = False) -> None:
     """Save a Workspace to a DuckDB file.
 
+    A full save writes the file next to the destination and swaps it in on success,
+    so lazily loaded datatables can still be copied from the file being overwritten.
+
+    An incremental save applies to the workspace's own, previously saved file: only the
+    datatables whose frame was replaced or mutated, and the ``_meta_*`` rows whose content
+    changed, are rewritten, inside a single DuckDB transaction. Falls back to a full save
+    when the file does not belong to this workspace.
+
     Args:
         filename: Destination file path.
         workspace: The workspace to persist.
+        incremental: Update the existing file in place instead of rewriting it.
     """
-    path = Path(filename)
-    if path.exists():
-        path.unlink()
+    path = str(Path(filename).resolve())
 
     logger.info(f"Saving workspace to {path}")
 
     tic = timeit.default_timer()
-    con = duckdb.connect(path)
-    try:
-        _create_meta_tables(con)
-        _save_workspace(con, workspace)
-        for dataset in workspace.datasets.values():
-            _save_dataset(con, dataset)
-    finally:
+    if incremental and _can_save_incrementally(path, workspace):
+        con = duckdb.connect(path)
+        try:
+            con.execute("BEGIN TRANSACTION")
+            try:
+                _save_workspace_incremental(con, path, workspace)
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+            con.execute("CHECKPOINT")
+        finally:
+            con.close()
+    else:
+        tmp_path = f"{path}.tmp"
+        Path(tmp_path).unlink(missing_ok=True)
+        con = duckdb.connect(tmp_path)
+        try:
+            sources = _attach_sources(con, workspace, tmp_path)
+            _create_meta_tables(con)
+            _save_workspace(con, workspace)
+            for dataset in workspace.datasets.values():
+                _save_dataset(con, dataset, sources)
+            _detach_sources(con, sources)
+        except Exception:
+            con.close()
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
         con.close()
+        os.replace(tmp_path, path)
+
+    _mark_persisted(path, workspace)
 
     logger.info(f"Workspace saved successfully in {(timeit.default_timer() - tic):.3f} sec")
 
@@ -281,13 +598,35 @@ def _load_workspace_meta(con: duckdb.DuckDBPyConnection) -> Workspace:
     return ws
 
 
+def _restore_report_images(con: duckdb.DuckDBPyConnection, contents: list[str | None]) -> list[str | None]:
+    """Replace the image references in report contents by the embedded images."""
+    hashes = {image_hash for content in contents if content for image_hash in _IMAGE_REFERENCE_PATTERN.findall(content)}
+    if not hashes:
+        return contents
+
+    rows = con.execute(
+        "SELECT hash, mime_type, data FROM _meta_report_images WHERE list_contains(?::VARCHAR[], hash)",
+        [list(hashes)],
+    ).fetchall()
+    data_uris = {
+        image_hash: f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+        for image_hash, mime_type, data in rows
+    }
+
+    def replace(match: re.Match) -> str:
+        return data_uris.get(match[1], match[0])
+
+    return [_IMAGE_REFERENCE_PATTERN.sub(replace, content) if content else content for content in contents]
+
+
 def _load_reports(con: duckdb.DuckDBPyConnection, dataset_id: UUID, dataset: Dataset) -> dict[str, Report]:
     rows = con.execute(
         "SELECT report_name, content, timestamp FROM _meta_reports WHERE dataset_id = ?",
         [dataset_id],
     ).fetchall()
+    contents = _restore_report_images(con, [row[1] for row in rows])
     reports: dict[str, Report] = {}
-    for name, content, timestamp in rows:
+    for (name, _, timestamp), content in zip(rows, contents, strict=True):
         reports[name] = Report(
             dataset,
             name,
@@ -297,9 +636,20 @@ def _load_reports(con: duckdb.DuckDBPyConnection, dataset_id: UUID, dataset: Dat
     return reports
 
 
+def _load_datatable_frame(
+    con: duckdb.DuckDBPyConnection,
+    table_name: str,
+    lazy_path: str | None,
+) -> tuple[pd.DataFrame | None, DuckDBTableSource | None]:
+    if lazy_path is not None:
+        return None, DuckDBTableSource(lazy_path, table_name)
+    return _load_dataframe(con, table_name), None
+
+
 def _load_datatables_for_dataset(
     con: duckdb.DuckDBPyConnection,
     dataset: Dataset,
+    lazy_path: str | None,
 ) -> dict[str, Datatable]:
     """Load all non-extension datatables for a dataset and wire the tree."""
     rows = con.execute(
@@ -320,7 +670,7 @@ def _load_datatables_for_dataset(
         metadata,
         outliers_settings,
     ) in rows:
-        df = _load_dataframe(con, duckdb_table_name)
+        df, df_source = _load_datatable_frame(con, duckdb_table_name, lazy_path)
 
         datatable = Datatable(
             dataset,
@@ -329,6 +679,7 @@ def _load_datatables_for_dataset(
             TypeAdapter(dict[str, Variable]).validate_json(variables_json),
             df,
             TypeAdapter(dict[str, Any]).validate_json(metadata),
+            df_source=df_source,
         )
         datatable.id = datatable_id
         datatable.outliers_settings = TypeAdapter(OutliersSettings).validate_json(outliers_settings)
@@ -340,6 +691,7 @@ def _load_datatables_for_dataset(
 def _load_raw_datatables_for_dataset(
     con: duckdb.DuckDBPyConnection,
     dataset: Dataset,
+    lazy_path: str | None,
 ) -> dict[str, dict[str, Datatable]]:
     """Load all raw extension datatables for a dataset and wire the tree."""
     rows = con.execute(
@@ -360,7 +712,7 @@ def _load_raw_datatables_for_dataset(
         metadata,
         outliers_settings,
     ) in rows:
-        df = _load_dataframe(con, duckdb_table_name)
+        df, df_source = _load_datatable_frame(con, duckdb_table_name, lazy_path)
 
         datatable = Datatable(
             dataset,
@@ -369,6 +721,7 @@ def _load_raw_datatables_for_dataset(
             TypeAdapter(dict[str, Variable]).validate_json(variables_json),
             df,
             TypeAdapter(dict[str, Any]).validate_json(metadata),
+            df_source=df_source,
         )
         datatable.id = datatable_id
         datatable.outliers_settings = TypeAdapter(OutliersSettings).validate_json(outliers_settings)
@@ -381,7 +734,7 @@ def _load_raw_datatables_for_dataset(
     return raw_datatables
 
 
-def _load_dataset(con: duckdb.DuckDBPyConnection, dataset_id: UUID) -> Dataset:
+def _load_dataset(con: duckdb.DuckDBPyConnection, dataset_id: UUID, lazy_path: str | None) -> Dataset:
     row = con.execute(
         "SELECT id, name, description, dataset_type, animals, factors, metadata FROM _meta_datasets WHERE id = ?",
         [dataset_id],
@@ -398,21 +751,24 @@ def _load_dataset(con: duckdb.DuckDBPyConnection, dataset_id: UUID) -> Dataset:
     dataset.factors = TypeAdapter(dict[str, Factor]).validate_json(row[5])
     dataset.reports = _load_reports(con, row[0], dataset)
 
-    dataset.datatables = _load_datatables_for_dataset(con, dataset)
-    dataset.raw_datatables = _load_raw_datatables_for_dataset(con, dataset)
+    dataset.datatables = _load_datatables_for_dataset(con, dataset, lazy_path)
+    dataset.raw_datatables = _load_raw_datatables_for_dataset(con, dataset, lazy_path)
 
     return dataset
 
 
-def load_workspace(path: str) -> Workspace:
+def load_workspace(path: str, lazy: bool = False) -> Workspace:
     """Load a Workspace from a DuckDB file.
 
     Args:
         path: Path to the DuckDB file.
+        lazy: When ``True`` only the metadata is read; each datatable DataFrame is
+            read from the file on first access, so tables never opened are never loaded.
 
     Returns:
         The reconstructed Workspace.
     """
+    path = str(Path(path).resolve())
     logger.info(f"Loading workspace from {path}")
 
     tic = timeit.default_timer()
@@ -422,8 +778,9 @@ def load_workspace(path: str) -> Workspace:
 
         dataset_rows = con.execute("SELECT id FROM _meta_datasets").fetchall()
         for row in dataset_rows:
-            dataset = _load_dataset(con, row[0])
+            dataset = _load_dataset(con, row[0], path if lazy else None)
             workspace.datasets[dataset.id] = dataset
+        _mark_persisted(path, workspace)
 
         logger.info(f"Workspace loaded successfully in {(timeit.default_timer() - tic):.3f} sec")
     except Exception as e:
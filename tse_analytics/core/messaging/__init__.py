@@ -34,3 +34,5 @@ is_subscribed = __messenger.is_subscribed
 get_handler = __messenger.get_handler
 unsubscribe = __messenger.unsubscribe
 unsubscribe_all = __messenger.unsubscribe_all
+delay_callbacks = __messenger.delay_callbacks
+ignore_callbacks = __messenger.ignore_callbacks
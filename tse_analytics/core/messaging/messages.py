@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
 from typing import TYPE_CHECKING
 
 from tse_analytics.core.models.tree_item import TreeItem
@@ -36,6 +37,16 @@ class Message:
     def __str__(self):
         return f"{type(self).__name__}\n\t Sent from: {self.sender}"
 
+    def coalesce_key(self) -> Hashable | None:
+        """Key identifying redundant messages of the same type within a coalesced batch
+
+        Of several queued messages with the same type and key, only the last one is
+        delivered when a coalescing :meth:`~Messenger.delay_callbacks` batch is flushed.
+
+        :return: The key, or None if every message of this type must be delivered
+        """
+        return None
+
 
 class SelectedTreeItemChangedMessage(Message):
     """Indicates that the selected TreeView item has changed"""
@@ -62,6 +73,9 @@ class DataChangedMessage(Message):
         super().__init__(sender)
         self.dataset = dataset
 
+    def coalesce_key(self) -> Hashable | None:
+        return id(self.dataset)
+
 
 class OutliersChangedMessage(Message):
     """Indicates that datatable outliers changed"""
@@ -70,6 +84,9 @@ class OutliersChangedMessage(Message):
         super().__init__(sender)
         self.datatable = datatable
 
+    def coalesce_key(self) -> Hashable | None:
+        return id(self.datatable)
+
 
 class WorkspaceChangedMessage(Message):
     """Indicates that the workspace has changed"""
@@ -83,6 +100,9 @@ class WorkspaceChangedMessage(Message):
         super().__init__(sender)
         self.workspace = workspace
 
+    def coalesce_key(self) -> Hashable | None:
+        return id(self.workspace)
+
 
 class DatasetChangedMessage(Message):
     """Indicates that the selected dataset is changed"""
@@ -96,6 +116,9 @@ class DatasetChangedMessage(Message):
         super().__init__(sender)
         self.dataset = dataset
 
+    def coalesce_key(self) -> Hashable | None:
+        return id(self.dataset)
+
 
 class DatatableChangedMessage(Message):
     """Indicates that the selected datatable is changed"""
@@ -109,6 +132,9 @@ class DatatableChangedMessage(Message):
         super().__init__(sender)
         self.datatable = datatable
 
+    def coalesce_key(self) -> Hashable | None:
+        return id(self.datatable)
+
 
 class ReportsChangedMessage(Message):
     def __init__(self, sender, report: Report | None):
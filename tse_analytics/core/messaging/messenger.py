@@ -1,7 +1,7 @@
 from collections import Counter
 from contextlib import contextmanager
 from inspect import getmro
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, ref
 
 from tse_analytics.core.exceptions import InvalidMessage, InvalidSubscriber
 from tse_analytics.core.messaging.messages import Message
@@ -26,6 +26,10 @@ class Messenger:
         * If filter(message) == True, it calls handler(message)
           (or notify(message) if handler wasn't provided).
 
+    The subscriber and subscription class chosen for a message type are
+    cached until the subscriptions change, so the class ranking is done
+    once per message type rather than once per broadcast.
+
     """
 
     def __init__(self, *args):
@@ -36,7 +40,11 @@ class Messenger:
         # Dictionary of subscriptions
         self._subscriptions = WeakKeyDictionary()
 
-        self._paused = False
+        # Message type => [(weak subscriber, most-specific subscribed class)]
+        self._dispatch_cache: dict[type, list[tuple[ref, type]]] = {}
+
+        self._paused = 0
+        self._coalescing = False
         self._queue = []
 
         self._ignore = Counter()
@@ -96,6 +104,7 @@ class Messenger:
             self._subscriptions[subscriber] = MessengerCallbackContainer()
 
         self._subscriptions[subscriber][message_class] = handler, filter
+        self._dispatch_cache.clear()
 
     def is_subscribed(self, subscriber: MessengerListener, message: Message):
         """
@@ -136,6 +145,7 @@ class Messenger:
             return
         if message in self._subscriptions[subscriber]:
             self._subscriptions[subscriber].pop(message)
+            self._dispatch_cache.clear()
 
     def unsubscribe_all(self, subscriber: MessengerListener):
         """
@@ -143,6 +153,23 @@ class Messenger:
         """
         if subscriber in self._subscriptions:
             self._subscriptions.pop(subscriber)
+            self._dispatch_cache.clear()
+
+    def _build_dispatch(self, message_type: type) -> list[tuple[ref, type]]:
+        """Rank the subscriptions of every subscriber for a message type.
+
+        :param message_type: The message type to dispatch
+        :return: (weak subscriber, most-specific subscribed class) pairs, in subscription order
+        """
+        # self._subscriptions:
+        # subscriber => { message type => (filter, handler)}
+
+        dispatch = []
+        for subscriber, subscriptions in list(self._subscriptions.items()):
+            candidate = _most_specific(subscriptions, message_type)
+            if candidate is not None:
+                dispatch.append((ref(subscriber), candidate))
+        return dispatch
 
     def _find_handlers(self, message: Message):
         """Yields all (subscriber, handler) pairs that should receive a message.
@@ -155,19 +182,23 @@ class Messenger:
         :param message: The message to find handlers for
         :yield: Tuples of (subscriber, handler) for each matching subscription
         """
-        # self._subscriptions:
-        # subscriber => { message type => (filter, handler)}
-
-        # loop over subscribed objects
-        for subscriber, subscriptions in list(self._subscriptions.items()):
-            # subscriptions to message or its superclasses
-            messages = [msg for msg in subscriptions.keys() if issubclass(type(message), msg)]
-
-            if len(messages) == 0:
+        message_type = type(message)
+        dispatch = self._dispatch_cache.get(message_type)
+        if dispatch is None:
+            dispatch = self._dispatch_cache[message_type] = self._build_dispatch(message_type)
+
+        for subscriber_ref, candidate in dispatch:
+            subscriber = subscriber_ref()
+            subscriptions = self._subscriptions.get(subscriber) if subscriber is not None else None
+            if subscriptions is None:
                 continue
 
-            # narrow to the most-specific message
-            candidate = max(messages, key=_mro_count)
+            if candidate not in subscriptions:
+                # The subscription was dropped with its garbage-collected handler
+                self._dispatch_cache.clear()
+                candidate = _most_specific(subscriptions, message_type)
+                if candidate is None:
+                    continue
 
             handler, test = subscriptions[candidate]
             if test(message):
@@ -182,16 +213,28 @@ class Messenger:
             self._ignore[ignore_type] -= 1
 
     @contextmanager
-    def delay_callbacks(self):
-        self._paused = True
+    def delay_callbacks(self, coalesce: bool = False):
+        """Queue all broadcasts within the block and deliver them on exit.
+
+        Nested blocks are flushed together when the outermost one exits.
+
+        :param coalesce: Whether to drop redundant queued messages: of several messages
+                         with the same type and :meth:`~Message.coalesce_key`, only the
+                         last one is delivered. The queue is coalesced if any of the
+                         nested blocks asks for it.
+        """
+        self._paused += 1
+        self._coalescing = self._coalescing or coalesce
         try:
             yield
         finally:
-            self._paused = False
-            # TODO: could de-duplicate messages here
-            for message in self._queue:
-                self.broadcast(message)
-            self._queue = []
+            self._paused -= 1
+            if self._paused == 0:
+                queue = _coalesce(self._queue) if self._coalescing else self._queue
+                self._queue = []
+                self._coalescing = False
+                for message in queue:
+                    self.broadcast(message)
 
     def broadcast(self, message: Message):
         """Broadcasts a message to all subscribed objects.
@@ -209,6 +252,40 @@ class Messenger:
                 handler(message)
 
 
+def _most_specific(subscriptions, message_type: type):
+    """Return the most specific subscribed class matching a message type.
+
+    :param subscriptions: The subscriptions of one subscriber
+    :param message_type: The message type to match
+    :return: The most-subclassed subscribed superclass of the message type, or None
+    """
+    # subscriptions to message or its superclasses
+    messages = [msg for msg in subscriptions.keys() if issubclass(message_type, msg)]
+    if len(messages) == 0:
+        return None
+
+    # narrow to the most-specific message
+    return max(messages, key=_mro_count)
+
+
+def _coalesce(queue: list[Message]) -> list[Message]:
+    """Drop queued messages superseded by a later message with the same type and key.
+
+    :param queue: The queued messages, in broadcast order
+    :return: The remaining messages, in broadcast order
+    """
+    last_positions = {}
+    for position, message in enumerate(queue):
+        key = message.coalesce_key()
+        if key is not None:
+            last_positions[type(message), key] = position
+    return [
+        message
+        for position, message in enumerate(queue)
+        if (key := message.coalesce_key()) is None or last_positions[type(message), key] == position
+    ]
+
+
 def _mro_count(obj):
     """Return the length of the method resolution order (MRO) for an object.
 
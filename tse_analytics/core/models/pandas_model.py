@@ -1,3 +1,6 @@
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtGui import QColor
@@ -12,10 +15,19 @@ class PandasModel(QAbstractTableModel):
 
     This model provides a tabular representation of a pandas DataFrame,
     with support for highlighting outliers based on the dataset's outlier settings.
+
+    The model is columnar so that multi-million-row tables scroll smoothly: column arrays are
+    extracted from the frame once, cells are formatted in blocks of rows that are kept in a small
+    LRU cache, outlier masks are computed once per column as boolean arrays, and rows are exposed
+    to the view incrementally (``canFetchMore``/``fetchMore``).
     """
 
     outlier_color = QColor("#f4a582")  # Color used for highlighting outliers
 
+    block_size = 256  # Rows formatted together on a cache miss
+    cache_blocks = 64  # Formatted blocks kept in the LRU cache
+    fetch_size = 100_000  # Rows exposed to the view per fetch
+
     def __init__(
         self,
         df: pd.DataFrame,
@@ -35,23 +47,22 @@ class PandasModel(QAbstractTableModel):
         self.datatable = datatable
         self.df = df
         self.row_count, self.column_count = df.shape
+        self.fetched_row_count = min(self.row_count, PandasModel.fetch_size)
 
+        self._columns = [df.iloc[:, i].array for i in range(self.column_count)]
+        self._blocks: OrderedDict[int, list[list[str]]] = OrderedDict()
+
+        # Column position -> boolean outlier mask; None marks a mask to be (re)computed on demand
+        self._outlier_masks: dict[int, np.ndarray | None] = {}
         if self.datatable.outliers_settings.mode == OutliersMode.HIGHLIGHT:
-            remove_outliers_for_vars = {
-                key: variable
-                for (key, variable) in datatable.variables.items()
-                if (variable.remove_outliers and variable.name in df.columns)
-            }
-            vars = list(remove_outliers_for_vars)
-            if len(remove_outliers_for_vars) > 0:
-                match self.datatable.outliers_settings.type:
-                    case OutliersType.IQR:
-                        self.q1 = self.df[vars].quantile(0.25, numeric_only=True)
-                        self.q3 = self.df[vars].quantile(0.75, numeric_only=True)
-                    case OutliersType.ZSCORE:
-                        self.z_score = ((self.df[vars] - self.df[vars].mean()) / self.df[vars].std()).abs()
-                    case OutliersType.THRESHOLDS:
-                        pass
+            for i, column in enumerate(df.columns):
+                variable = datatable.variables.get(str(column))
+                if (
+                    variable is not None
+                    and variable.remove_outliers
+                    and pd.api.types.is_numeric_dtype(df.dtypes.iloc[i])
+                ):
+                    self._outlier_masks[i] = None
 
     def rowCount(self, parent=None):
         """
@@ -61,9 +72,9 @@ class PandasModel(QAbstractTableModel):
             parent: Unused parameter required by the interface.
 
         Returns:
-            int: The number of rows in the DataFrame.
+            int: The number of rows exposed to the view so far (see ``fetchMore``).
         """
-        return self.row_count
+        return self.fetched_row_count
 
     def columnCount(self, parent=None):
         """
@@ -77,6 +88,78 @@ class PandasModel(QAbstractTableModel):
         """
         return self.column_count
 
+    def canFetchMore(self, parent=None):
+        """
+        Check whether more rows of the DataFrame can be exposed to the view.
+
+        Args:
+            parent: Unused parameter required by the interface.
+
+        Returns:
+            bool: True while not all rows are exposed.
+        """
+        return self.fetched_row_count < self.row_count
+
+    def fetchMore(self, parent=None):
+        """
+        Expose the next batch of rows to the view.
+
+        Args:
+            parent: Unused parameter required by the interface.
+        """
+        count = min(PandasModel.fetch_size, self.row_count - self.fetched_row_count)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.fetched_row_count, self.fetched_row_count + count - 1)
+        self.fetched_row_count += count
+        self.endInsertRows()
+
+    def _formatted_block(self, block: int) -> list[list[str]]:
+        """Return the formatted cells of a block of rows, per column, formatting it on a cache miss."""
+        cells = self._blocks.get(block)
+        if cells is not None:
+            self._blocks.move_to_end(block)
+            return cells
+
+        start = block * PandasModel.block_size
+        stop = min(start + PandasModel.block_size, self.row_count)
+        cells = [[str(value) for value in column[start:stop]] for column in self._columns]
+        self._blocks[block] = cells
+        if len(self._blocks) > PandasModel.cache_blocks:
+            self._blocks.popitem(last=False)
+        return cells
+
+    def _outlier_mask(self, column: int) -> np.ndarray:
+        """Return the outlier mask of a column, computing it once for the whole column."""
+        mask = self._outlier_masks[column]
+        if mask is not None:
+            return mask
+
+        values = pd.Series(self._columns[column])
+        settings = self.datatable.outliers_settings
+        match settings.type:
+            case OutliersType.IQR:
+                q1 = values.quantile(0.25)
+                q3 = values.quantile(0.75)
+                iqr = q3 - q1
+                is_outlier = (values < q1 - settings.iqr_multiplier * iqr) | (
+                    values > q3 + settings.iqr_multiplier * iqr
+                )
+            case OutliersType.ZSCORE:
+                is_outlier = ((values - values.mean()) / values.std()).abs() > 3
+            case OutliersType.THRESHOLDS:
+                is_outlier = pd.Series(False, index=values.index)
+                if settings.min_threshold_enabled:
+                    is_outlier = is_outlier | (values < settings.min_threshold)
+                if settings.max_threshold_enabled:
+                    is_outlier = is_outlier | (values > settings.max_threshold)
+            case _:
+                is_outlier = pd.Series(False, index=values.index)
+
+        mask = is_outlier.to_numpy(dtype=bool, na_value=False)
+        self._outlier_masks[column] = mask
+        return mask
+
     def data(self, index: QModelIndex, role: Qt.ItemDataRole = ...):
         """
         Return the data stored at the given index for the specified role.
@@ -95,31 +178,11 @@ class PandasModel(QAbstractTableModel):
                 - None for unsupported roles
         """
         if role == Qt.ItemDataRole.DisplayRole:
-            return str(self.df.iat[index.row(), index.column()])
-        if self.datatable.outliers_settings.mode == OutliersMode.HIGHLIGHT and role == Qt.ItemDataRole.BackgroundRole:
-            value = self.df.iat[index.row(), index.column()]
-            if isinstance(value, int | float):
-                var_name = str(self.df.columns[index.column()])
-                if var_name in self.datatable.variables and self.datatable.variables[var_name].remove_outliers:
-                    match self.datatable.outliers_settings.type:
-                        case OutliersType.IQR:
-                            q1 = self.q1[var_name]
-                            q3 = self.q3[var_name]
-                            iqr = q3 - q1
-                            iqr_multiplier = self.datatable.outliers_settings.iqr_multiplier
-                            if (value < (q1 - iqr_multiplier * iqr)) or (value > (q3 + iqr_multiplier * iqr)):
-                                return PandasModel.outlier_color
-                        case OutliersType.ZSCORE:
-                            z_score = self.z_score[var_name]
-                            if z_score[index.row()] > 3:
-                                return PandasModel.outlier_color
-                        case OutliersType.THRESHOLDS:
-                            if self.datatable.outliers_settings.min_threshold_enabled:
-                                if value < self.datatable.outliers_settings.min_threshold:
-                                    return PandasModel.outlier_color
-                            if self.datatable.outliers_settings.max_threshold_enabled:
-                                if value > self.datatable.outliers_settings.max_threshold:
-                                    return PandasModel.outlier_color
+            block, offset = divmod(index.row(), PandasModel.block_size)
+            return self._formatted_block(block)[index.column()][offset]
+        if role == Qt.ItemDataRole.BackgroundRole and index.column() in self._outlier_masks:
+            if self._outlier_mask(index.column())[index.row()]:
+                return PandasModel.outlier_color
         return None
 
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
@@ -128,6 +191,14 @@ class PandasModel(QAbstractTableModel):
             row_index = self.df.index[index.row()]
             col_name = self.df.columns[index.column()]
             self.datatable.df.at[row_index, col_name] = value
+            self.datatable.mark_df_modified()
+
+            # The write may have replaced the column array; refresh it and drop stale derived state
+            self._columns[index.column()] = self.df.iloc[:, index.column()].array
+            self._blocks.pop(index.row() // PandasModel.block_size, None)
+            if index.column() in self._outlier_masks:
+                self._outlier_masks[index.column()] = None
+
             self.dataChanged.emit(index, index, [role])
             return True
         return False
@@ -11,6 +11,7 @@ from tse_analytics.core import messaging
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.report import Report
+from tse_analytics.core.io.merge_store import create_temporary_store_path
 from tse_analytics.core.services.selection_service import SelectionService
 from tse_analytics.core.services.workspace_service import WorkspaceService
 from tse_analytics.core.utils import data_merger
@@ -67,6 +68,7 @@ class DatasetService:
         """
         datatable.dataset.remove_datatable(datatable)
         self._selection.set_selected_datatable(None)
+        self._workspace.release_temporary_stores()
         ws = self._workspace.get_workspace()
         messaging.broadcast(messaging.WorkspaceChangedMessage(self, ws))
 
@@ -77,6 +79,7 @@ class DatasetService:
         single_trial: bool,
         continuous_mode: bool,
         generate_new_animal_names: bool,
+        out_of_core: bool = False,
     ) -> None:
         """Merge multiple datasets into a new dataset and add it to the workspace.
 
@@ -89,17 +92,26 @@ class DatasetService:
             single_trial: Whether to treat all datasets as a single trial.
             continuous_mode: Whether to use continuous mode for merging.
             generate_new_animal_names: Whether to generate new animal names.
+            out_of_core: Whether to merge in a temporary DuckDB file that backs the merged datatables
+                until the workspace is saved; the file is deleted once no datatable reads from it.
         """
-        merged_dataset = data_merger.merge_datasets(
-            new_dataset_name,
-            datasets,
-            single_trial,
-            continuous_mode,
-            generate_new_animal_names,
-        )
-
-        if merged_dataset is not None:
-            self.add_dataset(merged_dataset)
+        store_path = create_temporary_store_path() if out_of_core else None
+
+        try:
+            merged_dataset = data_merger.merge_datasets(
+                new_dataset_name,
+                datasets,
+                single_trial,
+                continuous_mode,
+                generate_new_animal_names,
+                store_path,
+            )
+            if merged_dataset is not None:
+                self.add_dataset(merged_dataset)
+        finally:
+            if store_path is not None:
+                # Deletes the store right away if the merge failed
+                self._workspace.release_temporary_stores()
 
     def clone_dataset(self, original_dataset: Dataset, new_name: str) -> None:
         """Create a deep copy of a dataset with a new name and add it to the workspace.
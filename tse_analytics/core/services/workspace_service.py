@@ -12,6 +12,7 @@ from PySide6.QtCore import QTimer
 
 from tse_analytics.core import messaging
 from tse_analytics.core.data.workspace import Workspace
+from tse_analytics.core.io.merge_store import release_temporary_stores
 from tse_analytics.core.io.storage import load_workspace as _load_from_duckdb
 from tse_analytics.core.io.storage import save_workspace as _save_to_duckdb
 from tse_analytics.core.services.selection_service import SelectionService
@@ -45,6 +46,7 @@ class WorkspaceService:
         """Load a workspace from a file and clear selections.
 
         Supports both DuckDB (``.duckdb``) and legacy pickle (``.workspace``) formats.
+        DuckDB workspaces are loaded lazily: datatable frames are read on first access.
 
         Args:
             path: The path to the workspace file to load.
@@ -53,13 +55,14 @@ class WorkspaceService:
             with open(path, "rb") as file:
                 self._workspace = pickle.load(file)
         else:
-            self._workspace = _load_from_duckdb(path)
+            self._workspace = _load_from_duckdb(path, lazy=True)
         self._cleanup_workspace()
 
     def save_workspace(self, path: str) -> None:
         """Save the current workspace to a file.
 
         Supports both DuckDB (``.duckdb``) and legacy pickle (``.workspace``) formats.
+        Saving a DuckDB workspace over its own file only rewrites what changed.
 
         Args:
             path: The path where the workspace file will be saved.
@@ -68,7 +71,18 @@ class WorkspaceService:
             with open(path, "wb") as file:
                 pickle.dump(self._workspace, file)
         else:
-            _save_to_duckdb(path, self._workspace)
+            _save_to_duckdb(path, self._workspace, incremental=True)
+        # Saved datatables no longer read from temporary merge stores
+        self.release_temporary_stores()
+
+    def release_temporary_stores(self) -> None:
+        """Delete the temporary merge stores no datatable of the current workspace reads from."""
+        release_temporary_stores(
+            datatable
+            for dataset in self._workspace.datasets.values()
+            for datatables in (dataset.datatables, *dataset.raw_datatables.values())
+            for datatable in datatables.values()
+        )
 
     def _cleanup_workspace(self) -> None:
         """Clean up the workspace by clearing selections and triggering garbage collection.
@@ -77,5 +91,6 @@ class WorkspaceService:
         such as loading a new workspace or removing a dataset.
         """
         self._selection.clear()
+        self.release_temporary_stores()
         messaging.broadcast(messaging.WorkspaceChangedMessage(self, self._workspace))
         QTimer.singleShot(1000, gc.collect)
@@ -0,0 +1,74 @@
+"""Startup import-time report.
+
+Importing this module starts the startup clock, so ``main.py`` imports it before any other
+application module. Once the main window is shown, ``log_startup_report`` logs how long startup took
+and warns about heavy analysis packages that were imported although they should only load with the
+toolbox widget (or pipeline editor) that needs them, so import regressions are visible in the log.
+For a per-module breakdown run ``python -X importtime -m tse_analytics.main``.
+"""
+
+import sys
+import timeit
+from dataclasses import dataclass
+
+from loguru import logger
+
+_started = timeit.default_timer()
+
+# Packages that must not be imported before a tool needing them is opened
+DEFERRED_PACKAGES: tuple[str, ...] = (
+    "anthropic",
+    "lmstudio",
+    "numba",
+    "pingouin",
+    "sklearn",
+    "umap",
+)
+
+
+@dataclass(frozen=True)
+class StartupReport:
+    """Imports done by the time the application started.
+
+    Attributes:
+        seconds: Time since this module was imported.
+        module_count: Number of imported modules.
+        deferred_packages: ``DEFERRED_PACKAGES`` members that are already imported.
+        loaded_plugins: Labels of toolbox plugins whose widget module is already imported.
+    """
+
+    seconds: float
+    module_count: int
+    deferred_packages: list[str]
+    loaded_plugins: list[str]
+
+
+def get_startup_report() -> StartupReport:
+    """Collect the imports done so far.
+
+    Returns:
+        The startup report.
+    """
+    from tse_analytics.toolbox import PLUGINS
+
+    return StartupReport(
+        seconds=timeit.default_timer() - _started,
+        module_count=len(sys.modules),
+        deferred_packages=[package for package in DEFERRED_PACKAGES if package in sys.modules],
+        loaded_plugins=[plugin.label for plugin in PLUGINS if plugin.module_name is not None and plugin.is_loaded],
+    )
+
+
+def log_startup_report() -> StartupReport:
+    """Log the startup report, warning about packages imported before they were needed.
+
+    Returns:
+        The logged report.
+    """
+    report = get_startup_report()
+    logger.info(f"Application started in {report.seconds:.3f} sec ({report.module_count} modules imported)")
+    if report.loaded_plugins:
+        logger.debug(f"Toolbox plugins imported at startup: {', '.join(report.loaded_plugins)}")
+    if report.deferred_packages:
+        logger.warning(f"Packages imported at startup instead of on demand: {', '.join(report.deferred_packages)}")
+    return report
@@ -9,10 +9,13 @@ from tse_analytics.core.utils.data import time_to_float
 from tse_analytics.core.utils.database import get_available_sqlite_tables
 from tse_analytics.core.utils.formatting import (
     get_great_table,
+    get_html_document,
     get_html_image_from_figure,
     get_html_image_from_plot,
+    get_html_images_from_figures,
     get_html_table,
     get_plot_layout,
+    render_html_sections,
 )
 from tse_analytics.core.utils.ui import (
     get_figsize_from_widget,
@@ -25,12 +28,15 @@ __all__ = [
     "get_available_sqlite_tables",
     "get_figsize_from_widget",
     "get_h_spacer_widget",
+    "get_html_document",
     "get_html_image_from_figure",
     "get_html_image_from_plot",
+    "get_html_images_from_figures",
     "get_html_table",
     "get_great_table",
     "get_plot_layout",
     "get_save_file_name",
     "get_widget_tool_button",
+    "render_html_sections",
     "time_to_float",
 ]
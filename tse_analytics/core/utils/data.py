@@ -86,7 +86,9 @@ def reassign_df_timedelta(df: pd.DataFrame, merging_mode: str | None) -> pd.Data
     """
     Reassign timedelta values in a DataFrame.
 
-    This function recalculates timedelta values based on the merging mode.
+    This function recalculates timedelta values based on the merging mode. In "overlap" mode
+    every trial is re-based on its own first timestamp, computed for all trials in a single
+    grouped pass; otherwise all rows are re-based on the first timestamp of the DataFrame.
 
     Parameters
     ----------
@@ -103,14 +105,11 @@ def reassign_df_timedelta(df: pd.DataFrame, merging_mode: str | None) -> pd.Data
     df.reset_index(inplace=True, drop=True)
 
     if merging_mode == "overlap":
-        # Get unique trial numbers
-        trials = df["Trial"].unique().tolist()
-
-        # Reassign timedeltas
-        for trial in trials:
-            # Get start timestamp per experiment
-            start_date_time = df[df["Trial"] == trial]["DateTime"].iloc[0]
-            df.loc[df["Trial"] == trial, "Timedelta"] = df["DateTime"] - start_date_time
+        # Start timestamp of the trial of every row (the first row of the trial, as in row order)
+        start_date_times = df.groupby("Trial", observed=True, sort=False)["DateTime"].transform("first", skipna=False)
+        timedelta = df["DateTime"] - start_date_times
+        # Keep the resolution of an existing column, as the per-trial assignment did
+        df["Timedelta"] = timedelta.astype(df["Timedelta"].dtype) if "Timedelta" in df.columns else timedelta
     else:
         start_date_time = df["DateTime"].iloc[0]
         df["Timedelta"] = df["DateTime"] - start_date_time
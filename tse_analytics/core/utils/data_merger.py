@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import asdict
 
 import pandas as pd
@@ -5,7 +6,9 @@ import pandas as pd
 from tse_analytics.core.color_manager import get_factor_level_color_hex
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import META_ORIGIN_PATH, META_SAMPLE_INTERVAL, Datatable
+from tse_analytics.core.data.factor_appliers import apply_factors
 from tse_analytics.core.data.shared import Animal, ByColumnConfig, Factor, FactorLevel, FactorRole
+from tse_analytics.core.io.merge_store import MergeStore
 from tse_analytics.globals import TIME_RESOLUTION_UNIT
 
 
@@ -15,6 +18,7 @@ def merge_datasets(
     single_trial: bool,
     continuous_mode: bool,
     generate_new_animal_names: bool,
+    store_path: str | None = None,
 ) -> Dataset | None:
     """
     Merge multiple PhenoMaster datasets into a single dataset.
@@ -23,6 +27,10 @@ def merge_datasets(
     It supports two merging modes: continuous (for sequential trials) and
     overlap (for parallel trials with potentially overlapping data).
 
+    With ``store_path`` the merge runs out of core: trial frames are united in a DuckDB file
+    (see ``core/io/merge_store.py``) and the merged datatables are read from it lazily, so the
+    merged data never has to fit in memory at once. The source datasets are left unchanged.
+
     Args:
         new_dataset_name (str): Name for the merged dataset
         datasets (list[Dataset]): List of datasets to merge
@@ -31,6 +39,7 @@ def merge_datasets(
                                if False, datasets are merged as parallel trials
         generate_new_animal_names (bool): If True, animal IDs will be modified to ensure uniqueness
                                          across datasets (only used in overlap mode)
+        store_path (str | None): DuckDB file for an out-of-core merge; None merges in memory
 
     Returns:
         Dataset | None: The merged dataset, or None if merging failed
@@ -38,6 +47,8 @@ def merge_datasets(
     # Sort datasets by experiment start time
     datasets.sort(key=lambda dataset: dataset.experiment_started)
 
+    animal_name_maps: list[dict[str, str] | None] = [None] * len(datasets)
+    dataset_animals = [dataset.animals for dataset in datasets]
     if not continuous_mode and generate_new_animal_names:
         for index, dataset in enumerate(datasets):
             trial_number = index + 1
@@ -46,23 +57,11 @@ def merge_datasets(
             for animal in dataset.animals.values():
                 new_animal_id = f"{animal.id}_{trial_number}"
                 name_map[animal.id] = new_animal_id
-                animal.id = new_animal_id
-                new_animals[new_animal_id] = animal
-            dataset.animals = new_animals
-
-            for datatable in dataset.datatables.values():
-                datatable.df["Animal"] = datatable.df["Animal"].astype("string")
-                datatable.df["Animal"] = datatable.df["Animal"].map(name_map)
-                datatable.df["Animal"] = datatable.df["Animal"].astype("category")
-
-            for extension_datatables in dataset.raw_datatables.values():
-                for datatable in extension_datatables.values():
-                    if "Animal" in datatable.df.columns:
-                        datatable.df["Animal"] = datatable.df["Animal"].astype("string")
-                        datatable.df["Animal"] = datatable.df["Animal"].map(name_map)
-                        datatable.df["Animal"] = datatable.df["Animal"].astype("category")
+                new_animals[new_animal_id] = Animal(id=new_animal_id, properties=animal.properties.copy())
+            dataset_animals[index] = new_animals
+            animal_name_maps[index] = name_map
 
-    merged_animals = _merge_animals(datasets)
+    merged_animals = _merge_animals(dataset_animals)
 
     merging_mode = "continuous" if continuous_mode else "overlap"
     merged_metadata = _merge_metadata(new_dataset_name, merging_mode, merged_animals, datasets)
@@ -75,12 +74,17 @@ def merge_datasets(
         merged_animals,
     )
 
+    if store_path is not None:
+        with MergeStore(store_path) as store:
+            _merge_datatables_in_store(store, merged_dataset, datasets, single_trial, continuous_mode, animal_name_maps)
+        return merged_dataset
+
     first_dataset = datasets[0]
     for datatable_name in first_dataset.datatables.keys():
         dataframes = []
-        for dataset in datasets:
+        for dataset, animal_name_map in zip(datasets, animal_name_maps, strict=True):
             if datatable_name in dataset.datatables:
-                dataframes.append(dataset.datatables[datatable_name].df)
+                dataframes.append(_get_source_frame(dataset.datatables[datatable_name], animal_name_map))
 
         # Assign trial number
         if not single_trial:
@@ -94,15 +98,7 @@ def merge_datasets(
                 new_df = new_df.drop(columns=["Trial"])
         else:
             new_df["Trial"] = new_df["Trial"].astype("category")
-            levels = {}
-            for i, trial in enumerate(new_df["Trial"].unique()):
-                levels[trial] = FactorLevel(name=trial, color=get_factor_level_color_hex(i))
-            factor = Factor(
-                name="Trial",
-                role=FactorRole.WITHIN_SUBJECT if continuous_mode else FactorRole.BETWEEN_SUBJECT,
-                config=ByColumnConfig(column="Trial"),
-                levels=levels,
-            )
+            factor = _get_trial_factor(new_df["Trial"].unique(), continuous_mode)
             merged_dataset.factors[factor.name] = factor
 
         if continuous_mode:
@@ -117,13 +113,7 @@ def merge_datasets(
         # Sort dataframe
         new_df = new_df.sort_values(by=["Timedelta", "Animal"]).reset_index(drop=True)
 
-        # Preserve sample_interval from the source so the merged datatable
-        # remains a regular timeseries and Dataset.set_factors auto-creates
-        # the Bin factor for it.
-        source_metadata = first_dataset.datatables[datatable_name].metadata
-        new_metadata: dict = {}
-        if META_SAMPLE_INTERVAL in source_metadata:
-            new_metadata[META_SAMPLE_INTERVAL] = source_metadata[META_SAMPLE_INTERVAL]
+        new_metadata = _get_merged_datatable_metadata(first_dataset.datatables[datatable_name])
 
         new_variables = first_dataset.datatables[datatable_name].variables
         datatable = Datatable(
@@ -136,7 +126,7 @@ def merge_datasets(
         )
         merged_dataset.add_datatable(datatable)
 
-    _merge_raw_datatables(merged_dataset, datasets, continuous_mode)
+    _merge_raw_datatables(merged_dataset, datasets, continuous_mode, animal_name_maps)
 
     # Materialize factor columns on the merged datatables.
     merged_dataset.set_factors(merged_dataset.factors)
@@ -144,7 +134,31 @@ def merge_datasets(
     return merged_dataset
 
 
-def _merge_raw_datatables(merged_dataset: Dataset, datasets: list[Dataset], continuous_mode: bool) -> None:
+def _get_source_frame(datatable: Datatable, animal_name_map: dict[str, str] | None) -> pd.DataFrame:
+    """
+    Shallow copy of a source datatable frame to merge, with animals renamed by ``animal_name_map``.
+
+    Columns written to the copy are copied by pandas copy-on-write, so the source stays unchanged.
+
+    Args:
+        datatable (Datatable): Source datatable.
+        animal_name_map (dict[str, str] | None): New animal ids by old id; None keeps the ids.
+
+    Returns:
+        pd.DataFrame: The frame to merge.
+    """
+    df = datatable.df.copy(deep=False)
+    if animal_name_map is not None and "Animal" in df.columns:
+        df["Animal"] = df["Animal"].astype("string").map(animal_name_map).astype("category")
+    return df
+
+
+def _merge_raw_datatables(
+    merged_dataset: Dataset,
+    datasets: list[Dataset],
+    continuous_mode: bool,
+    animal_name_maps: list[dict[str, str] | None],
+) -> None:
     """
     Merge raw_datatables (extension data) from source datasets into the merged dataset.
 
@@ -156,6 +170,8 @@ def _merge_raw_datatables(merged_dataset: Dataset, datasets: list[Dataset], cont
     Args:
         merged_dataset (Dataset): The destination merged dataset.
         datasets (list[Dataset]): Source datasets, sorted by start time.
+        continuous_mode (bool): Whether the datasets are merged as sequential trials.
+        animal_name_maps (list[dict[str, str] | None]): New animal ids of every source dataset, if renamed.
     """
 
     first_dataset = datasets[0]
@@ -169,7 +185,10 @@ def _merge_raw_datatables(merged_dataset: Dataset, datasets: list[Dataset], cont
             if not all(datatable_name in ds.raw_datatables[extension_name] for ds in datasets):
                 continue
 
-            dataframes = [ds.raw_datatables[extension_name][datatable_name].df for ds in datasets]
+            dataframes = [
+                _get_source_frame(ds.raw_datatables[extension_name][datatable_name], animal_name_map)
+                for ds, animal_name_map in zip(datasets, animal_name_maps, strict=True)
+            ]
             new_df = pd.concat(dataframes, ignore_index=True)
 
             if continuous_mode and "Timedelta" in new_df.columns:
@@ -184,14 +203,8 @@ def _merge_raw_datatables(merged_dataset: Dataset, datasets: list[Dataset], cont
                 new_df["Animal"] = new_df["Animal"].astype("string").astype("category")
 
             # Sort by the appropriate time column
-            if "Timedelta" in new_df.columns:
-                sort_keys = ["Timedelta"] + (["Animal"] if "Animal" in new_df.columns else [])
-                new_df = new_df.sort_values(by=sort_keys).reset_index(drop=True)
-            elif "StartDateTime" in new_df.columns:
-                sort_keys = ["StartDateTime"] + (["Animal"] if "Animal" in new_df.columns else [])
-                new_df = new_df.sort_values(by=sort_keys).reset_index(drop=True)
-            elif "DateTime" in new_df.columns:
-                sort_keys = ["DateTime"] + (["Animal"] if "Animal" in new_df.columns else [])
+            sort_keys = _get_raw_sort_keys(new_df.columns.tolist())
+            if sort_keys:
                 new_df = new_df.sort_values(by=sort_keys).reset_index(drop=True)
 
             # Copy metadata from the reference version, drop the stale origin_path
@@ -214,6 +227,125 @@ def _merge_raw_datatables(merged_dataset: Dataset, datasets: list[Dataset], cont
             merged_dataset.add_raw_datatable(extension_name, datatable)
 
 
+def _merge_datatables_in_store(
+    store: MergeStore,
+    merged_dataset: Dataset,
+    datasets: list[Dataset],
+    single_trial: bool,
+    continuous_mode: bool,
+    animal_name_maps: list[dict[str, str] | None],
+) -> None:
+    """
+    Merge datatables and raw datatables out of core, backing the merged datatables by the store.
+
+    Mirrors the in-memory merge: the same Trial assignment, Timedelta re-basing, sort order,
+    metadata and factor columns, computed in DuckDB and in streamed chunks instead of on the
+    concatenated frames.
+
+    Args:
+        store (MergeStore): The store the merged tables are written to.
+        merged_dataset (Dataset): The destination merged dataset.
+        datasets (list[Dataset]): Source datasets, sorted by start time.
+        single_trial (bool): If True, all data is treated as a single trial run.
+        continuous_mode (bool): If True, Timedelta is re-based on the merged experiment start.
+        animal_name_maps (list[dict[str, str] | None]): Per source dataset, new animal ids by old id.
+    """
+    timedelta_origin = merged_dataset.experiment_started if continuous_mode else None
+
+    def apply_factors_to_chunk(chunk: pd.DataFrame) -> None:
+        if "Animal" in chunk.columns:
+            apply_factors(chunk, merged_dataset.factors, merged_dataset)
+
+    first_dataset = datasets[0]
+    for datatable_name, reference_datatable in first_dataset.datatables.items():
+        trials = []
+        for dataset, name_map in zip(datasets, animal_name_maps, strict=True):
+            if datatable_name in dataset.datatables:
+                trial = None if single_trial else f"Trial {len(trials)}"
+                store.stage(datatable_name, dataset.datatables[datatable_name], trial, name_map)
+                trials.append(trial)
+
+        if not single_trial:
+            factor = _get_trial_factor(trials, continuous_mode)
+            merged_dataset.factors[factor.name] = factor
+
+        source = store.merge(
+            datatable_name,
+            lambda columns: ["Timedelta", "Animal"],
+            timedelta_origin,
+            apply_factors_to_chunk,
+        )
+        datatable = Datatable(
+            merged_dataset,
+            datatable_name,
+            f"Merged {datatable_name} datatable",
+            reference_datatable.variables,
+            None,
+            _get_merged_datatable_metadata(reference_datatable),
+            df_source=source,
+        )
+        merged_dataset.add_datatable(datatable)
+
+    for extension_name, extension_datatables in first_dataset.raw_datatables.items():
+        # Intersection semantics, as in _merge_raw_datatables
+        if not all(extension_name in ds.raw_datatables for ds in datasets):
+            continue
+
+        for datatable_name, reference_datatable in extension_datatables.items():
+            if not all(datatable_name in ds.raw_datatables[extension_name] for ds in datasets):
+                continue
+
+            table_name = f"{extension_name}__{datatable_name}"
+            for dataset, name_map in zip(datasets, animal_name_maps, strict=True):
+                store.stage(table_name, dataset.raw_datatables[extension_name][datatable_name], None, name_map)
+            source = store.merge(table_name, _get_raw_sort_keys, timedelta_origin)
+
+            new_metadata = {k: v for k, v in reference_datatable.metadata.items() if k != META_ORIGIN_PATH}
+            if "animal_ids" in new_metadata and "Animal" in store.columns(source):
+                new_metadata["animal_ids"] = store.distinct_values(source, "Animal")
+
+            datatable = Datatable(
+                merged_dataset,
+                datatable_name,
+                f"Merged {datatable_name} datatable",
+                reference_datatable.variables,
+                None,
+                new_metadata,
+                df_source=source,
+            )
+            merged_dataset.add_raw_datatable(extension_name, datatable)
+
+
+def _get_trial_factor(trials: Iterable[str], continuous_mode: bool) -> Factor:
+    levels = {}
+    for i, trial in enumerate(trials):
+        levels[trial] = FactorLevel(name=trial, color=get_factor_level_color_hex(i))
+    return Factor(
+        name="Trial",
+        role=FactorRole.WITHIN_SUBJECT if continuous_mode else FactorRole.BETWEEN_SUBJECT,
+        config=ByColumnConfig(column="Trial"),
+        levels=levels,
+    )
+
+
+def _get_merged_datatable_metadata(reference_datatable: Datatable) -> dict:
+    # Preserve sample_interval from the source so the merged datatable
+    # remains a regular timeseries and Dataset.set_factors auto-creates
+    # the Bin factor for it.
+    new_metadata: dict = {}
+    if META_SAMPLE_INTERVAL in reference_datatable.metadata:
+        new_metadata[META_SAMPLE_INTERVAL] = reference_datatable.metadata[META_SAMPLE_INTERVAL]
+    return new_metadata
+
+
+def _get_raw_sort_keys(columns: list[str]) -> list[str]:
+    # Sort raw datatables by the appropriate time column, then by animal
+    for time_column in ("Timedelta", "StartDateTime", "DateTime"):
+        if time_column in columns:
+            return [time_column] + (["Animal"] if "Animal" in columns else [])
+    return []
+
+
 def _merge_metadata(
     merged_dataset_name: str,
     merging_mode: str,
@@ -254,7 +386,7 @@ def _merge_metadata(
     return result
 
 
-def _merge_animals(datasets: list[Dataset]) -> dict[str, Animal]:
+def _merge_animals(dataset_animals: list[dict[str, Animal]]) -> dict[str, Animal]:
     """
     Merge animal data from multiple datasets.
 
@@ -264,13 +396,13 @@ def _merge_animals(datasets: list[Dataset]) -> dict[str, Animal]:
     animal ID.
 
     Args:
-        datasets (list[Dataset]): List of datasets whose animal data will be merged
+        dataset_animals (list[dict[str, Animal]]): Animals of every dataset being merged
 
     Returns:
         dict[str, Animal]: Dictionary mapping animal IDs to Animal objects
     """
     result: dict[str, Animal] = {}
-    for animals in [dataset.animals for dataset in reversed(datasets)]:
+    for animals in reversed(dataset_animals):
         result.update(animals)
     result = dict(sorted(result.items()))
     return result
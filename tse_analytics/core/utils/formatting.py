@@ -1,6 +1,7 @@
 """HTML image and table generation utilities."""
 
 from base64 import b64encode
+from collections.abc import Sequence
 from io import BytesIO
 
 import pandas as pd
@@ -8,14 +9,60 @@ import seaborn.objects as so
 from great_tables import GT
 from matplotlib.figure import Figure
 
+from tse_analytics.core.utils.rendering import render_figures_png
 from tse_analytics.styles.css import gt_theme_tse
 
+_HTML_DOCUMENT_TEMPLATE = """
+<html>
+<head>
+<style type="text/css">
+    body {{
+        font-family: "Segoe UI", system-ui, sans-serif;
+        font-size: 10pt;
+    }}
+    table {{
+        font-size: 10pt;
+        border-collapse: collapse;
+        border: 1px solid silver;
+        margin-bottom: 20px;
+    }}
+    caption {{
+        font-size: 12pt;
+        font-weight: bold;
+    }}
+    th {{
+        padding: 5px;
+        background: #dfebea;
+    }}
+    td {{
+        padding: 5px;
+    }}
+    .horizontal-container {{
+        display: flex;
+        justify-content: space-between;
+        margin: 20px;
+    }}
+</style>
+</head>
+<body>
+
+{content}
+
+</body>
+</html>
+"""
+
+
+def _html_image(image: bytes) -> str:
+    encoded = b64encode(image).decode("utf-8")
+    return f"<img src='data:image/png;base64,{encoded}'><br>"
+
 
 def get_html_image_from_figure(figure: Figure) -> str:
     """Convert a matplotlib figure to an HTML image tag with embedded base64 data.
 
-    This function saves the figure as a PNG image in memory, encodes it as base64,
-    and returns an HTML img tag that can be used to display the image in HTML content.
+    The figure is rendered as a PNG image, or taken from the image cache if an identical
+    figure was rendered before (see ``tse_analytics.core.utils.rendering``).
 
     Args:
         figure: The matplotlib Figure object to convert.
@@ -23,10 +70,33 @@ def get_html_image_from_figure(figure: Figure) -> str:
     Returns:
         A string containing an HTML img tag with the figure embedded as base64 data.
     """
-    io = BytesIO()
-    figure.savefig(io, format="png", bbox_inches="tight")
-    encoded = b64encode(io.getvalue()).decode("utf-8")
-    return f"<img src='data:image/png;base64,{encoded}'><br>"
+    return _html_image(render_figures_png([figure])[0])
+
+
+def get_html_images_from_figures(figures: Sequence[Figure]) -> list[str]:
+    """Convert several matplotlib figures to HTML image tags, rendering them concurrently.
+
+    Args:
+        figures: The matplotlib Figure objects to convert.
+
+    Returns:
+        An HTML img tag for every figure, in order.
+    """
+    return [_html_image(image) for image in render_figures_png(figures)]
+
+
+def render_html_sections(sections: Sequence[str | Figure]) -> list[str]:
+    """Render the figures among report sections as HTML image tags, all figures together.
+
+    Args:
+        sections: HTML fragments and figures, in report order.
+
+    Returns:
+        The HTML fragments, with every figure replaced by its image tag.
+    """
+    figures = [section for section in sections if isinstance(section, Figure)]
+    images = iter(get_html_images_from_figures(figures))
+    return [next(images) if isinstance(section, Figure) else section for section in sections]
 
 
 def get_html_image_from_plot(plot: so.Plot) -> str:
@@ -36,6 +106,18 @@ def get_html_image_from_plot(plot: so.Plot) -> str:
     return f"<img src='data:image/png;base64,{encoded}'><br>"
 
 
+def get_html_document(content: str) -> str:
+    """Wrap report content in a standalone HTML document with the report style sheet.
+
+    Args:
+        content: The report HTML fragment.
+
+    Returns:
+        The complete HTML document.
+    """
+    return _HTML_DOCUMENT_TEMPLATE.format(content=content)
+
+
 def get_html_table(df: pd.DataFrame, caption: str, precision=5, index=True) -> str:
     styler = df.style.set_caption(caption).format(precision=precision)
     if not index:
@@ -0,0 +1,111 @@
+"""Memory accounting of datatables.
+
+Cloned and derived datatables share column buffers with their source until pandas copy-on-write
+copies a column that one of them modifies. ``get_memory_usage`` tells, for every loaded datatable,
+how many bytes of its columns are referenced by no other datatable (owned) and how many are also
+referenced by another one (shared).
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from tse_analytics.core.data.datatable import Datatable
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """Bytes of the column buffers of one datatable.
+
+    Attributes:
+        owned_bytes: Bytes of the buffers no other datatable references.
+        shared_bytes: Bytes of the buffers at least one other datatable also references.
+    """
+
+    owned_bytes: int
+    shared_bytes: int
+
+    @property
+    def total_bytes(self) -> int:
+        return self.owned_bytes + self.shared_bytes
+
+
+def root_buffer(array: np.ndarray) -> np.ndarray:
+    """The array owning the memory of a (possibly chained) numpy view."""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def column_buffers(values) -> list[np.ndarray] | None:
+    """Numpy buffers backing a column's array, or None if they cannot be inspected."""
+    if isinstance(values, pd.Categorical):
+        return [values.codes]
+    # Masked (Int64, Float64, boolean, ...) arrays hold their values and mask separately
+    if hasattr(values, "_data") and hasattr(values, "_mask"):
+        return [values._data, values._mask]
+    # Numpy-backed extension arrays (datetime, timedelta, numpy, python string storage)
+    if isinstance(getattr(values, "_ndarray", None), np.ndarray):
+        return [values._ndarray]
+    if isinstance(values, np.ndarray):
+        return [values]
+    return None
+
+
+def get_memory_usage(datatables: Iterable[Datatable]) -> dict[UUID, MemoryUsage]:
+    """Account the column memory of datatables, telling shared buffers from owned ones.
+
+    Every column buffer is resolved to the numpy array owning its memory; a buffer is shared if the
+    columns of more than one datatable resolve to it. Datatables whose frame is not loaded hold no
+    column memory and are left out. Columns whose storage cannot be inspected are counted as owned.
+
+    Args:
+        datatables: The datatables to account, typically all datatables of the workspace.
+
+    Returns:
+        The memory usage of every loaded datatable, keyed by datatable id.
+    """
+    # Root buffers (address, size) referenced by each datatable
+    roots: dict[UUID, set[tuple[int, int]]] = {}
+    opaque_bytes: dict[UUID, int] = {}
+    for datatable in datatables:
+        if not datatable.is_loaded:
+            continue
+        datatable_roots = roots.setdefault(datatable.id, set())
+        opaque_bytes.setdefault(datatable.id, 0)
+        df = datatable.df
+        for i in range(df.shape[1]):
+            values = df.iloc[:, i].array
+            buffers = column_buffers(values)
+            if buffers is None:
+                opaque_bytes[datatable.id] += int(values.nbytes)
+                continue
+            for buffer in buffers:
+                root = root_buffer(buffer)
+                datatable_roots.add((root.__array_interface__["data"][0], root.nbytes))
+
+    references: dict[tuple[int, int], int] = {}
+    for datatable_roots in roots.values():
+        for root in datatable_roots:
+            references[root] = references.get(root, 0) + 1
+
+    usage: dict[UUID, MemoryUsage] = {}
+    for datatable_id, datatable_roots in roots.items():
+        shared_bytes = sum(size for address, size in datatable_roots if references[(address, size)] > 1)
+        owned_bytes = sum(size for address, size in datatable_roots if references[(address, size)] == 1)
+        usage[datatable_id] = MemoryUsage(owned_bytes + opaque_bytes[datatable_id], shared_bytes)
+    return usage
+
+
+def format_bytes(size: int) -> str:
+    """Human-readable size, e.g. ``"1.5 MB"``."""
+    if size < 1024:
+        return f"{size} B"
+    units = ("KB", "MB", "GB")
+    exponent = min(len(units), (size.bit_length() - 1) // 10)
+    return f"{size / 1024**exponent:.1f} {units[exponent - 1]}"
@@ -0,0 +1,230 @@
+"""PNG rendering of report figures with a process pool and an in-memory image cache.
+
+Rendering a figure with ``bbox_inches="tight"`` takes far longer than building it, and reports such
+as the chronobiology analysis hold many figures. ``render_figures_png`` renders the figures of a
+report together: figures whose image is cached are not rendered again, and the remaining ones are
+pickled and rendered concurrently in a persistent spawn-context process pool with the Agg backend.
+
+Images are cached by a hash of the figure spec, i.e. of the pickled figure with its run-time
+bookkeeping (callback ids, transform parent links) left out, so identical figures built again share
+their image. Figures that cannot be pickled are rendered in the calling thread and not cached.
+"""
+
+import atexit
+import hashlib
+import io
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from loguru import logger
+from matplotlib.category import UnitData
+from matplotlib.cbook import CallbackRegistry
+from matplotlib.figure import Figure
+from matplotlib.transforms import TransformNode
+
+DEFAULT_CACHE_BYTES = 128 * 1024**2
+
+_image_cache: OrderedDict[str, bytes] = OrderedDict()
+_image_cache_bytes = 0
+_image_cache_max_bytes = DEFAULT_CACHE_BYTES
+_image_cache_lock = threading.Lock()
+
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_lock = threading.Lock()
+
+# Worker processes (batch runs, the render pool itself) render in their own process
+_parallel_rendering = multiprocessing.parent_process() is None
+
+
+class _FigurePickler(pickle.Pickler):
+    """Pickler rebuilding figure state that cannot be pickled from its content."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, UnitData):
+            # Categorical axis units hold an itertools counter, which Python 3.14 cannot pickle; the
+            # categories are numbered in order, so the counter restarts at their number.
+            return UnitData, (list(obj._mapping),)
+        return NotImplemented
+
+
+class _SpecPickler(_FigurePickler):
+    """Pickler leaving out figure state that differs between identical figures."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, CallbackRegistry):
+            # Pickling a registry draws a new callback id
+            return CallbackRegistry, ()
+        if isinstance(obj, TransformNode):
+            # Parent links are keyed by object id
+            state = obj.__getstate__()
+            state.pop("_parents", None)
+            return type(obj), (), state
+        return super().reducer_override(obj)
+
+
+def _pickle_figure(figure: Figure) -> bytes:
+    buffer = io.BytesIO()
+    _FigurePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(figure)
+    return buffer.getvalue()
+
+
+def figure_spec_hash(figure: Figure) -> str | None:
+    """Hash of the content of a figure.
+
+    Args:
+        figure: The figure.
+
+    Returns:
+        The hash, or None if the figure cannot be pickled.
+    """
+    buffer = io.BytesIO()
+    try:
+        _SpecPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(figure)
+    except Exception:
+        return None
+    return hashlib.sha1(buffer.getbuffer()).hexdigest()
+
+
+def render_png(figure: Figure) -> bytes:
+    """Render a figure as PNG image, cropped to its content.
+
+    Args:
+        figure: The figure.
+
+    Returns:
+        The PNG image.
+    """
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def _render_pickled_figure(data: bytes) -> bytes:
+    """Render a pickled figure. This is the render pool entry point."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    return render_png(pickle.loads(data))
+
+
+def configure_image_cache(max_bytes: int) -> None:
+    """Set the size limit of the image cache and clear it.
+
+    Args:
+        max_bytes: Size limit of all cached images together, 0 disables caching.
+    """
+    global _image_cache_bytes, _image_cache_max_bytes
+    with _image_cache_lock:
+        _image_cache.clear()
+        _image_cache_bytes = 0
+        _image_cache_max_bytes = max_bytes
+
+
+def _cache_get(key: str) -> bytes | None:
+    with _image_cache_lock:
+        image = _image_cache.get(key)
+        if image is not None:
+            _image_cache.move_to_end(key)
+        return image
+
+
+def _cache_put(key: str, image: bytes) -> None:
+    global _image_cache_bytes
+    with _image_cache_lock:
+        if len(image) > _image_cache_max_bytes or key in _image_cache:
+            return
+        _image_cache[key] = image
+        _image_cache_bytes += len(image)
+        while _image_cache_bytes > _image_cache_max_bytes:
+            _, evicted = _image_cache.popitem(last=False)
+            _image_cache_bytes -= len(evicted)
+
+
+def set_parallel_rendering(enabled: bool) -> None:
+    """Enable or disable rendering in the render pool. Enabled by default in the main process.
+
+    Args:
+        enabled: Whether several figures are rendered concurrently in worker processes.
+    """
+    global _parallel_rendering
+    _parallel_rendering = enabled
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Return the shared render process pool, starting it on first use."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # Never fork: the GUI process runs Qt and worker threads
+            _render_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(shutdown_render_pool)
+        return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Stop the shared render process pool."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(wait=False, cancel_futures=True)
+            _render_pool = None
+
+
+def _render_in_pool(figures: dict[str, Figure]) -> dict[str, bytes]:
+    """Render figures in the render pool; figures that cannot be pickled are left out."""
+    payloads: dict[str, bytes] = {}
+    for key, figure in figures.items():
+        try:
+            payloads[key] = _pickle_figure(figure)
+        except Exception as e:
+            logger.debug(f"Rendering figure in process, it cannot be pickled: {e}")
+    if len(payloads) < 2:
+        return {}
+
+    try:
+        pool = get_render_pool()
+        futures = {key: pool.submit(_render_pickled_figure, data) for key, data in payloads.items()}
+        return {key: future.result() for key, future in futures.items()}
+    except BrokenProcessPool as e:
+        logger.warning(f"Render pool failed, rendering in process: {e}")
+        shutdown_render_pool()
+        return {}
+
+
+def render_figures_png(figures: Sequence[Figure]) -> list[bytes]:
+    """Render figures as PNG images, reusing cached images and rendering the others concurrently.
+
+    Args:
+        figures: The figures to render.
+
+    Returns:
+        The PNG image of every figure, in order.
+    """
+    keys = [figure_spec_hash(figure) for figure in figures]
+    images: dict[str, bytes] = {}
+    pending: dict[str, Figure] = {}
+    for key, figure in zip(keys, figures, strict=True):
+        if key is None or key in images or key in pending:
+            continue
+        image = _cache_get(key)
+        if image is not None:
+            images[key] = image
+        else:
+            pending[key] = figure
+
+    if _parallel_rendering and len(pending) >= 2 and (os.cpu_count() or 1) > 1:
+        images.update(_render_in_pool(pending))
+    for key, figure in pending.items():
+        if key not in images:
+            images[key] = render_png(figure)
+        _cache_put(key, images[key])
+
+    return [images[key] if key is not None else render_png(figure) for key, figure in zip(keys, figures, strict=True)]
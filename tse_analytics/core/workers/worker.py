@@ -5,6 +5,7 @@ This module provides the Worker class for executing functions in separate thread
 with signal handling for results, errors and completion status.
 """
 
+import threading
 import traceback
 from collections.abc import Callable
 from typing import Any
@@ -23,6 +24,11 @@ class Worker(QRunnable):
     The worker executes the provided function in a separate thread and emits
     signals for result, error, and completion status.
 
+    Long-running functions can report progress through ``signals.progress`` and poll
+    ``is_cancelled`` to stop early; both are opt-in and passed to the function by the caller
+    (e.g. ``worker.kwargs.update(progress_callback=worker.signals.progress.emit,
+    is_cancelled=worker.is_cancelled)``).
+
     Attributes:
         fn: The function to execute in the worker thread.
         args: Positional arguments to pass to the function.
@@ -52,6 +58,24 @@ class Worker(QRunnable):
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Request cancellation of the running function.
+
+        Cancellation is cooperative: the function must poll ``is_cancelled`` and return early.
+        """
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Check whether cancellation was requested.
+
+        Returns:
+            bool: ``True`` once ``cancel`` has been called. Safe to call from any thread.
+        """
+        return self._cancel_event.is_set()
 
     @Slot()
     def run(self) -> None:
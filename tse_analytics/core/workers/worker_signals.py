@@ -25,8 +25,12 @@ class WorkerSignals(QObject):
 
         result (Signal): Emitted when the worker successfully completes its task.
             Passes the return value from the worker function.
+
+        progress (Signal): Emitted by long-running functions to report progress.
+            Passes the number of completed steps and the total number of steps.
     """
 
     finished = Signal()
     error = Signal(tuple)
     result = Signal(object)
+    progress = Signal(int, int)
@@ -6,14 +6,17 @@ import os
 import platform
 import sys
 from multiprocessing import freeze_support
+from pathlib import Path
 
 from loguru import logger
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QSettings, QStandardPaths
 from PySide6.QtGui import QIcon, Qt
 from PySide6.QtWidgets import QApplication
 
+from tse_analytics.core import startup_report
 from tse_analytics.core.workers.task_manager import TaskManager
 from tse_analytics.globals import IS_FLATPAK, get_resource_base, init_global_settings
+from tse_analytics.toolbox.result_cache import configure_result_cache
 from tse_analytics.views.main_window import MainWindow
 
 
@@ -69,6 +72,10 @@ class App(QApplication):
         # TaskManager singleton initialization
         TaskManager(self)
 
+        # Disk cache of toolbox results, shared by all processors
+        cache_location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        configure_result_cache(Path(cache_location) / "results")
+
 
 def handle_exception(exc_type, exc_value, exc_traceback) -> None:
     """
@@ -130,6 +137,8 @@ def main() -> None:
     main_window = MainWindow(sys.argv)
     main_window.show()
 
+    startup_report.log_startup_report()
+
     sys.exit(app.exec())
 
 
@@ -6,7 +6,6 @@ It detects the version of the IntelliCage data format and delegates to the
 appropriate version-specific loader.
 """
 
-import tempfile
 import timeit
 import zipfile
 from pathlib import Path
@@ -24,16 +23,16 @@ from tse_analytics.modules.intellicage.io.dataset_loader_v2 import import_intell
 class IntelliCageDatasetLoader(Protocol):
     """Protocol for dataset loader functions."""
 
-    def __call__(self, path: Path, tmp_path: Path, data_descriptor: dict) -> Dataset | None: ...
+    def __call__(self, path: Path, root_path: zipfile.Path, data_descriptor: dict) -> Dataset | None: ...
 
 
 def import_intellicage_dataset(path: Path) -> Dataset | None:
     """
     Import an IntelliCage dataset from a zip file.
 
-    This function extracts the contents of the zip file to a temporary directory,
-    determines the version of the IntelliCage data format, and delegates to the
-    appropriate version-specific loader. It also extracts factors from the metadata.
+    This function determines the version of the IntelliCage data format and delegates
+    to the appropriate version-specific loader, which reads the archive members directly
+    from the zip file. It also extracts factors from the metadata.
 
     Parameters
     ----------
@@ -64,13 +63,11 @@ def import_intellicage_dataset(path: Path) -> Dataset | None:
     }
 
     with zipfile.ZipFile(path, mode="r") as zip:
-        with tempfile.TemporaryDirectory(prefix="tse-analytics-") as tempdir:
-            tmp_path = Path(tempdir)
-            zip.extractall(tempdir)
+        root_path = zipfile.Path(zip)
 
-            data_descriptor = _import_data_descriptor(tmp_path / "DataDescriptor.xml")
-            loader = dataset_loaders.get(data_descriptor["Version"], import_intellicage_dataset_v2)
-            dataset = loader(path, tmp_path, data_descriptor)
+        data_descriptor = _import_data_descriptor(root_path / "DataDescriptor.xml")
+        loader = dataset_loaders.get(data_descriptor["Version"], import_intellicage_dataset_v2)
+        dataset = loader(path, root_path, data_descriptor)
 
     # Extract factors from metadata
     factors: dict[str, Factor] = {}
@@ -87,7 +84,7 @@ def import_intellicage_dataset(path: Path) -> Dataset | None:
     return dataset
 
 
-def _import_data_descriptor(path: Path) -> dict | None:
+def _import_data_descriptor(path: zipfile.Path) -> dict | None:
     """
     Import the data descriptor XML file.
 
@@ -96,8 +93,8 @@ def _import_data_descriptor(path: Path) -> dict | None:
 
     Parameters
     ----------
-    path : Path
-        Path to the DataDescriptor.xml file.
+    path : zipfile.Path
+        Path to the DataDescriptor.xml file in the archive.
 
     Returns
     -------
@@ -108,7 +105,7 @@ def _import_data_descriptor(path: Path) -> dict | None:
     if not path.is_file():
         return None
 
-    with open(path, encoding="utf-8-sig") as file:
+    with path.open(encoding="utf-8-sig") as file:
         result = xmltodict.parse(
             file.read(),
             process_namespaces=False,
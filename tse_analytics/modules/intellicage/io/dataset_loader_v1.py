@@ -6,6 +6,7 @@ It includes functions for importing metadata, animals, visits, nosepokes, enviro
 hardware events, and logs from the extracted dataset files.
 """
 
+import zipfile
 from dataclasses import asdict
 from pathlib import Path
 
@@ -18,19 +19,19 @@ from tse_analytics.core.data.shared import Animal
 from tse_analytics.modules.intellicage.data.processor import get_nosepokes_datatable, get_visits_datatable
 
 
-def import_intellicage_dataset_v1(path: Path, tmp_path: Path, data_descriptor: dict) -> Dataset | None:
+def import_intellicage_dataset_v1(path: Path, root_path: zipfile.Path, data_descriptor: dict) -> Dataset | None:
     """
     Imports older IntelliCage datasets with DataVersion 1.x.
     """
-    metadata = _import_metadata(tmp_path / "Sessions.xml")
-    animals = _import_animals(tmp_path / "Animals.txt")
+    metadata = _import_metadata(root_path / "Sessions.xml")
+    animals = _import_animals(root_path / "Animals.txt")
 
     raw_data = {
-        "Visits": _import_visits_df(tmp_path),
-        "Nosepokes": _import_nosepokes_df(tmp_path),
-        "Environment": _import_environment_df(tmp_path),
-        "HardwareEvents": _import_hardware_events_df(tmp_path),
-        "Log": _import_log_df(tmp_path),
+        "Visits": _import_visits_df(root_path),
+        "Nosepokes": _import_nosepokes_df(root_path),
+        "Environment": _import_environment_df(root_path),
+        "HardwareEvents": _import_hardware_events_df(root_path),
+        "Log": _import_log_df(root_path),
     }
 
     dataset = Dataset(
@@ -72,11 +73,11 @@ def import_intellicage_dataset_v1(path: Path, tmp_path: Path, data_descriptor: d
     return dataset
 
 
-def _import_metadata(path: Path) -> dict:
+def _import_metadata(path: zipfile.Path) -> dict:
     if not path.is_file():
         raise FileNotFoundError(f"Sessions file not found: {path}")
 
-    with open(path, encoding="utf-8-sig") as file:
+    with path.open(encoding="utf-8-sig") as file:
         result = xmltodict.parse(
             file.read(),
             process_namespaces=False,
@@ -86,7 +87,7 @@ def _import_metadata(path: Path) -> dict:
     return result["ArrayOfSession"]["Session"]
 
 
-def _import_animals(path: Path) -> dict:
+def _import_animals(path: zipfile.Path) -> dict:
     if not path.is_file():
         raise FileNotFoundError(f"Animals file not found: {path}")
 
@@ -98,13 +99,14 @@ def _import_animals(path: Path) -> dict:
         "Notes": "string",
     }
 
-    df = pd.read_csv(
-        path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Replace np.nan with empty strings
     df.fillna({"Notes": ""}, inplace=True)
@@ -131,7 +133,7 @@ def _import_animals(path: Path) -> dict:
     return animals
 
 
-def _import_visits_df(folder_path: Path) -> pd.DataFrame:
+def _import_visits_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Visits.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Visits file not found: {file_path}")
@@ -152,13 +154,14 @@ def _import_visits_df(folder_path: Path) -> pd.DataFrame:
         "PresenceDuration": "Float64",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Standardize column names across different versions
     df.rename(
@@ -205,7 +208,7 @@ def _import_visits_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_nosepokes_df(folder_path: Path) -> pd.DataFrame:
+def _import_nosepokes_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Nosepokes.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Nosepokes file not found: {file_path}")
@@ -228,13 +231,14 @@ def _import_nosepokes_df(folder_path: Path) -> pd.DataFrame:
         "LED3State": "UInt8",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Standardize column names across different versions
     df.rename(
@@ -272,7 +276,7 @@ def _import_nosepokes_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_environment_df(folder_path: Path) -> pd.DataFrame:
+def _import_environment_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Environment.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Environment file not found: {file_path}")
@@ -283,13 +287,14 @@ def _import_environment_df(folder_path: Path) -> pd.DataFrame:
         "Illumination": "UInt32",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
     df["DateTime"] = pd.to_datetime(
@@ -304,7 +309,7 @@ def _import_environment_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_hardware_events_df(folder_path: Path) -> pd.DataFrame:
+def _import_hardware_events_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "HardwareEvents.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"HardwareEvents file not found: {file_path}")
@@ -318,13 +323,14 @@ def _import_hardware_events_df(folder_path: Path) -> pd.DataFrame:
         "State": "UInt8",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Standardize column names across different versions
     df.rename(
@@ -355,7 +361,7 @@ def _import_hardware_events_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_log_df(folder_path: Path) -> pd.DataFrame:
+def _import_log_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Log.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Log file not found: {file_path}")
@@ -370,13 +376,14 @@ def _import_log_df(folder_path: Path) -> pd.DataFrame:
         "Notes": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Standardize column names across different versions
     df.rename(
@@ -1,3 +1,4 @@
+import zipfile
 from dataclasses import asdict
 from pathlib import Path
 
@@ -7,18 +8,18 @@ import xmltodict
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Animal
-from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.intellicage.data.processor import get_nosepokes_datatable, get_visits_datatable
+from tse_analytics.modules.intellimaze.io.timestamps import parse_timestamps
 
 
-def import_intellicage_dataset_v2(path: Path, tmp_path: Path, data_descriptor: dict) -> Dataset | None:
+def import_intellicage_dataset_v2(path: Path, root_path: zipfile.Path, data_descriptor: dict) -> Dataset | None:
     """
     Imports IntelliCage datasets with DataVersion 2.x.
     """
-    metadata = _import_metadata(tmp_path / "Sessions.xml")
-    animals = _import_animals(tmp_path / "Animals.txt")
+    metadata = _import_metadata(root_path / "Sessions.xml")
+    animals = _import_animals(root_path / "Animals.txt")
 
-    folder_path = tmp_path / "IntelliCage"
+    folder_path = root_path / "IntelliCage"
     raw_data = {
         "Visits": _import_visits_df(folder_path),
         "Nosepokes": _import_nosepokes_df(folder_path),
@@ -66,11 +67,11 @@ def import_intellicage_dataset_v2(path: Path, tmp_path: Path, data_descriptor: d
     return dataset
 
 
-def _import_metadata(path: Path) -> dict:
+def _import_metadata(path: zipfile.Path) -> dict:
     if not path.is_file():
         raise FileNotFoundError(f"Sessions file not found: {path}")
 
-    with open(path, encoding="utf-8-sig") as file:
+    with path.open(encoding="utf-8-sig") as file:
         result = xmltodict.parse(
             file.read(),
             process_namespaces=False,
@@ -80,7 +81,7 @@ def _import_metadata(path: Path) -> dict:
     return result["ArrayOfSession"]["Session"]
 
 
-def _import_animals(path: Path) -> dict:
+def _import_animals(path: zipfile.Path) -> dict:
     if not path.is_file():
         raise FileNotFoundError(f"Animals file not found: {path}")
 
@@ -93,16 +94,17 @@ def _import_animals(path: Path) -> dict:
     }
 
     # Skip broken header
-    df = pd.read_csv(
-        path,
-        header=0,
-        usecols=["AnimalName", "AnimalTag", "Sex", "GroupName", "AnimalNotes"],
-        names=["AnimalName", "AnimalTag", "Sex", "GroupName", "AnimalNotes"],
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            header=0,
+            usecols=["AnimalName", "AnimalTag", "Sex", "GroupName", "AnimalNotes"],
+            names=["AnimalName", "AnimalTag", "Sex", "GroupName", "AnimalNotes"],
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Replace np.nan with empty strings
     df.fillna({"AnimalNotes": ""}, inplace=True)
@@ -129,7 +131,7 @@ def _import_animals(path: Path) -> dict:
     return animals
 
 
-def _import_visits_df(folder_path: Path) -> pd.DataFrame:
+def _import_visits_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Visits.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Visits file not found: {file_path}")
@@ -154,26 +156,19 @@ def _import_visits_df(folder_path: Path) -> pd.DataFrame:
         "LickDuration": "Float64",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Start"] = pd.to_datetime(
-        df["Start"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
-
-    df["End"] = pd.to_datetime(
-        df["End"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
+    df["Start"] = parse_timestamps(df["Start"])
+
+    df["End"] = parse_timestamps(df["End"])
 
     # Convert numeric Enum values to categories
     df = df.astype({
@@ -206,12 +201,12 @@ def _import_visits_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_nosepokes_df(folder_path: Path) -> pd.DataFrame:
+def _import_nosepokes_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Nosepokes.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Nosepokes file not found: {file_path}")
 
-    with open(file_path, encoding="utf-8-sig") as file:
+    with file_path.open(encoding="utf-8-sig") as file:
         first_line = file.readline()
         lick_start_time_column = "LickStartTime" in first_line
 
@@ -237,33 +232,22 @@ def _import_nosepokes_df(folder_path: Path) -> pd.DataFrame:
     if lick_start_time_column:
         dtype["LickStartTime"] = str
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Start"] = pd.to_datetime(
-        df["Start"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
-
-    df["End"] = pd.to_datetime(
-        df["End"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
+    df["Start"] = parse_timestamps(df["Start"])
+
+    df["End"] = parse_timestamps(df["End"])
 
     if lick_start_time_column:
-        df["LickStartTime"] = pd.to_datetime(
-            df["LickStartTime"],
-            format="ISO8601",
-            utc=False,
-        ).dt.as_unit(TIME_RESOLUTION_UNIT)
+        df["LickStartTime"] = parse_timestamps(df["LickStartTime"])
 
     # Convert numeric Enum values to categories
     df["SideCondition"] = pd.Categorical(df["SideCondition"], categories=[-1, 0, 1], ordered=True)
@@ -279,7 +263,7 @@ def _import_nosepokes_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_environment_df(folder_path: Path) -> pd.DataFrame:
+def _import_environment_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Environment.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Environment file not found: {file_path}")
@@ -291,20 +275,17 @@ def _import_environment_df(folder_path: Path) -> pd.DataFrame:
         "Cage": "UInt8",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTime"] = pd.to_datetime(
-        df["DateTime"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
+    df["DateTime"] = parse_timestamps(df["DateTime"])
 
     df.sort_values(["DateTime"], inplace=True)
     df.reset_index(drop=True, inplace=True)
@@ -312,7 +293,7 @@ def _import_environment_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_hardware_events_df(folder_path: Path) -> pd.DataFrame:
+def _import_hardware_events_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "HardwareEvents.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"HardwareEvents file not found: {file_path}")
@@ -326,20 +307,17 @@ def _import_hardware_events_df(folder_path: Path) -> pd.DataFrame:
         "State": "UInt8",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTime"] = pd.to_datetime(
-        df["DateTime"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
+    df["DateTime"] = parse_timestamps(df["DateTime"])
 
     # Convert numeric Enum values to categories
     df["HardwareType"] = df["HardwareType"].astype("category")
@@ -355,7 +333,7 @@ def _import_hardware_events_df(folder_path: Path) -> pd.DataFrame:
     return df
 
 
-def _import_log_df(folder_path: Path) -> pd.DataFrame:
+def _import_log_df(folder_path: zipfile.Path) -> pd.DataFrame:
     file_path = folder_path / "Log.txt"
     if not file_path.is_file():
         raise FileNotFoundError(f"Log file not found: {file_path}")
@@ -370,20 +348,17 @@ def _import_log_df(folder_path: Path) -> pd.DataFrame:
         "LogNotes": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTime"] = pd.to_datetime(
-        df["DateTime"],
-        format="ISO8601",
-        utc=False,
-    ).dt.as_unit(TIME_RESOLUTION_UNIT)
+    df["DateTime"] = parse_timestamps(df["DateTime"])
 
     # Convert numeric Enum values to categories
     df = df.astype({
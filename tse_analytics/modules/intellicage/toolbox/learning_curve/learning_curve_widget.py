@@ -20,7 +20,6 @@ from tse_analytics.modules.intellicage.toolbox.learning_curve.processor import (
     IntelliCageLearningCurveResult,
     get_intellicage_learning_curve_result,
 )
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 
@@ -41,13 +40,6 @@ class LearningCurveWidgetSettings:
     group_by: str = "Animal"
 
 
-@toolbox_plugin(
-    category="IntelliCage",
-    label="Learning Curve",
-    icon=":/icons/icons8-analyze-16.png",
-    order=2,
-    dataset_types=("IntelliCage", "IntelliMaze"),
-)
 class LearningCurveWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
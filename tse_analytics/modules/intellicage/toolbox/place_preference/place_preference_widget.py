@@ -17,7 +17,6 @@ from tse_analytics.modules.intellicage.toolbox.place_preference.processor import
     IntelliCagePlacePreferenceResult,
     get_intellicage_place_preference_result,
 )
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 
 
@@ -37,14 +36,6 @@ class PlacePreferenceWidgetSettings:
     only_visits_with_licks: bool = False
 
 
-@toolbox_plugin(
-    category="IntelliCage",
-    label="Place Preference",
-    icon=":/icons/icons8-corner-16.png",
-    order=1,
-    dataset_types=("IntelliCage", "IntelliMaze"),
-    required_datatable_name="Visits",
-)
 class PlacePreferenceWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
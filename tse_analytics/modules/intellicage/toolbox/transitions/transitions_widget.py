@@ -13,7 +13,6 @@ from tse_analytics.modules.intellicage.toolbox.transitions.processor import (
     IntelliCageTransitionsResult,
     get_intellicage_transitions_result,
 )
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 
 _INVALID_SHEET_CHARS = str.maketrans("[]:*?/\\", "_______")
@@ -30,14 +29,6 @@ class TransitionsWidgetSettings:
     include_diagonal: bool = True
 
 
-@toolbox_plugin(
-    category="IntelliCage",
-    label="Transitions",
-    icon=":/icons/icons8-transition-both-directions-16.png",
-    order=0,
-    dataset_types=("IntelliCage", "IntelliMaze"),
-    required_datatable_name="Visits",
-)
 class TransitionsWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
@@ -19,6 +19,40 @@ def get_tag_to_name_map(animals: dict[str, Animal]) -> dict[str, str]:
     return tag_to_animal_map
 
 
+def get_csv_core_columns(
+    df: pd.DataFrame,
+    date_time: pd.Series,
+    device_type: str,
+    table_type: str,
+    tag_to_animal_map: dict[str, str],
+    tag_column: str = "Tag",
+) -> dict[str, pd.Series | str]:
+    """
+    Get the columns every merged CSV table starts with.
+
+    Args:
+        df (pd.DataFrame): The raw extension table.
+        date_time (pd.Series): Timestamp of every row.
+        device_type (str): The extension name.
+        table_type (str): The table type written to the ``TableType`` column.
+        tag_to_animal_map (dict[str, str]): Dictionary mapping animal tags to animal IDs.
+        tag_column (str): Column of ``df`` holding the animal tag.
+
+    Returns:
+        dict[str, pd.Series | str]: ``DateTime``, ``DeviceType``, ``DeviceId``, ``AnimalName``, ``AnimalTag``
+            and ``TableType`` columns; missing and unknown tags are empty.
+    """
+    tags = df[tag_column].astype(object)
+    return {
+        "DateTime": date_time,
+        "DeviceType": device_type,
+        "DeviceId": df["DeviceId"],
+        "AnimalName": tags.map(tag_to_animal_map).fillna(""),
+        "AnimalTag": tags.fillna(""),
+        "TableType": table_type,
+    }
+
+
 def get_variables_csv_data(
     extension_data: dict[str, Datatable],
     extension_name: str,
@@ -46,27 +80,12 @@ def get_variables_csv_data(
 
     for name, type in variables_dict.items():
         if name in extension_data:
-            data: dict[str, list | str] = {
-                "DateTime": [],
-                "DeviceType": extension_name,
-                "DeviceId": [],
-                "AnimalName": [],
-                "AnimalTag": [],
-                "TableType": type,
-                "Name": [],
-                "Data": [],
-            }
-
-            for row in extension_data[name].df.itertuples():
-                data["DateTime"].append(row.Time)
-                data["DeviceId"].append(row.DeviceId)
-                data["AnimalName"].append(tag_to_animal_map[row.Tag] if row.Tag == row.Tag else "")
-                data["AnimalTag"].append(row.Tag if row.Tag == row.Tag else "")
-
-                data["Name"].append(row.Name)
-                data["Data"].append(row.Data)
-
-            result[name] = pd.DataFrame(data)
+            df = extension_data[name].df
+            result[name] = pd.DataFrame({
+                **get_csv_core_columns(df, df["Time"], extension_name, type, tag_to_animal_map),
+                "Name": df["Name"],
+                "Data": df["Data"],
+            })
 
     return result
 
@@ -5,19 +5,41 @@ This module provides functions for importing Actor data from files.
 It includes functions for loading state and model data, as well as variable data.
 """
 
-from pathlib import Path
+import zipfile
+from functools import partial
 
 import pandas as pd
 
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
-from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.intellimaze.extensions.actor.data import processor
-from tse_analytics.modules.intellimaze.io.variable_data_loader import import_variable_data
+from tse_analytics.modules.intellimaze.io.table_readers import TableReader, read_tables
+from tse_analytics.modules.intellimaze.io.timestamps import parse_timestamps
+from tse_analytics.modules.intellimaze.io.variable_data_loader import get_variable_data_readers
+
+
+def get_table_readers(
+    folder_path: zipfile.Path,
+    dataset: Dataset,
+) -> dict[str, TableReader]:
+    """
+    Get the readers of the extension tables, including the variable data tables.
+
+    Args:
+        folder_path (zipfile.Path): Archive path of the folder containing the data files.
+        dataset (Dataset): The dataset the tables belong to.
+
+    Returns:
+        dict[str, TableReader]: Table readers by table name.
+    """
+    return {
+        "State": partial(_import_state_df, dataset, folder_path / "State.txt"),
+        "Model": partial(_import_model_df, dataset, folder_path / "Model.txt"),
+    } | get_variable_data_readers(dataset, folder_path)
 
 
 def import_data(
-    folder_path: Path,
+    folder_path: zipfile.Path,
     dataset: Dataset,
 ) -> dict[str, Datatable]:
     """
@@ -27,24 +49,19 @@ def import_data(
     creates an ActorData object, and preprocesses the data.
 
     Args:
-        folder_path (Path): Path to the folder containing the data files.
+        folder_path (zipfile.Path): Archive path of the folder containing the data files.
         dataset (Dataset): The dataset to add the data to.
     """
-    extension_data = {
-        "State": _import_state_df(dataset, folder_path / "State.txt"),
-        "Model": _import_model_df(dataset, folder_path / "Model.txt"),
-    }
-
-    variables_data = import_variable_data(dataset, folder_path)
-    if len(variables_data) > 0:
-        extension_data = extension_data | variables_data
+    extension_data = read_tables({processor.EXTENSION_NAME: get_table_readers(folder_path, dataset)})[
+        processor.EXTENSION_NAME
+    ]
 
     processor.preprocess_data(dataset, extension_data)
 
     return extension_data
 
 
-def _import_state_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_state_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     """
     Import state data from a file.
 
@@ -52,7 +69,7 @@ def _import_state_df(dataset: Dataset, file_path: Path) -> Datatable:
     performs type conversions, and sorts the data by time.
 
     Args:
-        folder_path (Path): Path to the folder containing the State.txt file.
+        folder_path (zipfile.Path): Archive path of the folder containing the State.txt file.
 
     Returns:
         pd.DataFrame: A DataFrame containing the state data.
@@ -68,25 +85,17 @@ def _import_state_df(dataset: Dataset, file_path: Path) -> Datatable:
         "AnimalTag": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -111,7 +120,7 @@ def _import_state_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_model_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_model_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -122,25 +131,17 @@ def _import_model_df(dataset: Dataset, file_path: Path) -> Datatable:
         "Model": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
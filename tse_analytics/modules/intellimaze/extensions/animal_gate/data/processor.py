@@ -12,7 +12,11 @@ from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import META_ORIGIN, Datatable
 from tse_analytics.core.data.shared import Aggregation, Variable
 from tse_analytics.globals import TIME_RESOLUTION_UNIT
-from tse_analytics.modules.intellimaze.data.utils import get_tag_to_name_map, get_variables_csv_data
+from tse_analytics.modules.intellimaze.data.utils import (
+    get_csv_core_columns,
+    get_tag_to_name_map,
+    get_variables_csv_data,
+)
 
 EXTENSION_NAME = "AnimalGate"
 
@@ -122,37 +126,18 @@ def get_csv_data(
     tag_to_animal_map = get_tag_to_name_map(dataset.animals)
 
     if export_registrations:
-        data: dict[str, list | str] = {
-            "DateTime": [],
-            "DeviceType": EXTENSION_NAME,
-            "DeviceId": [],
-            "AnimalName": [],
-            "AnimalTag": [],
-            "TableType": "Sessions",
-            "Direction": [],
-            "Start": [],
-            "End": [],
-            "Duration": [],
-            "Weight": [],
-            "IdSectionVisited": [],
-            "StandbySectionVisited": [],
-        }
-
-        for row in extension_data["Sessions"].df.itertuples():
-            data["DateTime"].append(row.End if row.Direction == "Out" else row.Start)
-            data["DeviceId"].append(row.DeviceId)
-            data["AnimalName"].append(tag_to_animal_map[row.Tag] if row.Tag == row.Tag else "")
-            data["AnimalTag"].append(row.Tag if row.Tag == row.Tag else "")
-
-            data["Direction"].append(row.Direction)
-            data["Start"].append(row.Start)
-            data["End"].append(row.End)
-            data["Duration"].append((row.End - row.Start).total_seconds())
-            data["Weight"].append(row.Weight)
-            data["IdSectionVisited"].append(row.IdSectionVisited)
-            data["StandbySectionVisited"].append(row.StandbySectionVisited)
-
-        result["Sessions"] = pd.DataFrame(data)
+        df = extension_data["Sessions"].df
+        date_time = df["End"].where(df["Direction"] == "Out", df["Start"])
+        result["Sessions"] = pd.DataFrame({
+            **get_csv_core_columns(df, date_time, EXTENSION_NAME, "Sessions", tag_to_animal_map),
+            "Direction": df["Direction"],
+            "Start": df["Start"],
+            "End": df["End"],
+            "Duration": (df["End"] - df["Start"]).dt.total_seconds(),
+            "Weight": df["Weight"],
+            "IdSectionVisited": df["IdSectionVisited"],
+            "StandbySectionVisited": df["StandbySectionVisited"],
+        })
 
     if export_variables:
         variables_csv_data = get_variables_csv_data(extension_data, EXTENSION_NAME, tag_to_animal_map)
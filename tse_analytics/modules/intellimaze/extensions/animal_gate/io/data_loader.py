@@ -6,19 +6,44 @@ It includes functions for loading sessions, antenna, log, input, and output data
 as well as variable data.
 """
 
-from pathlib import Path
+import zipfile
+from functools import partial
 
 import pandas as pd
 
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
-from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.intellimaze.extensions.animal_gate.data import processor
-from tse_analytics.modules.intellimaze.io.variable_data_loader import import_variable_data
+from tse_analytics.modules.intellimaze.io.table_readers import TableReader, read_tables
+from tse_analytics.modules.intellimaze.io.timestamps import parse_timestamps
+from tse_analytics.modules.intellimaze.io.variable_data_loader import get_variable_data_readers
+
+
+def get_table_readers(
+    folder_path: zipfile.Path,
+    dataset: Dataset,
+) -> dict[str, TableReader]:
+    """
+    Get the readers of the extension tables, including the variable data tables.
+
+    Args:
+        folder_path (zipfile.Path): Archive path of the folder containing the data files.
+        dataset (Dataset): The dataset the tables belong to.
+
+    Returns:
+        dict[str, TableReader]: Table readers by table name.
+    """
+    return {
+        "Sessions": partial(_import_sessions_df, dataset, folder_path / "Sessions.txt"),
+        "Antenna": partial(_import_antenna_df, dataset, folder_path / "Antenna.txt"),
+        "Log": partial(_import_log_df, dataset, folder_path / "Log.txt"),
+        "Input": partial(_import_input_df, dataset, folder_path / "Input.txt"),
+        "Output": partial(_import_output_df, dataset, folder_path / "Output.txt"),
+    } | get_variable_data_readers(dataset, folder_path)
 
 
 def import_data(
-    folder_path: Path,
+    folder_path: zipfile.Path,
     dataset: Dataset,
 ) -> dict[str, Datatable]:
     """
@@ -28,27 +53,19 @@ def import_data(
     creates an AnimalGateData object, and preprocesses the data.
 
     Args:
-        folder_path (Path): Path to the folder containing the data files.
+        folder_path (zipfile.Path): Archive path of the folder containing the data files.
         dataset (Dataset): The dataset to add the data to.
     """
-    extension_data = {
-        "Sessions": _import_sessions_df(dataset, folder_path / "Sessions.txt"),
-        "Antenna": _import_antenna_df(dataset, folder_path / "Antenna.txt"),
-        "Log": _import_log_df(dataset, folder_path / "Log.txt"),
-        "Input": _import_input_df(dataset, folder_path / "Input.txt"),
-        "Output": _import_output_df(dataset, folder_path / "Output.txt"),
-    }
-
-    variables_data = import_variable_data(dataset, folder_path)
-    if len(variables_data) > 0:
-        extension_data = extension_data | variables_data
+    extension_data = read_tables({processor.EXTENSION_NAME: get_table_readers(folder_path, dataset)})[
+        processor.EXTENSION_NAME
+    ]
 
     processor.preprocess_data(dataset, extension_data)
 
     return extension_data
 
 
-def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_sessions_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     """
     Import sessions data from a file.
 
@@ -56,7 +73,7 @@ def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
     performs type conversions, and sorts the data by start time.
 
     Args:
-        folder_path (Path): Path to the folder containing the Sessions.txt file.
+        folder_path (zipfile.Path): Archive path of the folder containing the Sessions.txt file.
 
     Returns:
         pd.DataFrame: A DataFrame containing the sessions data.
@@ -75,39 +92,22 @@ def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
         "End": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # TODO: does -1 means no weight measurement?
     df["Weight"] = df["Weight"].replace(-1, pd.NA)
 
     # Convert DateTime columns
-    df["Start"] = (
-        pd
-        .to_datetime(
-            df["Start"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Start"] = parse_timestamps(df["Start"], drop_offset=True)
 
-    df["End"] = (
-        pd
-        .to_datetime(
-            df["End"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["End"] = parse_timestamps(df["End"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -131,7 +131,7 @@ def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_antenna_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     """
     Import antenna data from a file.
 
@@ -139,7 +139,7 @@ def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
     performs type conversions, and sorts the data by time.
 
     Args:
-        folder_path (Path): Path to the folder containing the Antenna.txt file.
+        folder_path (zipfile.Path): Archive path of the folder containing the Antenna.txt file.
 
     Returns:
         pd.DataFrame: A DataFrame containing the antenna data.
@@ -154,25 +154,17 @@ def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
         "AnimalName": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -195,7 +187,7 @@ def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_log_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     """
     Import log data from a file.
 
@@ -203,7 +195,7 @@ def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
     performs type conversions, and sorts the data by datetime.
 
     Args:
-        folder_path (Path): Path to the folder containing the Log.txt file.
+        folder_path (zipfile.Path): Archive path of the folder containing the Log.txt file.
 
     Returns:
         pd.DataFrame: A DataFrame containing the log data.
@@ -220,25 +212,17 @@ def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
         "Description": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTime"] = (
-        pd
-        .to_datetime(
-            df["DateTime"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["DateTime"] = parse_timestamps(df["DateTime"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -263,14 +247,14 @@ def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_input_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_input_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     """
     Import input data from a file.
 
     This function loads data from the Input.txt file in the specified folder.
 
     Args:
-        folder_path (Path): Path to the folder containing the Input.txt file.
+        folder_path (zipfile.Path): Archive path of the folder containing the Input.txt file.
 
     Returns:
         pd.DataFrame: A DataFrame containing the input data.
@@ -278,11 +262,12 @@ def _import_input_df(dataset: Dataset, file_path: Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    df = pd.read_csv(
-        file_path,
-        header=None,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            header=None,
+            dtype_backend="numpy_nullable",
+        )
 
     datatable = Datatable(
         dataset,
@@ -296,14 +281,14 @@ def _import_input_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_output_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_output_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     """
     Import output data from a file.
 
     This function loads data from the Output.txt file in the specified folder.
 
     Args:
-        folder_path (Path): Path to the folder containing the Output.txt file.
+        folder_path (zipfile.Path): Archive path of the folder containing the Output.txt file.
 
     Returns:
         pd.DataFrame | None: A DataFrame containing the output data, or None if the file doesn't exist.
@@ -311,11 +296,12 @@ def _import_output_df(dataset: Dataset, file_path: Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    df = pd.read_csv(
-        file_path,
-        header=None,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            header=None,
+            dtype_backend="numpy_nullable",
+        )
 
     datatable = Datatable(
         dataset,
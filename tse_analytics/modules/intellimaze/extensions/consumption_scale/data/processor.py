@@ -14,6 +14,7 @@ from tse_analytics.core.data.shared import Aggregation, Variable
 from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.intellimaze.data.utils import (
     get_combined_variables_table,
+    get_csv_core_columns,
     get_tag_to_name_map,
     get_variables_csv_data,
 )
@@ -130,25 +131,11 @@ def get_csv_data(
     tag_to_animal_map = get_tag_to_name_map(dataset.animals)
 
     if export_registrations:
-        data = {
-            "DateTime": [],
-            "DeviceType": EXTENSION_NAME,
-            "DeviceId": [],
-            "AnimalName": [],
-            "AnimalTag": [],
-            "TableType": "Consumption",
-            "Consumption": [],
-        }
-
-        for row in extension_data["Consumption"].df.itertuples():
-            data["DateTime"].append(row.Time)
-            data["DeviceId"].append(row.DeviceId)
-            data["AnimalName"].append(tag_to_animal_map[row.Tag] if row.Tag == row.Tag else "")
-            data["AnimalTag"].append(row.Tag if row.Tag == row.Tag else "")
-
-            data["Consumption"].append(row.Consumption)
-
-        result["Consumption"] = pd.DataFrame(data)
+        df = extension_data["Consumption"].df
+        result["Consumption"] = pd.DataFrame({
+            **get_csv_core_columns(df, df["Time"], EXTENSION_NAME, "Consumption", tag_to_animal_map),
+            "Consumption": df["Consumption"],
+        })
 
     if export_variables:
         variables_csv_data = get_variables_csv_data(extension_data, EXTENSION_NAME, tag_to_animal_map)
@@ -1 +1,2 @@
+from .data_loader import get_table_readers as get_table_readers
 from .data_loader import import_data as import_data
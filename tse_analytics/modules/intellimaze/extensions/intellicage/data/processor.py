@@ -4,7 +4,11 @@ from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import META_ORIGIN, Datatable
 from tse_analytics.core.data.shared import Aggregation, Variable
 from tse_analytics.globals import TIME_RESOLUTION_UNIT
-from tse_analytics.modules.intellimaze.data.utils import get_tag_to_name_map, get_variables_csv_data
+from tse_analytics.modules.intellimaze.data.utils import (
+    get_csv_core_columns,
+    get_tag_to_name_map,
+    get_variables_csv_data,
+)
 
 EXTENSION_NAME = "IntelliCage"
 
@@ -517,53 +521,25 @@ def get_csv_data(
     tag_to_animal_map = get_tag_to_name_map(dataset.animals)
 
     if export_registrations:
-        visits_data: dict[str, list | str] = {
-            "DateTime": [],
-            "DeviceType": EXTENSION_NAME,
-            "DeviceId": [],
-            "AnimalName": [],
-            "AnimalTag": [],
-            "TableType": "Visits",
-            "ModuleName": [],
-            "Start": [],
-            "End": [],
-            "Duration": [],
-            "Corner": [],
-            "CornerCondition": [],
-            "PlaceError": [],
-            "AntennaNumber": [],
-            "AntennaDuration": [],
-            "PresenceNumber": [],
-            "PresenceDuration": [],
-            "VisitSolution": [],
-            "LickNumber": [],
-            "LickContactTime": [],
-            "LickDuration": [],
-        }
-
-        for row in extension_data["Visits"].df.itertuples():
-            visits_data["DateTime"].append(row.Start)
-            visits_data["DeviceId"].append(row.DeviceId)
-            visits_data["AnimalName"].append(tag_to_animal_map[row.AnimalTag])
-            visits_data["AnimalTag"].append(row.AnimalTag)
-
-            visits_data["ModuleName"].append(row.ModuleName)
-            visits_data["Start"].append(row.Start)
-            visits_data["End"].append(row.End)
-            visits_data["Duration"].append((row.End - row.Start).total_seconds())
-            visits_data["Corner"].append(row.Corner)
-            visits_data["CornerCondition"].append(row.CornerCondition)
-            visits_data["PlaceError"].append(row.PlaceError)
-            visits_data["AntennaNumber"].append(row.AntennaNumber)
-            visits_data["AntennaDuration"].append(row.AntennaDuration)
-            visits_data["PresenceNumber"].append(row.PresenceNumber)
-            visits_data["PresenceDuration"].append(row.PresenceDuration)
-            visits_data["VisitSolution"].append(row.VisitSolution)
-            visits_data["LickNumber"].append(row.LickNumber)
-            visits_data["LickContactTime"].append(row.LickContactTime)
-            visits_data["LickDuration"].append(row.LickDuration)
-
-        result["Visits"] = pd.DataFrame(visits_data)
+        df = extension_data["Visits"].df
+        result["Visits"] = pd.DataFrame({
+            **get_csv_core_columns(df, df["Start"], EXTENSION_NAME, "Visits", tag_to_animal_map, "AnimalTag"),
+            "ModuleName": df["ModuleName"],
+            "Start": df["Start"],
+            "End": df["End"],
+            "Duration": (df["End"] - df["Start"]).dt.total_seconds(),
+            "Corner": df["Corner"],
+            "CornerCondition": df["CornerCondition"],
+            "PlaceError": df["PlaceError"],
+            "AntennaNumber": df["AntennaNumber"],
+            "AntennaDuration": df["AntennaDuration"],
+            "PresenceNumber": df["PresenceNumber"],
+            "PresenceDuration": df["PresenceDuration"],
+            "VisitSolution": df["VisitSolution"],
+            "LickNumber": df["LickNumber"],
+            "LickContactTime": df["LickContactTime"],
+            "LickDuration": df["LickDuration"],
+        })
 
     if export_variables:
         variables_csv_data = get_variables_csv_data(extension_data, EXTENSION_NAME, tag_to_animal_map)
@@ -1,36 +1,43 @@
-from pathlib import Path
+import zipfile
+from functools import partial
 
 import pandas as pd
 
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
-from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.intellimaze.extensions.intellicage.data import processor
-from tse_analytics.modules.intellimaze.io.variable_data_loader import import_variable_data
+from tse_analytics.modules.intellimaze.io.table_readers import TableReader, read_tables
+from tse_analytics.modules.intellimaze.io.timestamps import parse_timestamps
+from tse_analytics.modules.intellimaze.io.variable_data_loader import get_variable_data_readers
+
+
+def get_table_readers(
+    folder_path: zipfile.Path,
+    dataset: Dataset,
+) -> dict[str, TableReader]:
+    return {
+        "Visits": partial(_import_visits_df, dataset, folder_path / "Visit.txt"),
+        "Nosepokes": partial(_import_nosepokes_df, dataset, folder_path / "Nosepoke.txt"),
+        "Environment": partial(_import_environment_df, dataset, folder_path / "Environment.txt"),
+        "HardwareEvents": partial(_import_hardware_events_df, dataset, folder_path / "Hardware.txt"),
+        "Log": partial(_import_log_df, dataset, folder_path / "Log.txt"),
+    } | get_variable_data_readers(dataset, folder_path)
 
 
 def import_data(
-    folder_path: Path,
+    folder_path: zipfile.Path,
     dataset: Dataset,
 ) -> dict[str, Datatable]:
-    extension_data = {
-        "Visits": _import_visits_df(dataset, folder_path / "Visit.txt"),
-        "Nosepokes": _import_nosepokes_df(dataset, folder_path / "Nosepoke.txt"),
-        "Environment": _import_environment_df(dataset, folder_path / "Environment.txt"),
-        "HardwareEvents": _import_hardware_events_df(dataset, folder_path / "Hardware.txt"),
-        "Log": _import_log_df(dataset, folder_path / "Log.txt"),
-    }
-
-    variables_data = import_variable_data(dataset, folder_path)
-    if len(variables_data) > 0:
-        extension_data = extension_data | variables_data
+    extension_data = read_tables({processor.EXTENSION_NAME: get_table_readers(folder_path, dataset)})[
+        processor.EXTENSION_NAME
+    ]
 
     processor.preprocess_data(dataset, extension_data)
 
     return extension_data
 
 
-def _import_visits_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_visits_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Visit file not found: {file_path}")
 
@@ -54,36 +61,19 @@ def _import_visits_df(dataset: Dataset, file_path: Path) -> Datatable:
         "LickDuration": "Float64",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Start"] = (
-        pd
-        .to_datetime(
-            df["Start"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Start"] = parse_timestamps(df["Start"], drop_offset=True)
 
-    df["End"] = (
-        pd
-        .to_datetime(
-            df["End"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["End"] = parse_timestamps(df["End"], drop_offset=True)
 
     # Convert numeric Enum values to categories
     df = df.astype({
@@ -126,7 +116,7 @@ def _import_visits_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_nosepokes_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_nosepokes_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Nosepoke file not found: {file_path}")
 
@@ -150,47 +140,21 @@ def _import_nosepokes_df(dataset: Dataset, file_path: Path) -> Datatable:
         "LickStartTime": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Start"] = (
-        pd
-        .to_datetime(
-            df["Start"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Start"] = parse_timestamps(df["Start"], drop_offset=True)
 
-    df["End"] = (
-        pd
-        .to_datetime(
-            df["End"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["End"] = parse_timestamps(df["End"], drop_offset=True)
 
-    df["LickStartTime"] = (
-        pd
-        .to_datetime(
-            df["LickStartTime"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["LickStartTime"] = parse_timestamps(df["LickStartTime"], drop_offset=True)
 
     # Convert numeric Enum values to categories
     df["SideCondition"] = pd.Categorical(df["SideCondition"], categories=[-1, 0, 1], ordered=True)
@@ -215,7 +179,7 @@ def _import_nosepokes_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_environment_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_environment_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Environment file not found: {file_path}")
 
@@ -226,25 +190,17 @@ def _import_environment_df(dataset: Dataset, file_path: Path) -> Datatable:
         "DeviceId": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTimeOffset"] = (
-        pd
-        .to_datetime(
-            df["DateTimeOffset"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["DateTimeOffset"] = parse_timestamps(df["DateTimeOffset"], drop_offset=True)
 
     # Standardize column names
     df.rename(
@@ -274,7 +230,7 @@ def _import_environment_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_hardware_events_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_hardware_events_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Hardware events file not found: {file_path}")
 
@@ -287,25 +243,17 @@ def _import_hardware_events_df(dataset: Dataset, file_path: Path) -> Datatable:
         "State": "UInt32",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTimeOffset"] = (
-        pd
-        .to_datetime(
-            df["DateTimeOffset"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["DateTimeOffset"] = parse_timestamps(df["DateTimeOffset"], drop_offset=True)
 
     # Standardize column names
     df.rename(
@@ -341,7 +289,7 @@ def _import_hardware_events_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_log_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Log file not found: {file_path}")
 
@@ -355,25 +303,17 @@ def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
         "LogNotes": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTimeOffset"] = (
-        pd
-        .to_datetime(
-            df["DateTimeOffset"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["DateTimeOffset"] = parse_timestamps(df["DateTimeOffset"], drop_offset=True)
 
     # Standardize column names
     df.rename(
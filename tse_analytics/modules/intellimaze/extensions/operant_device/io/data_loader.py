@@ -1,36 +1,43 @@
-from pathlib import Path
+import zipfile
+from functools import partial
 
 import pandas as pd
 
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
-from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.intellimaze.extensions.operant_device.data import processor
-from tse_analytics.modules.intellimaze.io.variable_data_loader import import_variable_data
+from tse_analytics.modules.intellimaze.io.table_readers import TableReader, read_tables
+from tse_analytics.modules.intellimaze.io.timestamps import parse_timestamps
+from tse_analytics.modules.intellimaze.io.variable_data_loader import get_variable_data_readers
+
+
+def get_table_readers(
+    folder_path: zipfile.Path,
+    dataset: Dataset,
+) -> dict[str, TableReader]:
+    return {
+        "Sessions": partial(_import_sessions_df, dataset, folder_path / "Sessions.txt"),
+        "Antenna": partial(_import_antenna_df, dataset, folder_path / "Antenna.txt"),
+        "Log": partial(_import_log_df, dataset, folder_path / "Log.txt"),
+        "Input": partial(_import_input_df, dataset, folder_path / "Input.txt"),
+        "Output": partial(_import_output_df, dataset, folder_path / "Output.txt"),
+    } | get_variable_data_readers(dataset, folder_path)
 
 
 def import_data(
-    folder_path: Path,
+    folder_path: zipfile.Path,
     dataset: Dataset,
 ) -> dict[str, Datatable]:
-    extension_data = {
-        "Sessions": _import_sessions_df(dataset, folder_path / "Sessions.txt"),
-        "Antenna": _import_antenna_df(dataset, folder_path / "Antenna.txt"),
-        "Log": _import_log_df(dataset, folder_path / "Log.txt"),
-        "Input": _import_input_df(dataset, folder_path / "Input.txt"),
-        "Output": _import_output_df(dataset, folder_path / "Output.txt"),
-    }
-
-    variables_data = import_variable_data(dataset, folder_path)
-    if len(variables_data) > 0:
-        extension_data = extension_data | variables_data
+    extension_data = read_tables({processor.EXTENSION_NAME: get_table_readers(folder_path, dataset)})[
+        processor.EXTENSION_NAME
+    ]
 
     processor.preprocess_data(dataset, extension_data)
 
     return extension_data
 
 
-def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_sessions_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Sessions file not found: {file_path}")
 
@@ -45,39 +52,22 @@ def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
         "End": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # TODO: does -1 means no weight measurement?
     df["Weight"] = df["Weight"].replace(-1, pd.NA)
 
     # Convert DateTime columns
-    df["Start"] = (
-        pd
-        .to_datetime(
-            df["Start"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Start"] = parse_timestamps(df["Start"], drop_offset=True)
 
-    df["End"] = (
-        pd
-        .to_datetime(
-            df["End"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["End"] = parse_timestamps(df["End"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -101,7 +91,7 @@ def _import_sessions_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_antenna_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Antenna file not found: {file_path}")
 
@@ -112,25 +102,17 @@ def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
         "AnimalName": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -153,7 +135,7 @@ def _import_antenna_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_log_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Log file not found: {file_path}")
 
@@ -166,25 +148,17 @@ def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
         "Description": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["DateTime"] = (
-        pd
-        .to_datetime(
-            df["DateTime"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["DateTime"] = parse_timestamps(df["DateTime"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -209,15 +183,16 @@ def _import_log_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_input_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_input_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Input file not found: {file_path}")
 
-    df = pd.read_csv(
-        file_path,
-        header=None,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            header=None,
+            dtype_backend="numpy_nullable",
+        )
 
     datatable = Datatable(
         dataset,
@@ -231,15 +206,16 @@ def _import_input_df(dataset: Dataset, file_path: Path) -> Datatable:
     return datatable
 
 
-def _import_output_df(dataset: Dataset, file_path: Path) -> Datatable:
+def _import_output_df(dataset: Dataset, file_path: zipfile.Path) -> Datatable:
     if not file_path.is_file():
         raise FileNotFoundError(f"Output file not found: {file_path}")
 
-    df = pd.read_csv(
-        file_path,
-        header=None,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            header=None,
+            dtype_backend="numpy_nullable",
+        )
 
     datatable = Datatable(
         dataset,
@@ -4,7 +4,11 @@ from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import META_ORIGIN, Datatable
 from tse_analytics.core.data.shared import Aggregation, Variable
 from tse_analytics.globals import TIME_RESOLUTION_UNIT
-from tse_analytics.modules.intellimaze.data.utils import get_tag_to_name_map, get_variables_csv_data
+from tse_analytics.modules.intellimaze.data.utils import (
+    get_csv_core_columns,
+    get_tag_to_name_map,
+    get_variables_csv_data,
+)
 
 EXTENSION_NAME = "RunningWheel"
 
@@ -109,29 +113,13 @@ def get_csv_data(
     tag_to_animal_map = get_tag_to_name_map(dataset.animals)
 
     if export_registrations:
-        data: dict[str, list | str] = {
-            "DateTime": [],
-            "DeviceType": EXTENSION_NAME,
-            "DeviceId": [],
-            "AnimalName": [],
-            "AnimalTag": [],
-            "TableType": "Registration",
-            "Left": [],
-            "Right": [],
-            "Reset": [],
-        }
-
-        for row in extension_data["Registration"].df.itertuples():
-            data["DateTime"].append(row.Time)
-            data["DeviceId"].append(row.DeviceId)
-            data["AnimalName"].append(tag_to_animal_map[row.Tag] if row.Tag == row.Tag else "")
-            data["AnimalTag"].append(row.Tag if row.Tag == row.Tag else "")
-
-            data["Left"].append(row.Left)
-            data["Right"].append(row.Right)
-            data["Reset"].append(row.Reset)
-
-        result["Registration"] = pd.DataFrame(data)
+        df = extension_data["Registration"].df
+        result["Registration"] = pd.DataFrame({
+            **get_csv_core_columns(df, df["Time"], EXTENSION_NAME, "Registration", tag_to_animal_map),
+            "Left": df["Left"],
+            "Right": df["Right"],
+            "Reset": df["Reset"],
+        })
 
     if export_variables:
         variables_csv_data = get_variables_csv_data(extension_data, EXTENSION_NAME, tag_to_animal_map)
@@ -1,5 +1,3 @@
-import glob
-import tempfile
 import timeit
 import zipfile
 from dataclasses import asdict
@@ -20,14 +18,12 @@ from tse_analytics.modules.intellimaze.extensions import (
     operant_device,
     running_wheel,
 )
+from tse_analytics.modules.intellimaze.io.table_readers import read_tables
 
-extension_data_loaders = {
-    actor.EXTENSION_NAME: actor.io.import_data,
-    animal_gate.EXTENSION_NAME: animal_gate.io.import_data,
-    consumption_scale.EXTENSION_NAME: consumption_scale.io.import_data,
-    intellicage.EXTENSION_NAME: intellicage.io.import_data,
-    operant_device.EXTENSION_NAME: operant_device.io.import_data,
-    running_wheel.EXTENSION_NAME: running_wheel.io.import_data,
+# Extensions in the order their data is preprocessed and added to the dataset
+extensions = {
+    extension.EXTENSION_NAME: extension
+    for extension in (actor, animal_gate, consumption_scale, intellicage, operant_device, running_wheel)
 }
 
 
@@ -35,8 +31,9 @@ def import_intellimaze_dataset(path: Path) -> Dataset | None:
     """
     Import an IntelliMaze dataset from a zip file.
 
-    This function extracts the zip file, imports metadata, devices, and animals,
-    creates an Dataset, and loads data for each extension.
+    This function imports metadata, devices, and animals, creates an Dataset, and loads
+    data for each extension. Archive members are read directly from the zip file, and the
+    tables of all extensions are read concurrently.
 
     Args:
         path (Path): The path to the zip file containing the IntelliMaze dataset.
@@ -47,53 +44,49 @@ def import_intellimaze_dataset(path: Path) -> Dataset | None:
     tic = timeit.default_timer()
 
     with zipfile.ZipFile(path, mode="r") as zip:
-        with tempfile.TemporaryDirectory(prefix="tse-analytics-") as tempdir:
-            tmp_path = Path(tempdir)
-            zip.extractall(tempdir)
+        root_path = zipfile.Path(zip)
 
-            protocols_files = glob.glob(
-                "*.IntelliMaze",
-                root_dir=tmp_path,
-            )
-            if len(protocols_files) != 1:
-                # TODO: Not IntelliMaze archive!
-                return None
-
-            metadata = _import_metadata(tmp_path / "Info.xml")
-            devices = _get_devices(metadata)
-
-            if (tmp_path / "Groups").is_dir():
-                animals = _import_animals_v6(
-                    tmp_path / "Animals" / "Animals.animals",
-                    tmp_path / "Groups" / "Groups.groups",
-                )
-            else:
-                animals = _import_animals_v5(tmp_path / "Animals" / "Animals.animals")
-
-            dataset = Dataset(
-                path.stem,
-                "IntelliMaze dataset",
-                "IntelliMaze",
-                {
-                    "source_path": str(path),
-                    "experiment_started": str(
-                        pd.to_datetime(metadata["ExperimentStarted"], format="%m/%d/%Y %H:%M:%S")
-                    ),
-                    "experiment_stopped": str(
-                        pd.to_datetime(metadata["ExperimentStopped"], format="%m/%d/%Y %H:%M:%S")
-                    ),
-                    "experiment": metadata,
-                    "animals": {k: asdict(v) for (k, v) in animals.items()},
-                    "devices": devices,
-                },
-                animals,
+        protocols_files = list(root_path.glob("*.IntelliMaze"))
+        if len(protocols_files) != 1:
+            # TODO: Not IntelliMaze archive!
+            return None
+
+        metadata = _import_metadata(root_path / "Info.xml")
+        devices = _get_devices(metadata)
+
+        if (root_path / "Groups").is_dir():
+            animals = _import_animals_v6(
+                root_path / "Animals" / "Animals.animals",
+                root_path / "Groups" / "Groups.groups",
             )
+        else:
+            animals = _import_animals_v5(root_path / "Animals" / "Animals.animals")
+
+        dataset = Dataset(
+            path.stem,
+            "IntelliMaze dataset",
+            "IntelliMaze",
+            {
+                "source_path": str(path),
+                "experiment_started": str(pd.to_datetime(metadata["ExperimentStarted"], format="%m/%d/%Y %H:%M:%S")),
+                "experiment_stopped": str(pd.to_datetime(metadata["ExperimentStopped"], format="%m/%d/%Y %H:%M:%S")),
+                "experiment": metadata,
+                "animals": {k: asdict(v) for (k, v) in animals.items()},
+                "devices": devices,
+            },
+            animals,
+        )
 
-            for extension_name, data_loader in extension_data_loaders.items():
-                if extension_name in devices and (tmp_path / extension_name).is_dir():
-                    extension_data = data_loader(tmp_path / extension_name, dataset)
-                    for raw_datatable in extension_data.values():
-                        dataset.add_raw_datatable(extension_name, raw_datatable)
+        # Read the tables of all extensions concurrently, then preprocess them in a fixed order
+        extensions_data = read_tables({
+            extension_name: extension.io.get_table_readers(root_path / extension_name, dataset)
+            for extension_name, extension in extensions.items()
+            if extension_name in devices and (root_path / extension_name).is_dir()
+        })
+        for extension_name, extension_data in extensions_data.items():
+            extensions[extension_name].data.processor.preprocess_data(dataset, extension_data)
+            for raw_datatable in extension_data.values():
+                dataset.add_raw_datatable(extension_name, raw_datatable)
 
     preprocess_main_table(dataset)
 
@@ -137,14 +130,14 @@ def _get_devices(metadata: dict) -> dict[str, list[str]]:
     return devices
 
 
-def _import_metadata(path: Path) -> dict | None:
+def _import_metadata(path: zipfile.Path) -> dict | None:
     """
     Import metadata from an XML file.
 
     This function reads an XML file and parses it into a dictionary.
 
     Args:
-        path (Path): The path to the XML file.
+        path (zipfile.Path): The path to the XML file in the archive.
 
     Returns:
         dict | None: The parsed metadata, or None if the file doesn't exist.
@@ -152,7 +145,7 @@ def _import_metadata(path: Path) -> dict | None:
     if not path.is_file():
         return None
 
-    with open(path, encoding="utf-8-sig") as file:
+    with path.open(encoding="utf-8-sig") as file:
         result = xmltodict.parse(
             file.read(),
             process_namespaces=False,
@@ -162,7 +155,7 @@ def _import_metadata(path: Path) -> dict | None:
     return result["ExperimentInfo"]
 
 
-def _import_animals_v5(animals_file_path: Path) -> dict | None:
+def _import_animals_v5(animals_file_path: zipfile.Path) -> dict | None:
     """
     Import animal data from IntelliMaze version 5 format.
 
@@ -170,7 +163,7 @@ def _import_animals_v5(animals_file_path: Path) -> dict | None:
     mapping animal IDs to Animal objects.
 
     Args:
-        animals_file_path (Path): The path to the XML file containing animal data.
+        animals_file_path (zipfile.Path): The path to the XML file containing animal data.
 
     Returns:
         dict | None: Dictionary mapping animal IDs to Animal objects, or None if the file doesn't exist.
@@ -178,7 +171,7 @@ def _import_animals_v5(animals_file_path: Path) -> dict | None:
     if not animals_file_path.is_file():
         return None
 
-    with open(animals_file_path, encoding="utf-8-sig") as file:
+    with animals_file_path.open(encoding="utf-8-sig") as file:
         animals_json = xmltodict.parse(
             file.read(),
             process_namespaces=False,
@@ -225,7 +218,7 @@ def _import_animals_v5(animals_file_path: Path) -> dict | None:
     return animals
 
 
-def _import_animals_v6(animals_file_path: Path, groups_file_path: Path) -> dict | None:
+def _import_animals_v6(animals_file_path: zipfile.Path, groups_file_path: zipfile.Path) -> dict | None:
     """
     Import animal data from IntelliMaze version 6.x format.
 
@@ -233,8 +226,8 @@ def _import_animals_v6(animals_file_path: Path, groups_file_path: Path) -> dict
     mapping animal IDs to Animal objects. In version 6.x, groups are stored in a separate file.
 
     Args:
-        animals_file_path (Path): The path to the XML file containing animal data.
-        groups_file_path (Path): The path to the XML file containing group data.
+        animals_file_path (zipfile.Path): The path to the XML file containing animal data.
+        groups_file_path (zipfile.Path): The path to the XML file containing group data.
 
     Returns:
         dict | None: Dictionary mapping animal IDs to Animal objects, or None if either file doesn't exist.
@@ -243,14 +236,14 @@ def _import_animals_v6(animals_file_path: Path, groups_file_path: Path) -> dict
     if not animals_file_path.is_file() or not groups_file_path.is_file():
         return None
 
-    with open(animals_file_path, encoding="utf-8-sig") as file:
+    with animals_file_path.open(encoding="utf-8-sig") as file:
         animals_json = xmltodict.parse(
             file.read(),
             process_namespaces=False,
             xml_attribs=False,
         )
 
-    with open(groups_file_path, encoding="utf-8-sig") as file:
+    with groups_file_path.open(encoding="utf-8-sig") as file:
         groups_json = xmltodict.parse(
             file.read(),
             process_namespaces=False,
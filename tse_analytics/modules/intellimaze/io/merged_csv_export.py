@@ -0,0 +1,251 @@
+"""
+Merged CSV export of IntelliMaze datasets.
+
+The tables of the selected extensions are merged into one CSV file ordered by time, either as one
+long table (new format) or in the aligned wide layout of the IntelliMaze software (old format),
+where every table has its own block of columns after the common ones and three header rows name
+the extension, the table and the column. Rows are assembled column by column and written in chunks,
+so memory holds the source tables plus one chunk of text rather than the whole file.
+"""
+
+import csv
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from tse_analytics.core.data.dataset import Dataset
+from tse_analytics.modules.intellimaze.extensions import (
+    actor,
+    animal_gate,
+    consumption_scale,
+    intellicage,
+    operant_device,
+    running_wheel,
+)
+
+CSV_CORE_COLUMNS = ["DateTime", "DeviceType", "DeviceId", "AnimalName", "AnimalTag", "TableType"]
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+extension_csv_getters = {
+    actor.EXTENSION_NAME: actor.data.get_csv_data,
+    animal_gate.EXTENSION_NAME: animal_gate.data.get_csv_data,
+    consumption_scale.EXTENSION_NAME: consumption_scale.data.get_csv_data,
+    intellicage.EXTENSION_NAME: intellicage.data.get_csv_data,
+    operant_device.EXTENSION_NAME: operant_device.data.get_csv_data,
+    running_wheel.EXTENSION_NAME: running_wheel.data.get_csv_data,
+}
+
+
+@dataclass
+class _CsvTable:
+    extension_name: str
+    table_name: str
+    df: pd.DataFrame
+    fields: list[str] = field(default_factory=list)
+    # Output column of every field
+    positions: list[int] = field(default_factory=list)
+
+
+def get_extension_csv_data(
+    dataset: Dataset,
+    extension_names: list[str],
+    export_registrations: bool,
+    export_variables: bool,
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Get the CSV tables of IntelliMaze extensions.
+
+    Args:
+        dataset (Dataset): The IntelliMaze dataset.
+        extension_names (list[str]): Extensions to export.
+        export_registrations (bool): Whether to export registration data.
+        export_variables (bool): Whether to export variable data.
+
+    Returns:
+        dict[str, dict[str, pd.DataFrame]]: Tables by extension name and table name; extensions without
+            tables are left out.
+    """
+    extension_csv_data: dict[str, dict[str, pd.DataFrame]] = {}
+    for extension_name in extension_names:
+        name, csv_data = extension_csv_getters[extension_name](
+            dataset,
+            dataset.raw_datatables[extension_name],
+            export_registrations,
+            export_variables,
+        )
+        if len(csv_data) > 0:
+            extension_csv_data[name] = csv_data
+    return extension_csv_data
+
+
+def _write_chunks(
+    file,
+    tables: list[_CsvTable],
+    number_of_columns: int,
+    delimiter: str,
+    chunk_rows: int,
+    progress_callback: Callable[[int, int], None] | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> bool:
+    """Write the rows of all tables ordered by time, one chunk of rows at a time."""
+    if not tables:
+        return True
+    lengths = np.array([len(table.df) for table in tables], dtype=np.int64)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    total = int(lengths.sum())
+
+    # Global time order; stable, so rows with equal timestamps keep their table order
+    date_times = pd.concat([table.df["DateTime"] for table in tables], ignore_index=True)
+    order = date_times.sort_values(kind="stable", na_position="last").index.to_numpy()
+    table_of_row = np.repeat(np.arange(len(tables)), lengths)[order]
+    position_in_table = order - starts[table_of_row]
+
+    if progress_callback is not None:
+        progress_callback(0, total)
+    for chunk_start in range(0, total, chunk_rows):
+        if is_cancelled is not None and is_cancelled():
+            return False
+        chunk_tables = table_of_row[chunk_start : chunk_start + chunk_rows]
+        chunk_positions = position_in_table[chunk_start : chunk_start + chunk_rows]
+
+        columns = [np.full(len(chunk_tables), None, dtype=object) for _ in range(number_of_columns)]
+        for index, table in enumerate(tables):
+            mask = chunk_tables == index
+            if not mask.any():
+                continue
+            rows = table.df.take(chunk_positions[mask])
+            for column, name in enumerate(CSV_CORE_COLUMNS):
+                columns[column][mask] = rows[name].to_numpy(dtype=object)
+            for name, column in zip(table.fields, table.positions, strict=True):
+                columns[column][mask] = rows[name].to_numpy(dtype=object)
+
+        pd.DataFrame(dict(enumerate(columns))).to_csv(
+            file,
+            sep=delimiter,
+            header=False,
+            index=False,
+            lineterminator="\n",
+        )
+        if progress_callback is not None:
+            progress_callback(min(chunk_start + chunk_rows, total), total)
+    return True
+
+
+def write_merged_csv(
+    extension_csv_data: dict[str, dict[str, pd.DataFrame]],
+    filename: str | Path,
+    delimiter: str,
+    old_format: bool = False,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    progress_callback: Callable[[int, int], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> bool:
+    """
+    Write CSV tables into one CSV file ordered by time.
+
+    The new format has one column per distinct column name. The old format aligns every table
+    in its own block of columns after the common ``CSV_CORE_COLUMNS`` and starts with three header
+    rows: extension names, table names and column names.
+
+    Args:
+        extension_csv_data (dict[str, dict[str, pd.DataFrame]]): Tables by extension name and table name,
+            as returned by ``get_extension_csv_data``.
+        filename (str | Path): The output file.
+        delimiter (str): Field delimiter.
+        old_format (bool): Whether to write the aligned old format.
+        chunk_rows (int): Number of rows assembled and written at a time.
+        progress_callback (Callable[[int, int], None] | None): Called with the number of written and
+            total rows after each chunk.
+        is_cancelled (Callable[[], bool] | None): Polled between chunks; the partial file is deleted
+            when it returns True.
+
+    Returns:
+        bool: True if the file was written, False if the export was cancelled.
+    """
+    tic = timeit.default_timer()
+
+    tables: list[_CsvTable] = []
+    for extension_name, csv_data in extension_csv_data.items():
+        for table_name, df in csv_data.items():
+            fields = [column for column in df.columns if column not in CSV_CORE_COLUMNS]
+            tables.append(_CsvTable(extension_name, table_name, df, fields))
+
+    if old_format:
+        # Every table has its own block of columns
+        number_of_columns = len(CSV_CORE_COLUMNS)
+        for table in tables:
+            table.positions = list(range(number_of_columns, number_of_columns + len(table.fields)))
+            number_of_columns += len(table.fields)
+        header_rows = [
+            [""] * len(CSV_CORE_COLUMNS) + [table.extension_name for table in tables for _ in table.fields],
+            [""] * len(CSV_CORE_COLUMNS) + [table.table_name for table in tables for _ in table.fields],
+            CSV_CORE_COLUMNS + [name for table in tables for name in table.fields],
+        ]
+    else:
+        # One column per distinct name, in order of first appearance
+        column_names = list(dict.fromkeys(CSV_CORE_COLUMNS + [name for table in tables for name in table.fields]))
+        for table in tables:
+            table.positions = [column_names.index(name) for name in table.fields]
+        number_of_columns = len(column_names)
+        header_rows = [column_names]
+
+    path = Path(filename)
+    with open(path, "w", encoding="utf-8") as file:
+        csv.writer(file, delimiter=delimiter, lineterminator="\n").writerows(header_rows)
+        completed = _write_chunks(
+            file, tables, number_of_columns, delimiter, chunk_rows, progress_callback, is_cancelled
+        )
+
+    if not completed:
+        path.unlink(missing_ok=True)
+        logger.info(f"Merged CSV export to {path} cancelled")
+        return False
+
+    logger.info(f"Merged CSV exported to {path} in {(timeit.default_timer() - tic):.3f} sec")
+    return True
+
+
+def export_merged_csv(
+    dataset: Dataset,
+    extension_names: list[str],
+    filename: str | Path,
+    delimiter: str,
+    old_format: bool = False,
+    export_registrations: bool = True,
+    export_variables: bool = True,
+    progress_callback: Callable[[int, int], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> bool:
+    """
+    Export the tables of IntelliMaze extensions into one merged CSV file.
+
+    Args:
+        dataset (Dataset): The IntelliMaze dataset.
+        extension_names (list[str]): Extensions to export.
+        filename (str | Path): The output file.
+        delimiter (str): Field delimiter.
+        old_format (bool): Whether to write the aligned old format.
+        export_registrations (bool): Whether to export registration data.
+        export_variables (bool): Whether to export variable data.
+        progress_callback (Callable[[int, int], None] | None): Called with the number of written and
+            total rows.
+        is_cancelled (Callable[[], bool] | None): Polled between chunks to stop early.
+
+    Returns:
+        bool: True if the file was written, False if the export was cancelled.
+    """
+    extension_csv_data = get_extension_csv_data(dataset, extension_names, export_registrations, export_variables)
+    return write_merged_csv(
+        extension_csv_data,
+        filename,
+        delimiter,
+        old_format,
+        progress_callback=progress_callback,
+        is_cancelled=is_cancelled,
+    )
@@ -0,0 +1,79 @@
+"""
+Concurrent reading of IntelliMaze extension tables.
+
+Every extension describes its tables as zero-argument readers (see ``get_table_readers`` in the
+extension ``io`` packages). The readers of all extensions are independent of each other until the
+extension data is preprocessed, so they run together on a thread pool: archive members are
+decompressed and parsed concurrently, and an import takes about as long as its slowest table.
+Results are merged back in the order the readers were declared, so the imported dataset does not
+depend on which reader finishes first.
+"""
+
+import os
+import timeit
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from loguru import logger
+
+from tse_analytics.core.data.datatable import Datatable
+
+# Reads one table; returns None for optional tables missing from the archive
+TableReader = Callable[[], Datatable | None]
+
+
+def _timed(reader: TableReader) -> tuple[Datatable | None, float, float]:
+    start = timeit.default_timer()
+    datatable = reader()
+    return datatable, start, timeit.default_timer()
+
+
+def read_tables(
+    table_readers: dict[str, dict[str, TableReader]],
+    max_workers: int | None = None,
+) -> dict[str, dict[str, Datatable]]:
+    """
+    Run the table readers of several extensions concurrently.
+
+    Args:
+        table_readers (dict[str, dict[str, TableReader]]): Table readers by table name, by extension name.
+        max_workers (int | None): Size of the thread pool. Defaults to the number of readers, capped at the CPU count.
+
+    Returns:
+        dict[str, dict[str, Datatable]]: The tables read by each extension, in the order of ``table_readers``.
+            Tables whose reader returned None are omitted.
+
+    Raises:
+        Exception: The first error raised by a reader; readers that did not start yet are cancelled.
+    """
+    reader_count = sum(len(readers) for readers in table_readers.values())
+    if max_workers is None:
+        max_workers = max(1, min(reader_count, os.cpu_count() or 1))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="intellimaze-import")
+    try:
+        futures: dict[str, dict[str, Future]] = {
+            extension_name: {table_name: executor.submit(_timed, reader) for table_name, reader in readers.items()}
+            for extension_name, readers in table_readers.items()
+        }
+
+        result: dict[str, dict[str, Datatable]] = {}
+        for extension_name, extension_futures in futures.items():
+            extension_data: dict[str, Datatable] = {}
+            starts, ends = [], []
+            for table_name, future in extension_futures.items():
+                datatable, start, end = future.result()
+                starts.append(start)
+                ends.append(end)
+                if datatable is not None:
+                    extension_data[table_name] = datatable
+            if len(starts) > 0:
+                logger.info(
+                    f"{extension_name}: {len(extension_data)} tables read in {(max(ends) - min(starts)):.3f} sec"
+                )
+            result[extension_name] = extension_data
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+    return result
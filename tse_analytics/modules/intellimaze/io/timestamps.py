@@ -0,0 +1,182 @@
+"""
+Fast ISO 8601 timestamp decoding for device log columns.
+
+Device logs write every timestamp with the same fixed-width layout, e.g.
+``2024-01-01T08:30:00.1234567+01:00``. The layout is detected once from the first value of a
+column; all values are then decoded together as a byte matrix with vectorized integer arithmetic.
+Only values that do not follow the layout (different width, invalid dates, other offsets) are
+parsed by ``pd.to_datetime``, so the result matches the pandas conversion it replaces.
+"""
+
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from tse_analytics.globals import TIME_RESOLUTION_UNIT
+
+_LAYOUT_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?P<fraction>\.\d{1,9})?(?P<offset>Z|[+-]\d{2}:\d{2})?"
+)
+
+# Byte positions of the year, month, day, hour, minute and second digits
+_FIELD_POSITIONS = ((0, 4), (5, 7), (8, 10), (11, 13), (14, 16), (17, 19))
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_DAY = 86_400 * _NS_PER_SECOND
+
+# Values decoded per batch, bounding the size of the byte matrix
+DECODE_CHUNK_SIZE = 1_000_000
+
+# Years representable as datetime64[ns]
+_MIN_YEAR = 1678
+_MAX_YEAR = 2261
+
+
+@dataclass(frozen=True)
+class TimestampLayout:
+    """Fixed-width layout of the timestamps of a column."""
+
+    width: int
+    fraction_digits: int
+    offset: bytes
+
+    @classmethod
+    def detect(cls, value: str) -> TimestampLayout | None:
+        """Detect the layout of a timestamp, or None if it is not a plain ISO 8601 timestamp."""
+        match = _LAYOUT_PATTERN.fullmatch(value)
+        if match is None or not value.isascii():
+            return None
+        fraction = match.group("fraction") or ""
+        return cls(len(value), max(len(fraction) - 1, 0), (match.group("offset") or "").encode())
+
+    @property
+    def offset_seconds(self) -> int:
+        """UTC offset of the layout in seconds."""
+        if len(self.offset) <= 1:
+            return 0
+        seconds = int(self.offset[1:3]) * 3600 + int(self.offset[4:6]) * 60
+        return -seconds if self.offset.startswith(b"-") else seconds
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    # Days since 1970-01-01 of proleptic Gregorian dates (H. Hinnant's algorithm)
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _days_in_month(year: np.ndarray, month: np.ndarray) -> np.ndarray:
+    days = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.clip(month, 1, 12) - 1]
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return days + ((month == 2) & is_leap)
+
+
+def _decode(data: np.ndarray, layout: TimestampLayout) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a byte matrix of timestamps to nanoseconds since the epoch and a mask of the decoded rows."""
+    separators = {4: ord("-"), 7: ord("-"), 13: ord(":"), 16: ord(":")}
+    if layout.fraction_digits > 0:
+        separators[19] = ord(".")
+    offset_start = layout.width - len(layout.offset)
+    for i, char in enumerate(layout.offset):
+        separators[offset_start + i] = char
+
+    # Values of another width have their terminating zero byte elsewhere
+    is_valid = (data[:, layout.width - 1] != 0) & (data[:, layout.width] == 0)
+    is_valid &= (data[:, 10] == ord("T")) | (data[:, 10] == ord(" "))
+    for position, char in separators.items():
+        is_valid &= data[:, position] == char
+
+    def number(start: int, stop: int) -> np.ndarray:
+        nonlocal is_valid
+        value = np.zeros(len(data), dtype=np.int64)
+        for position in range(start, stop):
+            digit = data[:, position] - np.uint8(ord("0"))  # wraps around for bytes below "0"
+            is_valid &= digit <= 9
+            value = value * 10 + digit
+        return value
+
+    year, month, day, hour, minute, second = (number(start, stop) for start, stop in _FIELD_POSITIONS)
+    fraction = number(20, 20 + layout.fraction_digits) * 10 ** (9 - layout.fraction_digits)
+
+    is_valid &= (year >= _MIN_YEAR) & (year <= _MAX_YEAR) & (month >= 1) & (month <= 12)
+    is_valid &= (day >= 1) & (day <= _days_in_month(year, month))
+    is_valid &= (hour < 24) & (minute < 60) & (second < 60)
+
+    nanoseconds = (
+        _days_from_civil(year, month, day) * _NS_PER_DAY
+        + (hour * 3600 + minute * 60 + second) * _NS_PER_SECOND
+        + fraction
+    )
+    return np.where(is_valid, nanoseconds, 0), is_valid
+
+
+def parse_timestamps(
+    values: pd.Series,
+    drop_offset: bool = False,
+    unit: str = TIME_RESOLUTION_UNIT,
+) -> pd.Series:
+    """
+    Convert a column of ISO 8601 timestamp strings to datetimes.
+
+    The result is the same as ``pd.to_datetime(values, format="ISO8601", utc=False)``, followed by
+    ``.dt.tz_localize(None)`` if ``drop_offset`` is set, and by ``.dt.as_unit(unit)``. When offsets
+    are dropped, a column whose offset changes (e.g. at a daylight saving time switch) keeps the wall
+    time of every value instead of failing with mixed timezones.
+
+    Args:
+        values (pd.Series): Timestamp strings; missing values become NaT.
+        drop_offset (bool): Whether to keep the local wall time and drop the UTC offset of the timestamps.
+        unit (str): Resolution of the result.
+
+    Returns:
+        pd.Series: The parsed timestamps, with the index and name of ``values``.
+    """
+
+    def to_datetime(strings: pd.Series) -> pd.Series:
+        result = pd.to_datetime(strings, format="ISO8601", utc=False)
+        if drop_offset:
+            result = result.dt.tz_localize(None)
+        return result.dt.as_unit(unit)
+
+    strings = values.to_numpy(dtype=object, na_value=None)
+    is_missing = pd.isna(values).to_numpy(dtype=bool)
+    present = np.flatnonzero(~is_missing)
+    if len(present) == 0:
+        return to_datetime(values)
+
+    layout = TimestampLayout.detect(strings[present[0]])
+    if layout is None:
+        return to_datetime(values)
+
+    nanoseconds = np.zeros(len(strings), dtype=np.int64)
+    is_decoded = np.zeros(len(strings), dtype=bool)
+    for start in range(0, len(strings), DECODE_CHUNK_SIZE):
+        chunk = slice(start, start + DECODE_CHUNK_SIZE)
+        try:
+            # One spare byte per value tells values of the layout width apart from longer ones
+            encoded = np.asarray(np.where(is_missing[chunk], "", strings[chunk]), dtype=f"S{layout.width + 1}")
+        except UnicodeEncodeError:
+            return to_datetime(values)
+        data = encoded.view(np.uint8).reshape(len(encoded), layout.width + 1)
+        nanoseconds[chunk], is_decoded[chunk] = _decode(data, layout)
+
+    irregular = ~is_decoded & ~is_missing
+    result = pd.Series(nanoseconds.view("datetime64[ns]"), index=values.index, name=values.name, copy=False)
+    if len(layout.offset) > 0 and not drop_offset:
+        if irregular.any():
+            # Other offsets cannot share the timezone of the column; let pandas decide
+            return to_datetime(values)
+        # Same timezone object as pandas assigns to the column
+        tz = to_datetime(values.iloc[present[:1]]).dt.tz
+        result = (result - pd.Timedelta(layout.offset_seconds, unit="s")).dt.tz_localize("UTC").dt.tz_convert(tz)
+    result = result.dt.as_unit(unit)
+    result[is_missing] = pd.NaT
+
+    if irregular.any():
+        result[irregular] = to_datetime(values[irregular]).to_numpy()
+    return result
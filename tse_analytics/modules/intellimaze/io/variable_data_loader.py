@@ -1,43 +1,36 @@
-from pathlib import Path
+import zipfile
+from functools import partial
 
 import pandas as pd
 
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
-from tse_analytics.globals import TIME_RESOLUTION_UNIT
+from tse_analytics.modules.intellimaze.io.table_readers import TableReader
+from tse_analytics.modules.intellimaze.io.timestamps import parse_timestamps
 
 
-def import_variable_data(dataset: Dataset, folder_path: Path) -> dict[str, Datatable]:
+def get_variable_data_readers(dataset: Dataset, folder_path: zipfile.Path) -> dict[str, TableReader]:
     """
-    Import variable data from a folder.
+    Get the readers of the variable data tables of an extension folder.
 
-    This function imports integer, double, and boolean variable data from a folder
-    and returns a dictionary mapping variable types to DataFrames.
+    This function returns readers for integer, double, and boolean variable data.
+    A reader returns None when its file is not present in the folder.
 
     Args:
-        folder_path (Path): The path to the folder containing variable data.
+        dataset (Dataset): The dataset the tables belong to.
+        folder_path (zipfile.Path): The archive path of the folder containing variable data.
 
     Returns:
-        dict[str, pd.DataFrame]: Dictionary mapping variable types to DataFrames.
+        dict[str, TableReader]: Dictionary mapping variable types to table readers.
     """
-    result: dict[str, Datatable] = {}
-
-    integer_variables = _import_integer_variables_data(dataset, folder_path / "IntegerVariables.txt")
-    if integer_variables is not None:
-        result["IntegerVariables"] = integer_variables
-
-    double_variables = _import_double_variables_data(dataset, folder_path / "DoubleVariables.txt")
-    if double_variables is not None:
-        result["DoubleVariables"] = double_variables
-
-    boolean_variables = _import_boolean_variables_data(dataset, folder_path / "BooleanVariables.txt")
-    if boolean_variables is not None:
-        result["BooleanVariables"] = boolean_variables
-
-    return result
+    return {
+        "IntegerVariables": partial(_import_integer_variables_data, dataset, folder_path / "IntegerVariables.txt"),
+        "DoubleVariables": partial(_import_double_variables_data, dataset, folder_path / "DoubleVariables.txt"),
+        "BooleanVariables": partial(_import_boolean_variables_data, dataset, folder_path / "BooleanVariables.txt"),
+    }
 
 
-def _import_integer_variables_data(dataset: Dataset, file_path: Path) -> Datatable | None:
+def _import_integer_variables_data(dataset: Dataset, file_path: zipfile.Path) -> Datatable | None:
     """
     Import integer variable data from a text file.
 
@@ -45,7 +38,7 @@ def _import_integer_variables_data(dataset: Dataset, file_path: Path) -> Datatab
     converts data types, and returns a DataFrame.
 
     Args:
-        folder_path (Path): The path to the folder containing the text file.
+        folder_path (zipfile.Path): The archive path of the folder containing the text file.
 
     Returns:
         pd.DataFrame | None: DataFrame containing integer variable data, or None if the file doesn't exist.
@@ -62,25 +55,17 @@ def _import_integer_variables_data(dataset: Dataset, file_path: Path) -> Datatab
         "Tag": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -103,7 +88,7 @@ def _import_integer_variables_data(dataset: Dataset, file_path: Path) -> Datatab
     return datatable
 
 
-def _import_double_variables_data(dataset: Dataset, file_path: Path) -> Datatable | None:
+def _import_double_variables_data(dataset: Dataset, file_path: zipfile.Path) -> Datatable | None:
     """
     Import double variable data from a text file.
 
@@ -111,7 +96,7 @@ def _import_double_variables_data(dataset: Dataset, file_path: Path) -> Datatabl
     converts data types, and returns a DataFrame.
 
     Args:
-        folder_path (Path): The path to the folder containing the text file.
+        folder_path (zipfile.Path): The archive path of the folder containing the text file.
 
     Returns:
         pd.DataFrame | None: DataFrame containing double variable data, or None if the file doesn't exist.
@@ -128,25 +113,17 @@ def _import_double_variables_data(dataset: Dataset, file_path: Path) -> Datatabl
         "Tag": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -169,7 +146,7 @@ def _import_double_variables_data(dataset: Dataset, file_path: Path) -> Datatabl
     return datatable
 
 
-def _import_boolean_variables_data(dataset: Dataset, file_path: Path) -> Datatable | None:
+def _import_boolean_variables_data(dataset: Dataset, file_path: zipfile.Path) -> Datatable | None:
     """
     Import boolean variable data from a text file.
 
@@ -177,7 +154,7 @@ def _import_boolean_variables_data(dataset: Dataset, file_path: Path) -> Datatab
     converts data types, and returns a DataFrame.
 
     Args:
-        folder_path (Path): The path to the folder containing the text file.
+        folder_path (zipfile.Path): The archive path of the folder containing the text file.
 
     Returns:
         pd.DataFrame | None: DataFrame containing boolean variable data, or None if the file doesn't exist.
@@ -193,25 +170,17 @@ def _import_boolean_variables_data(dataset: Dataset, file_path: Path) -> Datatab
         "Tag": "string",
     }
 
-    df = pd.read_csv(
-        file_path,
-        delimiter="\t",
-        decimal=".",
-        dtype=dtype,
-        dtype_backend="numpy_nullable",
-    )
+    with file_path.open("rb") as file:
+        df = pd.read_csv(
+            file,
+            delimiter="\t",
+            decimal=".",
+            dtype=dtype,
+            dtype_backend="numpy_nullable",
+        )
 
     # Convert DateTime columns
-    df["Time"] = (
-        pd
-        .to_datetime(
-            df["Time"],
-            format="ISO8601",
-            utc=False,
-        )
-        .dt.tz_localize(None)
-        .dt.as_unit(TIME_RESOLUTION_UNIT)
-    )
+    df["Time"] = parse_timestamps(df["Time"], drop_offset=True)
 
     # Convert categorical types
     df = df.astype({
@@ -1,30 +1,18 @@
-import pandas as pd
+import timeit
+
+from pyqttoast import ToastPreset
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QDialog, QListWidgetItem, QWidget
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QListWidgetItem, QProgressBar, QWidget
 
 from tse_analytics.core.data.dataset import Dataset
+from tse_analytics.core.toaster import make_toast
 from tse_analytics.core.utils import get_save_file_name
-from tse_analytics.modules.intellimaze.extensions import (
-    actor,
-    animal_gate,
-    consumption_scale,
-    intellicage,
-    operant_device,
-    running_wheel,
-)
+from tse_analytics.core.workers import TaskManager, Worker
+from tse_analytics.modules.intellimaze.io.merged_csv_export import export_merged_csv
 from tse_analytics.modules.intellimaze.views.export_merged_csv.export_merged_csv_dialog_ui import (
     Ui_ExportMergedCsvDialog,
 )
 
-extension_csv_getters = {
-    actor.EXTENSION_NAME: actor.data.get_csv_data,
-    animal_gate.EXTENSION_NAME: animal_gate.data.get_csv_data,
-    consumption_scale.EXTENSION_NAME: consumption_scale.data.get_csv_data,
-    intellicage.EXTENSION_NAME: intellicage.data.get_csv_data,
-    operant_device.EXTENSION_NAME: operant_device.data.get_csv_data,
-    running_wheel.EXTENSION_NAME: running_wheel.data.get_csv_data,
-}
-
 
 class ExportMergedCsvDialog(QDialog):
     def __init__(self, dataset: Dataset, parent: QWidget | None = None):
@@ -33,6 +21,8 @@ class ExportMergedCsvDialog(QDialog):
         self.ui.setupUi(self)
 
         self.dataset = dataset
+        self.worker: Worker | None = None
+        self.tic = 0.0
 
         for extension_name in dataset.raw_datatables.keys():
             item = QListWidgetItem(extension_name)
@@ -40,7 +30,20 @@ class ExportMergedCsvDialog(QDialog):
             item.setCheckState(Qt.CheckState.Unchecked)
             self.ui.listWidgetExtensions.addItem(item)
 
-        self.ui.buttonBox.accepted.connect(self._export)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setVisible(False)
+        self.ui.verticalLayout.insertWidget(self.ui.verticalLayout.indexOf(self.ui.buttonBox), self.progress_bar)
+
+    def accept(self) -> None:
+        # The export runs in a worker; the dialog closes when it finishes
+        if self.worker is None:
+            self._export()
+
+    def reject(self) -> None:
+        if self.worker is not None:
+            self.worker.cancel()
+            return
+        super().reject()
 
     def _export(self):
         filename = get_save_file_name(self, "Export to CSV", "", "CSV Files (*.csv)")
@@ -52,105 +55,66 @@ class ExportMergedCsvDialog(QDialog):
             else:
                 delimiter = "\t"
 
-            export_registrations = self.ui.checkBoxExportRegistrations.isChecked()
-            export_variables = self.ui.checkBoxExportVariables.isChecked()
-
-            extension_csv_data = {}
+            extension_names = []
             for index in range(self.ui.listWidgetExtensions.count()):
                 item = self.ui.listWidgetExtensions.item(index)
                 if item.checkState() == Qt.CheckState.Checked:
-                    extension_name, csv_data = extension_csv_getters[item.text()](
-                        self.dataset,
-                        self.dataset.raw_datatables[item.text()],
-                        export_registrations,
-                        export_variables,
-                    )
-                    if len(csv_data) > 0:
-                        extension_csv_data[extension_name] = csv_data
-
-            if self.ui.radioButtonFormatNew.isChecked():
-                self._export_new_format(extension_csv_data, filename, delimiter)
-            else:
-                self._export_old_format(extension_csv_data, filename, delimiter)
-
-    def _export_new_format(
-        self,
-        extension_csv_data: dict[str, dict[str, pd.DataFrame]],
-        filename: str,
-        delimiter: str,
-    ) -> None:
-        result_df = pd.DataFrame()
-
-        for _, csv_data in extension_csv_data.items():
-            for _, df in csv_data.items():
-                result_df = pd.concat([result_df, df])
-
-        result_df.sort_values(["DateTime"], inplace=True)
-
-        result_df.to_csv(
-            filename,
-            sep=delimiter,
-            index=False,
-            quoting=None,
-        )
-
-    def _export_old_format(
-        self,
-        extension_csv_data: dict[str, dict[str, pd.DataFrame]],
-        filename: str,
-        delimiter: str,
-    ) -> None:
-        core_headers_set = {"DateTime", "DeviceType", "DeviceId", "AnimalName", "AnimalTag", "TableType"}
-        headers3 = list(core_headers_set)
-        commonColumnNumber = len(headers3)
-        headers2 = ["" for i in range(commonColumnNumber)]
-        headers1 = ["" for i in range(commonColumnNumber)]
-
-        # Estimate number of columns
-        for extension_name, csv_data in extension_csv_data.items():
-            for tableName, df in csv_data.items():
-                df_headers = list(set(df.columns.values.tolist()) - core_headers_set)
-                headers3 = headers3 + df_headers
-
-                subHeaders = [tableName for i in range(len(df_headers))]
-                headers2 = headers2 + subHeaders
-
-                subSubHeaders = [extension_name for i in range(len(df_headers))]
-                headers1 = headers1 + subSubHeaders
-
-        numberOfColumns = len(headers3)
-        fieldsOffset = 0
-        csvDataRows: list[list[str]] = []
-        for _, csv_data in extension_csv_data.items():
-            for _, df in csv_data.items():
-                field_names = list(set(df.columns.values.tolist()) - core_headers_set)
-                headerLength = len(field_names)
-                preContent = ["" for i in range(fieldsOffset)]
-                postContent = ["" for i in range(numberOfColumns - fieldsOffset - commonColumnNumber - headerLength)]
-
-                for _, row in df.iterrows():
-                    start = [
-                        str(row["DateTime"]),
-                        row["DeviceType"],
-                        row["DeviceId"],
-                        row["AnimalName"],
-                        row["AnimalTag"],
-                        row["TableType"],
-                    ]
-                    fields = [
-                        str(row[field_name]) if row[field_name] == row[field_name] else "" for field_name in field_names
-                    ]
-                    csvDataRows.append(start + preContent + fields + postContent)
-
-                fieldsOffset = fieldsOffset + headerLength
-
-        new_list = sorted(csvDataRows, key=lambda x: x[0], reverse=False)
-        lines = [f"{delimiter.join(items)}\n" for items in new_list]
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.writelines([
-                f"{delimiter.join(headers1)}\n",
-                f"{delimiter.join(headers2)}\n",
-                f"{delimiter.join(headers3)}\n",
-            ])
-            f.writelines(lines)
+                    extension_names.append(item.text())
+
+            self.ui.buttonBox.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
+            self.progress_bar.reset()
+            self.progress_bar.setVisible(True)
+
+            self.tic = timeit.default_timer()
+            self.worker = Worker(
+                export_merged_csv,
+                self.dataset,
+                extension_names,
+                filename,
+                delimiter,
+                self.ui.radioButtonFormatOld.isChecked(),
+                self.ui.checkBoxExportRegistrations.isChecked(),
+                self.ui.checkBoxExportVariables.isChecked(),
+            )
+            self.worker.kwargs.update(
+                progress_callback=self.worker.signals.progress.emit,
+                is_cancelled=self.worker.is_cancelled,
+            )
+            self.worker.signals.progress.connect(self._work_progress)
+            self.worker.signals.result.connect(self._work_result)
+            self.worker.signals.error.connect(self._work_error)
+            self.worker.signals.finished.connect(self._work_finished)
+            TaskManager.start_task(self.worker)
+
+    def _work_progress(self, completed: int, total: int) -> None:
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(completed)
+
+    def _work_result(self, completed: bool) -> None:
+        if completed:
+            make_toast(
+                self.parentWidget(),
+                "Export Merged CSV",
+                f"Export complete in {(timeit.default_timer() - self.tic):.1f} sec.",
+                duration=3000,
+                preset=ToastPreset.SUCCESS,
+                show_duration_bar=True,
+                echo_to_logger=True,
+            ).show()
+
+    def _work_error(self, error) -> None:
+        make_toast(
+            self.parentWidget(),
+            "Export Merged CSV",
+            "Export failed. See the log for details.",
+            duration=4000,
+            preset=ToastPreset.ERROR,
+        ).show()
+
+    def _work_finished(self) -> None:
+        cancelled = self.worker is not None and self.worker.is_cancelled()
+        self.worker = None
+        if cancelled:
+            super().reject()
+        else:
+            super().accept()
@@ -10,45 +10,90 @@ from tse_analytics.core.data.datatable import META_ORIGIN_PATH, META_SAMPLE_INTE
 from tse_analytics.globals import TIME_RESOLUTION_UNIT
 from tse_analytics.modules.phenomaster.io.tse_import_settings import ACTIMOT_RAW_TABLE
 
+# Rows fetched from the SQLite file per query when streaming the raw table
+ACTIMOT_RAW_CHUNK_SIZE = 2_000_000
 
-def read_actimot_raw(path: Path, dataset: Dataset) -> Datatable:
-    metadata = dataset.metadata["tables"][ACTIMOT_RAW_TABLE]
 
-    sample_interval = pd.Timedelta(metadata["sample_interval"])
+def read_actimot_raw(path: Path, dataset: Dataset, chunk_size: int | None = ACTIMOT_RAW_CHUNK_SIZE) -> Datatable:
+    """Read the raw ActiMot table of a PhenoMaster SQLite file.
 
-    df = cx.read_sql(
-        f"sqlite:///{path}",
-        f"SELECT DateTime, Box, X1, X2, Y1 AS Y FROM {ACTIMOT_RAW_TABLE}",
-        return_type="pandas",
-    )
+    The table is read in rowid-ordered chunks (keyset pagination, so every chunk is an index
+    seek) and each chunk is decoded straight into preallocated, compactly typed column arrays.
+    Peak memory is therefore the final table plus one chunk, independent of experiment length,
+    instead of several whole-table copies.
 
-    # Convert types
-    df = df.astype({"Box": "UInt16"}, errors="ignore")
+    Args:
+        path: Path to the PhenoMaster SQLite file.
+        dataset: Dataset the table belongs to (animals and experiment start).
+        chunk_size: Rows per chunk, or None to read the table with a single query.
 
-    df["X"] = np.left_shift(df["X2"].to_numpy(dtype=np.uint64), 32) + df["X1"].to_numpy(dtype=np.uint64)
-    df = df.drop(columns=["X1", "X2"])
+    Returns:
+        The raw ActiMot datatable.
+    """
+    metadata = dataset.metadata["tables"][ACTIMOT_RAW_TABLE]
 
-    # Convert DateTime from POSIX format
-    df["DateTime"] = pd.to_datetime(df["DateTime"], origin="unix", unit="ns").dt.as_unit(TIME_RESOLUTION_UNIT)
+    sample_interval = pd.Timedelta(metadata["sample_interval"])
 
-    box_to_animal_map = {animal.properties["Box"]: animal.id for animal in dataset.animals.values()}
-    df.insert(
-        df.columns.get_loc("Box"),
-        "Animal",
-        df["Box"].map(box_to_animal_map),
+    connection = f"sqlite:///{path}"
+    rows_count = int(
+        cx.read_sql(connection, f"SELECT COUNT(*) AS Count FROM {ACTIMOT_RAW_TABLE}", return_type="pandas").iat[0, 0]
     )
 
-    # Add Timedelta columns
-    df.insert(
-        loc=1,
-        column="Timedelta",
-        value=(df["DateTime"] - dataset.experiment_started).dt.as_unit(TIME_RESOLUTION_UNIT),
+    datetime_values = np.empty(rows_count, dtype=f"datetime64[{TIME_RESOLUTION_UNIT}]")
+    box_values = np.empty(rows_count, dtype=np.uint16)
+    x_values = np.empty(rows_count, dtype=np.uint64)
+    y_values = np.empty(rows_count, dtype=np.int64)
+    y_mask = np.zeros(rows_count, dtype=bool)
+
+    position = 0
+    last_rowid = None
+    while position < rows_count:
+        query = f"SELECT rowid AS RowId, DateTime, Box, X1, X2, Y1 AS Y FROM {ACTIMOT_RAW_TABLE}"
+        if last_rowid is not None:
+            query += f" WHERE rowid > {last_rowid}"
+        query += " ORDER BY rowid"
+        if chunk_size is not None:
+            query += f" LIMIT {int(chunk_size)}"
+
+        chunk = cx.read_sql(connection, query, return_type="pandas")
+        if chunk.empty:
+            break
+        chunk = chunk.iloc[: rows_count - position]
+        stop = position + len(chunk)
+
+        # Convert DateTime from POSIX format
+        datetime_values[position:stop] = pd.to_datetime(chunk["DateTime"], origin="unix", unit="ns").to_numpy(
+            dtype=datetime_values.dtype
+        )
+        box_values[position:stop] = chunk["Box"].to_numpy(dtype=np.uint16)
+        x_values[position:stop] = np.left_shift(chunk["X2"].to_numpy(dtype=np.uint64), 32) + chunk["X1"].to_numpy(
+            dtype=np.uint64
+        )
+        y = chunk["Y"]
+        y_mask[position:stop] = y.isna().to_numpy()
+        y_values[position:stop] = y.fillna(0).to_numpy(dtype=np.int64)
+
+        last_rowid = int(chunk["RowId"].iat[-1])
+        position = stop
+
+    datetime_values = datetime_values[:position]
+    box = pd.Categorical(pd.array(box_values[:position], dtype="UInt16"))
+    box_to_animal_map = {animal.properties["Box"]: animal.id for animal in dataset.animals.values()}
+    box_animals = [box_to_animal_map.get(box_number) for box_number in box.categories]
+    animal_categories = pd.Index(sorted({animal_id for animal_id in box_animals if animal_id is not None}))
+    # Map Box codes to Animal codes (-1 for boxes without an animal, and for missing boxes via index -1)
+    box_code_to_animal_code = np.array(
+        [animal_categories.get_loc(animal_id) if animal_id is not None else -1 for animal_id in box_animals] + [-1]
     )
 
-    # Convert categorical types
-    df = df.astype({
-        "Animal": "category",
-        "Box": "category",
+    df = pd.DataFrame({
+        "DateTime": datetime_values,
+        # Add Timedelta columns
+        "Timedelta": datetime_values - np.datetime64(dataset.experiment_started, TIME_RESOLUTION_UNIT),
+        "Animal": pd.Categorical.from_codes(box_code_to_animal_code[box.codes], categories=animal_categories),
+        "Box": box,
+        "Y": pd.arrays.IntegerArray(y_values[:position], y_mask[:position]),
+        "X": x_values[:position],
     })
 
     raw_datatable = Datatable(
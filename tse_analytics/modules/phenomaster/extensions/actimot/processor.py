@@ -1,5 +1,4 @@
 import timeit
-from multiprocessing import Pool
 
 import numpy as np
 import pandas as pd
@@ -57,6 +56,52 @@ def get_centroid_lookup(value, value_range):
         return np.nan
 
 
+def _zero_bit_tables() -> tuple[np.ndarray, np.ndarray]:
+    # Per byte value: number of zero bits and the sum of their indices (0..7)
+    zero_bits = 1 - np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1, bitorder="little")
+    return zero_bits.sum(axis=1).astype(np.int32), (zero_bits @ np.arange(8)).astype(np.int32)
+
+
+ZERO_BITS_COUNT, ZERO_BITS_INDEX_SUM = _zero_bit_tables()
+
+# Rows decoded per step; bounds the temporary (rows x bytes) lookup arrays
+DECODE_CHUNK_SIZE = 1_000_000
+
+
+def decode_centroids(values: np.ndarray, bits_count: int) -> np.ndarray:
+    """Vectorized equivalent of ``get_centroid_lookup`` over a whole column of beam states.
+
+    Each value is a bit-packed beam state (bit ``i`` cleared = beam ``i`` interrupted). The
+    centroid is the mean index of the cleared bits among the lowest ``bits_count`` bits, or
+    NaN when no beam is interrupted. Values are split into bytes and decoded with per-byte
+    lookup tables (zero-bit count and zero-bit index sum), so no Python code runs per row.
+
+    Args:
+        values: Integer beam states (any integer dtype; negative values are read as two's complement).
+        bits_count: Number of beams (64 for X, 32 for Y); must be a multiple of 8.
+
+    Returns:
+        Float array of centroids, one per value.
+    """
+    bytes_count = bits_count // 8
+    values = np.ascontiguousarray(np.asarray(values).astype("<u8", copy=False))
+    byte_offsets = 8 * np.arange(bytes_count, dtype=np.int32)
+
+    result = np.empty(len(values), dtype=np.float64)
+    for start in range(0, len(values), DECODE_CHUNK_SIZE):
+        stop = start + DECODE_CHUNK_SIZE
+        chunk_bytes = values[start:stop].view(np.uint8).reshape(-1, 8)[:, :bytes_count]
+
+        counts = ZERO_BITS_COUNT[chunk_bytes]
+        index_sums = (ZERO_BITS_INDEX_SUM[chunk_bytes] + byte_offsets * counts).sum(axis=1)
+        counts = counts.sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[start:stop] = np.where(counts > 0, index_sums / counts, np.nan)
+
+    return result
+
+
 def get_centroid_x(value):
     return get_centroid_lookup(value, x_range)
 
@@ -70,13 +115,9 @@ def get_cent(row):
 
 
 def get_pixmap_and_centroid(x: int, y: int) -> (QPixmap, tuple):
-    bitmask = np.zeros([32, 64], dtype=np.uint8)
-
-    for index_x in x_range:
-        if get_normalized_bit(x, index_x) == 0:
-            for index_y in y_range:
-                if get_normalized_bit(y, index_y) == 0:
-                    bitmask[index_y, index_x] = 255
+    interrupted_x = (np.uint64(x) >> np.arange(64, dtype=np.uint64)) & np.uint64(1) == 0
+    interrupted_y = (np.uint64(y & 0xFFFFFFFF) >> np.arange(32, dtype=np.uint64)) & np.uint64(1) == 0
+    bitmask = np.where(np.outer(interrupted_y, interrupted_x), 255, 0).astype(np.uint8)
 
     centroid = [np.average(indices) for indices in np.where(bitmask == 255)]
 
@@ -86,10 +127,6 @@ def get_pixmap_and_centroid(x: int, y: int) -> (QPixmap, tuple):
     return pixmap, centroid
 
 
-def work(input):
-    return input[0], input[1].apply(get_centroid_lookup, value_range=input[2])
-
-
 def calculate_trj(source_df: pd.DataFrame, actimot_settings: ActimotSettings) -> (pd.DataFrame, traja.TrajaDataFrame):
     tic = timeit.default_timer()
 
@@ -100,33 +137,8 @@ def calculate_trj(source_df: pd.DataFrame, actimot_settings: ActimotSettings) ->
     first_timestamp = df.at[0, "DateTime"]
     df["time"] = df["DateTime"] - first_timestamp
 
-    # df = df.transform({"DateTime": lambda x: x, "X": get_centroid_x, "Y": get_centroid_y})
-    # df.rename(columns={"X": "x", "Y": "y"}, inplace=True)
-
-    # df[["x", "y"]] = df.apply(get_cent, axis=1).to_list()
-
-    output = {}
-    with Pool(processes=2) as pool:
-        # call the same function with different data in parallel
-        for result in pool.map(work, (("x", df["X"], x_range), ("y", df["Y"], y_range))):
-            # report the value to show progress
-            output[result[0]] = result[1]
-
-    # output = Parallel(n_jobs=2, backend="multiprocessing")(
-    #     delayed(work)(input) for input in (("x", df["X"], x_range), ("y", df["Y"], y_range))
-    # )
-
-    df["x"] = output["x"]
-    df["y"] = output["y"]
-
-    # df["x"] = df["X"].apply(get_centroid_lookup, value_range=x_range)
-    # df["y"] = df["Y"].apply(get_centroid_lookup, value_range=y_range)
-
-    # df["x"] = df["X"].map(lambda  x: get_centroid(x, x_range))
-    # df["y"] = df["Y"].map(lambda  x: get_centroid(x, y_range))
-
-    # df["x"] = df["X"].apply(get_centroid, value_range=x_range)
-    # df["y"] = df["Y"].apply(get_centroid, value_range=y_range)
+    df["x"] = decode_centroids(df["X"].to_numpy(dtype=np.uint64), len(x_range))
+    df["y"] = decode_centroids(df["Y"].to_numpy(dtype=np.int64), len(y_range))
 
     trj_df = traja.from_df(df=df)
     trj_df.spatial_units = "beams"
@@ -0,0 +1,273 @@
+"""Batch engine for per-box calorimetry fitting.
+
+Each box is fitted in a worker process of a persistent process pool. Only the raw columns the
+fitting needs (``DateTime``, ``Bin``, ``Offset``, ``O2``, ``CO2``) are shipped to the workers as
+NumPy arrays; the Main table rows stay in the calling process, where the predictions are
+combined with the measured values as results come back. The engine has no Qt dependency, so it
+can be driven from a ``Worker`` (with progress and cancellation) or headless for whole datasets;
+``get_calo_result`` is its ``tse_analytics.batch`` processor.
+"""
+
+import atexit
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.utils import get_html_table
+from tse_analytics.modules.phenomaster.extensions.calo.calo_settings import CaloSettings
+from tse_analytics.modules.phenomaster.extensions.calo.data.calo_box import CaloBox
+from tse_analytics.modules.phenomaster.extensions.calo.fitting_params import FittingParams
+from tse_analytics.modules.phenomaster.extensions.calo.fitting_result import FittingResult
+from tse_analytics.modules.phenomaster.extensions.calo.processor import (
+    build_fitting_result_df,
+    predict_box_measurements,
+)
+
+# Raw calo columns used by the fitting, with the dtype they are shipped as
+FITTING_COLUMNS = {
+    "DateTime": None,
+    "Bin": np.int64,
+    "Offset": np.float64,
+    "O2": np.float64,
+    "CO2": np.float64,
+}
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+@dataclass
+class CaloBatchResult:
+    report: str
+    fitting: pd.DataFrame
+
+
+@dataclass
+class CaloBoxJob:
+    """Inputs of one box fit: the box pair, its Main table rows and the raw arrays of both boxes."""
+
+    calo_box: CaloBox
+    main_df: pd.DataFrame
+    box_arrays: dict[str, np.ndarray]
+    ref_arrays: dict[str, np.ndarray]
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared fitting process pool, starting it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        # Never fork: the GUI process runs Qt and worker threads
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+        atexit.register(shutdown_process_pool)
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared fitting process pool, cancelling queued fits."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def get_calo_boxes(calo_datatable: Datatable) -> list[CaloBox]:
+    """List the boxes of a calo datatable that have a reference box assigned."""
+    ref_box_mapping = calo_datatable.metadata["ref_box_mapping"]
+    boxes = []
+    for box in calo_datatable.df["Box"].unique().tolist():
+        ref_box = ref_box_mapping.get(box, None)
+        if ref_box is not None:
+            boxes.append(CaloBox(box, ref_box))
+    return boxes
+
+
+def _column_array(column: pd.Series, dtype: type | None) -> np.ndarray:
+    if dtype is None:
+        return column.to_numpy()
+    if np.issubdtype(dtype, np.floating):
+        return column.to_numpy(dtype=dtype, na_value=np.nan)
+    return column.to_numpy(dtype=dtype)
+
+
+def prepare_jobs(calo_datatable: Datatable, calo_boxes: list[CaloBox]) -> list[CaloBoxJob]:
+    """Split the calo and Main tables into per-box fitting jobs.
+
+    The last bin is dropped (it is usually incomplete) and reference boxes are skipped.
+    Each table is grouped by box once; rows are gathered by position instead of per-box masks.
+    """
+    raw_df = calo_datatable.df
+    bin_numbers = sorted(raw_df["Bin"].unique().tolist())
+    raw_df = raw_df.loc[raw_df["Bin"] != bin_numbers[-1]]
+    main_df = calo_datatable.dataset.datatables["Main"].df
+    main_df = main_df.loc[main_df["Bin"] != bin_numbers[-1]]
+
+    raw_columns = {name: _column_array(raw_df[name], dtype) for name, dtype in FITTING_COLUMNS.items()}
+    raw_indices = raw_df.groupby("Box", observed=True, sort=False).indices
+    main_indices = main_df.groupby("Box", observed=True, sort=False).indices
+
+    def box_arrays(box: int) -> dict[str, np.ndarray]:
+        positions = raw_indices.get(box, np.empty(0, dtype=np.intp))
+        return {name: values[positions] for name, values in raw_columns.items()}
+
+    jobs = []
+    for calo_box in calo_boxes:
+        # skip analysis of reference boxes
+        if calo_box.ref_box is None:
+            continue
+
+        positions = main_indices.get(calo_box.box, np.empty(0, dtype=np.intp))
+        jobs.append(
+            CaloBoxJob(
+                calo_box,
+                main_df.iloc[positions].reset_index(drop=True),
+                box_arrays(calo_box.box),
+                box_arrays(calo_box.ref_box),
+            )
+        )
+    return jobs
+
+
+def _predict_box(
+    box_arrays: dict[str, np.ndarray], ref_arrays: dict[str, np.ndarray], calo_settings: CaloSettings
+) -> tuple[pd.DataFrame, pd.DataFrame, timedelta]:
+    # Runs in a worker process
+    return predict_box_measurements(pd.DataFrame(box_arrays), pd.DataFrame(ref_arrays), calo_settings)
+
+
+def iter_fitting_results(
+    jobs: list[CaloBoxJob],
+    calo_settings: CaloSettings,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> Iterator[FittingResult]:
+    """Fit all jobs on the shared process pool and yield the results in completion order.
+
+    Args:
+        jobs: Per-box jobs from ``prepare_jobs``.
+        calo_settings: Fitting settings.
+        is_cancelled: Polled between completions; once it returns True the queued fits are
+            cancelled and iteration stops.
+
+    Yields:
+        One ``FittingResult`` per box, as soon as its fit is complete.
+    """
+    pool = get_process_pool()
+    futures: dict[Future, CaloBoxJob] = {
+        pool.submit(_predict_box, job.box_arrays, job.ref_arrays, calo_settings): job for job in jobs
+    }
+    pending = set(futures)
+    try:
+        while pending:
+            if is_cancelled is not None and is_cancelled():
+                logger.info(f"Calorimetry fitting cancelled, {len(pending)} boxes skipped")
+                return
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = futures[future]
+                df_predicted, df_ref_predicted, sample_time = future.result()
+                result_df = build_fitting_result_df(job.main_df, df_predicted, df_ref_predicted, calo_settings.flow)
+                logger.info(
+                    f"Done! Box: {job.calo_box.box}, Ref box: {job.calo_box.ref_box}, Sample time: {sample_time}, "
+                    f"Number of bins: {len(df_predicted)}, Number of ref bins: {len(df_ref_predicted)}"
+                )
+                params = FittingParams(
+                    job.calo_box,
+                    job.main_df,
+                    pd.DataFrame(job.box_arrays),
+                    pd.DataFrame(job.ref_arrays),
+                    calo_settings,
+                )
+                yield FittingResult(job.calo_box.box, params, result_df)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def run_calo_batch(
+    calo_datatable: Datatable,
+    calo_boxes: list[CaloBox] | None,
+    calo_settings: CaloSettings,
+    progress_callback: Callable[[int, int], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> dict[int, FittingResult]:
+    """Fit the given boxes (all boxes with a reference box if None) of a calo datatable.
+
+    Args:
+        calo_datatable: Raw calo datatable; its dataset must have a Main table.
+        calo_boxes: Boxes to fit, or None for the whole dataset.
+        calo_settings: Fitting settings.
+        progress_callback: Called with (completed boxes, total boxes) after each box.
+        is_cancelled: Polled while fitting; returning True stops the batch early.
+
+    Returns:
+        Fitting results of the completed boxes, by box number.
+    """
+    if calo_boxes is None:
+        calo_boxes = get_calo_boxes(calo_datatable)
+    jobs = prepare_jobs(calo_datatable, calo_boxes)
+
+    results: dict[int, FittingResult] = {}
+    if progress_callback is not None:
+        progress_callback(0, len(jobs))
+    for result in iter_fitting_results(jobs, calo_settings, is_cancelled):
+        results[result.box_number] = result
+        if progress_callback is not None:
+            progress_callback(len(results), len(jobs))
+    return results
+
+
+def get_calo_result(
+    datatable: Datatable,
+    boxes: list[int] | None = None,
+    iterations: int | None = None,
+    prediction_offset: int | None = None,
+    flow: float | None = None,
+) -> CaloBatchResult:
+    """Fit the boxes of a raw calo datatable with the default fitting settings.
+
+    Args:
+        datatable: Raw calo datatable; its dataset must have a Main table.
+        boxes: Boxes to fit, or None for all boxes with a reference box.
+        iterations: Overrides the number of fitting iterations.
+        prediction_offset: Overrides the prediction offset.
+        flow: Overrides the flow used to compute the predicted RER, VO2, VCO2 and EE.
+
+    Returns:
+        The measured and predicted values of all fitted boxes, and a report of their mean per box.
+
+    Raises:
+        ValueError: If a requested box has no reference box.
+    """
+    calo_settings = CaloSettings.get_default()
+    if iterations is not None:
+        calo_settings.iterations = iterations
+    if prediction_offset is not None:
+        calo_settings.prediction_offset = prediction_offset
+    if flow is not None:
+        calo_settings.flow = flow
+
+    calo_boxes = get_calo_boxes(datatable)
+    if boxes is not None:
+        missing = sorted(set(boxes) - {calo_box.box for calo_box in calo_boxes})
+        if missing:
+            raise ValueError(f"Boxes without reference box: {', '.join(str(box) for box in missing)}")
+        calo_boxes = [calo_box for calo_box in calo_boxes if calo_box.box in boxes]
+
+    results = run_calo_batch(datatable, calo_boxes, calo_settings)
+    fitting_df = pd.concat(
+        [results[box_number].df.assign(Box=box_number) for box_number in sorted(results)],
+        ignore_index=True,
+    )
+    fitting_df.insert(0, "Box", fitting_df.pop("Box"))
+    report = get_html_table(fitting_df.groupby("Box").mean(numeric_only=True), "Calorimetry fitting (mean per box)")
+
+    return CaloBatchResult(
+        report=report,
+        fitting=fitting_df,
+    )
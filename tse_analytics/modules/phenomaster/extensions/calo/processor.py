@@ -13,58 +13,83 @@ from tse_analytics.modules.phenomaster.extensions.calo.fitting_result import Fit
 
 
 def process_box(params: FittingParams) -> FittingResult:
-    # Calo Sample time [sec]
-    sample_time = params.box_df.iloc[1].at["DateTime"] - params.box_df.iloc[0].at["DateTime"]
+    df_predicted_measurements, df_ref_predicted_measurements, sample_time = predict_box_measurements(
+        params.box_df, params.ref_df, params.calo_settings
+    )
 
-    bin_numbers = sorted(params.box_df["Bin"].unique().tolist())
-    ref_bin_numbers = sorted(params.ref_df["Bin"].unique().tolist())
+    result_df = build_fitting_result_df(
+        params.main_df, df_predicted_measurements, df_ref_predicted_measurements, params.calo_settings.flow
+    )
+
+    bin_numbers = params.box_df["Bin"].unique()
+    ref_bin_numbers = params.ref_df["Bin"].unique()
+    logger.info(
+        f"Done! Box: {params.calo_box.box}, Ref box: {params.calo_box.ref_box}, Sample time: {sample_time}, "
+        f"Number of bins: {len(bin_numbers)}, Number of ref bins: {len(ref_bin_numbers)}"
+    )
+
+    return FittingResult(
+        params.calo_box.box,
+        params,
+        result_df,
+    )
+
+
+def predict_box_measurements(
+    box_df: pd.DataFrame, ref_df: pd.DataFrame, calo_settings: CaloSettings
+) -> tuple[pd.DataFrame, pd.DataFrame, timedelta]:
+    """Predict the per-bin O2/CO2 of a box and of its reference box.
+
+    Only the ``DateTime``, ``Bin``, ``Offset``, ``O2`` and ``CO2`` columns of the raw frames are used.
+    """
+    # Calo Sample time [sec]
+    sample_time = box_df.iloc[1].at["DateTime"] - box_df.iloc[0].at["DateTime"]
 
     # if len(ref_bin_numbers) > len(bin_numbers):
     #     print(ref_bin_numbers[-1])
     #     df_ref_box = df_ref_box.loc[df_ref_box["Bin"] != ref_bin_numbers[-1]]
 
-    df_predicted_measurements = calculate_predicted_measurements(
-        params.box_df, sample_time, params.calo_settings, False
-    )
+    df_predicted_measurements = calculate_predicted_measurements(box_df, sample_time, calo_settings, False)
 
-    df_ref_predicted_measurements = calculate_predicted_measurements(
-        params.ref_df, sample_time, params.calo_settings, True
-    )
+    df_ref_predicted_measurements = calculate_predicted_measurements(ref_df, sample_time, calo_settings, True)
 
-    predicted_rer = []
-    predicted_vo2 = []
-    predicted_vco2 = []
-    predicted_h = []
-    for bin_number in range(len(df_predicted_measurements)):
-        ref_bin_data = df_ref_predicted_measurements[df_ref_predicted_measurements["Bin"] == bin_number]
-        ref_o2 = ref_bin_data.iloc[0]["O2"]
-        ref_co2 = ref_bin_data.iloc[0]["CO2"]
+    return df_predicted_measurements, df_ref_predicted_measurements, sample_time
 
-        bin_data = df_predicted_measurements[df_predicted_measurements["Bin"] == bin_number]
-        o2 = bin_data.iloc[0]["O2"]
-        co2 = bin_data.iloc[0]["CO2"]
 
-        rer, vo2, vco2, h = calculate_rer(ref_o2, o2, ref_co2, co2, params.calo_settings.flow)
+def build_fitting_result_df(
+    main_df: pd.DataFrame,
+    df_predicted_measurements: pd.DataFrame,
+    df_ref_predicted_measurements: pd.DataFrame,
+    flow: float,
+) -> pd.DataFrame:
+    """Combine the measured values of the Main table with the predicted values of a box."""
+    # Align the predictions of both boxes by bin number (0..n-1) instead of scanning per bin
+    bin_numbers = range(len(df_predicted_measurements))
+    predicted = df_predicted_measurements.drop_duplicates("Bin").set_index("Bin").reindex(bin_numbers)
+    ref_predicted = df_ref_predicted_measurements.drop_duplicates("Bin").set_index("Bin").reindex(bin_numbers)
 
-        predicted_rer.append(rer)
-        predicted_vo2.append(vo2)
-        predicted_vco2.append(vco2)
-        predicted_h.append(h)
+    predicted_rer, predicted_vo2, predicted_vco2, predicted_h = calculate_rer(
+        ref_predicted["O2"].to_numpy(dtype=np.float64),
+        predicted["O2"].to_numpy(dtype=np.float64),
+        ref_predicted["CO2"].to_numpy(dtype=np.float64),
+        predicted["CO2"].to_numpy(dtype=np.float64),
+        flow,
+    )
 
     # measured_rer = params.general_df['RER']
     # if len(predicted_rer) > len(measured_rer):
     #     predicted_rer = predicted_rer[0:-1]
 
-    bins = params.main_df["Bin"].tolist()
+    bins = main_df["Bin"].tolist()
 
-    measured_rer = params.main_df["RER"].tolist()
-    measured_o2 = params.main_df["O2"].tolist()
-    measured_ref_o2 = params.main_df["Ref.O2"].tolist() if "Ref.O2" in params.main_df.columns else None
-    measured_co2 = params.main_df["CO2"].tolist()
-    measured_ref_co2 = params.main_df["Ref.CO2"].tolist() if "Ref.CO2" in params.main_df.columns else None
-    measured_vo2 = params.main_df["VO2"].tolist()
-    measured_vco2 = params.main_df["VCO2"].tolist()
-    measured_h = params.main_df["EE"].tolist()
+    measured_rer = main_df["RER"].tolist()
+    measured_o2 = main_df["O2"].tolist()
+    measured_ref_o2 = main_df["Ref.O2"].tolist() if "Ref.O2" in main_df.columns else None
+    measured_co2 = main_df["CO2"].tolist()
+    measured_ref_co2 = main_df["Ref.CO2"].tolist() if "Ref.CO2" in main_df.columns else None
+    measured_vo2 = main_df["VO2"].tolist()
+    measured_vco2 = main_df["VCO2"].tolist()
+    measured_h = main_df["EE"].tolist()
 
     predicted_o2 = df_predicted_measurements["O2"].tolist()
     predicted_ref_o2 = df_ref_predicted_measurements["O2"].tolist()
@@ -72,7 +97,7 @@ def process_box(params: FittingParams) -> FittingResult:
     predicted_co2 = df_predicted_measurements["CO2"].tolist()
     predicted_ref_co2 = df_ref_predicted_measurements["CO2"].tolist()
 
-    result_df = pd.DataFrame(
+    return pd.DataFrame(
         data={
             "Bin": bins,
             "O2": measured_o2,
@@ -84,27 +109,16 @@ def process_box(params: FittingParams) -> FittingResult:
             "Ref.CO2": measured_ref_co2,
             "Ref.CO2-p": predicted_ref_co2,
             "RER": measured_rer,
-            "RER-p": predicted_rer,
+            "RER-p": predicted_rer.tolist(),
             "VO2": measured_vo2,
-            "VO2-p": predicted_vo2,
+            "VO2-p": predicted_vo2.tolist(),
             "VCO2": measured_vco2,
-            "VCO2-p": predicted_vco2,
+            "VCO2-p": predicted_vco2.tolist(),
             "EE": measured_h,
-            "EE-p": predicted_h,
+            "EE-p": predicted_h.tolist(),
         }
     )
 
-    logger.info(
-        f"Done! Box: {params.calo_box.box}, Ref box: {params.calo_box.ref_box}, Sample time: {sample_time}, "
-        f"Number of bins: {len(bin_numbers)}, Number of ref bins: {len(ref_bin_numbers)}"
-    )
-
-    return FittingResult(
-        params.calo_box.box,
-        params,
-        result_df,
-    )
-
 
 def curve_fitting_func(x, a, b, c):
     return a * np.power(x, b) + c
@@ -115,8 +129,7 @@ def calculate_rer(o2_ref, o2, co2_ref, co2, flow):
     dco2 = co2 - co2_ref
 
     n2_ref = 100.0 - (o2_ref + co2_ref)  # -0.8
-    if n2_ref < 0.001:
-        n2_ref = 0.001  # Division durch Null vermeiden
+    n2_ref = np.maximum(n2_ref, 0.001)  # Division durch Null vermeiden
 
     v1 = n2_ref * do2
     v2 = o2_ref * (do2 - dco2)
@@ -196,43 +209,194 @@ def calculate_fit_v2(
     return a, b, c
 
 
+# Number of exponent candidates evaluated per bin before the golden-section refinement
+EXPONENT_GRID_SIZE = 256
+EXPONENT_REFINE_ITERATIONS = 60
+_GOLDEN_RATIO = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _linear_power_fit(
+    x: np.ndarray, y: np.ndarray, weights: np.ndarray, b: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Least-squares ``a`` and ``c`` of ``a * x**b + c`` for fixed exponents ``b``, with the residual sum of squares.
+
+    ``x``, ``y`` and ``weights`` have shape (bins, points); ``b`` has shape (bins, k) and the results (bins, k).
+    ``x`` must be scaled so that ``x**b`` stays well-conditioned (see ``fit_power_curves``).
+    """
+    phi = np.power(x[:, np.newaxis, :], b[:, :, np.newaxis])
+    w = weights[:, np.newaxis, :]
+    n = weights.sum(axis=1)[:, np.newaxis]
+    phi_mean = (w * phi).sum(axis=2) / n
+    y_mean = ((weights * y).sum(axis=1) / n[:, 0])[:, np.newaxis]
+    phi_centered = phi - phi_mean[:, :, np.newaxis]
+    y_centered = (y - y_mean)[:, np.newaxis, :]
+    s_pp = (w * phi_centered * phi_centered).sum(axis=2)
+    s_py = (w * phi_centered * y_centered).sum(axis=2)
+    s_yy = (w * y_centered * y_centered).sum(axis=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        a = s_py / s_pp
+        sse = s_yy - s_py * a
+    c = y_mean - a * phi_mean
+    return a, c, sse
+
+
+def fit_power_curves(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray,
+    bounds: tuple[tuple[float, float, float], tuple[float, float, float]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fit ``a * x**b + c`` to many bins at once.
+
+    For a fixed exponent ``b`` the model is linear in ``a`` and ``c``, so the fit reduces to a
+    one-dimensional search over ``b`` (variable projection): all bins are evaluated on a grid of
+    exponents within ``bounds`` with closed-form stacked least squares, then the best exponent of
+    each bin is refined by a vectorized golden-section search.
+
+    A bin is reported as not converged when its optimum lies on the exponent bounds, violates the
+    ``a`` bounds or ``c >= 0``, or it has fewer than three points; such bins should be refitted
+    with ``calculate_fit_v2``.
+
+    Args:
+        x: Offsets, shape (bins, points); must be positive where weights are set.
+        y: Measurements, shape (bins, points).
+        weights: 1.0 for points that belong to the bin, 0.0 for padding.
+        bounds: ``((a_min, b_min, c_min), (a_max, b_max, c_max))`` as for ``calculate_fit_v2``.
+
+    Returns:
+        Arrays ``a``, ``b``, ``c`` and the boolean ``converged`` mask, one value per bin.
+    """
+    (a_min, b_min, _), (a_max, b_max, _) = bounds
+    bins_count = x.shape[0]
+    valid = weights > 0
+    points_count = valid.sum(axis=1)
+
+    # Scale offsets by the first offset of each bin so that x**b stays close to 1
+    x_scale = np.where(valid, x, np.inf).min(axis=1)
+    x_scale = np.where(np.isfinite(x_scale) & (x_scale > 0), x_scale, 1.0)
+    x_scaled = np.where(valid, x / x_scale[:, np.newaxis], 1.0)
+    y = np.where(valid, y, 0.0)
+
+    grid = np.linspace(b_min, b_max, EXPONENT_GRID_SIZE)
+    _, _, sse = _linear_power_fit(x_scaled, y, weights, np.broadcast_to(grid, (bins_count, grid.size)))
+    best = np.nanargmin(np.where(np.isfinite(sse), sse, np.inf), axis=1)
+
+    # Golden-section search between the grid neighbours of the best exponent
+    low = grid[np.maximum(best - 1, 0)]
+    high = grid[np.minimum(best + 1, grid.size - 1)]
+    for _ in range(EXPONENT_REFINE_ITERATIONS):
+        step = _GOLDEN_RATIO * (high - low)
+        left = high - step
+        right = low + step
+        _, _, sse = _linear_power_fit(x_scaled, y, weights, np.stack([left, right], axis=1))
+        left_better = ~(sse[:, 0] > sse[:, 1])
+        high = np.where(left_better, right, high)
+        low = np.where(left_better, low, left)
+    b = (low + high) / 2.0
+
+    a_scaled, c, _ = _linear_power_fit(x_scaled, y, weights, b[:, np.newaxis])
+    a = a_scaled[:, 0] / np.power(x_scale, b)
+    c = c[:, 0]
+
+    converged = (
+        (best > 0)
+        & (best < grid.size - 1)
+        & (points_count >= 3)
+        & np.isfinite(a)
+        & np.isfinite(c)
+        & (a >= a_min)
+        & (a <= a_max)
+        & (c >= 0.0)
+    )
+    return a, b, c, converged
+
+
+def _training_windows(
+    df: pd.DataFrame, bin_positions: list[np.ndarray], gas_name: str, start_offset: int, end_offset: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Padded (bins, points) offsets, measurements and weights of the ``iloc[start:end]`` rows of each bin."""
+    windows = [positions[start_offset:end_offset] for positions in bin_positions]
+    width = max((len(window) for window in windows), default=0)
+    rows = np.zeros((len(windows), width), dtype=np.intp)
+    weights = np.zeros((len(windows), width), dtype=np.float64)
+    for i, window in enumerate(windows):
+        rows[i, : len(window)] = window
+        weights[i, : len(window)] = 1.0
+
+    offsets = df["Offset"].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+    values = df[gas_name].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+    weights[~(np.isfinite(offsets) & np.isfinite(values))] = 0.0
+    return offsets, values, weights
+
+
+def _predict_gas(
+    df: pd.DataFrame,
+    bin_positions: list[np.ndarray],
+    gas_name: str,
+    start_offset: int,
+    end_offset: int,
+    bounds: tuple[tuple[float, float, float], tuple[float, float, float]],
+    iterations: int,
+    prediction_x: float,
+) -> np.ndarray:
+    offsets, values, weights = _training_windows(df, bin_positions, gas_name, start_offset, end_offset)
+    a, b, c, converged = fit_power_curves(offsets, values, weights, bounds)
+
+    not_converged = np.flatnonzero(~converged)
+    if len(not_converged) > 0:
+        logger.debug(f"{gas_name}: {len(not_converged)} of {len(converged)} bins refitted with lmfit")
+    for i in not_converged:
+        training_data = df.iloc[bin_positions[i][start_offset:end_offset]]
+        a[i], b[i], c[i] = calculate_fit_v2(training_data, gas_name, iterations, bounds)
+
+    return curve_fitting_func(prediction_x, a, b, c)
+
+
 def calculate_predicted_measurements(
     df: pd.DataFrame, sample_time: timedelta, calo_data_settings: CaloSettings, is_ref: bool
 ):
-    bins = df["Bin"].unique().tolist()
-    offsets = []
-    o2 = []
-    co2 = []
-
-    start_offset_o2 = calo_data_settings.o2_settings.start_offset
-    end_offset_o2 = calo_data_settings.o2_settings.end_offset
-
-    start_offset_co2 = calo_data_settings.co2_settings.start_offset
-    end_offset_co2 = calo_data_settings.co2_settings.end_offset
-
-    o2_bounds = calo_data_settings.o2_settings.ref_bounds if is_ref else calo_data_settings.o2_settings.bounds
-    co2_bounds = calo_data_settings.co2_settings.ref_bounds if is_ref else calo_data_settings.co2_settings.bounds
-
-    for _idx, bin in enumerate(bins):
-        predicted_bin_measurements = calculate_predicted_bin_measurements(
-            bin,
-            df,
-            sample_time,
-            calo_data_settings.prediction_offset,
-            start_offset_o2,
-            end_offset_o2,
-            start_offset_co2,
-            end_offset_co2,
-            calo_data_settings.iterations,
-            o2_bounds,
-            co2_bounds,
-        )
-
-        offsets.append(predicted_bin_measurements[0])
-        o2.append(predicted_bin_measurements[1])
-        co2.append(predicted_bin_measurements[2])
-
-    calculated_df = pd.DataFrame(data={"Offset": offsets, "Bin": bins, "O2": o2, "CO2": co2})
+    """Predict the O2/CO2 of every bin with a batched fit (see ``fit_power_curves``).
+
+    The table is grouped by bin once; bins whose batched fit does not converge fall back to the
+    per-bin lmfit fit of ``calculate_predicted_bin_measurements``.
+    """
+    bin_values = df["Bin"].to_numpy()
+    bins, first_index, inverse = np.unique(bin_values, return_index=True, return_inverse=True)
+    # Keep the order of appearance of the bins, and the row order within each bin
+    appearance_order = np.argsort(first_index, kind="stable")
+    rows_by_bin = np.argsort(inverse, kind="stable")
+    splits = np.cumsum(np.bincount(inverse, minlength=len(bins)))[:-1]
+    positions = np.split(rows_by_bin, splits)
+    bin_positions = [positions[i] for i in appearance_order]
+    bins = bins[appearance_order].tolist()
+
+    o2_settings = calo_data_settings.o2_settings
+    co2_settings = calo_data_settings.co2_settings
+    prediction_x = calo_data_settings.prediction_offset * sample_time.total_seconds()
+
+    o2 = _predict_gas(
+        df,
+        bin_positions,
+        "O2",
+        o2_settings.start_offset,
+        o2_settings.end_offset,
+        o2_settings.ref_bounds if is_ref else o2_settings.bounds,
+        calo_data_settings.iterations,
+        prediction_x,
+    )
+    co2 = _predict_gas(
+        df,
+        bin_positions,
+        "CO2",
+        co2_settings.start_offset,
+        co2_settings.end_offset,
+        co2_settings.ref_bounds if is_ref else co2_settings.bounds,
+        calo_data_settings.iterations,
+        prediction_x,
+    )
+
+    offsets = [calo_data_settings.prediction_offset] * len(bins)
+    calculated_df = pd.DataFrame(data={"Offset": offsets, "Bin": bins, "O2": o2.tolist(), "CO2": co2.tolist()})
     return calculated_df
 
 
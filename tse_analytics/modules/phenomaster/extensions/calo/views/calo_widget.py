@@ -1,20 +1,19 @@
-import os
 import timeit
-from multiprocessing import Pool
 
 from pyqttoast import ToastPreset
 from PySide6.QtCore import QSettings, QSize, Qt
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QMessageBox, QToolBar, QWidget
+from PySide6.QtWidgets import QMessageBox, QProgressBar, QToolBar, QWidget
 
 from tse_analytics.core import messaging
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.toaster import make_toast
+from tse_analytics.core.workers.task_manager import TaskManager
+from tse_analytics.core.workers.worker import Worker
+from tse_analytics.modules.phenomaster.extensions.calo.batch import run_calo_batch
 from tse_analytics.modules.phenomaster.extensions.calo.calo_settings import CaloSettings
 from tse_analytics.modules.phenomaster.extensions.calo.data.calo_box import CaloBox
-from tse_analytics.modules.phenomaster.extensions.calo.fitting_params import FittingParams
 from tse_analytics.modules.phenomaster.extensions.calo.fitting_result import FittingResult
-from tse_analytics.modules.phenomaster.extensions.calo.processor import process_box
 from tse_analytics.modules.phenomaster.extensions.calo.views.bin_selector import BinSelector
 from tse_analytics.modules.phenomaster.extensions.calo.views.box_selector import BoxSelector
 from tse_analytics.modules.phenomaster.extensions.calo.views.calo_widget_ui import Ui_CaloWidget
@@ -53,6 +52,8 @@ class CaloWidget(QWidget):
         self.selected_boxes: list[CaloBox] = []
         self.selected_bins: list[int] = []
         self.fitting_results: dict[int, FittingResult] = {}
+        self.worker: Worker | None = None
+        self.tic = None
 
         # Setup toolbar
         toolbar = QToolBar(
@@ -64,6 +65,9 @@ class CaloWidget(QWidget):
             QIcon(":/icons/preprocess.png"), "Calculate prediction for selected boxes"
         )
         self.preprocess_action.triggered.connect(self._calculate)
+        self.cancel_action = toolbar.addAction(QIcon(":/icons/icons8-remove-16.png"), "Cancel")
+        self.cancel_action.setEnabled(False)
+        self.cancel_action.triggered.connect(self._cancel)
         self.reset_action = toolbar.addAction(QIcon(":/icons/icons8-undo-16.png"), "Reset settings")
         self.reset_action.triggered.connect(self._reset_settings)
         self.add_datatable_action = toolbar.addAction(
@@ -72,6 +76,12 @@ class CaloWidget(QWidget):
         self.add_datatable_action.setEnabled(False)
         self.add_datatable_action.triggered.connect(self._append_to_datatable)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setFormat("%v/%m boxes")
+        self.progress_bar_action = toolbar.addWidget(self.progress_bar)
+        self.progress_bar_action.setVisible(False)
+
         self.ui.verticalLayout.insertWidget(0, toolbar)
 
         self.calo_table_view = DataTableWidget(calo_datatable, "Calorimetry Data")
@@ -179,50 +189,56 @@ class CaloWidget(QWidget):
 
         calo_settings = self.calo_settings_widget.get_calo_settings()
 
-        # remove last bin
-        bin_numbers = sorted(self.calo_datatable.df["Bin"].unique().tolist())
-        raw_df = self.calo_datatable.df.loc[self.calo_datatable.df["Bin"] != bin_numbers[-1]]
-        df = self.calo_datatable.dataset.datatables["Main"].df.loc[
-            self.calo_datatable.dataset.datatables["Main"].df["Bin"] != bin_numbers[-1]
-        ]
-
-        fitting_params_list: list[FittingParams] = []
-
-        for calo_box in self.selected_boxes:
-            # skip analysis of reference boxes
-            if calo_box.ref_box is None:
-                continue
+        self.fitting_results.clear()
+        self.preprocess_action.setEnabled(False)
+        self.add_datatable_action.setEnabled(False)
+        self.cancel_action.setEnabled(True)
+        self.progress_bar.reset()
+        self.progress_bar_action.setVisible(True)
+
+        self.tic = timeit.default_timer()
+        self.worker = Worker(run_calo_batch, self.calo_datatable, list(self.selected_boxes), calo_settings)
+        self.worker.kwargs.update(
+            progress_callback=self.worker.signals.progress.emit,
+            is_cancelled=self.worker.is_cancelled,
+        )
+        self.worker.signals.progress.connect(self._work_progress)
+        self.worker.signals.result.connect(self._work_result)
+        self.worker.signals.finished.connect(self._work_finished)
+        TaskManager.start_task(self.worker)
 
-            # TODO: check int -> str conversion for general table!
-            # general_df = df[df["Box"] == str(calo_box.box)].copy()
-            main_df = df[df["Box"] == calo_box.box].copy()
-            box_df = raw_df[raw_df["Box"] == calo_box.box].copy()
-            ref_df = raw_df[raw_df["Box"] == calo_box.ref_box].copy()
+    def _cancel(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_action.setEnabled(False)
 
-            params = FittingParams(calo_box, main_df, box_df, ref_df, calo_settings)
-            fitting_params_list.append(params)
+    def _work_progress(self, completed: int, total: int) -> None:
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(completed)
 
-        self.fitting_results.clear()
-        # create the process pool
-        processes = len(self.selected_boxes) if len(self.selected_boxes) < os.cpu_count() else os.cpu_count()
-        tic = timeit.default_timer()
-        with Pool(processes=processes) as pool:
-            # call the same function with different data in parallel
-            for result in pool.map(process_box, fitting_params_list):
-                # report the value to show progress
-                self.fitting_results[result.box_number] = result
+    def _work_result(self, fitting_results: dict[int, FittingResult]) -> None:
+        self.fitting_results.update(fitting_results)
 
+        cancelled = self.worker is not None and self.worker.is_cancelled()
         make_toast(
             self,
             "Calorimetry Analysis",
-            f"Processing complete in {timeit.default_timer() - tic} sec.",
+            f"Processing {'cancelled' if cancelled else 'complete'} in {timeit.default_timer() - self.tic} sec.",
             duration=3000,
-            preset=ToastPreset.SUCCESS,
+            preset=ToastPreset.WARNING if cancelled else ToastPreset.SUCCESS,
             show_duration_bar=True,
             echo_to_logger=True,
         ).show()
 
-        self.add_datatable_action.setEnabled(True)
+        if len(self.selected_boxes) == 1 and self.selected_boxes[0].box in self.fitting_results:
+            self.calo_rer_widget.set_data(self.fitting_results[self.selected_boxes[0].box])
+
+    def _work_finished(self) -> None:
+        self.worker = None
+        self.preprocess_action.setEnabled(True)
+        self.cancel_action.setEnabled(False)
+        self.progress_bar_action.setVisible(False)
+        self.add_datatable_action.setEnabled(len(self.fitting_results) > 0)
 
     def _destroyed(self) -> None:
         """Save widget settings via QSettings on destruction."""
@@ -0,0 +1,126 @@
+"""Batch processors for the DrinkFeed analyses.
+
+Headless counterparts of the DrinkFeed widget for ``tse_analytics.batch``: they take the analysis
+settings as plain JSON values, run the sequential or interval processor on a raw DrinkFeed datatable
+and return its tables with a per-animal summary report.
+"""
+
+from dataclasses import dataclass
+from datetime import time
+
+import pandas as pd
+
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.core.utils import get_html_table
+from tse_analytics.modules.phenomaster.extensions.drinkfeed.drinkfeed_settings import DrinkFeedSettings
+from tse_analytics.modules.phenomaster.extensions.drinkfeed.interval_processor import process_drinkfeed_intervals
+from tse_analytics.modules.phenomaster.extensions.drinkfeed.sequential_processor import process_drinkfeed_sequences
+from tse_analytics.toolbox.result_cache import cached_result
+
+
+@dataclass
+class DrinkFeedSequencesResult:
+    report: str
+    events: pd.DataFrame
+    episodes: pd.DataFrame
+
+
+@dataclass
+class DrinkFeedIntervalsResult:
+    report: str
+    intervals: pd.DataFrame
+
+
+def _get_settings(
+    sequential_analysis_type: bool,
+    intermeal_interval: str | None = None,
+    drinking_minimum_amount: float | None = None,
+    feeding_minimum_amount: float | None = None,
+    fixed_interval: str | None = None,
+) -> DrinkFeedSettings:
+    settings = DrinkFeedSettings.get_default()
+    settings.sequential_analysis_type = sequential_analysis_type
+    if intermeal_interval is not None:
+        settings.intermeal_interval = time.fromisoformat(intermeal_interval)
+    if drinking_minimum_amount is not None:
+        settings.drinking_minimum_amount = drinking_minimum_amount
+    if feeding_minimum_amount is not None:
+        settings.feeding_minimum_amount = feeding_minimum_amount
+    if fixed_interval is not None:
+        settings.fixed_interval = time.fromisoformat(fixed_interval)
+    return settings
+
+
+def _get_diets_dict(datatable: Datatable, diets: dict[str, float] | None) -> dict[str, float]:
+    # Like the widget's animal selector: every animal, without caloric value unless given
+    diets = diets or {}
+    return {animal: diets.get(animal, pd.NA) for animal in datatable.dataset.animals}
+
+
+@cached_result
+def get_drinkfeed_sequences_result(
+    datatable: Datatable,
+    intermeal_interval: str | None = None,
+    drinking_minimum_amount: float | None = None,
+    feeding_minimum_amount: float | None = None,
+    diets: dict[str, float] | None = None,
+) -> DrinkFeedSequencesResult:
+    """Detect the drinking and feeding episodes of a raw DrinkFeed datatable.
+
+    Args:
+        datatable: Raw DrinkFeed datatable.
+        intermeal_interval: Longest pause within an episode as ``"HH:MM:SS"``; default 5 minutes.
+        drinking_minimum_amount: Smallest drinking episode quantity; default 0.05.
+        feeding_minimum_amount: Smallest feeding episode quantity; default 0.05.
+        diets: Caloric value of the diet by animal, for the ``Quantity[kcal]`` column.
+
+    Returns:
+        The events and episodes tables, and a report of the episodes per animal and sensor.
+    """
+    settings = _get_settings(True, intermeal_interval, drinking_minimum_amount, feeding_minimum_amount)
+    events_datatable, episodes_datatable = process_drinkfeed_sequences(
+        datatable, settings, _get_diets_dict(datatable, diets)
+    )
+
+    episodes_df = episodes_datatable.df
+    summary_df = episodes_df.groupby(["Animal", "Sensor"], observed=True).agg(
+        Episodes=("Id", "count"),
+        Quantity=("Quantity", "sum"),
+        Duration=("Duration[minutes]", "sum"),
+    )
+    report = get_html_table(summary_df, "DrinkFeed episodes")
+
+    return DrinkFeedSequencesResult(
+        report=report,
+        events=events_datatable.df,
+        episodes=episodes_df,
+    )
+
+
+@cached_result
+def get_drinkfeed_intervals_result(
+    datatable: Datatable,
+    fixed_interval: str | None = None,
+    diets: dict[str, float] | None = None,
+) -> DrinkFeedIntervalsResult:
+    """Aggregate a raw DrinkFeed datatable into fixed intervals.
+
+    Args:
+        datatable: Raw DrinkFeed datatable.
+        fixed_interval: Interval length as ``"HH:MM:SS"``; default 1 hour.
+        diets: Caloric value of the diet by animal, for the caloric columns of the feeding sensors.
+
+    Returns:
+        The intervals table, and a report of the interval totals per animal.
+    """
+    settings = _get_settings(False, fixed_interval=fixed_interval)
+    intervals_datatable = process_drinkfeed_intervals(datatable, settings, _get_diets_dict(datatable, diets))
+
+    intervals_df = intervals_datatable.df
+    summary_df = intervals_df.groupby("Animal", observed=True)[list(intervals_datatable.variables)].sum()
+    report = get_html_table(summary_df, "DrinkFeed interval totals")
+
+    return DrinkFeedIntervalsResult(
+        report=report,
+        intervals=intervals_df,
+    )
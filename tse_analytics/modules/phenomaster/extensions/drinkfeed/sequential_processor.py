@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from tse_analytics.core.data.datatable import Datatable
@@ -23,25 +24,8 @@ def process_drinkfeed_sequences(
     long_df = long_df.loc[long_df["Value"] != 0]
     long_df = long_df.sort_values(by=["Timedelta"]).reset_index(drop=True)
 
-    sensors = long_df["Sensor"].unique().tolist()
-
-    events_parts: list[pd.DataFrame] = []
-    episodes_parts: list[pd.DataFrame] = []
-    for animal_id in datatable.dataset.animals.keys():
-        animal_df = long_df[long_df["Animal"] == animal_id]
-        animal_events_df, animal_episodes_df = _process_animal(
-            animal_id,
-            animal_df,
-            sensors,
-            settings,
-        )
-        if not animal_events_df.empty:
-            events_parts.append(animal_events_df)
-        if not animal_episodes_df.empty:
-            episodes_parts.append(animal_episodes_df)
-
-    events_df = pd.concat(events_parts, ignore_index=True) if events_parts else pd.DataFrame()
-    episodes_df = pd.concat(episodes_parts, ignore_index=True) if episodes_parts else pd.DataFrame()
+    events_df, episode_numbers = _extract_events(long_df, list(datatable.dataset.animals.keys()), settings)
+    episodes_df = _extract_episodes(events_df, episode_numbers)
 
     # Add caloric value column
     episodes_df.insert(
@@ -210,52 +194,36 @@ def _reshape_episodes_to_wide(long_df: pd.DataFrame) -> tuple[pd.DataFrame, dict
     return wide, variables
 
 
-def _process_animal(
-    animal_id: str,
-    df: pd.DataFrame,
-    sensors: list[str],
+def _extract_events(
+    long_df: pd.DataFrame,
+    animal_ids: list[str],
     settings: DrinkFeedSettings,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
-    events_parts: list[pd.DataFrame] = []
-    episodes_parts: list[pd.DataFrame] = []
-    for sensor in sensors:
-        # Ignore Weight sensor
-        if sensor == "Weight":
-            continue
-
-        sensor_df = df[df["Sensor"] == sensor]
-        sensor_events_df = _extract_sensor_events(
-            sensor_df,
-            sensor,
-            settings,
-        )
-        if not sensor_events_df.empty:
-            events_parts.append(sensor_events_df)
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Assign episode ids to the events of all animals and sensors in a single pass.
 
-        sensor_episodes_df = _extract_sensor_episodes(
-            animal_id,
-            sensor_events_df,
-            sensor,
-        )
-        if not sensor_episodes_df.empty:
-            episodes_parts.append(sensor_episodes_df)
+    Events are ordered by animal (dataset order), then sensor (order of first appearance), then
+    time. Episode boundaries, per (animal, sensor) episode ids and minimum-amount validation are
+    computed over the whole frame with group-aware ``diff``/``cumsum`` and one grouped transform.
+    Episodes whose total amount is below the sensor's minimum get a missing ``EpisodeId``.
 
-    animal_events_df = pd.concat(events_parts, ignore_index=True) if events_parts else pd.DataFrame()
-    animal_episodes_df = pd.concat(episodes_parts, ignore_index=True) if episodes_parts else pd.DataFrame()
-    return animal_events_df, animal_episodes_df
+    Returns the events and, per event, a globally unique episode number (the grouping key of the
+    episodes).
+    """
+    # Ignore Weight sensor
+    sensors = [sensor for sensor in long_df["Sensor"].unique().tolist() if sensor != "Weight"]
 
+    animal_rank = pd.Categorical(long_df["Animal"], categories=animal_ids).codes
+    sensor_rank = pd.Categorical(long_df["Sensor"], categories=sensors).codes
+    selected = (animal_rank >= 0) & (sensor_rank >= 0)
 
-def _extract_sensor_events(
-    df: pd.DataFrame,
-    sensor: str,
-    settings: DrinkFeedSettings,
-) -> pd.DataFrame:
-    events_df = df.copy()
+    # long_df is time-ordered; a stable sort by (animal, sensor) keeps that order within each group
+    order = np.flatnonzero(selected)
+    order = order[np.lexsort((sensor_rank[order], animal_rank[order]))]
+    events_df = long_df.iloc[order].reset_index(drop=True)
 
-    if events_df.empty:
-        events_df.insert(1, "EpisodeId", pd.array([], dtype="UInt64"))
-        events_df.insert(2, "Interval", pd.array([], dtype="timedelta64[ns]"))
-        return events_df
+    group_keys = animal_rank[order].astype(np.int64) * len(sensors) + sensor_rank[order]
+    group_start = np.ones(len(events_df), dtype=bool)
+    group_start[1:] = group_keys[1:] != group_keys[:-1]
 
     timedelta = pd.Timedelta(
         hours=settings.intermeal_interval.hour,
@@ -264,25 +232,32 @@ def _extract_sensor_events(
     )
 
     intervals = events_df["Timedelta"].diff()
-    new_episode = intervals > timedelta
-    episode_ids = new_episode.astype("Int8").cumsum().astype("UInt64")
-
-    events_df.insert(1, "EpisodeId", episode_ids)
+    intervals[group_start] = pd.NaT
+    new_episode = (intervals > timedelta).to_numpy()
+
+    # Episode ids restart at 0 for every (animal, sensor) group
+    episode_counter = np.cumsum(new_episode)
+    group_first_row = np.maximum.accumulate(np.where(group_start, np.arange(len(events_df)), 0))
+    episode_ids = episode_counter - episode_counter[group_first_row]
+    # Globally unique episode number, used as the grouping key below
+    episode_numbers = np.cumsum(new_episode | group_start)
+
+    is_drink = np.array(["Drink" in sensor for sensor in sensors], dtype=bool)[sensor_rank[order]]
+    minimum_amount = np.where(is_drink, settings.drinking_minimum_amount, settings.feeding_minimum_amount)
+    episode_sum = events_df["Value"].groupby(episode_numbers).transform("sum")
+    valid = (episode_sum >= minimum_amount).to_numpy(dtype=bool, na_value=False)
+
+    events_df.insert(1, "EpisodeId", pd.array(episode_ids, dtype="UInt64"))
     events_df.insert(2, "Interval", intervals)
+    events_df["EpisodeId"] = events_df["EpisodeId"].where(valid)
+    return events_df, episode_numbers
 
-    events_df = _find_invalid_episodes(
-        events_df, settings.drinking_minimum_amount if "Drink" in sensor else settings.feeding_minimum_amount
-    )
-
-    return events_df
 
-
-def _extract_sensor_episodes(
-    animal_id: str,
-    events_df: pd.DataFrame,
-    sensor: str,
-) -> pd.DataFrame:
-    valid_events = events_df[events_df["EpisodeId"].notna()]
+def _extract_episodes(events_df: pd.DataFrame, episode_numbers: np.ndarray) -> pd.DataFrame:
+    """Aggregate the valid events of all animals and sensors into episodes with one groupby."""
+    valid = events_df["EpisodeId"].notna().to_numpy(dtype=bool)
+    episode_numbers = episode_numbers[valid]
+    valid_events = events_df.loc[valid]
 
     if valid_events.empty:
         return pd.DataFrame(
@@ -301,20 +276,24 @@ def _extract_sensor_episodes(
             ],
         )
 
-    grouped = valid_events.groupby("EpisodeId", sort=False).agg(
+    grouped = valid_events.groupby(episode_numbers, sort=False).agg(
         DateTime=("DateTime", "first"),
         Start=("Timedelta", "first"),
         End=("Timedelta", "last"),
+        Animal=("Animal", "first"),
+        Sensor=("Sensor", "first"),
+        Id=("EpisodeId", "first"),
         Quantity=("Value", "sum"),
         Count=("Value", "size"),
     )
+    grouped = grouped.reset_index(drop=True)
 
     episodes = pd.DataFrame({
         "DateTime": grouped["DateTime"],
         "Timedelta": grouped["Start"],
-        "Animal": animal_id,
-        "Sensor": sensor,
-        "Id": grouped.index,
+        "Animal": grouped["Animal"].astype("str"),
+        "Sensor": grouped["Sensor"].astype("str"),
+        "Id": grouped["Id"],
     })
 
     duration = grouped["End"] - grouped["Start"]
@@ -326,7 +305,7 @@ def _extract_sensor_episodes(
     episodes["Duration[minutes]"] = duration_minutes
 
     # Inter-meal interval = next_start - current_start + current_duration (NaT for single-event and last episode)
-    next_start = grouped["Start"].shift(-1)
+    next_start = grouped.groupby(["Animal", "Sensor"], observed=True, sort=False)["Start"].shift(-1)
     imi = next_start - grouped["Start"] + duration
     episodes["Interval"] = imi
     episodes["Interval[minutes]"] = (imi.dt.total_seconds() / 60).round(3).astype("Float64")
@@ -338,11 +317,3 @@ def _extract_sensor_episodes(
     episodes["Rate"] = grouped["Quantity"] / duration_minutes
 
     return episodes
-
-
-def _find_invalid_episodes(events_df: pd.DataFrame, minimum_amount: float) -> pd.DataFrame:
-    valid = events_df["EpisodeId"].notna()
-    if valid.any():
-        episode_sum = events_df.loc[valid].groupby("EpisodeId")["Value"].transform("sum")
-        events_df.loc[valid, "EpisodeId"] = events_df.loc[valid, "EpisodeId"].where(episode_sum >= minimum_amount)
-    return events_df
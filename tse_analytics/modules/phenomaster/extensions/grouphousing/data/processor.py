@@ -1,6 +1,6 @@
-import math
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from tse_analytics.core.data.dataset import Dataset
@@ -80,16 +80,11 @@ def get_preprocessed_data(
     drinkfeed_df = _preprocess_df(datatable, df[df["Channel"] < 4], remove_repeating_records)
 
     # Preprocess TraffiCage data
-    trafficage_df["Distance"] = trafficage_df.apply(_calculate_distance, axis=1)
+    trafficage_df["Distance"] = _calculate_distance(trafficage_df)
     # Detect overlapping records
-    animal_ids = datatable.metadata.get("animal_ids")
-    for animal in animal_ids:
-        trafficage_df.loc[trafficage_df["Animal"] == animal, "TimeDiff"] = trafficage_df[
-            trafficage_df["Animal"] == animal
-        ]["StartDateTime"].diff(2)
-        trafficage_df.loc[trafficage_df["Animal"] == animal, "ChannelDiff"] = trafficage_df[
-            trafficage_df["Animal"] == animal
-        ]["Channel"].diff(2)
+    animal_groups = trafficage_df.groupby("Animal", observed=True, sort=False)
+    trafficage_df["TimeDiff"] = animal_groups["StartDateTime"].diff(2)
+    trafficage_df["ChannelDiff"] = animal_groups["Channel"].diff(2)
 
     if remove_overlapping:
         trafficage_df = trafficage_df[
@@ -120,9 +115,7 @@ def _preprocess_df(
         drop = df[df["Animal"].eq(df["Animal"].shift()) & df["Channel"].eq(df["Channel"].shift())].index
         df.drop(drop, inplace=True)
 
-    animal_ids = datatable.metadata.get("animal_ids")
-    for animal in animal_ids:
-        df.loc[df["Animal"] == animal, "PreviousChannelType"] = df[df["Animal"] == animal]["ChannelType"].shift()
+    df["PreviousChannelType"] = df.groupby("Animal", observed=True, sort=False)["ChannelType"].shift()
 
     df["Activity"] = df.groupby("Animal", observed=False).cumcount()
 
@@ -132,10 +125,12 @@ def _preprocess_df(
     return df
 
 
-def _calculate_distance(row: pd.Series) -> float | None:
-    if pd.isna(row["PreviousChannelType"]):
-        return None
-    loc1 = TRAFFICAGE_POSITIONS[row["ChannelType"]]
-    loc2 = TRAFFICAGE_POSITIONS[row["PreviousChannelType"]]
-    distance = math.sqrt((loc1[0] - loc2[0]) ** 2 + (loc1[1] - loc2[1]) ** 2)
-    return distance
+def _calculate_distance(df: pd.DataFrame) -> pd.Series:
+    # Euclidean distance between the positions of the current and the previous antenna of each record
+    x = {channel_type: position[0] for channel_type, position in TRAFFICAGE_POSITIONS.items()}
+    y = {channel_type: position[1] for channel_type, position in TRAFFICAGE_POSITIONS.items()}
+    current_x = df["ChannelType"].map(x).astype("float64")
+    current_y = df["ChannelType"].map(y).astype("float64")
+    previous_x = df["PreviousChannelType"].map(x).astype("float64")
+    previous_y = df["PreviousChannelType"].map(y).astype("float64")
+    return np.sqrt((current_x - previous_x) ** 2 + (current_y - previous_y) ** 2)
@@ -0,0 +1,83 @@
+"""
+Fingerprints of pipeline packets and node configurations.
+
+A fingerprint identifies what a node output was computed from, so that ``PipelineNodeGraph`` can
+reuse the output of a node whose configuration and inputs did not change since the last run.
+Values whose state cannot be identified cheaply have no fingerprint (None); nodes fed by them are
+always executed.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from NodeGraphQt import BaseNode
+
+from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.pipeline.pipeline_packet import PipelinePacket
+
+# Plain values identified by their content
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _digest(payload: Any) -> str:
+    text = json.dumps(payload, default=str, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def value_fingerprint(value: Any) -> str | None:
+    """
+    Fingerprint the payload of a packet.
+
+    A datatable is identified by its id, its revision (bumped when its frame is replaced or flagged
+    as mutated in place), the content fingerprint of its frame (which also follows columns replaced
+    without flagging) and its variables.
+
+    Args:
+        value (Any): The packet payload.
+
+    Returns:
+        str | None: The fingerprint, or None if the value cannot be identified.
+    """
+    if isinstance(value, Datatable):
+        return _digest(["datatable", str(value.id), value.revision, value.fingerprint, list(value.variables)])
+    if isinstance(value, _PLAIN_TYPES):
+        return _digest([type(value).__name__, value])
+    return None
+
+
+def packet_fingerprint(packet: PipelinePacket) -> str | None:
+    """
+    Fingerprint a packet by its content.
+
+    Args:
+        packet (PipelinePacket): The packet.
+
+    Returns:
+        str | None: The fingerprint, or None if the packet payload cannot be identified.
+    """
+    fingerprint = value_fingerprint(packet.value)
+    if fingerprint is None:
+        return None
+    return _digest([fingerprint, packet.report, packet.active, dict(packet.meta)])
+
+
+def node_fingerprint(node: BaseNode, input_fingerprints: list[str | None]) -> str | None:
+    """
+    Fingerprint the execution of a node: its type, its properties and its inputs.
+
+    Args:
+        node (BaseNode): The node.
+        input_fingerprints (list[str | None]): Fingerprints of the input packets, in port order.
+
+    Returns:
+        str | None: The fingerprint, or None if any input cannot be identified.
+    """
+    if any(fingerprint is None for fingerprint in input_fingerprints):
+        return None
+    return _digest([node.type_, node.model.custom_properties, input_fingerprints])
+
+
+def port_fingerprint(node_fingerprint: str, port_name: str) -> str:
+    """Fingerprint the packet a node with the given fingerprint emits on an output port."""
+    return _digest([node_fingerprint, port_name])
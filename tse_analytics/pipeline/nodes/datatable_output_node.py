@@ -25,5 +25,7 @@ class DatatableOutputNode(PipelineNode):
         if datatable is None or not isinstance(datatable, Datatable):
             return
 
+        # The input may be the source datatable or an output cached for the next execution
+        datatable = datatable.clone()
         datatable.name = str(self.get_property("table_name"))
         manager.add_datatable(datatable)
@@ -7,6 +7,7 @@ from tse_analytics.pipeline.pipeline_packet import PipelinePacket
 class DescriptiveStatsNode(PipelineNode):
     __identifier__ = "stats"
     NODE_NAME = "Descriptive Statistics"
+    CONCURRENT = True
 
     def __init__(self):
         super().__init__()
@@ -9,6 +9,7 @@ from tse_analytics.pipeline.pipeline_packet import PipelinePacket
 class ResampleNode(PipelineNode):
     __identifier__ = "transformation"
     NODE_NAME = "Resample"
+    CONCURRENT = True
 
     def __init__(self):
         super().__init__()
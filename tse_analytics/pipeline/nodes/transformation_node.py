@@ -68,6 +68,7 @@ class TransformationNode(PipelineNode):
                 lambda_opt = None
 
         result_datatable.df[transformed_variable] = transformed_data
+        result_datatable.mark_df_modified()
 
         # Log / Log10 have no optimized lambda parameter.
         lambda_str = f"{lambda_opt:.5f}" if lambda_opt is not None else "N/A"
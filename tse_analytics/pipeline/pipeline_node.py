@@ -6,6 +6,10 @@ from tse_analytics.pipeline.pipeline_packet import PipelinePacket
 class PipelineNode(BaseNode):
     NODE_NAME = "PipelineNode"
 
+    # Whether process() may run on a worker thread while other nodes run; it must then not
+    # touch Qt items (e.g. self.view) or pyplot state.
+    CONCURRENT = False
+
     def __init__(self):
         super().__init__()
 
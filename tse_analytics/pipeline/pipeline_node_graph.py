@@ -1,8 +1,15 @@
+import timeit
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
 from NodeGraphQt import BaseNode, NodeGraph, PropertiesBinWidget
 from PySide6.QtCore import Qt
 
 from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.data.datatable import Datatable
+from tse_analytics.pipeline.fingerprint import node_fingerprint, packet_fingerprint, port_fingerprint
 from tse_analytics.pipeline.pipeline_packet import PipelinePacket
 
 # Light theme colors.
@@ -15,10 +22,23 @@ from tse_analytics.pipeline.pipeline_packet import PipelinePacket
 # ViewerEnum.GRID_COLOR._value_ = _GRID_COLOR
 
 
+@dataclass(frozen=True)
+class NodeRun:
+    """Outcome of the last execution of a pipeline node."""
+
+    fingerprint: str | None
+    result: Any
+    seconds: float
+    cached: bool
+
+
 class PipelineNodeGraph(NodeGraph):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Last execution of every node, by node id
+        self._node_runs: dict[str, NodeRun] = {}
+
         # self.set_background_color(*_BACKGROUND_COLOR)
         # self.set_grid_color(*_GRID_COLOR)
 
@@ -81,67 +101,163 @@ class PipelineNodeGraph(NodeGraph):
 
         return result
 
-    def execute_pipeline(self, dataset: Dataset) -> dict:
+    @property
+    def node_runs(self) -> dict[str, NodeRun]:
+        """Outcome of the last execution of every node, by node id."""
+        return self._node_runs
+
+    def clear_cache(self) -> None:
+        """Forget the cached node outputs, so that the next execution runs every node."""
+        self._node_runs.clear()
+
+    def _upstream_nodes(self, node: BaseNode) -> set[str]:
+        return {port.node().id for input_port in node.input_ports() for port in input_port.connected_ports()}
+
+    def _get_input_packets(
+        self,
+        node: BaseNode,
+        port_outputs: dict[tuple[str, str], PipelinePacket],
+        port_fingerprints: dict[tuple[str, str], str | None],
+    ) -> tuple[list[PipelinePacket], list[str | None]]:
+        """Get the packets from connected nodes via specific ports, with their fingerprints."""
+        input_packets: list[PipelinePacket] = []
+        input_fingerprints: list[str | None] = []
+        for input_port in node.input_ports():
+            connected_ports = input_port.connected_ports()
+
+            if not connected_ports:
+                input_packets.append(
+                    PipelinePacket.inactive(
+                        reason="Missing connection",
+                        node_id=node.id,
+                        input_port=input_port.name(),
+                    )
+                )
+                input_fingerprints.append(None)
+                continue
+
+            # Get output from connected port
+            connected_port = connected_ports[0]
+            port_key = (connected_port.node().id, connected_port.name())
+            packet = port_outputs.get(port_key)
+            if packet:
+                input_packets.append(packet)
+                input_fingerprints.append(port_fingerprints.get(port_key))
+        return input_packets, input_fingerprints
+
+    def execute_pipeline(self, dataset: Dataset, use_cache: bool = True, max_workers: int = 1) -> dict:
         """
         Execute pipeline with support for conditional branching.
         Handles if/else nodes by routing data through appropriate branches.
+
+        The output of a node is reused from the previous execution when the node's type, properties
+        and input packets are unchanged (see ``pipeline/fingerprint.py``), so editing one node only
+        re-executes the nodes downstream of it. Nodes without inputs (data sources) and without
+        outputs (sinks with side effects, e.g. reports) always run.
+
+        Nodes run in waves: a wave holds every node whose upstream nodes have all finished. Nodes of
+        a wave that are marked ``CONCURRENT`` run on a thread pool when ``max_workers`` > 1.
+
+        Args:
+            dataset (Dataset): Dataset the pipeline runs on.
+            use_cache (bool): Whether to reuse unchanged node outputs of the previous execution.
+            max_workers (int): Number of threads for concurrent nodes; 1 runs every node on the calling thread.
+
+        Returns:
+            dict: The output packets by (node id, port name).
         """
         nodes = self.get_execution_order()
         port_outputs: dict[tuple[str, str], PipelinePacket] = {}  # Store outputs per port for branching
+        port_fingerprints: dict[tuple[str, str], str | None] = {}
+        previous_runs = self._node_runs if use_cache else {}
+        self._node_runs = {}
 
-        for node in nodes:
-            # Ignore nodes without a process method
-            if not hasattr(node, "process"):
-                continue
+        executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline") if max_workers > 1 else None
+        )
+        try:
+            pending = nodes
+            finished: set[str] = set()
+            while pending:
+                wave = [node for node in pending if self._upstream_nodes(node) <= finished]
+                if not wave:
+                    break
+                pending = [node for node in pending if node not in wave]
 
-            # Get inputs from connected nodes via specific ports
-            input_packets: list[PipelinePacket] = []
-            for input_port in node.input_ports():
-                connected_ports = input_port.connected_ports()
-
-                if not connected_ports:
-                    input_packets.append(
-                        PipelinePacket.inactive(
-                            reason="Missing connection",
-                            node_id=node.id,
-                            input_port=input_port.name(),
-                        )
-                    )
-                    continue
-
-                # Get output from connected port
-                connected_port = connected_ports[0]
-                port_key = (connected_port.node().id, connected_port.name())
-                packet = port_outputs.get(
-                    port_key,
-                    # PipelinePacket.inactive(
-                    #     reason=f"Missing upstream output. Node: {node.name()}, Port: {input_port.name()}",
-                    #     upstream_node_id=connected_port.node().id,
-                    #     upstream_port=connected_port.name(),
-                    # ),
-                    None,
-                )
-                if packet:
-                    input_packets.append(packet)
+                scheduled: list[tuple[BaseNode, NodeRun | Future]] = []
+                for node in wave:
+                    # Ignore nodes without a process method
+                    if not hasattr(node, "process"):
+                        continue
 
-            should_run = all(p.active for p in input_packets)
-            if not should_run:
-                continue
+                    input_packets, input_fingerprints = self._get_input_packets(node, port_outputs, port_fingerprints)
+                    should_run = all(p.active for p in input_packets)
+                    if not should_run:
+                        continue
+
+                    fingerprint = node_fingerprint(node, input_fingerprints)
+                    is_cacheable = len(node.input_ports()) > 0 and len(node.output_ports()) > 0
+                    previous_run = previous_runs.get(node.id)
+                    if (
+                        is_cacheable
+                        and fingerprint is not None
+                        and previous_run is not None
+                        and previous_run.fingerprint == fingerprint
+                    ):
+                        scheduled.append((node, NodeRun(fingerprint, previous_run.result, 0.0, True)))
+                    elif executor is not None and getattr(node, "CONCURRENT", False):
+                        scheduled.append((node, executor.submit(_run_node, node, input_packets, fingerprint)))
+                    else:
+                        # Run on the calling thread; concurrent nodes of the wave keep running meanwhile
+                        scheduled.append((node, _run_node(node, input_packets, fingerprint)))
 
-            # Execute the node
-            result = node.process(*input_packets) if input_packets else node.process(None)
-
-            # For nodes with multiple outputs (like if/else), map results to ports
-            output_ports = node.output_ports()
-            if isinstance(result, dict) and len(output_ports) == len(result):
-                # Map each output to its corresponding port
-                for port in output_ports:
-                    port_key = (node.id, port.name())
-                    port_outputs[port_key] = result[port.name()]
-            elif len(output_ports) > 0:
-                # Single output: assign to all ports
-                for port in output_ports:
-                    port_key = (node.id, port.name())
-                    port_outputs[port_key] = result
+                for node, outcome in scheduled:
+                    run = outcome.result() if isinstance(outcome, Future) else outcome
+                    self._node_runs[node.id] = run
+                    self._store_outputs(node, run, port_outputs, port_fingerprints)
+                finished.update(node.id for node in wave)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         return port_outputs
+
+    def _store_outputs(
+        self,
+        node: BaseNode,
+        run: NodeRun,
+        port_outputs: dict[tuple[str, str], PipelinePacket],
+        port_fingerprints: dict[tuple[str, str], str | None],
+    ) -> None:
+        result = run.result
+
+        # For nodes with multiple outputs (like if/else), map results to ports
+        output_ports = node.output_ports()
+        if isinstance(result, dict) and len(output_ports) == len(result):
+            # Map each output to its corresponding port
+            packets = {port.name(): result[port.name()] for port in output_ports}
+        elif len(output_ports) > 0:
+            # Single output: assign to all ports
+            packets = {port.name(): result for port in output_ports}
+        else:
+            packets = {}
+
+        for port_name, packet in packets.items():
+            port_key = (node.id, port_name)
+            port_outputs[port_key] = packet
+            if len(node.input_ports()) == 0:
+                # Sources read external state: identify their output by its content
+                port_fingerprints[port_key] = packet_fingerprint(packet) if isinstance(packet, PipelinePacket) else None
+            elif run.fingerprint is not None:
+                port_fingerprints[port_key] = port_fingerprint(run.fingerprint, port_name)
+            else:
+                port_fingerprints[port_key] = None
+
+
+def _run_node(node: BaseNode, input_packets: list[PipelinePacket], fingerprint: str | None = None) -> NodeRun:
+    """Execute a node and time it."""
+    tic = timeit.default_timer()
+    result = node.process(*input_packets) if input_packets else node.process(None)
+    seconds = timeit.default_timer() - tic
+    logger.debug(f"Pipeline node {node.name()!r} executed in {seconds:.3f} sec")
+    return NodeRun(fingerprint, result, seconds, False)
@@ -1,37 +1,241 @@
-"""Import all toolbox widget modules to trigger their ``@toolbox_plugin`` registrations.
+"""Static manifest of the toolbox plugins.
 
-This module is the single place that drives plugin discovery.  It is imported
-by :class:`ToolboxButton` at construction time so the registry is populated
-before the menus are built.
+Declares one lightweight :class:`ToolboxPluginInfo` per tool and registers it
+with the ``registry``.  Widgets are referenced by import path, so importing this
+package (as :class:`ToolboxButton` does to build its menus) imports no widget
+module; each one is imported when the user first opens the tool.  To add a
+tool, add its descriptor here.
 """
 
-import tse_analytics.modules.intellicage.toolbox.learning_curve.learning_curve_widget  # noqa: F401
-import tse_analytics.modules.intellicage.toolbox.place_preference.place_preference_widget  # noqa: F401
-import tse_analytics.modules.intellicage.toolbox.transitions.transitions_widget  # noqa: F401
-import tse_analytics.toolbox.actogram.actogram_widget  # noqa: F401
-import tse_analytics.toolbox.ai_agent.ai_agent_widget  # noqa: F401
-import tse_analytics.toolbox.ancova.ancova_widget  # noqa: F401
-import tse_analytics.toolbox.chronobiology.chronobiology_widget  # noqa: F401
-import tse_analytics.toolbox.composite_score.composite_score_widget  # noqa: F401
-import tse_analytics.toolbox.correlation.correlation_widget  # noqa: F401
-import tse_analytics.toolbox.correlation_matrix.correlation_matrix_widget  # noqa: F401
-import tse_analytics.toolbox.data_plot.data_plot_widget  # noqa: F401
-import tse_analytics.toolbox.data_table.data_table_widget  # noqa: F401
-import tse_analytics.toolbox.distribution.distribution_widget  # noqa: F401
-import tse_analytics.toolbox.facet_data_plot.facet_data_plot_widget  # noqa: F401
-import tse_analytics.toolbox.fast_line_plot.fast_line_plot_widget  # noqa: F401
-import tse_analytics.toolbox.histogram.histogram_widget  # noqa: F401
-import tse_analytics.toolbox.matrix_plot.matrix_plot_widget  # noqa: F401
-import tse_analytics.toolbox.mds.mds_widget  # noqa: F401
-import tse_analytics.toolbox.mixed_anova.mixed_anova_widget  # noqa: F401
-import tse_analytics.toolbox.n_way_anova.n_way_anova_widget  # noqa: F401
-import tse_analytics.toolbox.normality.normality_widget  # noqa: F401
-import tse_analytics.toolbox.one_way_anova.one_way_anova_widget  # noqa: F401
-import tse_analytics.toolbox.pca.pca_widget  # noqa: F401
-import tse_analytics.toolbox.periodogram.periodogram_widget  # noqa: F401
-import tse_analytics.toolbox.regression.regression_widget  # noqa: F401
-import tse_analytics.toolbox.rm_anova.rm_anova_widget  # noqa: F401
-import tse_analytics.toolbox.timeseries_autocorrelation.timeseries_autocorrelation_widget  # noqa: F401
-import tse_analytics.toolbox.timeseries_decomposition.timeseries_decomposition_widget  # noqa: F401
-import tse_analytics.toolbox.tsne.tsne_widget  # noqa: F401
-import tse_analytics.toolbox.umap.umap_widget  # noqa: F401
+from tse_analytics.toolbox.toolbox_registry import ToolboxPluginInfo, registry
+
+PLUGINS: tuple[ToolboxPluginInfo, ...] = (
+    # AI
+    ToolboxPluginInfo(
+        category="AI",
+        label="TSE Assistant",
+        icon=":/icons/icons8-analyze-16.png",
+        widget="tse_analytics.toolbox.ai_agent.ai_agent_widget:AIAgentWidget",
+        order=0,
+        internal=True,
+    ),
+    # Data
+    ToolboxPluginInfo(
+        category="Data",
+        label="Table",
+        icon=":/icons/table.png",
+        widget="tse_analytics.toolbox.data_table.data_table_widget:DataTableWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="Data",
+        label="Fast Line Plot",
+        icon=":/icons/plot.png",
+        widget="tse_analytics.toolbox.fast_line_plot.fast_line_plot_widget:FastLinePlotWidget",
+        order=1,
+    ),
+    ToolboxPluginInfo(
+        category="Data",
+        label="Facet Plot",
+        icon=":/icons/plot.png",
+        widget="tse_analytics.toolbox.facet_data_plot.facet_data_plot_widget:FactorsPlotWidget",
+        order=2,
+    ),
+    ToolboxPluginInfo(
+        category="Data",
+        label="Line Plot",
+        icon=":/icons/plot.png",
+        widget="tse_analytics.toolbox.data_plot.data_plot_widget:DataPlotWidget",
+        order=3,
+    ),
+    # Exploration
+    ToolboxPluginInfo(
+        category="Exploration",
+        label="Histogram",
+        icon=":/icons/exploration.png",
+        widget="tse_analytics.toolbox.histogram.histogram_widget:HistogramWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="Exploration",
+        label="Distribution",
+        icon=":/icons/exploration.png",
+        widget="tse_analytics.toolbox.distribution.distribution_widget:DistributionWidget",
+        order=1,
+    ),
+    ToolboxPluginInfo(
+        category="Exploration",
+        label="Normality",
+        icon=":/icons/exploration.png",
+        widget="tse_analytics.toolbox.normality.normality_widget:NormalityWidget",
+        order=2,
+    ),
+    ToolboxPluginInfo(
+        category="Exploration",
+        label="Composite Performance Score",
+        icon=":/icons/exploration.png",
+        widget="tse_analytics.toolbox.composite_score.composite_score_widget:CompositeScoreWidget",
+        order=3,
+    ),
+    # Bivariate
+    ToolboxPluginInfo(
+        category="Bivariate",
+        label="Correlation",
+        icon=":/icons/bivariate.png",
+        widget="tse_analytics.toolbox.correlation.correlation_widget:CorrelationWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="Bivariate",
+        label="Regression",
+        icon=":/icons/bivariate.png",
+        widget="tse_analytics.toolbox.regression.regression_widget:RegressionWidget",
+        order=1,
+    ),
+    # ANOVA
+    ToolboxPluginInfo(
+        category="ANOVA",
+        label="One-way ANOVA",
+        icon=":/icons/anova.png",
+        widget="tse_analytics.toolbox.one_way_anova.one_way_anova_widget:OneWayAnovaWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="ANOVA",
+        label="N-way ANOVA",
+        icon=":/icons/anova.png",
+        widget="tse_analytics.toolbox.n_way_anova.n_way_anova_widget:NWayAnovaWidget",
+        order=1,
+    ),
+    ToolboxPluginInfo(
+        category="ANOVA",
+        label="Repeated Measures ANOVA",
+        icon=":/icons/anova.png",
+        widget="tse_analytics.toolbox.rm_anova.rm_anova_widget:RMAnovaWidget",
+        order=2,
+    ),
+    ToolboxPluginInfo(
+        category="ANOVA",
+        label="Mixed-design ANOVA",
+        icon=":/icons/anova.png",
+        widget="tse_analytics.toolbox.mixed_anova.mixed_anova_widget:MixedAnovaWidget",
+        order=3,
+    ),
+    ToolboxPluginInfo(
+        category="ANOVA",
+        label="ANCOVA",
+        icon=":/icons/anova.png",
+        widget="tse_analytics.toolbox.ancova.ancova_widget:AncovaWidget",
+        order=4,
+    ),
+    # Factor Analysis
+    ToolboxPluginInfo(
+        category="Factor Analysis",
+        label="Correlation Matrix",
+        icon=":/icons/dimensionality.png",
+        widget="tse_analytics.toolbox.correlation_matrix.correlation_matrix_widget:CorrelationMatrixWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="Factor Analysis",
+        label="Matrix Plot",
+        icon=":/icons/dimensionality.png",
+        widget="tse_analytics.toolbox.matrix_plot.matrix_plot_widget:MatrixPlotWidget",
+        order=1,
+    ),
+    ToolboxPluginInfo(
+        category="Factor Analysis",
+        label="Principal Component Analysis (PCA)",
+        icon=":/icons/dimensionality.png",
+        widget="tse_analytics.toolbox.pca.pca_widget:PcaWidget",
+        order=2,
+    ),
+    ToolboxPluginInfo(
+        category="Factor Analysis",
+        label="t-Distributed Stochastic Neighbor Embedding (t-SNE)",
+        icon=":/icons/dimensionality.png",
+        widget="tse_analytics.toolbox.tsne.tsne_widget:TsneWidget",
+        order=3,
+    ),
+    ToolboxPluginInfo(
+        category="Factor Analysis",
+        label="Multidimensional Scaling (MDS)",
+        icon=":/icons/dimensionality.png",
+        widget="tse_analytics.toolbox.mds.mds_widget:MdsWidget",
+        order=4,
+    ),
+    ToolboxPluginInfo(
+        category="Factor Analysis",
+        label="Uniform Manifold Approximation and Projection (UMAP)",
+        icon=":/icons/dimensionality.png",
+        widget="tse_analytics.toolbox.umap.umap_widget:UmapWidget",
+        order=5,
+    ),
+    # Chronobiology
+    ToolboxPluginInfo(
+        category="Chronobiology",
+        label="Chronobiology",
+        icon=":/icons/icons8-normal-distribution-histogram-16.png",
+        widget="tse_analytics.toolbox.chronobiology.chronobiology_widget:ChronobiologyWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="Chronobiology",
+        label="Actogram",
+        icon=":/icons/icons8-barcode-16.png",
+        widget="tse_analytics.toolbox.actogram.actogram_widget:ActogramWidget",
+        order=1,
+    ),
+    ToolboxPluginInfo(
+        category="Chronobiology",
+        label="Periodogram",
+        icon=":/icons/icons8-normal-distribution-histogram-16.png",
+        widget="tse_analytics.toolbox.periodogram.periodogram_widget:PeriodogramWidget",
+        order=2,
+    ),
+    # Time Series
+    ToolboxPluginInfo(
+        category="Time Series",
+        label="Decomposition",
+        icon=":/icons/timeseries.png",
+        widget="tse_analytics.toolbox.timeseries_decomposition.timeseries_decomposition_widget:TimeseriesDecompositionWidget",
+        order=0,
+    ),
+    ToolboxPluginInfo(
+        category="Time Series",
+        label="Autocorrelation",
+        icon=":/icons/timeseries.png",
+        widget="tse_analytics.toolbox.timeseries_autocorrelation.timeseries_autocorrelation_widget:TimeseriesAutocorrelationWidget",
+        order=1,
+    ),
+    # IntelliCage
+    ToolboxPluginInfo(
+        category="IntelliCage",
+        label="Transitions",
+        icon=":/icons/icons8-transition-both-directions-16.png",
+        widget="tse_analytics.modules.intellicage.toolbox.transitions.transitions_widget:TransitionsWidget",
+        order=0,
+        dataset_types=("IntelliCage", "IntelliMaze"),
+        required_datatable_name="Visits",
+    ),
+    ToolboxPluginInfo(
+        category="IntelliCage",
+        label="Place Preference",
+        icon=":/icons/icons8-corner-16.png",
+        widget="tse_analytics.modules.intellicage.toolbox.place_preference.place_preference_widget:PlacePreferenceWidget",
+        order=1,
+        dataset_types=("IntelliCage", "IntelliMaze"),
+        required_datatable_name="Visits",
+    ),
+    ToolboxPluginInfo(
+        category="IntelliCage",
+        label="Learning Curve",
+        icon=":/icons/icons8-analyze-16.png",
+        widget="tse_analytics.modules.intellicage.toolbox.learning_curve.learning_curve_widget:LearningCurveWidget",
+        order=2,
+        dataset_types=("IntelliCage", "IntelliMaze"),
+    ),
+)
+
+for _plugin in PLUGINS:
+    registry.register(_plugin)
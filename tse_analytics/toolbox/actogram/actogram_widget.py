@@ -9,7 +9,6 @@ from tse_analytics.core.utils import get_figsize_from_widget
 from tse_analytics.core.workers.task_manager import TaskManager
 from tse_analytics.core.workers.worker import Worker
 from tse_analytics.toolbox.actogram.processor import ActogramResult, get_actogram_result
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.variable_selector import VariableSelector
 
@@ -20,7 +19,6 @@ class ActogramWidgetSettings:
     bins_per_hour: int = 6
 
 
-@toolbox_plugin(category="Chronobiology", label="Actogram", icon=":/icons/icons8-barcode-16.png", order=1)
 class ActogramWidget(ToolboxWidgetBase):
     """Widget for visualizing activity patterns over time in a double-plotted actogram format.
 
@@ -5,12 +5,14 @@ from datetime import time
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.collections import PolyCollection
 
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
 from tse_analytics.core.utils import get_html_image_from_figure, time_to_float
 from tse_analytics.core.utils.data import normalize_nd_array
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 def dataframe_to_actogram(
@@ -83,29 +85,36 @@ def _draw_double_plotted_bars(
                 zorder=1,
             )
 
+    # Day i is drawn at height days_count - i: the previous day on the left, the day itself on the right.
+    # All bars go into one collection; a patch per bar makes large actograms slow to build and render.
+    x_rows, height_rows, bottom_rows = [], [], []
     for i in range(days_count):
         if i > 0:
-            ax.bar(
-                np.arange(bins_per_day),
-                activity_data[i - 1],
-                width=1,
-                color=bar_color,
-                align="center",
-                bottom=days_count - i,
-                alpha=1,
-                zorder=3,
-                edgecolor="none",
-            )
-        ax.bar(
-            np.arange(bins_per_day, 2 * bins_per_day),
-            activity_data[i],
-            width=1,
-            color=bar_color,
-            align="center",
-            bottom=days_count - i,
-            alpha=1,
-            zorder=3,
-            edgecolor="none",
+            x_rows.append(np.arange(bins_per_day))
+            height_rows.append(activity_data[i - 1])
+            bottom_rows.append(np.full(bins_per_day, days_count - i))
+        x_rows.append(np.arange(bins_per_day, 2 * bins_per_day))
+        height_rows.append(activity_data[i])
+        bottom_rows.append(np.full(bins_per_day, days_count - i))
+    if x_rows:
+        x = np.concatenate(x_rows)
+        heights = np.concatenate(height_rows).astype(float)
+        bottoms = np.concatenate(bottom_rows)
+        drawn = np.isfinite(heights) & (heights != 0)
+        x, heights, bottoms = x[drawn], heights[drawn], bottoms[drawn]
+        tops = bottoms + heights
+        vertices = np.stack(
+            [
+                np.stack([x - 0.5, bottoms], axis=-1),
+                np.stack([x + 0.5, bottoms], axis=-1),
+                np.stack([x + 0.5, tops], axis=-1),
+                np.stack([x - 0.5, tops], axis=-1),
+            ],
+            axis=1,
+        )
+        ax.add_collection(
+            PolyCollection(vertices, facecolors=bar_color, edgecolors="none", zorder=3),
+            autolim=False,
         )
 
     ax.set_xticks(np.concatenate([xticks, xticks + bins_per_day]))
@@ -287,6 +296,7 @@ class ActogramResult:
     report: str
 
 
+@cached_result
 def get_actogram_result(
     datatable: Datatable,
     variable: Variable,
@@ -40,7 +40,6 @@ from tse_analytics.core.workers.worker import Worker
 from tse_analytics.toolbox.ai_agent.claude import call_claude
 from tse_analytics.toolbox.ai_agent.lmstudio import lms_get_response
 from tse_analytics.toolbox.ai_agent.prompt_builder import build_system_prompt
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 
 CLAUDE_MODELS = [
@@ -96,13 +95,6 @@ def _run_code(code: str, df: pd.DataFrame) -> Any:
         return None
 
 
-@toolbox_plugin(
-    category="AI",
-    label="TSE Assistant",
-    icon=":/icons/icons8-analyze-16.png",
-    order=0,
-    internal=True,
-)
 class AIAgentWidget(ToolboxWidgetBase):
     """Natural-language pandas agent for a :class:`Datatable`."""
 
@@ -8,6 +8,7 @@ from tse_analytics.toolbox.ancova.processor import get_ancova_result
 class AncovaNode(PipelineNode):
     __identifier__ = "stats"
     NODE_NAME = "ANCOVA"
+    CONCURRENT = True
 
     def __init__(self):
         super().__init__()
@@ -4,7 +4,9 @@ import pingouin as pg
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
+from tse_analytics.core.io.query import query_datatable
 from tse_analytics.core.utils import get_great_table
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -12,6 +14,7 @@ class AncovaResult:
     report: str
 
 
+@cached_result
 def get_ancova_result(
     datatable: Datatable,
     dependent_variable: Variable,
@@ -20,19 +23,14 @@ def get_ancova_result(
     effsize: str,
     padjust: str,
 ) -> AncovaResult:
-    df = datatable.get_filtered_df(["Animal", dependent_variable.name, covariate_variable.name, factor_name])
-    df = (
-        df
-        .groupby(
-            ["Animal", factor_name],
-            dropna=False,
-            observed=True,
-        )
-        .aggregate({
+    df = query_datatable(
+        datatable,
+        ["Animal", dependent_variable.name, covariate_variable.name, factor_name],
+        group_by=["Animal", factor_name],
+        aggregations={
             dependent_variable.name: dependent_variable.aggregation,
             covariate_variable.name: covariate_variable.aggregation,
-        })
-        .reset_index()
+        },
     )
 
     ancova = pg.ancova(
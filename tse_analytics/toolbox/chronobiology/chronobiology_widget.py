@@ -15,7 +15,6 @@ from tse_analytics.core.utils import get_figsize_from_widget
 from tse_analytics.core.workers.task_manager import TaskManager
 from tse_analytics.core.workers.worker import Worker
 from tse_analytics.toolbox.chronobiology.processor import ChronobiologyResult, get_chronobiology_result
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.variable_selector import VariableSelector
@@ -31,12 +30,6 @@ class ChronobiologyWidgetSettings:
     onset_threshold_pct: float = 50.0
 
 
-@toolbox_plugin(
-    category="Chronobiology",
-    label="Chronobiology",
-    icon=":/icons/icons8-normal-distribution-histogram-16.png",
-    order=0,
-)
 class ChronobiologyWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
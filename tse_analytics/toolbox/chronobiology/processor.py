@@ -33,7 +33,7 @@ from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
 from tse_analytics.core.utils import (
     get_great_table,
-    get_html_image_from_figure,
+    render_html_sections,
     time_to_float,
 )
 from tse_analytics.toolbox.actogram.processor import (
@@ -42,6 +42,7 @@ from tse_analytics.toolbox.actogram.processor import (
     plot_combined_actograms_grid,
     plot_enhanced_actogram,
 )
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -585,6 +586,7 @@ def _plot_onset_offset(
     return figure
 
 
+@cached_result
 def get_chronobiology_result(
     datatable: Datatable,
     variable: Variable,
@@ -608,7 +610,8 @@ def get_chronobiology_result(
     light_cycle_start = time_cycles.light_cycle_start
     dark_cycle_start = time_cycles.dark_cycle_start
 
-    sections: list[str] = []
+    # Figures are kept in place and rendered together once the report is complete
+    sections: list[str | plt.Figure] = []
     tables: dict[str, ResultTable] = {}
     # Result tables are only exposed for the "Add Datatable" feature when grouping by
     # Animal, so every table carries an "Animal" id column and is directly usable for
@@ -654,7 +657,7 @@ def get_chronobiology_result(
 
     if not has_datetime:
         sections.append("<p><em>DateTime column not available — time-series sections skipped.</em></p>")
-        return ChronobiologyResult(report="\n<p>\n".join(sections), tables=tables)
+        return ChronobiologyResult(report="\n<p>\n".join(render_html_sections(sections)), tables=tables)
 
     # Common reference and group column resolution -------------------------
     reference_time = dataset.experiment_started
@@ -683,11 +686,7 @@ def get_chronobiology_result(
 
     # --- Section 2: ZT profile --------------------------------------------
     sections.append("<h3>Zeitgeber-time profile</h3>")
-    sections.append(
-        get_html_image_from_figure(
-            _plot_zt_profile(grouped_df, variable, light_cycle_start, dark_zt, group_col, palette, figsize)
-        )
-    )
+    sections.append(_plot_zt_profile(grouped_df, variable, light_cycle_start, dark_zt, group_col, palette, figsize))
 
     # --- Per-group computation (single pass over group-mean series) -------
     ls_series: dict[str, tuple[np.ndarray, np.ndarray, float]] = {}
@@ -733,7 +732,7 @@ def get_chronobiology_result(
 
     # --- Section 3: Lomb–Scargle periodogram ------------------------------
     sections.append("<h3>Lomb–Scargle periodogram</h3>")
-    sections.append(get_html_image_from_figure(_plot_periodogram(ls_series, variable, palette, figsize)))
+    sections.append(_plot_periodogram(ls_series, variable, palette, figsize))
     ls_table_df = pd.DataFrame(ls_table_rows)
     sections.append(get_great_table(ls_table_df, "Dominant periods (per-animal mean)").as_raw_html(inline_css=True))
     if expose_tables:
@@ -752,11 +751,7 @@ def get_chronobiology_result(
         "series; the between-animal aggregation (N animals, SEM, rhythmic count) is the more reliable "
         "indicator. Curves show the cosinor fit on the group-mean series.</em></p>"
     )
-    sections.append(
-        get_html_image_from_figure(
-            _plot_cosinor_fits(cosinor_fits, variable, period_hours, zt_offset, palette, figsize)
-        )
-    )
+    sections.append(_plot_cosinor_fits(cosinor_fits, variable, period_hours, zt_offset, palette, figsize))
 
     # --- Section 4b: two-component cosinor --------------------------------
     sections.append(f"<h3>Two-component cosinor (periods = {period_hours:g} h + {period2_hours:g} h)</h3>")
@@ -769,9 +764,7 @@ def get_chronobiology_result(
     if expose_tables:
         tables["Two-component cosinor"] = ResultTable(two_comp_df.rename(columns={"Group": factor_name}), factor_name)
     sections.append(
-        get_html_image_from_figure(
-            _plot_two_component_fits(two_comp_fits, variable, period_hours, period2_hours, zt_offset, palette, figsize)
-        )
+        _plot_two_component_fits(two_comp_fits, variable, period_hours, period2_hours, zt_offset, palette, figsize)
     )
 
     # --- Section 5: activity onset / offset -------------------------------
@@ -791,7 +784,7 @@ def get_chronobiology_result(
         sections.append(get_great_table(onset_df, "Daily onset / offset (ZT)").as_raw_html(inline_css=True))
         if expose_tables:
             tables["Activity onset / offset"] = ResultTable(onset_df, key_col)
-        sections.append(get_html_image_from_figure(_plot_onset_offset(onset_tables, palette, figsize)))
+        sections.append(_plot_onset_offset(onset_tables, palette, figsize))
     else:
         sections.append("<p><em>Not enough data to detect daily onset / offset.</em></p>")
 
@@ -814,21 +807,19 @@ def get_chronobiology_result(
                 bar_color=palette.get(label, color_manager.get_color_hex(0)),
                 title=f"Actogram — {variable.name} ({label})",
             )
-            sections.append(get_html_image_from_figure(figure))
+            sections.append(figure)
         elif len(groups_data) >= 2:
             sections.append(
-                get_html_image_from_figure(
-                    plot_combined_actograms_grid(
-                        groups_data,
-                        shared_days,
-                        figsize,
-                        binsize=1 / bins_per_hour,
-                        highlight_periods=periods,
-                        palette=palette,
-                        title=f"Actograms grid — {variable.name}",
-                    )
+                plot_combined_actograms_grid(
+                    groups_data,
+                    shared_days,
+                    figsize,
+                    binsize=1 / bins_per_hour,
+                    highlight_periods=periods,
+                    palette=palette,
+                    title=f"Actograms grid — {variable.name}",
                 )
             )
 
-    report = "\n<p>\n".join(sections)
+    report = "\n<p>\n".join(render_html_sections(sections))
     return ChronobiologyResult(report=report, tables=tables)
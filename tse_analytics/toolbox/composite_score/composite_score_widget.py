@@ -10,7 +10,6 @@ from tse_analytics.core.toaster import make_toast
 from tse_analytics.core.utils import get_figsize_from_widget, get_widget_tool_button
 from tse_analytics.toolbox.composite_score.processor import get_composite_score_result
 from tse_analytics.toolbox.composite_score.score_config_table_widget import ScoreConfigTableWidget
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 
@@ -26,12 +25,6 @@ class CompositeScoreWidgetSettings:
     color_by: str = "Animal"  # factor name used to color the chart bars
 
 
-@toolbox_plugin(
-    category="Exploration",
-    label="Composite Performance Score",
-    icon=":/icons/exploration.png",
-    order=3,
-)
 class CompositeScoreWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
@@ -15,6 +15,7 @@ from matplotlib import pyplot as plt
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -97,6 +98,7 @@ def compute_composite_scores(
     return result, warnings
 
 
+@cached_result
 def get_composite_score_result(
     datatable: Datatable,
     variables: list[str],
@@ -7,6 +7,7 @@ from matplotlib import rcParams
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -14,6 +15,7 @@ class CorrelationResult:
     report: str
 
 
+@cached_result
 def get_correlation_result(
     datatable: Datatable,
     x_var_name: str,
@@ -11,7 +11,6 @@ from PySide6.QtWidgets import (
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_figsize_from_widget, get_widget_tool_button
 from tse_analytics.toolbox.correlation_matrix.processor import get_correlation_matrix_result
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.variables_table_widget import VariablesTableWidget
 
@@ -21,7 +20,6 @@ class CorrelationMatrixWidgetSettings:
     selected_variables: list[str] = field(default_factory=list)
 
 
-@toolbox_plugin(category="Factor Analysis", label="Correlation Matrix", icon=":/icons/dimensionality.png", order=0)
 class CorrelationMatrixWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
@@ -7,6 +7,7 @@ from matplotlib import rcParams
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -14,6 +15,7 @@ class CorrelationMatrixResult:
     report: str
 
 
+@cached_result
 def get_correlation_matrix_result(
     datatable: Datatable,
     variables: list[str],
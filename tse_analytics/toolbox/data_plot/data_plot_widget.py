@@ -27,7 +27,6 @@ from tse_analytics.core.utils import (
     get_widget_tool_button,
 )
 from tse_analytics.toolbox.data_plot.processor import ERROR_BAR_TYPE, compute_dark_band_spans
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.MplCanvas import MplCanvas
 from tse_analytics.views.misc.variables_table_widget import VariablesTableWidget
@@ -41,7 +40,6 @@ class DataPlotWidgetSettings:
     line_width: float = 1.0
 
 
-@toolbox_plugin(category="Data", label="Line Plot", icon=":/icons/plot.png", order=3)
 class DataPlotWidget(QWidget):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(parent)
@@ -8,6 +8,7 @@ from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import ByTimeOfDayConfig, Variable
 from tse_analytics.core.utils import get_html_image_from_figure, time_to_float
+from tse_analytics.toolbox.result_cache import cached_result
 
 ERROR_BAR_TYPE: dict[str, str | None] = {
     "None": None,
@@ -64,6 +65,7 @@ def compute_dark_band_spans(
     return spans
 
 
+@cached_result
 def get_data_plot_result(
     datatable: Datatable,
     variables: dict[str, Variable],
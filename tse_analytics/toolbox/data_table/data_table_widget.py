@@ -28,7 +28,6 @@ from tse_analytics.core.utils import get_great_table, get_h_spacer_widget, get_s
 from tse_analytics.core.workers.task_manager import TaskManager
 from tse_analytics.core.workers.worker import Worker
 from tse_analytics.toolbox.data_table.variables.variables_widget import VariablesWidget
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.views.misc.report_edit import ReportEdit
 
 
@@ -38,7 +37,6 @@ class DataWidgetSettings:
     splitter_state: QByteArray | None = None
 
 
-@toolbox_plugin(category="Data", label="Table", icon=":/icons/table.png", order=0)
 class DataTableWidget(QWidget, messaging.MessengerListener):
     def __init__(self, datatable: Datatable, name: str = "DataTableWidget", parent: QWidget | None = None):
         super().__init__(parent)
@@ -63,7 +63,7 @@ class AddVariableDialog(QDialog):
             QMessageBox.warning(self, "Warning", "Variable name already exists.")
             return
 
-        df = self.datatable.df.copy()
+        df = self.datatable.df.copy(deep=False)
 
         if self.ui.radioButtonOriginAnimalProperty.isChecked():
             animal_property = self.ui.comboBoxAnimalProperty.currentText()
@@ -7,6 +7,7 @@ from ptitprince import RainCloud
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -14,6 +15,7 @@ class DistributionResult:
     report: str
 
 
+@cached_result
 def get_distribution_result(
     datatable: Datatable,
     variable_name: str,
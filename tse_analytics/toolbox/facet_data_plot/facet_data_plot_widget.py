@@ -11,7 +11,6 @@ from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.report import Report
 from tse_analytics.core.toaster import make_toast
 from tse_analytics.core.utils import get_h_spacer_widget, get_html_image_from_figure
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.MplCanvas import MplCanvas
 from tse_analytics.views.misc.variable_selector import VariableSelector
@@ -24,7 +23,6 @@ class FactorsPlotWidgetSettings:
     selected_variable: str = None
 
 
-@toolbox_plugin(category="Data", label="Facet Plot", icon=":/icons/plot.png", order=2)
 class FactorsPlotWidget(QWidget):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(parent)
@@ -0,0 +1,118 @@
+"""Level-of-detail decimation for long line series.
+
+A ``DecimationPyramid`` is built once per plotted series. Each level splits the series into
+equal buckets of consecutive samples and keeps, per bucket, the indices of its first, last,
+minimum and maximum samples (M4 aggregation). Drawing those four points per pixel column gives
+the same raster as drawing every sample, so a view only needs about four points per pixel of
+plot width regardless of how many samples fall into its x-range.
+"""
+
+import numpy as np
+
+BASE_BUCKET_SIZE = 8  # Samples per bucket at the finest level
+LEVEL_FACTOR = 4  # Bucket size ratio between consecutive levels
+POINTS_PER_BUCKET = 4  # First, min, max and last sample of a bucket
+
+
+class DecimationPyramid:
+    """Min/max decimation pyramid of a series sorted by x.
+
+    Args:
+        x: Sample positions, sorted ascending.
+        y: Sample values; NaN marks gaps and never wins a min/max comparison.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+
+        # Per level: bucket size and (first, min, max, last) sample indices of each bucket
+        self.levels: list[tuple[int, np.ndarray]] = []
+        if self.x.size > BASE_BUCKET_SIZE:
+            self._build_levels()
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    def _build_levels(self) -> None:
+        # Keys used to pick the bucket extrema, ignoring NaN gaps
+        is_nan = np.isnan(self.y)
+        min_key = np.where(is_nan, np.inf, self.y)
+        max_key = np.where(is_nan, -np.inf, self.y)
+
+        n = self.x.size
+        bucket_count = -(-n // BASE_BUCKET_SIZE)
+        starts = np.arange(bucket_count) * BASE_BUCKET_SIZE
+        padded = np.full(bucket_count * BASE_BUCKET_SIZE, n - 1)
+        padded[:n] = np.arange(n)
+        padded = padded.reshape(bucket_count, BASE_BUCKET_SIZE)
+
+        indices = np.column_stack((
+            starts,
+            padded[np.arange(bucket_count), min_key[padded].argmin(axis=1)],
+            padded[np.arange(bucket_count), max_key[padded].argmax(axis=1)],
+            np.minimum(starts + BASE_BUCKET_SIZE - 1, n - 1),
+        ))
+        bucket_size = BASE_BUCKET_SIZE
+        self.levels.append((bucket_size, indices))
+
+        while len(indices) > 1:
+            count = -(-len(indices) // LEVEL_FACTOR)
+            # Repeating the last bucket as padding leaves the extrema and the last sample unchanged
+            padded = np.concatenate((indices, np.repeat(indices[-1:], count * LEVEL_FACTOR - len(indices), axis=0)))
+            groups = padded.reshape(count, LEVEL_FACTOR, POINTS_PER_BUCKET)
+            rows = np.arange(count)
+            indices = np.column_stack((
+                groups[:, 0, 0],
+                groups[rows, min_key[groups[:, :, 1]].argmin(axis=1), 1],
+                groups[rows, max_key[groups[:, :, 2]].argmax(axis=1), 2],
+                groups[:, -1, 3],
+            ))
+            bucket_size *= LEVEL_FACTOR
+            self.levels.append((bucket_size, indices))
+
+    def query(self, x_min: float, x_max: float, pixel_width: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the points needed to draw ``[x_min, x_max]`` at the given pixel width.
+
+        One sample beyond each end of the range is included so that lines run to the view edges.
+
+        Args:
+            x_min: Start of the visible x-range.
+            x_max: End of the visible x-range.
+            pixel_width: Width of the plot area in pixels.
+
+        Returns:
+            The x and y values to plot, sorted by x.
+        """
+        start = max(int(np.searchsorted(self.x, x_min, side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(self.x, x_max, side="right")) + 1, self.x.size)
+        count = stop - start
+        pixel_width = max(int(pixel_width), 1)
+        if count <= POINTS_PER_BUCKET * pixel_width or not self.levels:
+            return self.x[start:stop], self.y[start:stop]
+
+        # Coarsest level that still has at least one bucket per pixel
+        level = 0
+        while level + 1 < len(self.levels) and count // self.levels[level + 1][0] >= pixel_width:
+            level += 1
+
+        selected = np.concatenate(self._select(start, stop, level))
+        selected = selected[np.concatenate(([True], selected[1:] != selected[:-1]))]
+        return self.x[selected], self.y[selected]
+
+    def _select(self, start: int, stop: int, level: int) -> list[np.ndarray]:
+        # Buckets lying entirely within [start, stop) at this level, partial ends from finer levels
+        if start >= stop:
+            return []
+        if level < 0:
+            return [np.arange(start, stop)]
+        bucket_size, indices = self.levels[level]
+        first = -(-start // bucket_size)
+        last = len(indices) if stop == self.x.size else stop // bucket_size
+        if first >= last:
+            return self._select(start, stop, level - 1)
+        return [
+            *self._select(start, first * bucket_size, level - 1),
+            np.sort(indices[first:last], axis=1).ravel(),
+            *self._select(min(last * bucket_size, stop), stop, level - 1),
+        ]
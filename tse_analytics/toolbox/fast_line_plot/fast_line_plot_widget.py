@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from io import BytesIO
 from math import isnan
 
+import numpy as np
 import pandas as pd
 import pyqtgraph as pg
 from pyqtgraph.exporters import ImageExporter
@@ -10,12 +11,12 @@ from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSettings, QSize, Qt
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QCheckBox, QInputDialog, QLabel, QToolBar, QVBoxLayout, QWidget
 
-from tse_analytics.core import color_manager, manager
+from tse_analytics.core import color_manager, manager, messaging
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.report import Report
 from tse_analytics.core.data.shared import Factor
 from tse_analytics.core.utils import get_h_spacer_widget, get_widget_tool_button
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
+from tse_analytics.toolbox.fast_line_plot.decimation import DecimationPyramid
 from tse_analytics.views.misc.animals_table_view import AnimalsTableView
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.TimedeltaAxisItem import TimedeltaAxisItem
@@ -29,8 +30,7 @@ class FastLinePlotWidgetSettings:
     scatter_plot: bool = False
 
 
-@toolbox_plugin(category="Data", label="Fast Line Plot", icon=":/icons/plot.png", order=1)
-class FastLinePlotWidget(QWidget):
+class FastLinePlotWidget(QWidget, messaging.MessengerListener):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(parent)
 
@@ -54,6 +54,11 @@ class FastLinePlotWidget(QWidget):
 
         self.datatable = datatable
 
+        # Decimation pyramids of the plotted series, cached per (variable, factor, animal filter)
+        self._series_cache: dict[tuple, list[tuple[str, str, DecimationPyramid]]] = {}
+        # Detail plot items with the pyramids they are drawn from
+        self._plotted_series: list[tuple[pg.PlotDataItem, DecimationPyramid]] = []
+
         # Setup toolbar
         toolbar = QToolBar(
             "Toolbar",
@@ -123,6 +128,7 @@ class FastLinePlotWidget(QWidget):
 
         self.region.sigRegionChanged.connect(self._region_changed)
         self.plot_item1.sigXRangeChanged.connect(self._x_range_changed)
+        self.plot_item1.vb.sigResized.connect(self._update_detail_plot)
 
         self._layout.addWidget(self.plot_view)
 
@@ -132,7 +138,11 @@ class FastLinePlotWidget(QWidget):
 
         self._refresh_data()
 
+        messaging.subscribe(self, messaging.OutliersChangedMessage, self._on_outliers_changed)
+        messaging.subscribe(self, messaging.DataChangedMessage, self._on_data_changed)
+
     def _destroyed(self):
+        messaging.unsubscribe_all(self)
         settings = QSettings()
         settings.setValue(
             self.__class__.__name__,
@@ -149,79 +159,114 @@ class FastLinePlotWidget(QWidget):
     def _set_scatter_plot(self, state: Qt.CheckState):
         self._refresh_data()
 
+    def _on_outliers_changed(self, message: messaging.OutliersChangedMessage) -> None:
+        if message.datatable == self.datatable:
+            self._series_cache.clear()
+            self._refresh_data()
+
+    def _on_data_changed(self, message: messaging.DataChangedMessage) -> None:
+        if message.dataset == self.datatable.dataset:
+            self._series_cache.clear()
+            self._refresh_data()
+
     def _refresh_data(self):
         self.plot_item1.clear()
         self.plot_item2.clearPlots()
         self.legend.clear()
+        self._plotted_series.clear()
 
         factor_name = self.group_by_selector.currentText()
         variable = self.variableSelector.get_selected_variable()
 
-        columns = ["Timedelta", factor_name, variable.name]
+        selected_animal_ids = (
+            tuple(self.animals_table_view.get_selected_animal_ids())
+            if factor_name == "Animal" and len(self.animals_table_view.selectedIndexes()) > 0
+            else ()
+        )
+        key = (variable.name, factor_name, selected_animal_ids)
+        series = self._series_cache.get(key)
+        if series is None:
+            series = self._get_series(variable.name, factor_name, selected_animal_ids)
+            self._series_cache[key] = series
+
+        x_min = None
+        x_max = None
+        for name, color, pyramid in series:
+            tmp_min, tmp_max = self._plot_item(pyramid, variable.name, name, pg.mkPen(color=color, width=1))
+            if x_min is None or tmp_min < x_min:
+                x_min = tmp_min
+            if x_max is None or tmp_max > x_max:
+                x_max = tmp_max
+
+        # bound the LinearRegionItem to the plotted data
+        self.region.setRegion([x_min, x_max])
+
+    def _get_series(
+        self, variable_name: str, factor_name: str, selected_animal_ids: tuple[str, ...]
+    ) -> list[tuple[str, str, DecimationPyramid]]:
+        columns = ["Timedelta", factor_name, variable_name]
         df = self.datatable.get_filtered_df(columns)
 
-        if factor_name == "Animal" and len(self.animals_table_view.selectedIndexes()) > 0:
-            df = df[df["Animal"].isin(self.animals_table_view.get_selected_animal_ids())]
+        if len(selected_animal_ids) > 0:
+            df = df[df["Animal"].isin(selected_animal_ids)]
             df["Animal"] = df["Animal"].cat.remove_unused_categories()
 
         df = df.groupby(["Timedelta", factor_name], dropna=False, observed=False).aggregate("mean").reset_index()
 
         factor = self.datatable.dataset.factors[factor_name]
-        x_min, x_max = self._plot_factors(df, variable.name, factor)
+        return self._get_factor_series(df, variable_name, factor)
 
-        # bound the LinearRegionItem to the plotted data
-        self.region.setRegion([x_min, x_max])
-
-    def _plot_item(self, data: pd.DataFrame, variable_name: str, name: str, pen):
-        # x = (data["DateTime"] - pd.Timestamp("1970-01-01")) // pd.Timedelta("1s")  # Convert to POSIX timestamp
-        x = data["Timedelta"].dt.total_seconds().to_numpy()
-        y = data[variable_name].to_numpy()
+    def _get_factor_series(
+        self, df: pd.DataFrame, variable_name: str, factor: Factor
+    ) -> list[tuple[str, str, DecimationPyramid]]:
+        if len(factor.levels) > 0:
+            levels = [(level.name, f"{level.name}", level.color) for level in factor.levels.values()]
+        else:
+            levels = [
+                (level, f"{level}", color_manager.get_color_hex(int(level))) for level in df[factor.name].unique()
+            ]
+
+        series = []
+        for level, name, color in levels:
+            factor_data = df[df[factor.name] == level]
+            # x = (data["DateTime"] - pd.Timestamp("1970-01-01")) // pd.Timedelta("1s")  # Convert to POSIX timestamp
+            x = factor_data["Timedelta"].dt.total_seconds().to_numpy()
+            y = factor_data[variable_name].to_numpy(dtype=np.float64, na_value=np.nan)
+            series.append((name, color, DecimationPyramid(x, y)))
+        return series
+
+    def _plot_item(self, pyramid: DecimationPyramid, variable_name: str, name: str, pen):
+        x = pyramid.x
+        if x.size != 0:
+            x_range = x[0], x[-1]
+        else:
+            x_range = 0, 0
 
+        x_detail, y_detail = pyramid.query(*x_range, self._get_plot_width(self.plot_item1))
         plot_data_item = (
-            self.plot_item1.scatterPlot(x, y, pen=pen, size=2)
+            self.plot_item1.scatterPlot(x_detail, y_detail, pen=pen, size=2)
             if self.checkBoxScatterPlot.isChecked()
-            else self.plot_item1.plot(x, y, pen=pen)
+            else self.plot_item1.plot(x_detail, y_detail, pen=pen)
         )
+        self._plotted_series.append((plot_data_item, pyramid))
         self.plot_item1.setTitle(variable_name)
-
         self.legend.addItem(plot_data_item, name)
 
-        self.plot_item2.plot(x, y, pen=pen)
-
-        if x.size != 0:
-            return x.min(), x.max()
-        else:
-            return 0, 0
-
-    def _plot_factors(self, df: pd.DataFrame, variable_name: str, factor: Factor) -> tuple[float, float]:
-        x_min = None
-        x_max = None
-
-        if len(factor.levels) > 0:
-            for level in factor.levels.values():
-                factor_data = df[df[factor.name] == level.name]
-
-                pen = pg.mkPen(color=level.color, width=1)
-                tmp_min, tmp_max = self._plot_item(factor_data, variable_name, f"{level.name}", pen)
-
-                if x_min is None or tmp_min < x_min:
-                    x_min = tmp_min
-                if x_max is None or tmp_max > x_max:
-                    x_max = tmp_max
-        else:
-            levels = df[factor.name].unique()
-            for level in levels:
-                factor_data = df[df[factor.name] == level]
+        self.plot_item2.plot(*pyramid.query(*x_range, self._get_plot_width(self.plot_item2)), pen=pen)
 
-                pen = pg.mkPen(color=color_manager.get_color_hex(int(level)), width=1)
-                tmp_min, tmp_max = self._plot_item(factor_data, variable_name, f"{level}", pen)
+        return x_range
 
-                if x_min is None or tmp_min < x_min:
-                    x_min = tmp_min
-                if x_max is None or tmp_max > x_max:
-                    x_max = tmp_max
+    @staticmethod
+    def _get_plot_width(plot_item: pg.PlotItem) -> int:
+        # The view box is not laid out before the widget is first shown
+        return max(int(plot_item.vb.width()), 1000)
 
-        return x_min, x_max
+    def _update_detail_plot(self):
+        """Replace the detail plot data with the points needed for its current x-range and width."""
+        (x_min, x_max), _ = self.plot_item1.vb.viewRange()
+        pixel_width = self._get_plot_width(self.plot_item1)
+        for plot_data_item, pyramid in self._plotted_series:
+            plot_data_item.setData(*pyramid.query(x_min, x_max, pixel_width))
 
     def _region_changed(self):
         """Handle changes in the region selector.
@@ -242,6 +287,7 @@ class FastLinePlotWidget(QWidget):
             range: The new x-range.
         """
         self.region.setRegion(range)
+        self._update_detail_plot()
 
     def _add_report(self):
         exporter = ImageExporter(self.plot_item1)
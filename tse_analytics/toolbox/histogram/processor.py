@@ -6,6 +6,7 @@ import seaborn.objects as so
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -13,6 +14,7 @@ class HistogramResult:
     report: str
 
 
+@cached_result
 def get_histogram_result(
     datatable: Datatable,
     variable_name: str,
@@ -15,7 +15,6 @@ from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.toaster import make_toast
 from tse_analytics.core.utils import get_figsize_from_widget, get_widget_tool_button
 from tse_analytics.toolbox.matrix_plot.processor import MATRIXPLOT_KIND, get_matrix_plot_result
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.variables_table_widget import VariablesTableWidget
@@ -28,7 +27,6 @@ class MatrixPlotWidgetSettings:
     plot_type: str = "Scatter Plot"
 
 
-@toolbox_plugin(category="Factor Analysis", label="Matrix Plot", icon=":/icons/dimensionality.png", order=1)
 class MatrixPlotWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
@@ -7,6 +7,7 @@ from matplotlib import rcParams
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 MATRIXPLOT_KIND: dict[str, Literal["scatter", "kde", "hist", "reg"]] = {
     "Scatter Plot": "scatter",
@@ -21,6 +22,7 @@ class MatrixPlotResult:
     report: str
 
 
+@cached_result
 def get_matrix_plot_result(
     datatable: Datatable,
     variables: list[str],
@@ -10,6 +10,7 @@ from sklearn.preprocessing import StandardScaler
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -17,6 +18,7 @@ class MdsResult:
     report: str
 
 
+@cached_result
 def get_mds_result(
     datatable: Datatable,
     variables: list[str],
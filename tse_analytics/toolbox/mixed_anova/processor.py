@@ -10,6 +10,7 @@ from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_plot
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -17,6 +18,7 @@ class MixedAnovaResult:
     report: str
 
 
+@cached_result
 def get_mixed_anova_result(
     datatable: Datatable,
     dependent_variable: Variable,
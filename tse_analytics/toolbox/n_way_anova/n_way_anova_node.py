@@ -8,6 +8,7 @@ from tse_analytics.toolbox.n_way_anova.processor import get_n_way_anova_result
 class NWayAnovaNode(PipelineNode):
     __identifier__ = "stats"
     NODE_NAME = "N-way ANOVA"
+    CONCURRENT = True
 
     def __init__(self):
         super().__init__()
@@ -4,7 +4,9 @@ import pingouin as pg
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
+from tse_analytics.core.io.query import query_datatable
 from tse_analytics.core.utils import get_great_table
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -12,6 +14,7 @@ class NWayAnovaResult:
     report: str
 
 
+@cached_result
 def get_n_way_anova_result(
     datatable: Datatable,
     dependent_variable: Variable,
@@ -19,18 +22,11 @@ def get_n_way_anova_result(
     effsize: str,
     padjust: str,
 ) -> NWayAnovaResult:
-    df = datatable.get_filtered_df(["Animal", dependent_variable.name] + factor_names)
-    df = (
-        df
-        .groupby(
-            ["Animal"] + factor_names,
-            dropna=False,
-            observed=True,
-        )
-        .aggregate({
-            dependent_variable.name: dependent_variable.aggregation,
-        })
-        .reset_index()
+    df = query_datatable(
+        datatable,
+        ["Animal", dependent_variable.name] + factor_names,
+        group_by=["Animal"] + factor_names,
+        aggregations={dependent_variable.name: dependent_variable.aggregation},
     )
 
     # Sanitize variable name: comma, bracket, and colon are not allowed in column names
@@ -5,7 +5,6 @@ from PySide6.QtWidgets import QLabel, QToolBar, QWidget
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_figsize_from_widget
 from tse_analytics.toolbox.normality.processor import get_normality_result
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.variable_selector import VariableSelector
@@ -17,7 +16,6 @@ class NormalityWidgetSettings:
     selected_variable: str | None = None
 
 
-@toolbox_plugin(category="Exploration", label="Normality", icon=":/icons/exploration.png", order=2)
 class NormalityWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
@@ -5,6 +5,7 @@ import pingouin as pg
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure, get_plot_layout
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -12,6 +13,7 @@ class NormalityTestResult:
     report: str
 
 
+@cached_result
 def get_normality_result(
     datatable: Datatable,
     variable_name: str,
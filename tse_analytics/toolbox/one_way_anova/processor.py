@@ -6,7 +6,9 @@ from statsmodels.stats.multicomp import pairwise_tukeyhsd
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
+from tse_analytics.core.io.query import query_datatable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -14,6 +16,7 @@ class OneWayAnovaResult:
     report: str
 
 
+@cached_result
 def get_one_way_anova_result(
     datatable: Datatable,
     dependent_variable: Variable,
@@ -21,18 +24,11 @@ def get_one_way_anova_result(
     effsize: str,
     figsize: tuple[float, float] | None = None,
 ) -> OneWayAnovaResult:
-    df = datatable.get_filtered_df(["Animal", dependent_variable.name, factor_name])
-    df = (
-        df
-        .groupby(
-            ["Animal", factor_name],
-            dropna=False,
-            observed=True,
-        )
-        .aggregate({
-            dependent_variable.name: dependent_variable.aggregation,
-        })
-        .reset_index()
+    df = query_datatable(
+        datatable,
+        ["Animal", dependent_variable.name, factor_name],
+        group_by=["Animal", factor_name],
+        aggregations={dependent_variable.name: dependent_variable.aggregation},
     )
 
     normality = pg.normality(df, group=factor_name, dv=dependent_variable.name)
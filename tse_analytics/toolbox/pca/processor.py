@@ -9,8 +9,9 @@ from sklearn.preprocessing import StandardScaler
 
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
-from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.core.utils import get_html_images_from_figures
 from tse_analytics.toolbox.pca.plots import pca_explained_variance_plot, variable_contributions_plot
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -18,6 +19,7 @@ class PcaResult:
     report: str
 
 
+@cached_result
 def get_pca_result(
     datatable: Datatable,
     variables: list[str],
@@ -95,14 +97,23 @@ def get_pca_result(
         title="PCA Scores (3D)",
     )
 
+    explained_variance_image, variable_contributions_image, scores_2d_image, scores_3d_image = (
+        get_html_images_from_figures([
+            explained_variance_figure,
+            variable_contributions_figure,
+            figure_2d_scores,
+            figure_3d_scores,
+        ])
+    )
+
     report = f"""
-    {get_html_image_from_figure(explained_variance_figure)}
+    {explained_variance_image}
     <p>
-    {get_html_image_from_figure(variable_contributions_figure)}
+    {variable_contributions_image}
     <p>
-    {get_html_image_from_figure(figure_2d_scores)}
+    {scores_2d_image}
     <p>
-    {get_html_image_from_figure(figure_3d_scores)}
+    {scores_3d_image}
     """
 
     return PcaResult(
@@ -14,7 +14,6 @@ from tse_analytics.toolbox.periodogram.processor import (
     PeriodogramResult,
     get_periodogram_result,
 )
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
 from tse_analytics.views.misc.variable_selector import VariableSelector
@@ -28,12 +27,6 @@ class PeriodogramWidgetSettings:
     max_period: float = MAX_PERIOD_HOURS
 
 
-@toolbox_plugin(
-    category="Chronobiology",
-    label="Periodogram",
-    icon=":/icons/icons8-normal-distribution-histogram-16.png",
-    order=2,
-)
 class PeriodogramWidget(ToolboxWidgetBase):
     """Lomb–Scargle periodogram of a selected variable, one power curve per group level."""
 
@@ -9,6 +9,7 @@ from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_figure
 from tse_analytics.toolbox.chronobiology.processor import _lombscargle_period, _to_hours_since_start
+from tse_analytics.toolbox.result_cache import cached_result
 
 # Period search grid (hours). The frequency grid is uniformly spaced in frequency
 # between 1 / MAX_PERIOD_HOURS and 1 / MIN_PERIOD_HOURS.
@@ -51,6 +52,7 @@ def _plot_periodogram(
     return figure
 
 
+@cached_result
 def get_periodogram_result(
     datatable: Datatable,
     variable: Variable,
@@ -9,6 +9,7 @@ from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -16,6 +17,7 @@ class RegressionResult:
     report: str
 
 
+@cached_result
 def get_regression_result(
     datatable: Datatable,
     covariate: Variable,
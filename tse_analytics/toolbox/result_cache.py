@@ -0,0 +1,246 @@
+"""Disk cache of toolbox processor results.
+
+Processors decorated with ``cached_result`` look their result up in a shared on-disk cache before
+computing it, so reopening a layout or re-running an unchanged analysis does not repeat minutes of
+computation. A result is keyed by the processor, the content fingerprint of the datatable, the
+dataset state processors read (variables, outlier settings, factors, animals, metadata) and the
+remaining processor arguments. The cache is a directory of pickled results; the least recently used
+entries are evicted once it exceeds its size limit.
+
+The cache is disabled until ``configure_result_cache`` is called, which the application does at
+startup, so processors called from tests or scripts compute their results as before.
+"""
+
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import threading
+import timeit
+from collections.abc import Callable
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from tse_analytics.core.data.datatable import Datatable
+
+DEFAULT_MAX_BYTES = 512 * 1024**2
+
+_ENTRY_SUFFIX = ".pickle"
+
+
+def _application_version() -> str:
+    try:
+        return importlib.metadata.version("tse-analytics")
+    except importlib.metadata.PackageNotFoundError:
+        return "dev"
+
+
+class ResultCache:
+    """A size-limited directory of pickled results, evicted least recently used first.
+
+    Entries are written atomically, so several threads or processes can share a cache directory.
+    Reading an entry refreshes its modification time, which orders the eviction.
+
+    Args:
+        path: The cache directory, created if needed.
+        max_bytes: Size limit of all entries together.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}{_ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.path.glob(f"*{_ENTRY_SUFFIX}"):
+            with contextlib.suppress(FileNotFoundError):
+                entries.append((path, path.stat()))
+        return entries
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of all entries together."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def get(self, key: str) -> Any | None:
+        """Read an entry.
+
+        Args:
+            key: The entry key.
+
+        Returns:
+            The cached value, or None if there is no (readable) entry for the key.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Truncated or written by an incompatible version
+            logger.warning(f"Discarding unreadable result cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Write an entry, then evict the least recently used entries beyond the size limit.
+
+        Values larger than the size limit itself are not stored.
+
+        Args:
+            key: The entry key.
+            value: A picklable value.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError as e:
+            logger.warning(f"Cannot write result cache entry: {e}")
+            Path(temp_path).unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits its size limit."""
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+            size = sum(stat.st_size for _, stat in entries)
+            for path, stat in entries:
+                if size <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                size -= stat.st_size
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+
+_result_cache: ResultCache | None = None
+
+
+def configure_result_cache(path: str | Path | None, max_bytes: int = DEFAULT_MAX_BYTES) -> ResultCache | None:
+    """Set up the result cache shared by all processors.
+
+    Args:
+        path: The cache directory, or None to disable caching.
+        max_bytes: Size limit of the cache.
+
+    Returns:
+        The shared cache, or None if disabled.
+    """
+    global _result_cache
+    _result_cache = ResultCache(path, max_bytes) if path is not None else None
+    return _result_cache
+
+
+def get_result_cache() -> ResultCache | None:
+    """The shared result cache, or None if caching is disabled."""
+    return _result_cache
+
+
+def _json_default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def result_cache_key(function: Callable[..., Any], datatable: Datatable, arguments: dict[str, Any]) -> str | None:
+    """Key of a processor call.
+
+    Args:
+        function: The processor function.
+        datatable: The datatable the processor runs on.
+        arguments: The other arguments of the call by parameter name.
+
+    Returns:
+        The key, or None if the arguments cannot be serialized.
+    """
+    dataset = datatable.dataset
+    payload = [
+        _application_version(),
+        f"{function.__module__}.{function.__qualname__}",
+        datatable.fingerprint,
+        datatable.variables,
+        datatable.outliers_settings,
+        datatable.metadata,
+        dataset.factors,
+        dataset.animals,
+        dataset.metadata,
+        arguments,
+    ]
+    try:
+        text = json.dumps(payload, default=_json_default, sort_keys=True)
+    except TypeError, ValueError:
+        return None
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def cached_result(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a processor ``get_*_result(datatable, ...)`` to reuse results from the result cache.
+
+    A None result is not cached.
+
+    Args:
+        function: The processor, taking the datatable as first argument.
+
+    Returns:
+        The caching processor.
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        cache = _result_cache
+        if cache is None:
+            return function(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        datatable = arguments.pop(next(iter(signature.parameters)))
+        key = result_cache_key(function, datatable, arguments)
+        if key is None:
+            return function(*args, **kwargs)
+
+        result = cache.get(key)
+        if result is not None:
+            logger.debug(f"{function.__qualname__} result reused from cache")
+            return result
+
+        tic = timeit.default_timer()
+        result = function(*args, **kwargs)
+        if result is not None:
+            cache.put(key, result)
+        logger.debug(f"{function.__qualname__} computed in {(timeit.default_timer() - tic):.3f} sec")
+        return result
+
+    return wrapper
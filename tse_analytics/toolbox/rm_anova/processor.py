@@ -9,7 +9,9 @@ from matplotlib import rcParams
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.data.shared import Variable
+from tse_analytics.core.io.query import query_datatable
 from tse_analytics.core.utils import get_great_table, get_html_image_from_plot
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -17,6 +19,7 @@ class RMAnovaResult:
     report: str
 
 
+@cached_result
 def get_rm_anova_result(
     datatable: Datatable,
     dependent_variable: Variable,
@@ -27,18 +30,11 @@ def get_rm_anova_result(
     figsize: tuple[float, float] | None = None,
 ) -> RMAnovaResult:
     subject = datatable.dataset.subject_id_column
-    df = datatable.get_filtered_df([subject, dependent_variable.name] + factor_names)
-    df = (
-        df
-        .groupby(
-            [subject] + factor_names,
-            dropna=False,
-            observed=True,
-        )
-        .aggregate({
-            dependent_variable.name: dependent_variable.aggregation,
-        })
-        .reset_index()
+    df = query_datatable(
+        datatable,
+        [subject, dependent_variable.name] + factor_names,
+        group_by=[subject] + factor_names,
+        aggregations={dependent_variable.name: dependent_variable.aggregation},
     )
 
     report_sections: list[str] = []
@@ -7,6 +7,7 @@ from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -14,6 +15,7 @@ class TimeseriesAutocorrelationResult:
     report: str
 
 
+@cached_result
 def get_timeseries_autocorrelation_result(
     datatable: Datatable,
     animal_id: str,
@@ -6,6 +6,7 @@ from statsmodels.tsa.seasonal import STL, seasonal_decompose
 
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -13,6 +14,7 @@ class TimeseriesDecompositionResult:
     report: str
 
 
+@cached_result
 def get_timeseries_decomposition_result(
     datatable: Datatable,
     animal_id: str,
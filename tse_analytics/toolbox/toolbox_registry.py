@@ -1,8 +1,11 @@
-"""Decorator-based plugin registry for toolbox widgets.
+"""Plugin registry for toolbox widgets.
 
-Provides a ``@toolbox_plugin`` class-decorator that registers a widget class
-with the :class:`ToolboxRegistry`.  :class:`ToolboxButton` reads the registry
-at construction time to build its menus dynamically.
+Tools are declared statically as :class:`ToolboxPluginInfo` descriptors in the
+manifest in ``toolbox/__init__.py``.  A descriptor names its widget class by
+import path, so building the menus imports no widget module (and none of the
+heavy analysis libraries behind them); the module is imported the first time
+the user opens the tool.  :class:`ToolboxButton` reads the registry at
+construction time to build its menus dynamically.
 
 The registry is the single source of truth for *which* tools exist and *when*
 they apply: the optional ``dataset_types`` / ``required_datatable_name`` /
@@ -13,9 +16,14 @@ no hard-coded per-tool special-casing.
 
 from __future__ import annotations
 
+import importlib
+import sys
+import timeit
 from dataclasses import dataclass
 from typing import Any, Protocol
 
+from loguru import logger
+
 
 class ToolboxWidget(Protocol):
     """Structural contract that registered toolbox widgets must satisfy.
@@ -39,12 +47,17 @@ class ToolboxWidget(Protocol):
 
 @dataclass(frozen=True)
 class ToolboxPluginInfo:
-    """Metadata for a single registered toolbox widget."""
+    """Metadata for a single registered toolbox widget.
+
+    ``widget`` is either the widget class itself or its import path as
+    ``"package.module:ClassName"``; :attr:`widget_class` resolves the latter on
+    first access.
+    """
 
     category: str
     label: str
     icon: str
-    widget_class: type
+    widget: type | str
     order: int = 0
     # --- optional applicability / presentation metadata ---
     dataset_types: tuple[str, ...] | None = None
@@ -56,6 +69,29 @@ class ToolboxPluginInfo:
     tooltip: str | None = None
     """Optional tooltip shown on the menu action."""
 
+    @property
+    def module_name(self) -> str | None:
+        """Module defining the widget class, or ``None`` for a class given directly."""
+        return self.widget.partition(":")[0] if isinstance(self.widget, str) else None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the widget class is available without importing its module."""
+        return self.module_name is None or self.module_name in sys.modules
+
+    @property
+    def widget_class(self) -> type:
+        """The widget class, importing its module on first access."""
+        if not isinstance(self.widget, str):
+            return self.widget
+        module_name, _, class_name = self.widget.partition(":")
+        if module_name in sys.modules:
+            return getattr(sys.modules[module_name], class_name)
+        tic = timeit.default_timer()
+        module = importlib.import_module(module_name)
+        logger.debug(f"Toolbox plugin {self.label!r} imported in {(timeit.default_timer() - tic):.3f} sec")
+        return getattr(module, class_name)
+
     def is_applicable(self, dataset: Any, datatable: Any | None) -> bool:
         """Whether this tool applies to the given dataset/datatable selection.
 
@@ -112,69 +148,18 @@ class ToolboxRegistry:
         return ordered
 
 
-# Module-level singleton used by the decorator and consumers.
+# Module-level singleton populated by the manifest in ``toolbox/__init__.py``.
 registry = ToolboxRegistry()
 
 
-def toolbox_plugin(
-    category: str,
-    label: str,
-    icon: str,
-    order: int = 0,
-    *,
-    dataset_types: tuple[str, ...] | None = None,
-    required_datatable_name: str | None = None,
-    internal: bool = False,
-    tooltip: str | None = None,
-):
-    """Class decorator that registers a widget with the toolbox registry.
-
-    Usage::
-
-        @toolbox_plugin(category="Exploration", label="Histogram", icon=":/icons/exploration.png")
-        class HistogramWidget(ToolboxWidgetBase):
-            ...
-
-    The applicability keywords are optional; when omitted a tool applies to every
-    dataset type and is shown unconditionally (the historical default)::
-
-        @toolbox_plugin(
-            category="IntelliCage",
-            label="Transitions",
-            icon=":/icons/...",
-            dataset_types=("IntelliCage", "IntelliMaze"),
-            required_datatable_name="Visits",
-        )
-        class TransitionsWidget(ToolboxWidgetBase):
-            ...
-    """
-
-    def decorator(cls: type) -> type:
-        registry.register(
-            ToolboxPluginInfo(
-                category,
-                label,
-                icon,
-                cls,
-                order,
-                dataset_types=dataset_types,
-                required_datatable_name=required_datatable_name,
-                internal=internal,
-                tooltip=tooltip,
-            )
-        )
-        return cls
-
-    return decorator
-
-
 def validate_registry() -> list[str]:
     """Return a list of human-readable consistency issues in the registry.
 
-    Cheap, runtime-safe checks only — duplicate ``(category, label)`` pairs and
-    empty icon strings.  Never raises, so a malformed plugin degrades gracefully
-    instead of breaking the Toolbox menu.  Deeper checks (contract conformance,
-    completeness of the import manifest) live in the registry test.
+    Cheap, runtime-safe checks only — duplicate ``(category, label)`` pairs,
+    empty icon strings and malformed widget paths.  Never imports a widget
+    module and never raises, so a malformed plugin degrades gracefully instead
+    of breaking the Toolbox menu.  Deeper checks (contract conformance,
+    completeness of the manifest) live in the registry test.
     """
     issues: list[str] = []
     seen: set[tuple[str, str]] = set()
@@ -186,4 +171,8 @@ def validate_registry() -> list[str]:
             seen.add(key)
             if not plugin.icon:
                 issues.append(f"Toolbox plugin has empty icon: category={category!r} label={plugin.label!r}")
+            if isinstance(plugin.widget, str) and not all(plugin.widget.partition(":")[::2]):
+                issues.append(
+                    f"Toolbox plugin widget is not 'module:Class': category={category!r} label={plugin.label!r}"
+                )
     return issues
@@ -17,7 +17,6 @@ from tse_analytics.core.toaster import make_toast
 from tse_analytics.core.utils import get_figsize_from_widget, get_widget_tool_button
 from tse_analytics.core.workers.task_manager import TaskManager
 from tse_analytics.core.workers.worker import Worker
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.toolbox.tsne.processor import TsneResult, get_tsne_result
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
@@ -34,12 +33,6 @@ class TsneWidgetSettings:
     metric: str = "euclidean"
 
 
-@toolbox_plugin(
-    category="Factor Analysis",
-    label="t-Distributed Stochastic Neighbor Embedding (t-SNE)",
-    icon=":/icons/dimensionality.png",
-    order=3,
-)
 class TsneWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
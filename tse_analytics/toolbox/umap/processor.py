@@ -9,6 +9,7 @@ from sklearn.preprocessing import StandardScaler
 from tse_analytics.core import color_manager
 from tse_analytics.core.data.datatable import Datatable
 from tse_analytics.core.utils import get_html_image_from_figure
+from tse_analytics.toolbox.result_cache import cached_result
 
 
 @dataclass
@@ -16,6 +17,7 @@ class UmapResult:
     report: str
 
 
+@cached_result
 def get_umap_result(
     datatable: Datatable,
     variables: list[str],
@@ -18,7 +18,6 @@ from tse_analytics.core.toaster import make_toast
 from tse_analytics.core.utils import get_figsize_from_widget, get_widget_tool_button
 from tse_analytics.core.workers.task_manager import TaskManager
 from tse_analytics.core.workers.worker import Worker
-from tse_analytics.toolbox.toolbox_registry import toolbox_plugin
 from tse_analytics.toolbox.toolbox_widget_base import ToolboxWidgetBase
 from tse_analytics.toolbox.umap.processor import UmapResult, get_umap_result
 from tse_analytics.views.misc.group_by_selector import GroupBySelector
@@ -35,12 +34,6 @@ class UmapWidgetSettings:
     min_dist: float = 0.1
 
 
-@toolbox_plugin(
-    category="Factor Analysis",
-    label="Uniform Manifold Approximation and Projection (UMAP)",
-    icon=":/icons/dimensionality.png",
-    order=5,
-)
 class UmapWidget(ToolboxWidgetBase):
     def __init__(self, datatable: Datatable, parent: QWidget | None = None):
         super().__init__(
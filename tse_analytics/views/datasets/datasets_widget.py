@@ -381,24 +381,27 @@ class DatasetsWidget(QWidget, messaging.MessengerListener):
         """
         if current.isValid():
             item = current.model().getItem(current)
-            messaging.broadcast(messaging.SelectedTreeItemChangedMessage(self, item))
 
             is_dataset_item = isinstance(item, DatasetTreeItem)
             is_datatable_item = isinstance(item, DatatableTreeItem)
             is_report_item = isinstance(item, ReportTreeItem)
 
-            if is_dataset_item:
-                manager.set_selected_dataset(item.dataset)
-                manager.set_selected_datatable(None)
-                self.toolbox_button.set_enabled_actions(item.dataset, None)
-            elif is_datatable_item:
-                manager.set_selected_dataset(item.datatable.dataset)
-                manager.set_selected_datatable(item.datatable)
-                self.toolbox_button.set_enabled_actions(item.datatable.dataset, item.datatable)
-            else:
-                if hasattr(item, "dataset"):
-                    if item.dataset is not None:
-                        manager.set_selected_dataset(item.dataset)
+            # Deliver the selection messages once the whole selection is updated
+            with messaging.delay_callbacks(coalesce=True):
+                messaging.broadcast(messaging.SelectedTreeItemChangedMessage(self, item))
+
+                if is_dataset_item:
+                    manager.set_selected_dataset(item.dataset)
+                    manager.set_selected_datatable(None)
+                    self.toolbox_button.set_enabled_actions(item.dataset, None)
+                elif is_datatable_item:
+                    manager.set_selected_dataset(item.datatable.dataset)
+                    manager.set_selected_datatable(item.datatable)
+                    self.toolbox_button.set_enabled_actions(item.datatable.dataset, item.datatable)
+                else:
+                    if hasattr(item, "dataset"):
+                        if item.dataset is not None:
+                            manager.set_selected_dataset(item.dataset)
 
             self.import_action.setEnabled(is_dataset_item)
             self.edit_action.setEnabled(is_dataset_item or is_datatable_item)
@@ -43,7 +43,7 @@ class EditDatatableDialog(QDialog):
             name=self.ui.nameLineEdit.text(),
             description=self.ui.descriptionLineEdit.text(),
             variables=self.datatable.variables.copy(),
-            df=self.datatable.df.copy(),
+            df=self.datatable.df.copy(deep=False),
             metadata=self.datatable.metadata.copy(),
         )
 
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import partial
 
 from PySide6.QtCore import Qt
@@ -22,7 +21,8 @@ class DatasetsMergeDialog(QDialog):
         self.ui = Ui_DatasetsMergeDialog()
         self.ui.setupUi(self)
 
-        self.datasets = deepcopy(datasets)
+        # Cloned datasets share the storage of not yet materialized datatables instead of reading them
+        self.datasets = [dataset.clone() for dataset in datasets]
         # sort datasets by start time
         self.datasets.sort(key=lambda dataset: dataset.experiment_started)
 
@@ -70,6 +70,7 @@ class DatasetsMergeDialog(QDialog):
         single_trial = self.ui.checkBoxSingleTrial.isChecked()
         continuous_mode = self.ui.radioButtonContinuousMode.isChecked()
         generate_new_animal_names = self.ui.checkBoxGenerateAnimalNames.isChecked()
+        out_of_core = self.ui.checkBoxOutOfCore.isChecked()
         manager.merge_datasets(
-            new_dataset_name, self.datasets, single_trial, continuous_mode, generate_new_animal_names
+            new_dataset_name, self.datasets, single_trial, continuous_mode, generate_new_animal_names, out_of_core
         )
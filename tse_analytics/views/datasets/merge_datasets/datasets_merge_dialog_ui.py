@@ -99,6 +99,11 @@ class Ui_DatasetsMergeDialog(object):
 
         self.verticalLayout_2.addWidget(self.checkBoxSingleTrial)
 
+        self.checkBoxOutOfCore = QCheckBox(self.widgetSettings)
+        self.checkBoxOutOfCore.setObjectName(u"checkBoxOutOfCore")
+
+        self.verticalLayout_2.addWidget(self.checkBoxOutOfCore)
+
         self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
 
         self.verticalLayout_2.addItem(self.verticalSpacer)
@@ -132,5 +137,9 @@ class Ui_DatasetsMergeDialog(object):
         self.radioButtonOverlapMode.setText(QCoreApplication.translate("DatasetsMergeDialog", u"Overlap", None))
         self.checkBoxGenerateAnimalNames.setText(QCoreApplication.translate("DatasetsMergeDialog", u"Add trial number as suffix in animal names ", None))
         self.checkBoxSingleTrial.setText(QCoreApplication.translate("DatasetsMergeDialog", u"Merge as a single trial", None))
+#if QT_CONFIG(tooltip)
+        self.checkBoxOutOfCore.setToolTip(QCoreApplication.translate("DatasetsMergeDialog", u"Merge in a temporary DuckDB file and load the merged datatables on demand", None))
+#endif // QT_CONFIG(tooltip)
+        self.checkBoxOutOfCore.setText(QCoreApplication.translate("DatasetsMergeDialog", u"Store merged data on disk", None))
     # retranslateUi
 
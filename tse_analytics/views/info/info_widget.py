@@ -1,10 +1,21 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QAbstractItemView, QTreeView, QWidget
 
-from tse_analytics.core import messaging
+from tse_analytics.core import manager, messaging
+from tse_analytics.core.data.dataset import Dataset
 from tse_analytics.core.models.dataset_tree_item import DatasetTreeItem
 from tse_analytics.core.models.datatable_tree_item import DatatableTreeItem
 from tse_analytics.core.models.json_model import JsonModel
+from tse_analytics.core.utils.memory import format_bytes, get_memory_usage
+
+
+def _iter_datatables(dataset: Dataset):
+    """Yield (display key, datatable) for the regular and raw datatables of a dataset."""
+    for name, datatable in dataset.datatables.items():
+        yield name, datatable
+    for extension_name, datatables in dataset.raw_datatables.items():
+        for name, datatable in datatables.items():
+            yield f"{extension_name}/{name}", datatable
 
 
 class InfoWidget(QTreeView, messaging.MessengerListener):
@@ -29,9 +40,31 @@ class InfoWidget(QTreeView, messaging.MessengerListener):
 
     def _on_selected_tree_node_changed(self, message: messaging.SelectedTreeItemChangedMessage):
         if isinstance(message.tree_item, DatasetTreeItem):
-            self.set_data(message.tree_item.dataset.metadata)
+            self._show_dataset(message.tree_item.dataset)
         elif isinstance(message.tree_item, DatatableTreeItem):
-            self.set_data(message.tree_item.datatable.dataset.metadata)
+            self._show_dataset(message.tree_item.datatable.dataset)
+
+    def _show_dataset(self, dataset: Dataset) -> None:
+        data = dict(dataset.metadata)
+        data["memory"] = self._get_memory_info(dataset)
+        self.set_data(data)
+
+    @staticmethod
+    def _get_memory_info(dataset: Dataset) -> dict:
+        """Owned vs shared column memory of the dataset's datatables, across the whole workspace."""
+        datasets = list(manager.get_workspace().datasets.values())
+        if dataset not in datasets:
+            datasets.append(dataset)
+        usages = get_memory_usage(datatable for item in datasets for _, datatable in _iter_datatables(item))
+
+        info = {}
+        for key, datatable in _iter_datatables(dataset):
+            usage = usages.get(datatable.id)
+            if usage is None:
+                info[key] = "not loaded"
+            else:
+                info[key] = {"owned": format_bytes(usage.owned_bytes), "shared": format_bytes(usage.shared_bytes)}
+        return info
 
     def _on_dataset_changed(self, message: messaging.DatasetChangedMessage):
         if message.dataset is None:
@@ -33,7 +33,6 @@ from tse_analytics.views.info.info_widget import InfoWidget
 from tse_analytics.views.logs.log_widget import LogWidget
 from tse_analytics.views.main_window_ui import Ui_MainWindow
 from tse_analytics.views.misc.toolbox_button import ToolboxButton
-from tse_analytics.views.pipeline.pipeline_editor_widget import PipelineEditorWidget
 from tse_analytics.views.settings.settings_dialog import SettingsDialog
 
 
@@ -253,6 +252,9 @@ class MainWindow(QMainWindow):
         LayoutManager.open_perspective("Default")
 
     def _show_pipeline_editor(self):
+        # Imported on first use: the node modules pull in the toolbox analysis libraries
+        from tse_analytics.views.pipeline.pipeline_editor_widget import PipelineEditorWidget
+
         widget = PipelineEditorWidget()
         LayoutManager.add_widget_to_central_area(
             manager.get_selected_dataset(), widget, "Pipeline Editor", QIcon(":/icons/icons8-genealogy-16.png")
@@ -1,45 +1,7 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWebEngineWidgets import QWebEngineView
 
-html_template = """
-<html>
-<head>
-<style type="text/css">
-    body {{
-        font-family: "Segoe UI", system-ui, sans-serif;
-        font-size: 10pt;
-    }}
-    table {{
-        font-size: 10pt;
-        border-collapse: collapse;
-        border: 1px solid silver;
-        margin-bottom: 20px;
-    }}
-    caption {{
-        font-size: 12pt;
-        font-weight: bold;
-    }}
-    th {{
-        padding: 5px;
-        background: #dfebea;
-    }}
-    td {{
-        padding: 5px;
-    }}
-    .horizontal-container {{
-        display: flex;
-        justify-content: space-between;
-        margin: 20px;
-    }}
-</style>
-</head>
-<body>
-
-{content}
-
-</body>
-</html>
-"""
+from tse_analytics.core.utils.formatting import get_html_document
 
 
 class ReportView(QWebEngineView):
@@ -53,10 +15,7 @@ class ReportView(QWebEngineView):
         # self.settings().setAttribute(self.settings().WebAttribute.PdfViewerEnabled, True)
 
     def set_content(self, content: str) -> None:
-        html = html_template.format(
-            content=content,
-        )
-        self.setHtml(html)
+        self.setHtml(get_html_document(content))
 
     def clear(self) -> None:
         self.setHtml("")
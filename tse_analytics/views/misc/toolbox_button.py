@@ -114,8 +114,9 @@ class ToolboxButton(QToolButton):
         if datatable is None:
             return
 
-        widget_class = plugin_info.widget_class
         try:
+            # The first use of a tool imports its widget module
+            widget_class = plugin_info.widget_class
             widget = widget_class(datatable)
         except Exception as e:
             logger.exception(f"Failed to instantiate {plugin_info.label}: {e}")
@@ -1,3 +1,5 @@
+import os
+
 from NodeGraphQt import NodesPaletteWidget, NodesTreeWidget
 from PySide6.QtCore import QSize, Qt, Signal
 from PySide6.QtGui import QIcon
@@ -104,6 +106,14 @@ class PipelineEditorWidget(QWidget):
         self.action_execute.setToolTip("Execute current pipeline")
         self.action_execute.triggered.connect(self._execute_pipeline)
 
+        self.action_parallel = self.toolbar.addAction("Parallel")
+        self.action_parallel.setToolTip("Run independent branches of the pipeline concurrently")
+        self.action_parallel.setCheckable(True)
+
+        self.action_clear_cache = self.toolbar.addAction(QIcon(":/icons/icons8-erase-16.png"), "Clear Cache")
+        self.action_clear_cache.setToolTip("Forget cached node outputs, so that the next execution runs every node")
+        self.action_clear_cache.triggered.connect(self._clear_cache)
+
         self._layout.addWidget(self.toolbar)
 
     def _init_graph(self):
@@ -239,12 +249,13 @@ class PipelineEditorWidget(QWidget):
         dataset = manager.get_selected_dataset()
         if dataset is None:
             return
-        node_outputs = self.graph.execute_pipeline(dataset)
+        max_workers = (os.cpu_count() or 1) if self.action_parallel.isChecked() else 1
+        node_outputs = self.graph.execute_pipeline(dataset, max_workers=max_workers)
 
         # Emit signal with results
         self.pipeline_executed.emit(node_outputs)
 
-        QMessageBox.information(self, "Pipeline", "Pipeline executed successfully!")
+        QMessageBox.information(self, "Pipeline", f"Pipeline executed successfully!\n\n{self._get_timings_text()}")
 
         # try:
         #     # Execute nodes in order
@@ -258,6 +269,17 @@ class PipelineEditorWidget(QWidget):
         # except Exception as e:
         #     QMessageBox.critical(self, "Error", f"Failed to execute pipeline: {str(e)}")
 
+    def _clear_cache(self):
+        self.graph.clear_cache()
+
+    def _get_timings_text(self) -> str:
+        """Per-node execution times of the last run, in execution order."""
+        lines = []
+        for node_id, run in self.graph.node_runs.items():
+            timing = "cached" if run.cached else f"{run.seconds:.3f} sec"
+            lines.append(f"{self.graph.get_node_by_id(node_id).name()}: {timing}")
+        return "\n".join(lines)
+
     def get_graph(self):
         """Get the node graph instance."""
         return self.graph